@@ -18,7 +18,7 @@ SELECT
         WHEN sigla = 'LTN' AND pu_med IS NULL AND taxa_med IS NOT NULL
             THEN 'OBSERVED_YIELD'
 
-        WHEN sigla = 'NTN-F' AND pu_med IS NOT NULL
+        WHEN sigla IN ('NTN-F', 'LFT', 'NTN-B') AND pu_med IS NOT NULL
             THEN 'OBSERVED_PU'
 
         ELSE 'NOT_ELIGIBLE'
@@ -31,7 +31,7 @@ SELECT
         WHEN sigla = 'LTN' AND pu_med IS NULL AND taxa_med IS NOT NULL
             THEN 'TAXA_MED'
 
-        WHEN sigla = 'NTN-F' AND pu_med IS NOT NULL
+        WHEN sigla IN ('NTN-F', 'LFT', 'NTN-B') AND pu_med IS NOT NULL
             THEN 'PU_MED'
 
         ELSE 'NONE'
@@ -44,19 +44,19 @@ SELECT
         WHEN sigla = 'LTN' AND pu_med IS NULL AND taxa_med IS NOT NULL
             THEN 'YIELD'
 
-        WHEN sigla = 'NTN-F' AND pu_med IS NOT NULL
+        WHEN sigla IN ('NTN-F', 'LFT', 'NTN-B') AND pu_med IS NOT NULL
             THEN 'PRICE'
 
         ELSE 'NONE'
     END AS primary_quote_type,
 
     CASE
-        WHEN sigla IN ('LTN', 'NTN-F') THEN TRUE
+        WHEN sigla IN ('LTN', 'NTN-F', 'LFT', 'NTN-B') THEN TRUE
         ELSE FALSE
     END AS can_price_in_engine,
 
     CASE
-        WHEN sigla NOT IN ('LTN', 'NTN-F')
+        WHEN sigla NOT IN ('LTN', 'NTN-F', 'LFT', 'NTN-B')
             THEN 'PRICING_ENGINE_NOT_AVAILABLE'
 
         WHEN maturity <= ref_date
@@ -68,6 +68,12 @@ SELECT
         WHEN sigla = 'NTN-F' AND pu_med IS NULL
             THEN 'NTNF_REQUIRES_OBSERVED_PU'
 
+        WHEN sigla = 'LFT' AND pu_med IS NULL
+            THEN 'LFT_REQUIRES_OBSERVED_PU'
+
+        WHEN sigla = 'NTN-B' AND pu_med IS NULL
+            THEN 'NTNB_REQUIRES_OBSERVED_PU'
+
         WHEN sigla = 'LTN' AND pu_med IS NULL AND taxa_med IS NULL
             THEN 'LTN_MISSING_PU_AND_YIELD'
 
@@ -83,7 +89,7 @@ SELECT
         THEN TRUE
 
         WHEN
-            sigla = 'NTN-F'
+            sigla IN ('NTN-F', 'LFT', 'NTN-B')
             AND pu_med IS NOT NULL
             AND maturity > ref_date
             AND bd_to_maturity > 0
@@ -1,31 +1,38 @@
 CREATE OR REPLACE VIEW mart_public_bonds_curve_candidates AS
 WITH eligible_candidates AS (
-    SELECT *
+    SELECT
+        *,
+        instrument_type IN ('LTN', 'NTN-F') AS is_nominal
     FROM mart_public_bonds_quotes_quality
     WHERE eligible_for_curve_input = TRUE
 ),
 daily_stats AS (
     SELECT
         *,
-        COUNT(*) OVER (
+        -- Contagens e flags descrevem a curva nominal (LTN e NTN-F); títulos
+        -- indexados (LFT, NTN-B) herdam as flags do dia sem entrar nelas.
+        SUM(CASE WHEN is_nominal THEN 1 ELSE 0 END) OVER (
             PARTITION BY ref_date
         ) AS numero_observacoes_dia,
         -- Faixas empíricas definidas pelos quartis de bd_to_maturity:
         -- curto <= Q25 (219), médio entre Q25 e Q75, longo > Q75 (920).
-        SUM(CASE WHEN bd_to_maturity <= 219 THEN 1 ELSE 0 END)
+        SUM(CASE WHEN is_nominal AND bd_to_maturity <= 219 THEN 1 ELSE 0 END)
             OVER (PARTITION BY ref_date) AS numero_observacoes_curto,
-        SUM(CASE WHEN bd_to_maturity > 219 AND bd_to_maturity <= 920 THEN 1 ELSE 0 END)
+        SUM(CASE WHEN is_nominal AND bd_to_maturity > 219 AND bd_to_maturity <= 920 THEN 1 ELSE 0 END)
             OVER (PARTITION BY ref_date) AS numero_observacoes_medio,
-        SUM(CASE WHEN bd_to_maturity > 920 THEN 1 ELSE 0 END)
+        SUM(CASE WHEN is_nominal AND bd_to_maturity > 920 THEN 1 ELSE 0 END)
             OVER (PARTITION BY ref_date) AS numero_observacoes_longo,
-        (
-            MAX(bd_to_maturity) OVER (PARTITION BY ref_date)
-            - MIN(bd_to_maturity) OVER (PARTITION BY ref_date)
-        ) / 252.0 AS tenor_spread_years
+        COALESCE(
+            (
+                MAX(CASE WHEN is_nominal THEN bd_to_maturity END) OVER (PARTITION BY ref_date)
+                - MIN(CASE WHEN is_nominal THEN bd_to_maturity END) OVER (PARTITION BY ref_date)
+            ) / 252.0,
+            0.0
+        ) AS tenor_spread_years
     FROM eligible_candidates
 )
 SELECT
-    * EXCLUDE (tenor_spread_years),
+    * EXCLUDE (is_nominal, tenor_spread_years),
     CASE
         WHEN numero_observacoes_dia < 8 THEN 'LOW'
         WHEN numero_observacoes_dia BETWEEN 8 AND 12 THEN 'MEDIUM'
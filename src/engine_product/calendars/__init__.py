@@ -1,4 +1,10 @@
 from .business_calendar import BusinessCalendar
-from .repository import DataFrameCalendarRepository
+from .index import CalendarIndex
+from .repository import ArrayCalendarRepository, DataFrameCalendarRepository
 
-__all__ = ["BusinessCalendar", "DataFrameCalendarRepository"]
+__all__ = [
+    "ArrayCalendarRepository",
+    "BusinessCalendar",
+    "CalendarIndex",
+    "DataFrameCalendarRepository",
+]
@@ -1,4 +1,6 @@
 from datetime import date
+
+import numpy as np
 from dateutil.relativedelta import relativedelta
 from .interface import BusinessCalendarRepository
 
@@ -7,6 +9,14 @@ class BusinessCalendar:
     def __init__(self, repo: BusinessCalendarRepository):
         self._repo = repo
 
+    @property
+    def repository(self) -> BusinessCalendarRepository:
+        return self._repo
+
+    @property
+    def calendar_id(self) -> str | None:
+        return getattr(self._repo, "calendar_id", None)
+
     # Delega as operações base
     def is_business_day(self, d: date) -> bool:
         return self._repo.is_business_day(d)
@@ -19,3 +29,13 @@ class BusinessCalendar:
 
     def first_business_day_of_month(self, year: int, month: int) -> date:
         return self._repo.first_business_day_of_month(year, month)
+
+    # Versões vetoriais sobre arrays de datas
+    def is_business_day_array(self, dates) -> np.ndarray:
+        return self._repo.is_business_day_array(dates)
+
+    def business_days_between_array(self, start, end) -> np.ndarray:
+        return self._repo.business_days_between_array(start, end)
+
+    def adjust_to_next_business_day_array(self, dates) -> np.ndarray:
+        return self._repo.adjust_to_next_business_day_array(dates)
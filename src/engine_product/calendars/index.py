@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+
+MISSING_BD_INDEX = -1
+
+
+def as_datetime64_days(dates) -> np.ndarray:
+    """
+    Converte datas (datetime64, Series/Index, Timestamp, date ou strings) em
+    datetime64[D], preservando o formato; valores inválidos viram NaT.
+    """
+    if isinstance(dates, (pd.Series, pd.Index)):
+        return np.asarray(
+            pd.to_datetime(dates, errors="coerce"),
+            dtype="datetime64[ns]",
+        ).astype("datetime64[D]")
+
+    values = np.asarray(dates)
+
+    if values.dtype.kind != "M":
+        values = (
+            pd.to_datetime(values.ravel(), errors="coerce")
+            .to_numpy(dtype="datetime64[ns]")
+            .reshape(values.shape)
+        )
+
+    return values.astype("datetime64[D]")
+
+
+class CalendarIndex:
+    """
+    Índice denso de calendário pelo ordinal da data.
+
+    Cada dia entre a primeira e a última data ocupa uma posição de um array
+    int32 com o bd_index (-1 para datas ausentes), de modo que converter um
+    array de datas em bd_index é um único gather. O caminho inverso usa o
+    array das datas dos dias úteis, indexado por bd_index.
+    """
+
+    def __init__(self, dates, bd_index, is_business_day) -> None:
+        days = as_datetime64_days(dates).astype(np.int64)
+        bd_index = np.asarray(bd_index, dtype=np.int32)
+        is_business_day = np.asarray(is_business_day, dtype=bool)
+
+        if days.size == 0:
+            raise ValueError("calendar must contain at least one date")
+
+        if not days.shape == bd_index.shape == is_business_day.shape:
+            raise ValueError("dates, bd_index and is_business_day must be aligned")
+
+        self._origin = int(days.min())
+        size = int(days.max()) - self._origin + 1
+        offsets = days - self._origin
+
+        self._bd_index = np.full(size, MISSING_BD_INDEX, dtype=np.int32)
+        self._bd_index[offsets] = bd_index
+
+        self._is_business_day = np.zeros(size, dtype=bool)
+        self._is_business_day[offsets] = is_business_day
+
+        business_bd_index = bd_index[is_business_day]
+        self._bd_origin = int(business_bd_index.min()) if business_bd_index.size else 0
+        bd_size = (
+            int(business_bd_index.max()) - self._bd_origin + 1
+            if business_bd_index.size
+            else 0
+        )
+        self._business_dates = np.full(bd_size, np.datetime64("NaT"), dtype="datetime64[D]")
+        self._business_dates[business_bd_index - self._bd_origin] = (
+            days[is_business_day].astype("datetime64[D]")
+        )
+
+    @classmethod
+    def from_calendar_df(cls, calendar_df: pd.DataFrame) -> CalendarIndex:
+        """Sem a coluna is_business_day, todas as datas contam como dias úteis."""
+
+        if "is_business_day" in calendar_df:
+            is_business_day = calendar_df["is_business_day"].to_numpy(dtype=bool)
+        else:
+            is_business_day = np.ones(len(calendar_df), dtype=bool)
+
+        return cls(
+            dates=calendar_df["date"],
+            bd_index=calendar_df["bd_index"].to_numpy(),
+            is_business_day=is_business_day,
+        )
+
+    def __len__(self) -> int:
+        return self._bd_index.size
+
+    def __contains__(self, d) -> bool:
+        return bool(self.bd_index(d) >= 0)
+
+    @property
+    def first_date(self) -> np.datetime64:
+        return np.datetime64(self._origin, "D")
+
+    @property
+    def last_date(self) -> np.datetime64:
+        return np.datetime64(self._origin + self._bd_index.size - 1, "D")
+
+    @property
+    def business_dates(self) -> np.ndarray:
+        """Datas dos dias úteis em ordem de bd_index."""
+
+        return self._business_dates[~np.isnat(self._business_dates)]
+
+    def bd_index(self, dates, business_days_only: bool = False) -> np.ndarray:
+        """
+        bd_index de cada data, -1 para datas fora do calendário, NaT e, com
+        `business_days_only`, dias não úteis.
+        """
+        offsets, inside = self._lookup(dates)
+        result = np.where(inside, self._bd_index[offsets], MISSING_BD_INDEX)
+
+        if business_days_only:
+            result = np.where(self._is_business_day[offsets] & inside, result, MISSING_BD_INDEX)
+
+        return result.astype(np.int32)
+
+    def is_business_day(self, dates) -> np.ndarray:
+        offsets, inside = self._lookup(dates)
+        return self._is_business_day[offsets] & inside
+
+    def dates(self, bd_indexes) -> np.ndarray:
+        """Data do dia útil de cada bd_index, NaT quando não existe."""
+
+        positions = np.asarray(bd_indexes, dtype=np.int64) - self._bd_origin
+        inside = (positions >= 0) & (positions < self._business_dates.size)
+
+        if not self._business_dates.size:
+            return np.full(positions.shape, np.datetime64("NaT"), dtype="datetime64[D]")
+
+        return np.where(
+            inside,
+            self._business_dates[np.where(inside, positions, 0)],
+            np.datetime64("NaT"),
+        )
+
+    def _lookup(self, dates) -> tuple[np.ndarray, np.ndarray]:
+        values = as_datetime64_days(dates)
+        offsets = np.where(np.isnat(values), -1, values.astype(np.int64) - self._origin)
+        inside = (offsets >= 0) & (offsets < self._bd_index.size)
+
+        return np.where(inside, offsets, 0), inside
@@ -1,6 +1,9 @@
 from abc import ABC, abstractmethod
 from datetime import date
 
+import numpy as np
+
+
 class BusinessCalendarRepository(ABC):
 
     @abstractmethod
@@ -29,4 +32,40 @@ class BusinessCalendarRepository(ABC):
     @abstractmethod
     def first_business_day_of_month(self, year: int, month: int) -> date:
         ...
-        
\ No newline at end of file
+
+    # Operações vetoriais. As implementações padrão delegam data a data para
+    # os métodos escalares; repositórios baseados em arrays as sobrescrevem.
+
+    def is_business_day_array(self, dates) -> np.ndarray:
+        values = np.asarray(dates, dtype="datetime64[D]")
+        return np.asarray(
+            [self.is_business_day(d) for d in values.astype(object).ravel()],
+            dtype=bool,
+        ).reshape(values.shape)
+
+    def business_days_between_array(self, start, end) -> np.ndarray:
+        starts, ends = np.broadcast_arrays(
+            np.asarray(start, dtype="datetime64[D]"),
+            np.asarray(end, dtype="datetime64[D]"),
+        )
+        return np.asarray(
+            [
+                self.business_days_between(s, e)
+                for s, e in zip(
+                    starts.astype(object).ravel(),
+                    ends.astype(object).ravel(),
+                    strict=True,
+                )
+            ],
+            dtype=np.int64,
+        ).reshape(starts.shape)
+
+    def adjust_to_next_business_day_array(self, dates) -> np.ndarray:
+        values = np.asarray(dates, dtype="datetime64[D]")
+        return np.asarray(
+            [
+                self.adjust_to_next_business_day(d)
+                for d in values.astype(object).ravel()
+            ],
+            dtype="datetime64[D]",
+        ).reshape(values.shape)
@@ -1,7 +1,11 @@
+import numpy as np
 import pandas as pd
 from datetime import date
+from .index import CalendarIndex
 from .interface import BusinessCalendarRepository
 
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
 class DataFrameCalendarRepository(BusinessCalendarRepository):
 
     def __init__(self, df: pd.DataFrame):
@@ -44,4 +48,182 @@ class DataFrameCalendarRepository(BusinessCalendarRepository):
             (self._data["month"] == month) &
             (self._data["is_business_day"] == True)
         )
-        return self._data[mask].index[0]
\ No newline at end of file
+        return self._data[mask].index[0]
+
+class ArrayCalendarRepository(BusinessCalendarRepository):
+    """
+    Repositório de calendário indexado pelo ordinal da data.
+
+    Cada dia entre a primeira e a última data do calendário ocupa uma posição
+    em arrays contíguos (bd_index, act_index, is_business_day e próximo/anterior
+    dia útil). Qualquer consulta vira um acesso por índice, tanto para uma data
+    isolada quanto para arrays de datas.
+    """
+
+    def __init__(self, df: pd.DataFrame):
+        self._data = df.set_index("date")
+
+        days = (
+            pd.to_datetime(df["date"])
+            .to_numpy()
+            .astype("datetime64[D]")
+            .astype(np.int64)
+        )
+        if days.size == 0:
+            raise ValueError("calendar must contain at least one date")
+
+        self._origin = int(days.min())
+        size = int(days.max()) - self._origin + 1
+        offsets = days - self._origin
+
+        self._row_position = np.full(size, -1, dtype=np.int64)
+        self._row_position[offsets] = np.arange(days.size, dtype=np.int64)
+
+        self._bd_index = np.full(size, -1, dtype=np.int64)
+        self._bd_index[offsets] = df["bd_index"].to_numpy(dtype=np.int64)
+
+        self._act_index = np.full(size, -1, dtype=np.int64)
+        self._act_index[offsets] = df["act_index"].to_numpy(dtype=np.int64)
+
+        self._is_business_day = np.zeros(size, dtype=bool)
+        self._is_business_day[offsets] = (
+            df["is_business_day"].to_numpy(dtype=bool)
+        )
+
+        business_offsets = np.flatnonzero(self._is_business_day)
+        positions = np.arange(size, dtype=np.int64)
+
+        next_slot = np.searchsorted(business_offsets, positions, side="left")
+        self._next_business_day = np.full(size, -1, dtype=np.int64)
+        has_next = next_slot < business_offsets.size
+        self._next_business_day[has_next] = business_offsets[next_slot[has_next]]
+
+        previous_slot = np.searchsorted(business_offsets, positions, side="right") - 1
+        self._previous_business_day = np.full(size, -1, dtype=np.int64)
+        has_previous = previous_slot >= 0
+        self._previous_business_day[has_previous] = (
+            business_offsets[previous_slot[has_previous]]
+        )
+
+        calendar_ids = df["calendar_id"].dropna().unique() if "calendar_id" in df else []
+        self._calendar_id = str(calendar_ids[0]) if len(calendar_ids) == 1 else None
+        self._calendar_index: CalendarIndex | None = None
+
+    @property
+    def calendar_id(self) -> str | None:
+        return self._calendar_id
+
+    @property
+    def calendar_index(self) -> CalendarIndex:
+        """CalendarIndex com o mesmo bd_index, construído uma vez."""
+
+        if self._calendar_index is None:
+            present = self._row_position >= 0
+            self._calendar_index = CalendarIndex(
+                dates=(np.flatnonzero(present) + self._origin).astype("datetime64[D]"),
+                bd_index=self._bd_index[present],
+                is_business_day=self._is_business_day[present],
+            )
+
+        return self._calendar_index
+
+    @property
+    def first_date(self) -> date:
+        return self._to_date(0)
+
+    @property
+    def last_date(self) -> date:
+        return self._to_date(self._row_position.size - 1)
+
+    def get(self, d: date) -> dict:
+        return self._data.iloc[self._row_position[self._offset(d)]].to_dict()
+
+    def actual_days_between(self, start: date, end: date) -> int:
+        return int(
+            self._act_index[self._offset(end)]
+            - self._act_index[self._offset(start)]
+        )
+
+    def is_business_day(self, d: date) -> bool:
+        return bool(self._is_business_day[self._offset(d)])
+
+    def business_days_between(self, start: date, end: date) -> int:
+        return int(
+            self._bd_index[self._offset(end)]
+            - self._bd_index[self._offset(start)]
+        )
+
+    def adjust_to_next_business_day(self, d: date) -> date:
+        target = self._next_business_day[self._offset(d)]
+
+        if target < 0:
+            raise KeyError(f"No business day on or after {d} in calendar")
+
+        return self._to_date(int(target))
+
+    def adjust_to_previous_business_day(self, d: date) -> date:
+        target = self._previous_business_day[self._offset(d)]
+
+        if target < 0:
+            raise KeyError(f"No business day on or before {d} in calendar")
+
+        return self._to_date(int(target))
+
+    def first_business_day_of_month(self, year: int, month: int) -> date:
+        result = self.adjust_to_next_business_day(date(year, month, 1))
+
+        if (result.year, result.month) != (year, month):
+            raise KeyError(f"No business day in {year}-{month:02d}")
+
+        return result
+
+    def bd_index_array(self, dates) -> np.ndarray:
+        return self._bd_index[self._offsets(dates)]
+
+    def is_business_day_array(self, dates) -> np.ndarray:
+        return self._is_business_day[self._offsets(dates)]
+
+    def business_days_between_array(self, start, end) -> np.ndarray:
+        return self.bd_index_array(end) - self.bd_index_array(start)
+
+    def adjust_to_next_business_day_array(self, dates) -> np.ndarray:
+        targets = self._next_business_day[self._offsets(dates)]
+
+        if (targets < 0).any():
+            raise KeyError("Some dates have no business day on or after them in calendar")
+
+        return (targets + self._origin).astype("datetime64[D]")
+
+    def adjust_to_previous_business_day_array(self, dates) -> np.ndarray:
+        targets = self._previous_business_day[self._offsets(dates)]
+
+        if (targets < 0).any():
+            raise KeyError("Some dates have no business day on or before them in calendar")
+
+        return (targets + self._origin).astype("datetime64[D]")
+
+    def _offset(self, d: date) -> int:
+        if isinstance(d, np.datetime64):
+            offset = int(d.astype("datetime64[D]").astype(np.int64)) - self._origin
+        else:
+            offset = d.toordinal() - _EPOCH_ORDINAL - self._origin
+
+        if not 0 <= offset < self._row_position.size or self._row_position[offset] < 0:
+            raise KeyError(d)
+
+        return offset
+
+    def _offsets(self, dates) -> np.ndarray:
+        offsets = (
+            np.asarray(dates, dtype="datetime64[D]").astype(np.int64)
+            - self._origin
+        )
+        inside = (offsets >= 0) & (offsets < self._row_position.size)
+
+        if not inside.all() or (self._row_position[offsets] < 0).any():
+            raise KeyError("Some dates are outside the calendar")
+
+        return offsets
+
+    def _to_date(self, offset: int) -> date:
+        return date.fromordinal(offset + self._origin + _EPOCH_ORDINAL)
@@ -6,6 +6,8 @@
     indexers/      → regras de remuneração
     builder.py     → monta instrumentos via composição
     engine.py      → executa os componentes
+    batch.py       → modo colunar: eventos e fluxos de vários contratos em arrays
+    cache.py       → cache LRU de fluxos de vida inteira por termos contratuais
 
 Public API for cashflow generation.
 
@@ -13,7 +15,14 @@ This module exposes the core cashflow models, events and builders used by
 instrument contracts to generate projected cashflows.
 """
 
+from engine_product.cashflows.batch import CashflowBatch, CashflowEventBatch
 from engine_product.cashflows.builder import CashflowEngineBuilder
+from engine_product.cashflows.cache import (
+    CashflowCache,
+    CashflowCacheInfo,
+    DEFAULT_CASHFLOW_CACHE,
+    calendar_cache_id,
+)
 from engine_product.cashflows.events import CashflowEvent
 from engine_product.cashflows.models import Cashflow, CashflowType
 
@@ -22,4 +31,10 @@ __all__ = [
     "CashflowType",
     "CashflowEvent",
     "CashflowEngineBuilder",
+    "CashflowBatch",
+    "CashflowEventBatch",
+    "CashflowCache",
+    "CashflowCacheInfo",
+    "DEFAULT_CASHFLOW_CACHE",
+    "calendar_cache_id",
 ]
\ No newline at end of file
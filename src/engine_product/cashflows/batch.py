@@ -0,0 +1,399 @@
+"""
+Modo colunar do engine de cashflows.
+
+    CashflowEventBatch → eventos de vários contratos (offsets + arrays)
+    CashflowEventStep  → k-ésimo evento de cada contrato, visto em arrays
+    CashflowStateBatch → estado de todos os contratos
+    CashflowColumns    → fluxos gerados por um componente em um passo
+    CashflowBatch      → resultado final (offsets + arrays por contrato)
+
+A lista de Cashflow continua disponível como visão: CashflowBatch.to_cashflows.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import date
+from typing import Sequence
+
+import numpy as np
+
+from engine_product.cashflows.events import CashflowEvent
+from engine_product.cashflows.models import Cashflow, CashflowType
+
+
+CASHFLOW_TYPES: tuple[CashflowType, ...] = tuple(CashflowType)
+CASHFLOW_TYPE_CODES: dict[CashflowType, int] = {
+    cashflow_type: code for code, cashflow_type in enumerate(CASHFLOW_TYPES)
+}
+
+# O engine unitário ordena por (payment_date, cashflow_type.value).
+_TYPE_SORT_KEY = np.argsort(
+    np.argsort([cashflow_type.value for cashflow_type in CASHFLOW_TYPES])
+)
+
+# Chave de metadata reconstruída na visão de lista, por tipo de fluxo.
+_FACTOR_METADATA_KEY = {
+    CashflowType.INTEREST: "accrual_factor",
+    CashflowType.AMORTIZATION: "amortization_factor",
+}
+
+_NAT = np.datetime64("NaT", "D")
+
+
+def _as_dates(values, n: int | None = None) -> np.ndarray:
+    dates = np.asarray(values, dtype="datetime64[D]").reshape(-1)
+
+    if n is not None and dates.size == 1 and n != 1:
+        return np.full(n, dates[0], dtype="datetime64[D]")
+
+    return dates
+
+
+def _to_date(value: np.datetime64) -> date | None:
+    if np.isnat(value):
+        return None
+
+    return value.astype(object)
+
+
+@dataclass(frozen=True)
+class CashflowEventStep:
+    """Um evento por contrato, alinhado a `contract`."""
+
+    contract: np.ndarray
+    event_date: np.ndarray
+    interest: np.ndarray
+    amortization_factor: np.ndarray
+    amortization_amount: np.ndarray
+    principal: np.ndarray
+    early_redemption: np.ndarray
+    redemption_premium: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.contract)
+
+    def subset(self, mask: np.ndarray) -> CashflowEventStep:
+        return CashflowEventStep(
+            contract=self.contract[mask],
+            event_date=self.event_date[mask],
+            interest=self.interest[mask],
+            amortization_factor=self.amortization_factor[mask],
+            amortization_amount=self.amortization_amount[mask],
+            principal=self.principal[mask],
+            early_redemption=self.early_redemption[mask],
+            redemption_premium=self.redemption_premium[mask],
+        )
+
+
+@dataclass(frozen=True)
+class CashflowEventBatch:
+    """
+    Eventos de vários contratos em layout ragged.
+
+    Os eventos do contrato i estão em [offsets[i], offsets[i + 1]), em ordem
+    de data. amortization_amount usa NaN para "não informado".
+    """
+
+    offsets: np.ndarray
+    event_date: np.ndarray
+    interest: np.ndarray
+    amortization_factor: np.ndarray
+    amortization_amount: np.ndarray
+    principal: np.ndarray
+    early_redemption: np.ndarray
+    redemption_premium: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    @property
+    def counts(self) -> np.ndarray:
+        return np.diff(self.offsets)
+
+    @classmethod
+    def from_arrays(
+        cls,
+        offsets,
+        event_date,
+        *,
+        interest=True,
+        amortization_factor=0.0,
+        amortization_amount=np.nan,
+        principal=False,
+        early_redemption=False,
+        redemption_premium=0.0,
+    ) -> CashflowEventBatch:
+        """Monta o lote a partir de arrays; escalares valem para todos os eventos."""
+        event_date = _as_dates(event_date)
+        n = len(event_date)
+
+        def column(value, dtype):
+            return np.broadcast_to(np.asarray(value, dtype=dtype), (n,)).copy()
+
+        return cls(
+            offsets=np.asarray(offsets, dtype=np.int64),
+            event_date=event_date,
+            interest=column(interest, bool),
+            amortization_factor=column(amortization_factor, float),
+            amortization_amount=column(amortization_amount, float),
+            principal=column(principal, bool),
+            early_redemption=column(early_redemption, bool),
+            redemption_premium=column(redemption_premium, float),
+        )
+
+    @classmethod
+    def from_events(
+        cls,
+        events_by_contract: Sequence[Sequence[CashflowEvent]],
+    ) -> CashflowEventBatch:
+        ordered = [
+            sorted(events, key=lambda e: e.event_date)
+            for events in events_by_contract
+        ]
+        flat = [event for events in ordered for event in events]
+
+        offsets = np.zeros(len(ordered) + 1, dtype=np.int64)
+        np.cumsum([len(events) for events in ordered], out=offsets[1:])
+
+        return cls(
+            offsets=offsets,
+            event_date=_as_dates([e.event_date for e in flat]),
+            interest=np.asarray([e.interest for e in flat], dtype=bool),
+            amortization_factor=np.asarray(
+                [e.amortization_factor for e in flat],
+                dtype=float,
+            ),
+            amortization_amount=np.asarray(
+                [
+                    np.nan if e.amortization_amount is None else e.amortization_amount
+                    for e in flat
+                ],
+                dtype=float,
+            ),
+            principal=np.asarray([e.principal for e in flat], dtype=bool),
+            early_redemption=np.asarray(
+                [e.early_redemption for e in flat],
+                dtype=bool,
+            ),
+            redemption_premium=np.asarray(
+                [e.redemption_premium for e in flat],
+                dtype=float,
+            ),
+        )
+
+    def step(self, k: int) -> CashflowEventStep:
+        """k-ésimo evento de cada contrato que tem pelo menos k + 1 eventos."""
+        contract = np.flatnonzero(self.counts > k)
+        rows = self.offsets[contract] + k
+
+        return CashflowEventStep(
+            contract=contract,
+            event_date=self.event_date[rows],
+            interest=self.interest[rows],
+            amortization_factor=self.amortization_factor[rows],
+            amortization_amount=self.amortization_amount[rows],
+            principal=self.principal[rows],
+            early_redemption=self.early_redemption[rows],
+            redemption_premium=self.redemption_premium[rows],
+        )
+
+
+@dataclass
+class CashflowStateBatch:
+    issue_date: np.ndarray
+    as_of_date: np.ndarray
+    current_period_start: np.ndarray
+    outstanding_notional: np.ndarray
+
+
+@dataclass(frozen=True)
+class CashflowColumns:
+    """Fluxos gerados por um componente, um por linha, ligados a `contract`."""
+
+    contract: np.ndarray
+    payment_date: np.ndarray
+    amount: np.ndarray
+    type_code: np.ndarray
+    accrual_start: np.ndarray
+    accrual_end: np.ndarray
+    notional_before: np.ndarray
+    notional_after: np.ndarray
+    factor: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.contract)
+
+    @classmethod
+    def empty(cls) -> CashflowColumns:
+        return cls.build(
+            contract=np.empty(0, dtype=np.int64),
+            payment_date=np.empty(0, dtype="datetime64[D]"),
+            amount=np.empty(0, dtype=float),
+            cashflow_type=CashflowType.PRINCIPAL,
+        )
+
+    @classmethod
+    def build(
+        cls,
+        *,
+        contract: np.ndarray,
+        payment_date: np.ndarray,
+        amount: np.ndarray,
+        cashflow_type: CashflowType,
+        accrual_start: np.ndarray | None = None,
+        accrual_end: np.ndarray | None = None,
+        notional_before: np.ndarray | None = None,
+        notional_after: np.ndarray | None = None,
+        factor: np.ndarray | None = None,
+    ) -> CashflowColumns:
+        n = len(contract)
+
+        def dates(values):
+            if values is None:
+                return np.full(n, _NAT)
+            return _as_dates(values, n)
+
+        def floats(values):
+            if values is None:
+                return np.full(n, np.nan)
+            return np.broadcast_to(np.asarray(values, dtype=float), (n,)).copy()
+
+        return cls(
+            contract=np.asarray(contract, dtype=np.int64),
+            payment_date=dates(payment_date),
+            amount=floats(amount),
+            type_code=np.full(n, CASHFLOW_TYPE_CODES[cashflow_type], dtype=np.int8),
+            accrual_start=dates(accrual_start),
+            accrual_end=dates(accrual_end),
+            notional_before=floats(notional_before),
+            notional_after=floats(notional_after),
+            factor=floats(factor),
+        )
+
+
+@dataclass(frozen=True)
+class CashflowBatch:
+    """
+    Cashflows de vários contratos em struct-of-arrays.
+
+    Os fluxos do contrato i estão em [offsets[i], offsets[i + 1]), na mesma
+    ordem do engine unitário. Datas ausentes são NaT; valores ausentes, NaN.
+    `factor` guarda o accrual_factor (juros) ou amortization_factor
+    (amortização) que a visão de lista devolve em metadata.
+    """
+
+    offsets: np.ndarray
+    payment_date: np.ndarray
+    amount: np.ndarray
+    type_code: np.ndarray
+    accrual_start: np.ndarray
+    accrual_end: np.ndarray
+    notional_before: np.ndarray
+    notional_after: np.ndarray
+    factor: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    @property
+    def counts(self) -> np.ndarray:
+        return np.diff(self.offsets)
+
+    @property
+    def owner(self) -> np.ndarray:
+        """Posição do contrato dono de cada fluxo."""
+        return np.repeat(np.arange(len(self), dtype=np.int64), self.counts)
+
+    @property
+    def cashflow_type(self) -> np.ndarray:
+        """Valores de CashflowType (str) de cada fluxo."""
+        values = np.asarray([t.value for t in CASHFLOW_TYPES], dtype=object)
+        return values[self.type_code]
+
+    @classmethod
+    def from_columns(
+        cls,
+        parts: Sequence[CashflowColumns],
+        n_contracts: int,
+    ) -> CashflowBatch:
+        parts = [part for part in parts if len(part)] or [CashflowColumns.empty()]
+
+        def concat(name: str) -> np.ndarray:
+            return np.concatenate([getattr(part, name) for part in parts])
+
+        contract = concat("contract")
+        payment_date = concat("payment_date")
+        type_code = concat("type_code")
+
+        order = np.lexsort(
+            (
+                np.arange(len(contract)),
+                _TYPE_SORT_KEY[type_code],
+                payment_date,
+                contract,
+            )
+        )
+
+        offsets = np.zeros(n_contracts + 1, dtype=np.int64)
+        np.cumsum(np.bincount(contract, minlength=n_contracts), out=offsets[1:])
+
+        return cls(
+            offsets=offsets,
+            payment_date=payment_date[order],
+            amount=concat("amount")[order],
+            type_code=type_code[order],
+            accrual_start=concat("accrual_start")[order],
+            accrual_end=concat("accrual_end")[order],
+            notional_before=concat("notional_before")[order],
+            notional_after=concat("notional_after")[order],
+            factor=concat("factor")[order],
+        )
+
+    def metadata(self) -> list[dict | None]:
+        """Metadata de cada fluxo, como na visão de lista."""
+        keys = [_FACTOR_METADATA_KEY.get(t) for t in CASHFLOW_TYPES]
+
+        return [
+            None if keys[code] is None else {keys[code]: factor}
+            for code, factor in zip(
+                self.type_code.tolist(),
+                self.factor.tolist(),
+                strict=True,
+            )
+        ]
+
+    def cashflow(self, row: int) -> Cashflow:
+        cashflow_type = CASHFLOW_TYPES[int(self.type_code[row])]
+        metadata_key = _FACTOR_METADATA_KEY.get(cashflow_type)
+
+        return Cashflow(
+            payment_date=_to_date(self.payment_date[row]),
+            amount=float(self.amount[row]),
+            cashflow_type=cashflow_type,
+            accrual_start=_to_date(self.accrual_start[row]),
+            accrual_end=_to_date(self.accrual_end[row]),
+            notional_before=_optional_float(self.notional_before[row]),
+            notional_after=_optional_float(self.notional_after[row]),
+            metadata=(
+                None
+                if metadata_key is None
+                else {metadata_key: float(self.factor[row])}
+            ),
+        )
+
+    def to_cashflows(self, i: int) -> list[Cashflow]:
+        return [
+            self.cashflow(row)
+            for row in range(self.offsets[i], self.offsets[i + 1])
+        ]
+
+    def to_cashflow_lists(self) -> list[list[Cashflow]]:
+        return [self.to_cashflows(i) for i in range(len(self))]
+
+
+def _optional_float(value: float) -> float | None:
+    if np.isnan(value):
+        return None
+
+    return float(value)
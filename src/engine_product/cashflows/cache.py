@@ -0,0 +1,158 @@
+"""
+Cache de fluxos por termos contratuais.
+
+Contratos com os mesmos termos (tipo, emissão, vencimento, notional, cupom,
+calendário) têm os mesmos fluxos de vida inteira. O cache guarda esses fluxos
+uma vez e atende cada as_of_date com uma busca binária nas datas de pagamento.
+
+    CashflowCache     → LRU limitado, com contadores de hit/miss
+    CashflowCacheInfo → retrato dos contadores
+    calendar_cache_id → identificador estável do calendário para as chaves
+
+As chaves não guardam o objeto de calendário: usam o calendar_id quando o
+calendário o expõe, ou um token emitido uma vez por objeto e mantido apenas
+por referência fraca. O cache é compartilhado entre threads e protegido por
+um lock.
+"""
+
+from __future__ import annotations
+
+import threading
+import weakref
+from bisect import bisect_right
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import date
+from itertools import count
+from typing import Any, Callable, Hashable
+
+from engine_product.cashflows.models import Cashflow
+
+
+DEFAULT_CASHFLOW_CACHE_SIZE = 4096
+
+# as_of_date usada para gerar os fluxos de vida inteira: nenhum evento é passado.
+FULL_LIFE_AS_OF_DATE = date.min
+
+_CALENDAR_TOKENS: weakref.WeakKeyDictionary[Any, str] = weakref.WeakKeyDictionary()
+_CALENDAR_TOKEN_COUNTER = count()
+_CALENDAR_TOKEN_LOCK = threading.Lock()
+
+
+def calendar_cache_id(calendar: Any) -> str:
+    """
+    Identificador do calendário usado nas chaves do cache.
+
+    Calendários com calendar_id compartilham entradas pelo id. Os demais
+    recebem um token único por objeto; o token nunca é reutilizado, então as
+    entradas de um calendário descartado apenas deixam de ser consultadas.
+    """
+    calendar_id = getattr(calendar, "calendar_id", None)
+
+    if calendar_id is not None:
+        return f"id:{calendar_id}"
+
+    with _CALENDAR_TOKEN_LOCK:
+        token = _CALENDAR_TOKENS.get(calendar)
+
+        if token is None:
+            token = f"object:{next(_CALENDAR_TOKEN_COUNTER)}"
+            _CALENDAR_TOKENS[calendar] = token
+
+    return token
+
+
+@dataclass(frozen=True)
+class CashflowCacheInfo:
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+@dataclass(frozen=True)
+class _CachedCashflows:
+    cashflows: tuple[Cashflow, ...]
+    payment_dates: tuple[date, ...]
+
+    def after(self, as_of_date: date) -> list[Cashflow]:
+        start = bisect_right(self.payment_dates, as_of_date)
+        return list(self.cashflows[start:])
+
+
+class CashflowCache:
+    """
+    LRU de fluxos de vida inteira, indexado pelos termos do contrato.
+
+    `build_full_life` recebe a as_of_date de vida inteira e deve devolver os
+    fluxos ordenados por data de pagamento, como CashflowEngine.build. Ele é
+    chamado fora do lock; se duas threads constroem a mesma chave, a primeira
+    entrada gravada é mantida.
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_CASHFLOW_CACHE_SIZE):
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive")
+
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[Hashable, _CachedCashflows] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            return key in self._entries
+
+    def get_cashflows(
+        self,
+        key: Hashable,
+        as_of_date: date,
+        build_full_life: Callable[[date], list[Cashflow]],
+    ) -> list[Cashflow]:
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is not None:
+                self.hits += 1
+                self._entries.move_to_end(key)
+                return entry.after(as_of_date)
+
+            self.misses += 1
+
+        cashflows = tuple(build_full_life(FULL_LIFE_AS_OF_DATE))
+        built = _CachedCashflows(
+            cashflows=cashflows,
+            payment_dates=tuple(cf.payment_date for cf in cashflows),
+        )
+
+        with self._lock:
+            entry = self._entries.setdefault(key, built)
+            self._entries.move_to_end(key)
+
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+        return entry.after(as_of_date)
+
+    def info(self) -> CashflowCacheInfo:
+        with self._lock:
+            return CashflowCacheInfo(
+                hits=self.hits,
+                misses=self.misses,
+                maxsize=self.maxsize,
+                currsize=len(self._entries),
+            )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+DEFAULT_CASHFLOW_CACHE = CashflowCache()
@@ -1,3 +1,10 @@
+import numpy as np
+
+from engine_product.cashflows.batch import (
+    CashflowColumns,
+    CashflowEventStep,
+    CashflowStateBatch,
+)
 from engine_product.cashflows.components.base import CashflowComponent
 from engine_product.cashflows.events import CashflowEvent
 from engine_product.cashflows.models import Cashflow, CashflowType
@@ -35,4 +42,37 @@ class AmortizationComponent(CashflowComponent):
                     "amortization_factor": event.amortization_factor,
                 },
             )
-        ]
\ No newline at end of file
+        ]
+
+    def generate_batch(
+        self,
+        step: CashflowEventStep,
+        state: CashflowStateBatch,
+    ) -> list[CashflowColumns]:
+
+        has_amount = ~np.isnan(step.amortization_amount)
+        step = step.subset((step.amortization_factor > 0) | has_amount)
+
+        if not len(step):
+            return []
+
+        notional = state.outstanding_notional[step.contract]
+        amount = np.where(
+            np.isnan(step.amortization_amount),
+            notional * step.amortization_factor,
+            step.amortization_amount,
+        )
+
+        return [
+            CashflowColumns.build(
+                contract=step.contract,
+                payment_date=step.event_date,
+                accrual_start=step.event_date,
+                accrual_end=step.event_date,
+                amount=amount,
+                cashflow_type=CashflowType.AMORTIZATION,
+                notional_before=notional,
+                notional_after=notional - amount,
+                factor=step.amortization_factor,
+            )
+        ]
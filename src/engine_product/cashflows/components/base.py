@@ -1,5 +1,10 @@
 from typing import Protocol
 
+from engine_product.cashflows.batch import (
+    CashflowColumns,
+    CashflowEventStep,
+    CashflowStateBatch,
+)
 from engine_product.cashflows.events import CashflowEvent
 from engine_product.cashflows.models import Cashflow
 from engine_product.cashflows.state import CashflowState
@@ -12,4 +17,14 @@ class CashflowComponent(Protocol):
         event: CashflowEvent,
         state: CashflowState,
     ) -> list[Cashflow]:
-        ...
\ No newline at end of file
+        ...
+
+class BatchCashflowComponent(CashflowComponent, Protocol):
+    """Componente que também gera fluxos em modo colunar."""
+
+    def generate_batch(
+        self,
+        step: CashflowEventStep,
+        state: CashflowStateBatch,
+    ) -> list[CashflowColumns]:
+        ...
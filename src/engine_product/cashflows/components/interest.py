@@ -1,5 +1,11 @@
+from engine_product.cashflows.batch import (
+    CashflowColumns,
+    CashflowEventStep,
+    CashflowStateBatch,
+)
 from engine_product.cashflows.components.base import CashflowComponent
 from engine_product.cashflows.events import CashflowEvent
+from engine_product.cashflows.indexers.base import accrual_factors
 from engine_product.cashflows.models import Cashflow, CashflowType
 from engine_product.cashflows.state import CashflowState
 
@@ -37,4 +43,37 @@ class InterestComponent(CashflowComponent):
                     "accrual_factor": accrual_factor,
                 },
             )
-        ]
\ No newline at end of file
+        ]
+
+    def generate_batch(
+        self,
+        step: CashflowEventStep,
+        state: CashflowStateBatch,
+    ) -> list[CashflowColumns]:
+
+        step = step.subset(step.interest)
+
+        if not len(step):
+            return []
+
+        accrual_start = state.current_period_start[step.contract]
+        accrual_factor = accrual_factors(
+            self.indexer,
+            accrual_start,
+            step.event_date,
+        )
+        notional = state.outstanding_notional[step.contract]
+
+        return [
+            CashflowColumns.build(
+                contract=step.contract,
+                payment_date=step.event_date,
+                accrual_start=accrual_start,
+                accrual_end=step.event_date,
+                amount=notional * accrual_factor,
+                cashflow_type=CashflowType.INTEREST,
+                notional_before=notional,
+                notional_after=notional,
+                factor=accrual_factor,
+            )
+        ]
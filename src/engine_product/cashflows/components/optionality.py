@@ -1,6 +1,11 @@
 # engine_product/cashflows/components/optionality.py
 # A SER REPENSADO EM COMO ADQUIRIR DADOS DE SPREAD ATRELADO AO RESGATE ANTECIPADO
 
+from engine_product.cashflows.batch import (
+    CashflowColumns,
+    CashflowEventStep,
+    CashflowStateBatch,
+)
 from engine_product.cashflows.components.base import CashflowComponent
 from engine_product.cashflows.events import CashflowEvent
 from engine_product.cashflows.models import Cashflow, CashflowType
@@ -46,4 +51,42 @@ class EarlyRedemptionComponent(CashflowComponent):
                 )
             )
 
-        return cashflows
\ No newline at end of file
+        return cashflows
+
+    def generate_batch(
+        self,
+        step: CashflowEventStep,
+        state: CashflowStateBatch,
+    ) -> list[CashflowColumns]:
+
+        step = step.subset(step.early_redemption)
+
+        if not len(step):
+            return []
+
+        notional = state.outstanding_notional[step.contract]
+        premium_amount = notional * step.redemption_premium
+        has_premium = premium_amount > 0
+
+        return [
+            CashflowColumns.build(
+                contract=step.contract,
+                payment_date=step.event_date,
+                accrual_start=step.event_date,
+                accrual_end=step.event_date,
+                amount=notional,
+                cashflow_type=CashflowType.EARLY_REDEMPTION,
+                notional_before=notional,
+                notional_after=0.0,
+            ),
+            CashflowColumns.build(
+                contract=step.contract[has_premium],
+                payment_date=step.event_date[has_premium],
+                accrual_start=step.event_date[has_premium],
+                accrual_end=step.event_date[has_premium],
+                amount=premium_amount[has_premium],
+                cashflow_type=CashflowType.PREMIUM,
+                notional_before=notional[has_premium],
+                notional_after=notional[has_premium],
+            ),
+        ]
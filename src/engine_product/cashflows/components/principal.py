@@ -1,5 +1,10 @@
 # engine_product/cashflows/components/principal.py
 
+from engine_product.cashflows.batch import (
+    CashflowColumns,
+    CashflowEventStep,
+    CashflowStateBatch,
+)
 from engine_product.cashflows.components.base import CashflowComponent
 from engine_product.cashflows.events import CashflowEvent
 from engine_product.cashflows.models import Cashflow, CashflowType
@@ -29,4 +34,30 @@ class PrincipalComponent(CashflowComponent):
                 notional_before=state.outstanding_notional,
                 notional_after=0.0,
             )
-        ]
\ No newline at end of file
+        ]
+
+    def generate_batch(
+        self,
+        step: CashflowEventStep,
+        state: CashflowStateBatch,
+    ) -> list[CashflowColumns]:
+
+        step = step.subset(step.principal)
+
+        if not len(step):
+            return []
+
+        notional = state.outstanding_notional[step.contract]
+
+        return [
+            CashflowColumns.build(
+                contract=step.contract,
+                payment_date=step.event_date,
+                accrual_start=step.event_date,
+                accrual_end=step.event_date,
+                amount=notional,
+                cashflow_type=CashflowType.PRINCIPAL,
+                notional_before=notional,
+                notional_after=0.0,
+            )
+        ]
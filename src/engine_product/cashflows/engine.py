@@ -3,10 +3,22 @@
 percorrer eventos
 chamar componentes
 atualizar estado
+
+build_batch faz o mesmo para vários contratos de uma vez: percorre o k-ésimo
+evento de todos os contratos em arrays. build é uma visão de lista sobre ele.
 """
 
 from datetime import date
 
+import numpy as np
+
+from engine_product.cashflows.batch import (
+    CashflowBatch,
+    CashflowColumns,
+    CashflowEventBatch,
+    CashflowEventStep,
+    CashflowStateBatch,
+)
 from engine_product.cashflows.components.base import CashflowComponent
 from engine_product.cashflows.events import CashflowEvent
 from engine_product.cashflows.models import Cashflow, CashflowType
@@ -25,6 +37,110 @@ class CashflowEngine:
         as_of_date: date,
     ) -> list[Cashflow]:
 
+        if not self.supports_batch:
+            return self._build_unit(issue_date, events, notional, as_of_date)
+
+        batch = self.build_batch(
+            issue_dates=[issue_date],
+            events=CashflowEventBatch.from_events([events]),
+            notionals=[notional],
+            as_of_dates=[as_of_date],
+        )
+
+        return batch.to_cashflows(0)
+
+    @property
+    def supports_batch(self) -> bool:
+        return all(
+            hasattr(component, "generate_batch")
+            for component in self.components
+        )
+
+    def build_batch(
+        self,
+        issue_dates,
+        events: CashflowEventBatch,
+        notionals,
+        as_of_dates,
+    ) -> CashflowBatch:
+        """
+        Gera os fluxos de vários contratos sem criar objetos por fluxo.
+
+        issue_dates, notionals e as_of_dates podem ser escalares ou arrays
+        alinhados aos contratos de `events`.
+        """
+        if not self.supports_batch:
+            raise TypeError("all components must implement generate_batch")
+
+        n = len(events)
+        issue_dates = np.broadcast_to(
+            np.asarray(issue_dates, dtype="datetime64[D]"),
+            (n,),
+        ).copy()
+
+        state = CashflowStateBatch(
+            issue_date=issue_dates,
+            as_of_date=np.broadcast_to(
+                np.asarray(as_of_dates, dtype="datetime64[D]"),
+                (n,),
+            ).copy(),
+            current_period_start=issue_dates.copy(),
+            outstanding_notional=np.broadcast_to(
+                np.asarray(notionals, dtype=float),
+                (n,),
+            ).copy(),
+        )
+
+        parts: list[CashflowColumns] = []
+        max_events = int(events.counts.max()) if n else 0
+
+        for k in range(max_events):
+            step = events.step(k)
+            future = step.subset(
+                step.event_date > state.as_of_date[step.contract]
+            )
+
+            if len(future):
+                for component in self.components:
+                    parts.extend(component.generate_batch(future, state))
+
+            self._apply_event_step(step, state)
+
+        return CashflowBatch.from_columns(parts, n_contracts=n)
+
+    def _apply_event_step(
+        self,
+        step: CashflowEventStep,
+        state: CashflowStateBatch,
+    ) -> None:
+        outstanding = state.outstanding_notional[step.contract]
+
+        outstanding = np.where(
+            ~np.isnan(step.amortization_amount),
+            outstanding - np.nan_to_num(step.amortization_amount),
+            np.where(
+                step.amortization_factor > 0,
+                outstanding - outstanding * step.amortization_factor,
+                outstanding,
+            ),
+        )
+        outstanding = np.where(
+            step.principal | step.early_redemption,
+            0.0,
+            outstanding,
+        )
+
+        state.outstanding_notional[step.contract] = outstanding
+        state.current_period_start[step.contract] = step.event_date
+
+    def _build_unit(
+        self,
+        issue_date: date,
+        events: list[CashflowEvent],
+        notional: float,
+        as_of_date: date,
+    ) -> list[Cashflow]:
+
         state = CashflowState(
             issue_date=issue_date,
             as_of_date=as_of_date,
@@ -1,6 +1,10 @@
 from datetime import date
 from typing import Protocol
 
+import numpy as np
+
+from engine_product.convention import DayCountConventionRepository
+
 
 class Indexer(Protocol):
 
@@ -9,4 +13,68 @@ class Indexer(Protocol):
         start: date,
         end: date,
     ) -> float:
-        ...
\ No newline at end of file
+        ...
+
+
+def accrual_factors(indexer, starts, ends) -> np.ndarray:
+    """
+    Fatores de accrual em lote.
+
+    Usa `indexer.accrual_factors` quando existe; caso contrário chama
+    `accrual_factor` período a período.
+    """
+    if hasattr(indexer, "accrual_factors"):
+        return np.asarray(indexer.accrual_factors(starts, ends), dtype=float)
+
+    starts = np.asarray(starts, dtype="datetime64[D]").astype(object)
+    ends = np.asarray(ends, dtype="datetime64[D]").astype(object)
+
+    return np.asarray(
+        [
+            indexer.accrual_factor(start, end)
+            for start, end in zip(starts, ends, strict=True)
+        ],
+        dtype=float,
+    )
+
+
+def accumulated_factors(curve, starts, ends) -> np.ndarray:
+    """
+    Fatores acumulados de uma curva de indexador em lote.
+
+    Usa `curve.accumulated_factors` quando existe (ex.: CumulativeIndexTable);
+    caso contrário chama `accumulated_factor` período a período.
+    """
+    if hasattr(curve, "accumulated_factors"):
+        return np.asarray(curve.accumulated_factors(starts, ends), dtype=float)
+
+    starts = np.asarray(starts, dtype="datetime64[D]").astype(object)
+    ends = np.asarray(ends, dtype="datetime64[D]").astype(object)
+
+    return np.asarray(
+        [
+            curve.accumulated_factor(start, end)
+            for start, end in zip(starts, ends, strict=True)
+        ],
+        dtype=float,
+    )
+
+
+def year_fractions_by_period(day_count, starts, ends) -> np.ndarray:
+    starts = np.asarray(starts, dtype="datetime64[D]")
+    ends = np.asarray(ends, dtype="datetime64[D]")
+
+    if isinstance(day_count, DayCountConventionRepository):
+        return day_count.year_fractions(starts, ends)
+
+    return np.asarray(
+        [
+            day_count.year_fraction(start, end)
+            for start, end in zip(
+                starts.astype(object),
+                ends.astype(object),
+                strict=True,
+            )
+        ],
+        dtype=float,
+    )
@@ -0,0 +1,189 @@
+"""
+Tabelas de fator acumulado para indexadores pós-fixados.
+
+O log do fator acumulado é pré-calculado por dia útil; qualquer fator entre
+duas datas é exp(L[fim] - L[início]), ou seja, dois acessos por índice e uma
+subtração, também para arrays de períodos.
+
+    CumulativeIndexTable   → log-fator acumulado denso por dia corrido
+    build_cdi_index_table  → taxa anual (% a.a.) do SGS, capitalizada por dia útil
+    build_ipca_index_table → variação mensal (%) do SGS, pro rata por dias úteis
+"""
+
+from __future__ import annotations
+
+from datetime import date
+
+import numpy as np
+import pandas as pd
+
+from engine_product.calendars.index import CalendarIndex, as_datetime64_days
+
+
+SGS_SELIC_SERIES_ID = 432
+SGS_IPCA_SERIES_ID = 433
+
+
+class CumulativeIndexTable:
+    """
+    Log-fator acumulado de um indexador, indexado pelo ordinal da data.
+
+    `log_increments[i]` é o log do fator do dia útil `business_dates[i]` até
+    o dia útil seguinte. A posição de cada dia corrido guarda a soma dos
+    incrementos dos dias úteis anteriores a ele; datas fora da cobertura
+    devolvem NaN. Implementa `accumulated_factor(start, end)`, o contrato
+    esperado por CDIPlusSpreadIndexer e IPCAPlusSpreadIndexer.
+    """
+
+    def __init__(self, business_dates, log_increments, coverage_end=None) -> None:
+        days = as_datetime64_days(business_dates).astype(np.int64)
+        log_increments = np.asarray(log_increments, dtype=np.float64)
+
+        if days.ndim != 1 or days.size == 0:
+            raise ValueError("business_dates must be a non-empty vector")
+        if days.shape != log_increments.shape:
+            raise ValueError("business_dates and log_increments must be aligned")
+        if (np.diff(days) <= 0).any():
+            raise ValueError("business_dates must be strictly increasing")
+        if not np.isfinite(log_increments).all():
+            raise ValueError("log_increments must be finite")
+
+        last = (
+            int(days[-1]) + 1
+            if coverage_end is None
+            else int(as_datetime64_days(coverage_end).astype(np.int64))
+        )
+        if last <= days[-1]:
+            raise ValueError("coverage_end must be after the last business date")
+
+        self._origin = int(days[0])
+        offsets = np.arange(last - self._origin + 1, dtype=np.int64)
+        cumulative = np.concatenate(([0.0], np.cumsum(log_increments)))
+
+        # Dias úteis estritamente anteriores a cada dia corrido.
+        self._log_factor = cumulative[
+            np.searchsorted(days - self._origin, offsets, side="left")
+        ]
+
+    @property
+    def first_date(self) -> np.datetime64:
+        return np.datetime64(self._origin, "D")
+
+    @property
+    def last_date(self) -> np.datetime64:
+        return np.datetime64(self._origin + self._log_factor.size - 1, "D")
+
+    def log_factors(self, dates) -> np.ndarray:
+        values = as_datetime64_days(dates)
+        offsets = np.where(
+            np.isnat(values),
+            -1,
+            values.astype(np.int64) - self._origin,
+        )
+        inside = (offsets >= 0) & (offsets < self._log_factor.size)
+
+        return np.where(
+            inside,
+            self._log_factor[np.where(inside, offsets, 0)],
+            np.nan,
+        )
+
+    def accumulated_factors(self, starts, ends) -> np.ndarray:
+        return np.exp(self.log_factors(ends) - self.log_factors(starts))
+
+    def accumulated_factor(self, start: date, end: date) -> float:
+        factor = float(self.accumulated_factors(start, end))
+
+        if np.isnan(factor):
+            raise KeyError(f"Accrual period {start} -> {end} is outside the index table")
+
+        return factor
+
+
+def _sgs_series(points: pd.DataFrame, series_id: int) -> pd.DataFrame:
+    series = points.loc[
+        points["series_id"].astype(int).eq(series_id),
+        ["ref_date", "value"],
+    ].copy()
+    series["ref_date"] = as_datetime64_days(series["ref_date"])
+    series["value"] = pd.to_numeric(series["value"], errors="coerce")
+    series = series.dropna().sort_values("ref_date", kind="stable")
+
+    if series.empty:
+        raise ValueError(f"SGS series {series_id} has no valid points")
+
+    return series
+
+
+def build_cdi_index_table(
+    points: pd.DataFrame,
+    calendar_index: CalendarIndex,
+    *,
+    series_id: int = SGS_SELIC_SERIES_ID,
+    business_days_per_year: int = 252,
+) -> CumulativeIndexTable:
+    """
+    Tabela de um indexador diário a partir de taxas anuais (% a.a.) do SGS.
+
+    Cada dia útil capitaliza (1 + taxa) ** (1 / 252) com a última taxa
+    publicada até ele (forward-fill entre publicações).
+    """
+    series = _sgs_series(points, series_id)
+    ref_dates = series["ref_date"].to_numpy("datetime64[D]")
+    business_dates = calendar_index.business_dates
+    business_dates = business_dates[
+        (business_dates >= ref_dates[0]) & (business_dates <= ref_dates[-1])
+    ]
+
+    if business_dates.size == 0:
+        raise ValueError(f"SGS series {series_id} has no points on business days")
+
+    latest = np.searchsorted(ref_dates, business_dates, side="right") - 1
+    rates = series["value"].to_numpy(dtype=np.float64)[latest] / 100.0
+
+    return CumulativeIndexTable(
+        business_dates=business_dates,
+        log_increments=np.log1p(rates) / business_days_per_year,
+    )
+
+
+def build_ipca_index_table(
+    points: pd.DataFrame,
+    calendar_index: CalendarIndex,
+    *,
+    series_id: int = SGS_IPCA_SERIES_ID,
+) -> CumulativeIndexTable:
+    """
+    Tabela de um índice de preços a partir da variação mensal (%) do SGS.
+
+    A variação do mês é distribuída pro rata pelos dias úteis do mês, de modo
+    que o fator entre o primeiro dia de dois meses é o produto das variações.
+    A cobertura vai até o primeiro dia do mês seguinte ao último publicado.
+    """
+    series = _sgs_series(points, series_id)
+    months = series["ref_date"].to_numpy("datetime64[D]").astype("datetime64[M]")
+
+    if (np.diff(months.astype(np.int64)) != 1).any():
+        raise ValueError(f"SGS series {series_id} must have one point per consecutive month")
+
+    business_dates = calendar_index.business_dates
+    business_months = business_dates.astype("datetime64[M]")
+    covered = (business_months >= months[0]) & (business_months <= months[-1])
+    business_dates = business_dates[covered]
+    month_position = (
+        business_months[covered].astype(np.int64) - months[0].astype(np.int64)
+    )
+
+    if business_dates.size == 0:
+        raise ValueError(f"SGS series {series_id} has no business days in the calendar")
+
+    business_days_in_month = np.bincount(month_position, minlength=months.size)
+    monthly_log = np.log1p(series["value"].to_numpy(dtype=np.float64) / 100.0)
+
+    return CumulativeIndexTable(
+        business_dates=business_dates,
+        log_increments=(
+            monthly_log[month_position] / business_days_in_month[month_position]
+        ),
+        coverage_end=(months[-1] + 1).astype("datetime64[D]"),
+    )
@@ -1,5 +1,8 @@
 from datetime import date
 
+import numpy as np
+
+from engine_product.cashflows.indexers.base import year_fractions_by_period
 from engine_product.convention import DayCountConventionRepository
 
 
@@ -16,6 +19,10 @@ class CompoundFixedRateIndexer:
         yf = self.day_count.year_fraction(start, end)
         return (1 + self.annual_rate) ** yf - 1
 
+    def accrual_factors(self, starts, ends) -> np.ndarray:
+        yf = year_fractions_by_period(self.day_count, starts, ends)
+        return (1 + self.annual_rate) ** yf - 1
+
 
 class PeriodicFixedCouponIndexer:
     def __init__(
@@ -33,4 +40,11 @@ class PeriodicFixedCouponIndexer:
         self.frequency = frequency
 
     def accrual_factor(self, start, end) -> float:
-        return (1.0 + self.annual_rate) ** (1.0 / self.frequency) - 1.0
\ No newline at end of file
+        return (1.0 + self.annual_rate) ** (1.0 / self.frequency) - 1.0
+
+    def accrual_factors(self, starts, ends) -> np.ndarray:
+        return np.full(
+            np.shape(ends),
+            (1.0 + self.annual_rate) ** (1.0 / self.frequency) - 1.0,
+        )
+
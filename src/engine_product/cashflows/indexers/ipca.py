@@ -1,5 +1,12 @@
 from datetime import date
 
+import numpy as np
+
+from engine_product.cashflows.indexers.base import (
+    accumulated_factors,
+    year_fractions_by_period,
+)
+
 
 class IPCAPlusSpreadIndexer:
     def __init__(
@@ -16,4 +23,14 @@ class IPCAPlusSpreadIndexer:
         inflation_factor = self.inflation_curve.accumulated_factor(start, end)
         spread_factor = self.spread * self.day_count.year_fraction(start, end)
 
-        return (inflation_factor - 1.0) + spread_factor
\ No newline at end of file
+        return (inflation_factor - 1.0) + spread_factor
+
+    def accrual_factors(self, starts, ends) -> np.ndarray:
+        inflation_factors = accumulated_factors(self.inflation_curve, starts, ends)
+        spread_factors = self.spread * year_fractions_by_period(
+            self.day_count,
+            starts,
+            ends,
+        )
+
+        return (inflation_factors - 1.0) + spread_factors
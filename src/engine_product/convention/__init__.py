@@ -1,3 +1,4 @@
 from .conventions import BU252, DayCountConventionRepository
+from .interface import year_fractions
 
-__all__ = ["BU252", "DayCountConventionRepository"]
\ No newline at end of file
+__all__ = ["BU252", "DayCountConventionRepository", "year_fractions"]
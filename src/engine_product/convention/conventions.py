@@ -1,4 +1,7 @@
 from datetime import date
+
+import numpy as np
+
 from .interface import DayCountConventionRepository
 from engine_product.calendars.business_calendar import BusinessCalendar
 
@@ -12,3 +15,12 @@ class BU252(DayCountConventionRepository):
 
     def year_fraction(self, start: date, end: date) -> float:
         return self.day_count(start, end) / 252
+
+    def day_counts(self, start, ends) -> np.ndarray:
+        return np.asarray(
+            self._calendar.business_days_between_array(start, ends),
+            dtype=np.int64,
+        )
+
+    def year_fractions(self, start, ends) -> np.ndarray:
+        return self.day_counts(start, ends) / 252
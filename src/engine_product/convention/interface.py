@@ -1,6 +1,9 @@
 from abc import ABC, abstractmethod
 from datetime import date
 
+import numpy as np
+
+
 class DayCountConventionRepository(ABC):
 
     @abstractmethod
@@ -11,4 +14,61 @@ class DayCountConventionRepository(ABC):
     @abstractmethod
     def year_fraction(self, start: date, end: date) -> float:
         """Fração de ano para precificação."""
-        ...
\ No newline at end of file
+        ...
+
+    # Operações em lote. `start` pode ser uma data ou um array alinhado a
+    # `ends`. As implementações padrão chamam os métodos escalares data a
+    # data; convenções com calendário vetorial as sobrescrevem.
+
+    def day_counts(self, start, ends) -> np.ndarray:
+        """Quantidade de dias entre start e cada data de ends."""
+        starts, ends = _broadcast_dates(start, ends)
+        return np.asarray(
+            [
+                self.day_count(s, e)
+                for s, e in zip(
+                    starts.astype(object).ravel(),
+                    ends.astype(object).ravel(),
+                    strict=True,
+                )
+            ],
+            dtype=np.int64,
+        ).reshape(ends.shape)
+
+    def year_fractions(self, start, ends) -> np.ndarray:
+        """Frações de ano entre start e cada data de ends."""
+        starts, ends = _broadcast_dates(start, ends)
+        return np.asarray(
+            [
+                self.year_fraction(s, e)
+                for s, e in zip(
+                    starts.astype(object).ravel(),
+                    ends.astype(object).ravel(),
+                    strict=True,
+                )
+            ],
+            dtype=float,
+        ).reshape(ends.shape)
+
+
+def year_fractions(day_count, start, ends) -> np.ndarray:
+    """
+    Frações de ano em lote para qualquer objeto de day count.
+
+    Usa `year_fractions` quando a convenção implementa a interface e cai para
+    `year_fraction` data a data nos demais casos (ex.: dublês de teste).
+    """
+    if isinstance(day_count, DayCountConventionRepository):
+        return np.asarray(day_count.year_fractions(start, ends), dtype=float)
+
+    return np.asarray(
+        [day_count.year_fraction(start, end) for end in ends],
+        dtype=float,
+    )
+
+
+def _broadcast_dates(start, ends) -> tuple[np.ndarray, np.ndarray]:
+    return np.broadcast_arrays(
+        np.asarray(start, dtype="datetime64[D]"),
+        np.asarray(ends, dtype="datetime64[D]"),
+    )
@@ -1,6 +1,15 @@
-from engine_product.instruments.public_bonds import LTNContract, NTNFContract
+from engine_product.instruments.public_bonds import (
+    IndexedNotional,
+    LFTContract,
+    LTNContract,
+    NTNBContract,
+    NTNFContract,
+)
 
 __all__ = [
+    "IndexedNotional",
+    "LFTContract",
     "LTNContract",
-    "NTNFContract"
-]
\ No newline at end of file
+    "NTNBContract",
+    "NTNFContract",
+]
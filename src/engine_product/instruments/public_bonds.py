@@ -1,18 +1,36 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import date
 
+import numpy as np
+
 from engine_product.convention import DayCountConventionRepository
 from engine_product.calendars.business_calendar import BusinessCalendar
+from engine_product.calendars.index import as_datetime64_days
 
-from engine_product.cashflows import CashflowEngineBuilder, CashflowEvent
+from engine_product.cashflows import (
+    CashflowBatch,
+    CashflowEngineBuilder,
+    CashflowEvent,
+    CashflowEventBatch,
+)
+from engine_product.cashflows.cache import (
+    CashflowCache,
+    DEFAULT_CASHFLOW_CACHE,
+    calendar_cache_id,
+)
+from engine_product.cashflows.engine import CashflowEngine
 from engine_product.cashflows.components.interest import InterestComponent
 from engine_product.cashflows.components.principal import PrincipalComponent
+from engine_product.cashflows.indexers.cumulative import CumulativeIndexTable
 from engine_product.cashflows.indexers.fixed import PeriodicFixedCouponIndexer
 from engine_product.cashflows.models import Cashflow
 
 from engine_product.schedules import (
+    BatchScheduleRule,
+    ScheduleBatch,
     ScheduleBuilder,
     custom_dates,
+    day_of_months,
     first_day_of_months,
     following,
 )
@@ -20,7 +38,38 @@ from engine_product.schedules import (
 
 DEFAULT_PUBLIC_BOND_NOTIONAL = 1000.0
 DEFAULT_NTNF_COUPON_RATE = 0.10
+DEFAULT_NTNB_COUPON_RATE = 0.06
 NTNF_COUPON_MONTHS = [1, 7]
+NTNB_COUPON_DAY = 15
+
+# Data-base em que o VNA de LFT e NTN-B vale o notional (R$ 1.000,00).
+LFT_VNA_BASE_DATE = date(2000, 7, 1)
+NTNB_VNA_BASE_DATE = date(2000, 7, 15)
+
+# Regras equivalentes a build_schedule, para build_schedule_batch.
+LTN_SCHEDULE_RULE = BatchScheduleRule()
+LFT_SCHEDULE_RULE = BatchScheduleRule()
+NTNF_SCHEDULE_RULE = BatchScheduleRule(
+    months=tuple(NTNF_COUPON_MONTHS),
+    include_start=True,
+)
+
+
+def ntnb_coupon_months(maturity_month: int) -> tuple[int, ...]:
+    """Meses de cupom da NTN-B: o mês do vencimento e o mês seis meses antes."""
+    if not 1 <= maturity_month <= 12:
+        raise ValueError("maturity_month must be between 1 and 12")
+
+    return tuple(sorted({maturity_month, (maturity_month + 5) % 12 + 1}))
+
+
+def ntnb_schedule_rule(maturity_month: int) -> BatchScheduleRule:
+    """Regra equivalente a NTNBContract.build_schedule para o mês de vencimento."""
+    return BatchScheduleRule(
+        months=ntnb_coupon_months(maturity_month),
+        include_start=True,
+        day=NTNB_COUPON_DAY,
+    )
 
 @dataclass(frozen=True)
 class LTNContract:
@@ -28,6 +77,22 @@ class LTNContract:
     maturity_date: date
     calendar: BusinessCalendar
     notional: float = DEFAULT_PUBLIC_BOND_NOTIONAL
+    cashflow_cache: CashflowCache | None = field(
+        default=DEFAULT_CASHFLOW_CACHE,
+        compare=False,
+        repr=False,
+    )
+
+    @property
+    def cache_key(self) -> tuple:
+        return (
+            "LTN",
+            self.start_date,
+            self.maturity_date,
+            self.notional,
+            None,
+            calendar_cache_id(self.calendar),
+        )
 
     def build_schedule(self) -> list[date]:
         return (
@@ -42,8 +107,9 @@ class LTNContract:
             .build()
         )
 
-    def build_events(self) -> list[CashflowEvent]:
-        schedule = self.build_schedule()
+    def build_events(self, schedule: list[date] | None = None) -> list[CashflowEvent]:
+        if schedule is None:
+            schedule = self.build_schedule()
 
         return [
             CashflowEvent(
@@ -53,18 +119,50 @@ class LTNContract:
             )
         ]
 
-    def build_cashflows(self, as_of_date: date) -> list[Cashflow]:
+    def build_cashflows(
+        self,
+        as_of_date: date,
+        schedule: list[date] | None = None,
+    ) -> list[Cashflow]:
+        if schedule is None and self.cashflow_cache is not None:
+            return self.cashflow_cache.get_cashflows(
+                self.cache_key,
+                as_of_date,
+                self._build_cashflows,
+            )
+
+        return self._build_cashflows(as_of_date, schedule)
+
+    def _build_cashflows(
+        self,
+        as_of_date: date,
+        schedule: list[date] | None = None,
+    ) -> list[Cashflow]:
         return (
             CashflowEngineBuilder(
                 issue_date=self.start_date,
                 notional=self.notional,
-                events=self.build_events(),
+                events=self.build_events(schedule),
             )
             .add_component(PrincipalComponent())
             .build_cashflows(as_of_date=as_of_date)
         )
 
 
+@dataclass(frozen=True)
+class LFTContract(LTNContract):
+    """
+    LFT: principal único no vencimento, como a LTN.
+
+    Os valores estão em unidades do VNA na data-base (notional); o preço em
+    reais é o fluxo vezes VNA(ref_date) / notional, ver IndexedNotional.
+    """
+
+    @property
+    def cache_key(self) -> tuple:
+        return ("LFT",) + super().cache_key[1:]
+
+
 @dataclass(frozen=True)
 class NTNFContract:
     start_date: date
@@ -73,6 +171,22 @@ class NTNFContract:
     day_count: DayCountConventionRepository
     notional: float = DEFAULT_PUBLIC_BOND_NOTIONAL
     coupon_rate: float = DEFAULT_NTNF_COUPON_RATE
+    cashflow_cache: CashflowCache | None = field(
+        default=DEFAULT_CASHFLOW_CACHE,
+        compare=False,
+        repr=False,
+    )
+
+    @property
+    def cache_key(self) -> tuple:
+        return (
+            "NTN-F",
+            self.start_date,
+            self.maturity_date,
+            self.notional,
+            self.coupon_rate,
+            calendar_cache_id(self.calendar),
+        )
 
     def build_schedule(self) -> list[date]:
         return (
@@ -88,8 +202,9 @@ class NTNFContract:
             .build()
         )
 
-    def build_events(self) -> list[CashflowEvent]:
-        schedule = self.build_schedule()
+    def build_events(self, schedule: list[date] | None = None) -> list[CashflowEvent]:
+        if schedule is None:
+            schedule = self.build_schedule()
 
         return [
             CashflowEvent(
@@ -100,7 +215,25 @@ class NTNFContract:
             for payment_date in schedule[1:]
         ]
 
-    def build_cashflows(self, as_of_date: date) -> list[Cashflow]:
+    def build_cashflows(
+        self,
+        as_of_date: date,
+        schedule: list[date] | None = None,
+    ) -> list[Cashflow]:
+        if schedule is None and self.cashflow_cache is not None:
+            return self.cashflow_cache.get_cashflows(
+                self.cache_key,
+                as_of_date,
+                self._build_cashflows,
+            )
+
+        return self._build_cashflows(as_of_date, schedule)
+
+    def _build_cashflows(
+        self,
+        as_of_date: date,
+        schedule: list[date] | None = None,
+    ) -> list[Cashflow]:
         indexer = PeriodicFixedCouponIndexer(
             annual_rate=self.coupon_rate,
             frequency=2,
@@ -110,9 +243,180 @@ class NTNFContract:
             CashflowEngineBuilder(
                 issue_date=self.start_date,
                 notional=self.notional,
-                events=self.build_events(),
+                events=self.build_events(schedule),
             )
             .add_component(InterestComponent(indexer=indexer))
             .add_component(PrincipalComponent())
             .build_cashflows(as_of_date=as_of_date)
-        )
\ No newline at end of file
+        )
+
+
+@dataclass(frozen=True)
+class NTNBContract(NTNFContract):
+    """
+    NTN-B: cupons semestrais de 6% a.a. no dia 15 do mês do vencimento e do
+    mês seis meses antes, e principal no vencimento.
+
+    Como na LFT, os valores estão em unidades do VNA na data-base.
+    """
+
+    coupon_rate: float = DEFAULT_NTNB_COUPON_RATE
+
+    @property
+    def cache_key(self) -> tuple:
+        return ("NTN-B",) + super().cache_key[1:]
+
+    def build_schedule(self) -> list[date]:
+        return (
+            ScheduleBuilder()
+            .seed(
+                rule=day_of_months(
+                    months=ntnb_coupon_months(self.maturity_date.month),
+                    day=NTNB_COUPON_DAY,
+                ),
+                start=self.start_date,
+                maturity=self.maturity_date,
+            )
+            .add_dates(self.start_date, self.maturity_date)
+            .adjust(following(self.calendar))
+            .normalize()
+            .build()
+        )
+
+
+@dataclass(frozen=True)
+class IndexedNotional:
+    """
+    Valor nominal atualizado (VNA) de um título pós-fixado.
+
+    O VNA vale `anchor_value` em `anchor_date` e varia pelo fator acumulado
+    da tabela do indexador; as consultas são vetoriais sobre a tabela.
+    """
+
+    index_table: CumulativeIndexTable
+    anchor_date: date
+    anchor_value: float = DEFAULT_PUBLIC_BOND_NOTIONAL
+
+    def values(self, ref_dates) -> np.ndarray:
+        """VNA em cada data; NaN fora da cobertura da tabela."""
+        ref_dates = as_datetime64_days(ref_dates).reshape(-1)
+        anchors = np.full(ref_dates.shape, np.datetime64(self.anchor_date, "D"))
+
+        return self.anchor_value * self.index_table.accumulated_factors(
+            anchors,
+            ref_dates,
+        )
+
+    def notional_factors(
+        self,
+        ref_dates,
+        notional: float = DEFAULT_PUBLIC_BOND_NOTIONAL,
+    ) -> np.ndarray:
+        """VNA / notional: converte fluxos do contrato em reais na data."""
+        return self.values(ref_dates) / notional
+
+
+def build_ltn_cashflow_batch(
+    schedules: ScheduleBatch,
+    issue_dates,
+    as_of_dates,
+    notional: float = DEFAULT_PUBLIC_BOND_NOTIONAL,
+) -> CashflowBatch:
+    """
+    Cashflows de várias LTN a partir de schedules em lote.
+
+    Equivale a LTNContract.build_cashflows contrato a contrato.
+    """
+    n = len(schedules)
+    events = CashflowEventBatch.from_arrays(
+        offsets=np.arange(n + 1, dtype=np.int64),
+        event_date=schedules.dates[schedules.offsets[1:] - 1],
+        interest=False,
+        principal=True,
+    )
+
+    return CashflowEngine(components=[PrincipalComponent()]).build_batch(
+        issue_dates=issue_dates,
+        events=events,
+        notionals=notional,
+        as_of_dates=as_of_dates,
+    )
+
+
+def build_ntnf_cashflow_batch(
+    schedules: ScheduleBatch,
+    issue_dates,
+    as_of_dates,
+    notional: float = DEFAULT_PUBLIC_BOND_NOTIONAL,
+    coupon_rate: float = DEFAULT_NTNF_COUPON_RATE,
+) -> CashflowBatch:
+    """
+    Cashflows de várias NTN-F a partir de schedules em lote.
+
+    Equivale a NTNFContract.build_cashflows contrato a contrato: o primeiro
+    ponto do schedule é o início do accrual e o último paga o principal.
+    """
+    n = len(schedules)
+    position = np.arange(len(schedules.dates)) - schedules.offsets[schedules.owner]
+    is_event = position > 0
+    is_last = np.zeros(len(schedules.dates), dtype=bool)
+    is_last[schedules.offsets[1:][schedules.counts > 0] - 1] = True
+
+    offsets = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(np.maximum(schedules.counts - 1, 0), out=offsets[1:])
+
+    events = CashflowEventBatch.from_arrays(
+        offsets=offsets,
+        event_date=schedules.dates[is_event],
+        interest=True,
+        principal=is_last[is_event],
+    )
+    indexer = PeriodicFixedCouponIndexer(
+        annual_rate=coupon_rate,
+        frequency=2,
+    )
+
+    return CashflowEngine(
+        components=[InterestComponent(indexer=indexer), PrincipalComponent()]
+    ).build_batch(
+        issue_dates=issue_dates,
+        events=events,
+        notionals=notional,
+        as_of_dates=as_of_dates,
+    )
+
+
+def build_lft_cashflow_batch(
+    schedules: ScheduleBatch,
+    issue_dates,
+    as_of_dates,
+    notional: float = DEFAULT_PUBLIC_BOND_NOTIONAL,
+) -> CashflowBatch:
+    """
+    Cashflows de várias LFT a partir de schedules em lote.
+
+    Equivale a LFTContract.build_cashflows contrato a contrato.
+    """
+    return build_ltn_cashflow_batch(schedules, issue_dates, as_of_dates, notional)
+
+
+def build_ntnb_cashflow_batch(
+    schedules: ScheduleBatch,
+    issue_dates,
+    as_of_dates,
+    notional: float = DEFAULT_PUBLIC_BOND_NOTIONAL,
+    coupon_rate: float = DEFAULT_NTNB_COUPON_RATE,
+) -> CashflowBatch:
+    """
+    Cashflows de várias NTN-B a partir de schedules em lote.
+
+    Equivale a NTNBContract.build_cashflows contrato a contrato; os
+    schedules vêm de ntnb_schedule_rule.
+    """
+    return build_ntnf_cashflow_batch(
+        schedules,
+        issue_dates,
+        as_of_dates,
+        notional=notional,
+        coupon_rate=coupon_rate,
+    )
@@ -12,8 +12,11 @@ from engine_product.pricing.yield_solvers import (
 )
 
 from engine_product.pricing.yield_solvers_batch import (
+    BatchBracketConfig,
     BatchNewtonConfig,
     BatchYieldSolver,
+    RaggedCashflows,
+    RaggedYieldSolution,
     YieldSolverBatchResult,
 )
 
@@ -26,6 +29,13 @@ from engine_product.pricing.cashflow_arrays import (
     macaulay_duration_from_time_amount_pairs,
     price_from_time_amount_pairs,
 )
+from engine_product.pricing.cashflow_store import CashflowSlices, CashflowStore
+from engine_product.pricing.curves import (
+    CashflowMatrix,
+    DiscountCurve,
+    LogLinearDiscountCurve,
+    reprice_bonds,
+)
 
 __all__ = [
     "YieldProblem",
@@ -45,7 +55,16 @@ __all__ = [
     "build_cashflow_schedule_lookup",
     "macaulay_duration_from_time_amount_pairs",
     "price_from_time_amount_pairs",
+    "CashflowSlices",
+    "CashflowStore",
+    "CashflowMatrix",
+    "DiscountCurve",
+    "LogLinearDiscountCurve",
+    "reprice_bonds",
+    "BatchBracketConfig",
     "BatchNewtonConfig",
     "BatchYieldSolver",
+    "RaggedCashflows",
+    "RaggedYieldSolution",
     "YieldSolverBatchResult",
 ]
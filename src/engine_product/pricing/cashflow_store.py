@@ -0,0 +1,323 @@
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterable
+
+import numpy as np
+import pandas as pd
+
+from engine_product.pricing.cashflow_arrays import CashflowScheduleArrays
+from engine_product.pricing.yield_solvers_batch import RaggedCashflows
+
+
+_MAGIC = b"CFSTORE1"
+_ALIGNMENT = 64
+_ARRAYS = ("isins", "offsets", "payment_bd_index", "amount", "search_keys")
+
+
+@dataclass(frozen=True)
+class CashflowSlices:
+    """
+    Future cashflows of many (isin, ref_bd_index) queries in CSR layout.
+
+    Query i owns `tenor_bd[offsets[i]:offsets[i + 1]]` and the matching
+    `amount`; `found` is False for ISINs missing from the store.
+    """
+
+    offsets: np.ndarray
+    tenor_bd: np.ndarray
+    amount: np.ndarray
+    found: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    @property
+    def counts(self) -> np.ndarray:
+        return np.diff(self.offsets)
+
+    def row(self, index: int) -> tuple[np.ndarray, np.ndarray]:
+        start, end = self.offsets[index], self.offsets[index + 1]
+        return self.tenor_bd[start:end], self.amount[start:end]
+
+    def time_amount_pairs(
+        self,
+        index: int,
+        business_days_per_year: float = 252.0,
+    ) -> tuple[tuple[float, float], ...]:
+        tenor_bd, amounts = self.row(index)
+
+        return tuple(
+            (float(t), float(amount))
+            for t, amount in zip(
+                tenor_bd / business_days_per_year,
+                amounts,
+                strict=True,
+            )
+        )
+
+    def to_ragged_cashflows(
+        self,
+        business_days_per_year: float = 252.0,
+    ) -> RaggedCashflows:
+        return RaggedCashflows(
+            offsets=self.offsets,
+            times=self.tenor_bd / business_days_per_year,
+            amounts=self.amount,
+        )
+
+
+@dataclass(frozen=True)
+class CashflowStore:
+    """
+    Contiguous CSR index of pricing cashflows for every ISIN.
+
+    ISINs are sorted, so an ISIN code is its position in `isins`. ISIN code c
+    owns `payment_bd_index[offsets[c]:offsets[c + 1]]`, sorted and with
+    amounts on the same payment business day aggregated, as in
+    CashflowScheduleArrays.
+
+    `search_keys` is the sorted key that `future_slices` searches. It is
+    computed when omitted; `load` reads it from the file, so memory-mapped
+    stores share it across processes instead of rebuilding it in each one.
+    """
+
+    isins: np.ndarray
+    offsets: np.ndarray
+    payment_bd_index: np.ndarray
+    amount: np.ndarray
+    search_keys: np.ndarray | None = field(default=None, repr=False, compare=False)
+    _bd_origin: int = field(init=False, repr=False)
+    _bd_span: int = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        if len(self.offsets) != len(self.isins) + 1:
+            raise ValueError("offsets must have one entry per ISIN plus one")
+
+        if self.offsets[-1] != len(self.payment_bd_index):
+            raise ValueError("offsets must cover payment_bd_index and amount")
+
+        if len(self.payment_bd_index) != len(self.amount):
+            raise ValueError("payment_bd_index and amount must have the same length")
+
+        payment_bd_index = self.payment_bd_index
+        origin = int(payment_bd_index.min()) if payment_bd_index.size else 0
+        span = (int(payment_bd_index.max()) - origin + 2) if payment_bd_index.size else 2
+
+        if self.search_keys is None:
+            owner = np.repeat(
+                np.arange(len(self.isins), dtype=np.int64),
+                np.diff(self.offsets),
+            )
+
+            # Chave global ordenada: segmento do ISIN * span + dia útil relativo.
+            object.__setattr__(
+                self,
+                "search_keys",
+                owner * span + np.asarray(payment_bd_index, dtype=np.int64) - origin,
+            )
+        elif len(self.search_keys) != len(payment_bd_index):
+            raise ValueError("search_keys must have one entry per cashflow")
+
+        object.__setattr__(self, "_bd_origin", origin)
+        object.__setattr__(self, "_bd_span", span)
+
+    def __len__(self) -> int:
+        return len(self.isins)
+
+    @property
+    def n_cashflows(self) -> int:
+        return len(self.payment_bd_index)
+
+    @classmethod
+    def from_cashflow_dimension(cls, cashflow_dimension: pd.DataFrame) -> CashflowStore:
+        required_columns = {"isin", "payment_bd_index", "amount"}
+        missing_columns = required_columns - set(cashflow_dimension.columns)
+
+        if missing_columns:
+            raise ValueError(
+                "cashflow_dimension is missing required columns: "
+                f"{sorted(missing_columns)}"
+            )
+
+        isin = cashflow_dimension["isin"].astype(str).to_numpy(dtype=str)
+        payment_bd_index = cashflow_dimension["payment_bd_index"].to_numpy(dtype=np.int64)
+        amount = cashflow_dimension["amount"].to_numpy(dtype=float)
+
+        isins, isin_code = np.unique(isin, return_inverse=True)
+        order = np.lexsort((payment_bd_index, isin_code))
+        isin_code = isin_code[order]
+        payment_bd_index = payment_bd_index[order]
+        amount = amount[order]
+
+        first = np.ones(len(order), dtype=bool)
+        first[1:] = (isin_code[1:] != isin_code[:-1]) | (
+            payment_bd_index[1:] != payment_bd_index[:-1]
+        )
+        starts = np.flatnonzero(first)
+
+        offsets = np.zeros(len(isins) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(isin_code[starts], minlength=len(isins)), out=offsets[1:])
+
+        return cls(
+            isins=isins,
+            offsets=offsets,
+            payment_bd_index=payment_bd_index[starts],
+            amount=np.add.reduceat(amount, starts) if len(starts) else amount,
+        )
+
+    def isin_codes(self, isins: Iterable[str]) -> np.ndarray:
+        """ISIN codes for `isins`, -1 where the ISIN is not in the store."""
+
+        query = np.asarray([str(isin) for isin in isins], dtype=str)
+
+        if not len(self.isins):
+            return np.full(len(query), -1, dtype=np.int64)
+
+        codes = np.searchsorted(self.isins, query)
+        codes = np.minimum(codes, len(self.isins) - 1)
+
+        return np.where(self.isins[codes] == query, codes, -1).astype(np.int64)
+
+    def schedule(self, isin: str) -> CashflowScheduleArrays | None:
+        """Per-ISIN CashflowScheduleArrays view, or None if missing."""
+
+        code = int(self.isin_codes([isin])[0])
+
+        if code < 0:
+            return None
+
+        start, end = self.offsets[code], self.offsets[code + 1]
+
+        return CashflowScheduleArrays(
+            payment_bd_index=np.asarray(self.payment_bd_index[start:end]),
+            amount=np.asarray(self.amount[start:end]),
+        )
+
+    def future_slices(self, isin_codes, ref_bd_indexes) -> CashflowSlices:
+        """
+        Future cashflows (payment_bd_index > ref_bd_index) of every query.
+
+        One `searchsorted` over the whole store finds where each query's
+        future cashflows start, so a day or the whole history is sliced at
+        once. Tenors are returned in business days from the ref_bd_index.
+        """
+        codes = np.asarray(isin_codes, dtype=np.int64).reshape(-1)
+        ref_bd = np.broadcast_to(
+            np.asarray(ref_bd_indexes, dtype=np.int64),
+            codes.shape,
+        )
+
+        if not len(self.isins):
+            return CashflowSlices(
+                offsets=np.zeros(len(codes) + 1, dtype=np.int64),
+                tenor_bd=np.empty(0, dtype=np.int64),
+                amount=np.empty(0, dtype=float),
+                found=np.zeros(len(codes), dtype=bool),
+            )
+
+        found = codes >= 0
+        safe_codes = np.where(found, codes, 0)
+
+        relative = np.clip(ref_bd - self._bd_origin, -1, self._bd_span - 1)
+        start = np.searchsorted(
+            self.search_keys,
+            safe_codes * self._bd_span + relative,
+            side="right",
+        )
+        end = np.asarray(self.offsets[safe_codes + 1])
+        start = np.clip(start, self.offsets[safe_codes], end)
+        counts = np.where(found, end - start, 0)
+
+        offsets = np.zeros(len(codes) + 1, dtype=np.int64)
+        np.cumsum(counts, out=offsets[1:])
+
+        owner = np.repeat(np.arange(len(codes)), counts)
+        flat = start[owner] + (np.arange(offsets[-1]) - offsets[:-1][owner])
+
+        return CashflowSlices(
+            offsets=offsets,
+            tenor_bd=np.asarray(self.payment_bd_index[flat], dtype=np.int64) - ref_bd[owner],
+            amount=np.asarray(self.amount[flat], dtype=float),
+            found=found,
+        )
+
+    def save(self, path: str | Path) -> None:
+        """
+        Write the store to one file: a JSON header followed by the raw,
+        64-byte aligned arrays, so `load` can memory-map them.
+        """
+        arrays = {
+            "isins": np.ascontiguousarray(self.isins, dtype=str),
+            "offsets": np.ascontiguousarray(self.offsets, dtype=np.int64),
+            "payment_bd_index": np.ascontiguousarray(self.payment_bd_index, dtype=np.int64),
+            "amount": np.ascontiguousarray(self.amount, dtype=np.float64),
+            "search_keys": np.ascontiguousarray(self.search_keys, dtype=np.int64),
+        }
+
+        layout = {}
+        position = 0
+
+        for name in _ARRAYS:
+            array = arrays[name]
+            position = -(-position // _ALIGNMENT) * _ALIGNMENT
+            layout[name] = {
+                "dtype": array.dtype.str,
+                "shape": list(array.shape),
+                "offset": position,
+            }
+            position += array.nbytes
+
+        header = json.dumps(layout).encode("utf-8")
+        data_start = -(-(len(_MAGIC) + 8 + len(header)) // _ALIGNMENT) * _ALIGNMENT
+
+        with open(path, "wb") as file:
+            file.write(_MAGIC)
+            file.write(len(header).to_bytes(8, "little"))
+            file.write(header)
+
+            for name in _ARRAYS:
+                file.seek(data_start + layout[name]["offset"])
+                file.write(arrays[name].tobytes())
+
+    @classmethod
+    def load(cls, path: str | Path, mmap: bool = True) -> CashflowStore:
+        with open(path, "rb") as file:
+            if file.read(len(_MAGIC)) != _MAGIC:
+                raise ValueError(f"{path} is not a CashflowStore file")
+
+            header_size = int.from_bytes(file.read(8), "little")
+            layout = json.loads(file.read(header_size).decode("utf-8"))
+
+        data_start = -(-(len(_MAGIC) + 8 + header_size) // _ALIGNMENT) * _ALIGNMENT
+        arrays = {}
+
+        for name in _ARRAYS:
+            if name not in layout:
+                continue
+
+            spec = layout[name]
+            shape = tuple(spec["shape"])
+            dtype = np.dtype(spec["dtype"])
+
+            if not np.prod(shape):
+                arrays[name] = np.empty(shape, dtype=dtype)
+            elif mmap:
+                arrays[name] = np.memmap(
+                    path,
+                    dtype=dtype,
+                    mode="r",
+                    offset=data_start + spec["offset"],
+                    shape=shape,
+                )
+            else:
+                arrays[name] = np.fromfile(
+                    path,
+                    dtype=dtype,
+                    count=int(np.prod(shape)),
+                    offset=data_start + spec["offset"],
+                ).reshape(shape)
+
+        return cls(**arrays)
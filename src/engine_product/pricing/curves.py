@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Protocol, Sequence, runtime_checkable
+
+import numpy as np
+
+from engine_product.pricing.cashflow_store import CashflowSlices
+
+
+@runtime_checkable
+class DiscountCurve(Protocol):
+    """
+    Common pricing view of a fitted curve, whatever methodology produced it.
+
+    `discount_factors` receives a 1-D array of strictly positive BU/252
+    tenors in business days and returns one discount factor per tenor.
+    """
+
+    def discount_factors(self, tenor_bd: Sequence[int] | np.ndarray) -> np.ndarray:
+        ...
+
+
+@dataclass(frozen=True)
+class LogLinearDiscountCurve:
+    """
+    Discount curve that is linear in log discount factor between nodes.
+
+    The curve is anchored at (0, 0) and the last segment's constant forward
+    is extrapolated, as in the bootstrapped and flat-forward curve grids.
+    """
+
+    node_tenor_bd: np.ndarray
+    node_log_discount: np.ndarray
+    _slopes: np.ndarray = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        tenors = np.asarray(self.node_tenor_bd, dtype=np.float64)
+        logs = np.asarray(self.node_log_discount, dtype=np.float64)
+
+        if tenors.ndim != 1 or tenors.shape != logs.shape:
+            raise ValueError("node_tenor_bd and node_log_discount must be aligned vectors")
+        if not np.isfinite(tenors).all() or not np.isfinite(logs).all():
+            raise ValueError("curve nodes must be finite")
+
+        if tenors.size == 0 or tenors[0] != 0.0:
+            tenors = np.concatenate(([0.0], tenors))
+            logs = np.concatenate(([0.0], logs))
+
+        if tenors.size < 2:
+            raise ValueError("curve requires at least one positive node")
+        if (np.diff(tenors) <= 0.0).any():
+            raise ValueError("node_tenor_bd must be strictly increasing and positive")
+
+        object.__setattr__(self, "node_tenor_bd", tenors)
+        object.__setattr__(self, "node_log_discount", logs)
+        object.__setattr__(self, "_slopes", np.diff(logs) / np.diff(tenors))
+
+    @classmethod
+    def from_discount_factors(
+        cls,
+        tenor_bd: Sequence[int] | np.ndarray,
+        discount_factor: Sequence[float] | np.ndarray,
+    ) -> LogLinearDiscountCurve:
+        """Wrap a materialized (tenor_bd, discount_factor) grid."""
+
+        discount_factor = np.asarray(discount_factor, dtype=np.float64)
+
+        if (discount_factor <= 0.0).any():
+            raise ValueError("discount factors must be strictly positive")
+
+        return cls(
+            node_tenor_bd=np.asarray(tenor_bd, dtype=np.float64),
+            node_log_discount=np.log(discount_factor),
+        )
+
+    def discount_factors(self, tenor_bd: Sequence[int] | np.ndarray) -> np.ndarray:
+        tenors = np.asarray(tenor_bd, dtype=np.float64)
+        segments = np.minimum(
+            np.searchsorted(self.node_tenor_bd[1:], tenors, side="left"),
+            self._slopes.size - 1,
+        )
+        log_discounts = self.node_log_discount[segments] + self._slopes[segments] * (
+            tenors - self.node_tenor_bd[segments]
+        )
+        return np.exp(log_discounts)
+
+
+@dataclass(frozen=True)
+class CashflowMatrix:
+    """
+    Bonds x cashflow-tenor amount matrix for repricing against any curve.
+
+    Column j holds every bond's aggregated amount paid `tenor_bd[j]` business
+    days ahead, so pricing is `amounts @ discount_factors(tenor_bd)` and many
+    curves price in one matmul against a (tenors x curves) matrix.
+    """
+
+    tenor_bd: np.ndarray
+    amounts: np.ndarray
+
+    def __post_init__(self) -> None:
+        tenor_bd = np.asarray(self.tenor_bd, dtype=np.int64)
+        amounts = np.asarray(self.amounts, dtype=np.float64)
+
+        if tenor_bd.ndim != 1 or amounts.ndim != 2 or amounts.shape[1] != tenor_bd.size:
+            raise ValueError("amounts must have one column per tenor_bd")
+        if (tenor_bd <= 0).any():
+            raise ValueError("tenor_bd must be strictly positive")
+
+        object.__setattr__(self, "tenor_bd", tenor_bd)
+        object.__setattr__(self, "amounts", amounts)
+
+    def __len__(self) -> int:
+        return self.amounts.shape[0]
+
+    @classmethod
+    def from_slices(cls, slices: CashflowSlices) -> CashflowMatrix:
+        """Scatter CSR cashflow slices into the dense amount matrix."""
+
+        tenor_bd, column = np.unique(slices.tenor_bd, return_inverse=True)
+        owner = np.repeat(np.arange(len(slices)), slices.counts)
+        amounts = np.zeros((len(slices), tenor_bd.size), dtype=np.float64)
+        np.add.at(amounts, (owner, column), slices.amount)
+
+        return cls(tenor_bd=tenor_bd, amounts=amounts)
+
+    def discount_factor_matrix(self, curves: Sequence[DiscountCurve]) -> np.ndarray:
+        if self.tenor_bd.size == 0:
+            return np.empty((0, len(curves)), dtype=np.float64)
+
+        return np.column_stack(
+            [
+                np.asarray(curve.discount_factors(self.tenor_bd), dtype=np.float64)
+                for curve in curves
+            ]
+        ).reshape(self.tenor_bd.size, len(curves))
+
+    def price(self, curve: DiscountCurve) -> np.ndarray:
+        return self.price_many([curve])[:, 0]
+
+    def price_many(self, curves: Sequence[DiscountCurve]) -> np.ndarray:
+        """(bonds x curves) prices from a single matmul."""
+
+        return self.amounts @ self.discount_factor_matrix(curves)
+
+
+def reprice_bonds(
+    cashflows: CashflowMatrix | CashflowSlices,
+    curves: DiscountCurve | Sequence[DiscountCurve],
+) -> np.ndarray:
+    """
+    Reprice a bond universe against one curve (bonds,) or many (bonds x curves).
+    """
+    if isinstance(cashflows, CashflowSlices):
+        cashflows = CashflowMatrix.from_slices(cashflows)
+
+    if isinstance(curves, DiscountCurve):
+        return cashflows.price(curves)
+
+    return cashflows.price_many(list(curves))
@@ -3,7 +3,7 @@ from datetime import date
 from typing import Iterable
 
 from engine_product.cashflows.models import Cashflow
-from engine_product.convention import DayCountConventionRepository
+from engine_product.convention import DayCountConventionRepository, year_fractions
 
 
 @dataclass(frozen=True)
@@ -27,13 +27,16 @@ class YieldProblem:
         if not future_cashflows:
             raise ValueError("cashflows must contain at least one future cashflow")
 
+        times = year_fractions(
+            self.day_count,
+            self.settlement_date,
+            [cf.payment_date for cf in future_cashflows],
+        )
+
         time_amount_pairs = tuple(
-            (t, cf.amount)
-            for cf in future_cashflows
-            if (t := self.day_count.year_fraction(
-                self.settlement_date,
-                cf.payment_date,
-            )) > 0
+            (float(t), cf.amount)
+            for t, cf in zip(times, future_cashflows, strict=True)
+            if t > 0
         )
 
         if not time_amount_pairs:
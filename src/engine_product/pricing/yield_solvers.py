@@ -12,6 +12,7 @@ class YieldSolverMethod(str, Enum):
     ZERO_COUPON = "ZERO_COUPON"
     NEWTON = "NEWTON"
     NEWTON_BATCH = "NEWTON_BATCH"
+    BISECTION_BATCH = "BISECTION_BATCH"
     BRENT = "BRENT"
     BRENT_EXPANDED = "BRENT_EXPANDED"
 
@@ -221,6 +222,7 @@ def yield_to_maturity(
 def yield_to_maturity_batch(
     problems: Iterable[YieldProblem],
     solver: object | None = None,
+    initial_guesses: Iterable[float | None] | None = None,
 ):
     """
     Public batch entrypoint.
@@ -232,5 +234,9 @@ def yield_to_maturity_batch(
     from engine_product.pricing.yield_solvers_batch import BatchYieldSolver
 
     batch_solver = solver or BatchYieldSolver()
-    return batch_solver.solve_many(problems)
+
+    if initial_guesses is None:
+        return batch_solver.solve_many(problems)
+
+    return batch_solver.solve_many(problems, initial_guesses=list(initial_guesses))
 
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Iterable
+from dataclasses import dataclass, field
+from typing import Iterable, Sequence
 
 import numpy as np
 
@@ -37,47 +37,364 @@ class BatchNewtonConfig:
     min_abs_derivative: float = 1e-14
 
 
+@dataclass(frozen=True)
+class BatchBracketConfig:
+    """
+    Vectorized safeguarded bisection for problems Newton did not solve.
+
+    Mirrors ExpandedBrentYieldSolver: the upper bound grows from
+    `initial_upper` up to `max_upper` until the root is bracketed.
+    """
+
+    lower: float = -0.95
+    initial_upper: float = 1.50
+    max_upper: float = 10.0
+    expansion_factor: float = 2.0
+    xtol: float = 1e-12
+    rtol: float = 1e-12
+    maxiter: int = 100
+
+
+@dataclass(frozen=True)
+class RaggedCashflows:
+    """
+    Cashflows of many problems in flat arrays.
+
+    Problem i owns `times[offsets[i]:offsets[i + 1]]` and the matching
+    `amounts`.
+    """
+
+    offsets: np.ndarray
+    times: np.ndarray
+    amounts: np.ndarray
+    _owner: np.ndarray = field(init=False, repr=False)
+
+    def __post_init__(self):
+        offsets = np.asarray(self.offsets, dtype=np.int64)
+        times = np.asarray(self.times, dtype=float)
+        amounts = np.asarray(self.amounts, dtype=float)
+
+        if times.shape != amounts.shape or offsets[-1] != times.size:
+            raise ValueError("offsets must cover flat times and amounts")
+
+        object.__setattr__(self, "offsets", offsets)
+        object.__setattr__(self, "times", times)
+        object.__setattr__(self, "amounts", amounts)
+        object.__setattr__(
+            self,
+            "_owner",
+            np.repeat(np.arange(len(offsets) - 1), np.diff(offsets)),
+        )
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    @property
+    def owner(self) -> np.ndarray:
+        return self._owner
+
+    @classmethod
+    def from_problems(cls, problems: Iterable[YieldProblem]) -> RaggedCashflows:
+        pairs = [problem.time_amount_pairs for problem in problems]
+        offsets = np.zeros(len(pairs) + 1, dtype=np.int64)
+        np.cumsum([len(items) for items in pairs], out=offsets[1:])
+
+        flat = np.asarray(
+            [pair for items in pairs for pair in items],
+            dtype=float,
+        ).reshape(-1, 2)
+
+        return cls(offsets=offsets, times=flat[:, 0], amounts=flat[:, 1])
+
+    def take(self, positions) -> RaggedCashflows:
+        """Problems at `positions`, in that order, as a new ragged batch."""
+
+        positions = np.asarray(positions, dtype=np.int64)
+        starts = self.offsets[positions]
+        counts = self.offsets[positions + 1] - starts
+
+        offsets = np.zeros(len(positions) + 1, dtype=np.int64)
+        np.cumsum(counts, out=offsets[1:])
+        rows = np.repeat(starts - offsets[:-1], counts) + np.arange(offsets[-1])
+
+        return RaggedCashflows(
+            offsets=offsets,
+            times=self.times[rows],
+            amounts=self.amounts[rows],
+        )
+
+    def time_amount_pairs(self, index: int) -> tuple[tuple[float, float], ...]:
+        start, end = self.offsets[index], self.offsets[index + 1]
+
+        return tuple(
+            (float(t), float(amount))
+            for t, amount in zip(self.times[start:end], self.amounts[start:end])
+        )
+
+    def price(self, ytm: np.ndarray, mask: np.ndarray) -> np.ndarray:
+        """Model price for problems where `mask` is True (zero elsewhere)."""
+
+        rows = mask[self.owner]
+        base = 1.0 + ytm[self.owner[rows]]
+        pv = self.amounts[rows] / np.power(base, self.times[rows])
+
+        return np.bincount(self.owner[rows], weights=pv, minlength=len(self))
+
+    def price_and_derivative(
+        self,
+        ytm: np.ndarray,
+        mask: np.ndarray,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        rows = mask[self.owner]
+        owner = self.owner[rows]
+        times = self.times[rows]
+        base = 1.0 + ytm[owner]
+        pv = self.amounts[rows] / np.power(base, times)
+
+        return (
+            np.bincount(owner, weights=pv, minlength=len(self)),
+            np.bincount(owner, weights=-times * pv / base, minlength=len(self)),
+        )
+
+
+@dataclass(frozen=True)
+class RaggedYieldSolution:
+    """
+    Yields solved in arrays; `method` is None where no stage converged.
+
+    `error_type`/`error_message`, when filled by `solve_ragged`, explain
+    each unsolved problem as YieldSolverBatchResult would.
+    """
+
+    ytm: np.ndarray
+    iterations: np.ndarray
+    method: list[YieldSolverMethod | None]
+    error_type: list[str | None] | None = None
+    error_message: list[str | None] | None = None
+
+    @property
+    def solved(self) -> np.ndarray:
+        return np.asarray([method is not None for method in self.method], dtype=bool)
+
+
 @dataclass(frozen=True)
 class BatchYieldSolver:
     unit_solver: YieldSolver | None = None
     newton: BatchNewtonConfig = BatchNewtonConfig()
+    bracket: BatchBracketConfig = BatchBracketConfig()
 
     def solve_many(
         self,
         problems: Iterable[YieldProblem],
+        initial_guesses: Sequence[float | None] | None = None,
     ) -> list[YieldSolverBatchResult]:
+        """
+        Solve all problems, keeping their original indexes.
+
+        `initial_guesses`, aligned with `problems`, warm-starts Newton per
+        problem (e.g. the previous day's yield); None or NaN entries use
+        `newton.initial_guess`.
+        """
         problems = list(problems)
+        guesses = self.initial_guess_vector(initial_guesses, len(problems))
         unit_solver = self.unit_solver or default_yield_solver()
 
         results: list[YieldSolverBatchResult | None] = [None] * len(problems)
 
         single_items: list[tuple[int, YieldProblem]] = []
-        multi_items_by_size: dict[int, list[tuple[int, YieldProblem]]] = {}
+        multi_items: list[tuple[int, YieldProblem]] = []
 
         for index, problem in enumerate(problems):
             if problem.is_single_cashflow:
                 single_items.append((index, problem))
             else:
-                size = len(problem.time_amount_pairs)
-                multi_items_by_size.setdefault(size, []).append((index, problem))
+                multi_items.append((index, problem))
 
         self._solve_single_cashflows(single_items, results)
 
-        for items in multi_items_by_size.values():
-            failed_indexes = self._solve_multi_cashflows_with_newton_batch(
-                items=items,
+        failed_indexes = self._solve_multi_cashflows_with_newton_batch(
+            items=multi_items,
+            results=results,
+            initial_guesses=guesses[[index for index, _ in multi_items]],
+        )
+
+        for index in failed_indexes:
+            self._solve_with_unit_solver(
+                index=index,
+                problem=problems[index],
+                solver=unit_solver,
                 results=results,
             )
 
-            for index in failed_indexes:
-                self._solve_with_unit_solver(
-                    index=index,
-                    problem=problems[index],
-                    solver=unit_solver,
-                    results=results,
+        return [result for result in results if result is not None]
+
+    def initial_guess_vector(
+        self,
+        initial_guesses: Sequence[float | None] | None,
+        n: int,
+    ) -> np.ndarray:
+        """Warm starts as an array; missing or out-of-range entries are static."""
+
+        if initial_guesses is None:
+            return np.full(n, self.newton.initial_guess, dtype=float)
+
+        guesses = np.asarray(
+            [np.nan if guess is None else guess for guess in initial_guesses],
+            dtype=float,
+        )
+
+        if guesses.shape != (n,):
+            raise ValueError("initial_guesses must be aligned with problems")
+
+        usable = (
+            np.isfinite(guesses)
+            & (guesses > self.newton.lower)
+            & (guesses < self.newton.upper)
+        )
+
+        return np.where(usable, guesses, self.newton.initial_guess)
+
+    def solve_arrays(
+        self,
+        cashflows: RaggedCashflows,
+        prices,
+        initial_guesses=None,
+    ) -> RaggedYieldSolution:
+        """
+        Solve every ragged problem in NumPy.
+
+        One Newton loop runs over all problems regardless of cashflow count;
+        the ones it does not solve go through the vectorized bracketing stage.
+        """
+        prices = np.asarray(prices, dtype=float)
+        guesses = self.initial_guess_vector(initial_guesses, len(cashflows))
+
+        y, iterations, converged = self._newton_arrays(cashflows, prices, guesses)
+        method: list[YieldSolverMethod | None] = [
+            YieldSolverMethod.NEWTON_BATCH if ok else None
+            for ok in converged
+        ]
+
+        if not np.all(converged):
+            pending = ~converged
+            y_b, iterations_b, bracketed = self._bisection_arrays(
+                cashflows,
+                prices,
+                pending,
+            )
+
+            solved = pending & bracketed
+            y[solved] = y_b[solved]
+            iterations[pending] += iterations_b[pending]
+
+            for pos in np.flatnonzero(solved):
+                method[pos] = YieldSolverMethod.BISECTION_BATCH
+
+        return RaggedYieldSolution(ytm=y, iterations=iterations, method=method)
+
+    def solve_ragged(
+        self,
+        cashflows: RaggedCashflows,
+        prices,
+        initial_guesses=None,
+    ) -> RaggedYieldSolution:
+        """
+        Columnar counterpart of `solve_many`, without a YieldProblem per row.
+
+        Single-cashflow problems use the closed-form zero-coupon yield, the
+        others go through `solve_arrays`, and only those still unsolved are
+        retried one by one with the unit solver. Results and error messages
+        match `solve_many` on the same cashflows.
+        """
+        n = len(cashflows)
+        prices = np.asarray(prices, dtype=float)
+        guesses = self.initial_guess_vector(initial_guesses, n)
+        counts = np.diff(cashflows.offsets)
+
+        ytm = np.full(n, np.nan, dtype=float)
+        iterations = np.zeros(n, dtype=int)
+        method: list[YieldSolverMethod | None] = [None] * n
+        error_type: list[str | None] = [None] * n
+        error_message: list[str | None] = [None] * n
+
+        for pos in np.flatnonzero(counts == 0):
+            error_type[pos] = "ValueError"
+            error_message[pos] = (
+                "time_amount_pairs must contain at least one valid future cashflow"
+            )
+
+        single = np.flatnonzero(counts == 1)
+
+        if single.size:
+            times = cashflows.times[cashflows.offsets[single]]
+            amounts = cashflows.amounts[cashflows.offsets[single]]
+            single_prices = prices[single]
+            valid = (times > 0.0) & (amounts > 0.0) & (single_prices > 0.0)
+
+            with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+                single_ytm = np.where(
+                    valid,
+                    np.power(amounts / single_prices, 1.0 / times) - 1.0,
+                    np.nan,
                 )
 
-        return [result for result in results if result is not None]
+            accepted = valid & np.isfinite(single_ytm)
+            ytm[single[accepted]] = single_ytm[accepted]
+
+            for pos, ok in zip(single, accepted):
+                if ok:
+                    method[pos] = YieldSolverMethod.ZERO_COUPON
+                else:
+                    error_type[pos] = "ValueError"
+                    error_message[pos] = (
+                        "single cashflow batch solve requires positive time, "
+                        "positive amount, positive market_price, and finite yield"
+                    )
+
+        multi = np.flatnonzero(counts > 1)
+
+        if multi.size:
+            multi_cashflows = cashflows.take(multi)
+            solution = self.solve_arrays(
+                multi_cashflows,
+                prices[multi],
+                initial_guesses=guesses[multi],
+            )
+            ytm[multi] = solution.ytm
+            iterations[multi] = solution.iterations
+
+            unit_solver = self.unit_solver or default_yield_solver()
+
+            for pos, index in enumerate(multi):
+                method[index] = solution.method[pos]
+
+                if method[index] is not None:
+                    continue
+
+                try:
+                    result = unit_solver.solve(
+                        YieldProblem.from_time_amount_pairs(
+                            time_amount_pairs=multi_cashflows.time_amount_pairs(pos),
+                            market_price=float(prices[index]),
+                        )
+                    )
+                except Exception as exc:
+                    ytm[index] = np.nan
+                    error_type[index] = type(exc).__name__
+                    error_message[index] = str(exc)
+                    continue
+
+                ytm[index] = result.ytm
+                iterations[index] = result.iterations
+                method[index] = result.method
+
+        return RaggedYieldSolution(
+            ytm=ytm,
+            iterations=iterations,
+            method=method,
+            error_type=error_type,
+            error_message=error_message,
+        )
 
     def _solve_single_cashflows(
         self,
@@ -128,54 +445,65 @@ class BatchYieldSolver:
         self,
         items: list[tuple[int, YieldProblem]],
         results: list[YieldSolverBatchResult | None],
+        initial_guesses: np.ndarray | None = None,
     ) -> list[int]:
+        if not items:
+            return []
+
         indexes = [index for index, _ in items]
         problems = [problem for _, problem in items]
 
-        times = np.asarray(
-            [[t for t, _ in problem.time_amount_pairs] for problem in problems],
-            dtype=float,
-        )
-        amounts = np.asarray(
-            [[amount for _, amount in problem.time_amount_pairs] for problem in problems],
-            dtype=float,
+        solution = self.solve_arrays(
+            RaggedCashflows.from_problems(problems),
+            [problem.market_price for problem in problems],
+            initial_guesses=initial_guesses,
         )
-        prices = np.asarray([problem.market_price for problem in problems], dtype=float)
 
-        n = len(problems)
-        y = np.full(n, self.newton.initial_guess, dtype=float)
+        failed: list[int] = []
+
+        for pos, index in enumerate(indexes):
+            method = solution.method[pos]
+
+            if method is None:
+                failed.append(index)
+                continue
+
+            results[index] = YieldSolverBatchResult(
+                index=index,
+                result=YieldSolverResult(
+                    ytm=float(solution.ytm[pos]),
+                    method=method,
+                    iterations=int(solution.iterations[pos]),
+                ),
+            )
+
+        return failed
+
+    def _newton_arrays(
+        self,
+        cashflows: RaggedCashflows,
+        prices: np.ndarray,
+        initial_guesses: np.ndarray,
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        n = len(cashflows)
+        y = np.array(initial_guesses, dtype=float)
         iterations = np.zeros(n, dtype=int)
 
-        active = np.ones(n, dtype=bool)
         converged = np.zeros(n, dtype=bool)
         failed = np.zeros(n, dtype=bool)
 
         for iteration in range(1, self.newton.maxiter + 1):
-            active_idx = active & ~converged & ~failed
+            active = ~converged & ~failed
 
-            if not np.any(active_idx):
+            if not np.any(active):
                 break
 
-            y_active = y[active_idx]
-            times_active = times[active_idx]
-            amounts_active = amounts[active_idx]
-            prices_active = prices[active_idx]
-
             with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
-                base = 1.0 + y_active[:, None]
-
-                model_prices = (
-                    amounts_active / np.power(base, times_active)
-                ).sum(axis=1)
-
-                objective = model_prices - prices_active
-
-                derivative = (
-                    -times_active
-                    * amounts_active
-                    / np.power(base, times_active + 1.0)
-                ).sum(axis=1)
+                model_prices, derivative = cashflows.price_and_derivative(y, active)
 
+                objective = model_prices[active] - prices[active]
+                derivative = derivative[active]
+                y_active = y[active]
                 y_next = y_active - objective / derivative
 
             local_failed = (
@@ -195,7 +523,7 @@ class BatchYieldSolver:
                 )
             )
 
-            positions = np.flatnonzero(active_idx)
+            positions = np.flatnonzero(active)
 
             y[positions[~local_failed]] = y_next[~local_failed]
             iterations[positions] = iteration
@@ -203,22 +531,76 @@ class BatchYieldSolver:
             converged[positions[local_converged]] = True
             failed[positions[local_failed]] = True
 
-            active = ~(converged | failed)
+        return y, iterations, converged
 
-        failed[~converged & ~failed] = True
+    def _bisection_arrays(
+        self,
+        cashflows: RaggedCashflows,
+        prices: np.ndarray,
+        pending: np.ndarray,
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Bracket each pending root in [lower, upper] and bisect all of them in
+        lockstep. Returns (ytm, iterations, solved).
+        """
+        config = self.bracket
+        n = len(cashflows)
+
+        def objective(y: np.ndarray, mask: np.ndarray) -> np.ndarray:
+            with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+                return cashflows.price(y, mask) - prices
 
-        for pos, index in enumerate(indexes):
-            if converged[pos]:
-                results[index] = YieldSolverBatchResult(
-                    index=index,
-                    result=YieldSolverResult(
-                        ytm=float(y[pos]),
-                        method=YieldSolverMethod.NEWTON_BATCH,
-                        iterations=int(iterations[pos]),
-                    ),
-                )
+        lower = np.full(n, config.lower, dtype=float)
+        upper = np.full(n, config.initial_upper, dtype=float)
+        f_lower = objective(lower, pending)
+        f_upper = objective(upper, pending)
+
+        bracketed = pending & np.isfinite(f_lower) & (f_lower * f_upper <= 0.0)
+        current_upper = config.initial_upper
+
+        while current_upper < config.max_upper and np.any(pending & ~bracketed):
+            current_upper = min(current_upper * config.expansion_factor, config.max_upper)
+            expand = pending & ~bracketed
+            upper[expand] = current_upper
+            f_upper = np.where(expand, objective(upper, expand), f_upper)
+            bracketed |= expand & np.isfinite(f_lower) & (f_lower * f_upper <= 0.0)
+
+        y = np.full(n, np.nan, dtype=float)
+        iterations = np.zeros(n, dtype=int)
+
+        at_lower = bracketed & (f_lower == 0.0)
+        at_upper = bracketed & ~at_lower & (f_upper == 0.0)
+        y[at_lower] = lower[at_lower]
+        y[at_upper] = upper[at_upper]
+
+        active = bracketed & ~at_lower & ~at_upper
+        solved = at_lower | at_upper
+
+        for iteration in range(1, config.maxiter + 1):
+            if not np.any(active):
+                break
+
+            mid = 0.5 * (lower + upper)
+            f_mid = objective(mid, active)
+
+            go_lower = active & (np.sign(f_mid) == np.sign(f_lower))
+            go_upper = active & ~go_lower
+
+            lower = np.where(go_lower, mid, lower)
+            f_lower = np.where(go_lower, f_mid, f_lower)
+            upper = np.where(go_upper, mid, upper)
+
+            iterations[active] = iteration
+
+            done = active & (
+                (f_mid == 0.0)
+                | (upper - lower <= config.xtol + config.rtol * np.abs(mid))
+            )
+            y[done] = np.where(f_mid == 0.0, mid, 0.5 * (lower + upper))[done]
+            solved |= done
+            active &= ~done
 
-        return [indexes[pos] for pos in range(n) if failed[pos]]
+        return y, iterations, solved
 
     def _solve_with_unit_solver(
         self,
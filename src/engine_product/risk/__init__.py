@@ -1,6 +1,15 @@
 from engine_product.risk.duration import macaulay_duration, modified_duration, modified_duration_from_derivative
+from engine_product.risk.batch import (
+    BondRiskBatch,
+    bond_risk_batch,
+    bond_risk_from_time_amount_pairs,
+)
 
 __all__ = [
     "macaulay_duration",
     "modified_duration",
-    "modified_duration_from_derivative"]
\ No newline at end of file
+    "modified_duration_from_derivative",
+    "BondRiskBatch",
+    "bond_risk_batch",
+    "bond_risk_from_time_amount_pairs",
+]
@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Iterable, Sequence
+
+import numpy as np
+
+
+BASIS_POINT = 1e-4
+
+
+@dataclass(frozen=True)
+class BondRiskBatch:
+    """
+    Risk analytics for many bonds, one entry per bond.
+
+    Bonds without positive present value get NaN durations, convexity and DV01
+    instead of raising, so one bad observation does not fail a whole batch.
+    """
+
+    price: np.ndarray
+    macaulay_duration: np.ndarray
+    modified_duration: np.ndarray
+    convexity: np.ndarray
+    dv01: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.price)
+
+
+def _as_ytm_vector(ytm, n: int) -> np.ndarray:
+    ytm = np.broadcast_to(np.asarray(ytm, dtype=float), (n,))
+
+    if np.any(ytm <= -1.0):
+        raise ValueError("ytm must be greater than -1")
+
+    return ytm
+
+
+def _risk_from_sums(
+    ytm: np.ndarray,
+    price: np.ndarray,
+    time_weighted: np.ndarray,
+    convexity_weighted: np.ndarray,
+) -> BondRiskBatch:
+    valid = price > 0.0
+    safe_price = np.where(valid, price, 1.0)
+
+    macaulay = np.where(valid, time_weighted / safe_price, np.nan)
+    modified = macaulay / (1.0 + ytm)
+    convexity = np.where(
+        valid,
+        convexity_weighted / (safe_price * (1.0 + ytm) ** 2),
+        np.nan,
+    )
+
+    return BondRiskBatch(
+        price=price,
+        macaulay_duration=macaulay,
+        modified_duration=modified,
+        convexity=convexity,
+        dv01=modified * price * BASIS_POINT,
+    )
+
+
+def bond_risk_batch(
+    times,
+    amounts,
+    ytm,
+    offsets: Sequence[int] | np.ndarray | None = None,
+) -> BondRiskBatch:
+    """
+    Computes price, Macaulay and modified duration, convexity and DV01 under
+    annual compound yield for many bonds at once.
+
+    `times`/`amounts` are either a padded (n_bonds, max_cashflows) matrix or,
+    when `offsets` is given, flat CSR arrays where bond i owns
+    `offsets[i]:offsets[i + 1]`. Only cashflows with finite positive time
+    count, so NaN or zero padding is ignored.
+
+        P     = sum(CF_i / (1 + y) ** t_i)
+        D_mac = sum(t_i * PV_i) / P
+        D_mod = D_mac / (1 + y)
+        C     = sum(t_i * (t_i + 1) * PV_i) / (P * (1 + y) ** 2)
+        DV01  = D_mod * P * 1bp
+    """
+    times = np.asarray(times, dtype=float)
+    amounts = np.asarray(amounts, dtype=float)
+
+    if times.shape != amounts.shape:
+        raise ValueError("times and amounts must have the same shape")
+
+    if offsets is None:
+        if times.ndim != 2:
+            raise ValueError("padded times and amounts must be 2-dimensional")
+
+        n = times.shape[0]
+    else:
+        offsets = np.asarray(offsets, dtype=np.int64)
+
+        if times.ndim != 1 or offsets[-1] != times.size:
+            raise ValueError("offsets must cover flat times and amounts")
+
+        n = len(offsets) - 1
+
+    ytm_vector = _as_ytm_vector(ytm, n)
+
+    if offsets is None:
+        rate = ytm_vector[:, None]
+    else:
+        owner = np.repeat(np.arange(n), np.diff(offsets))
+        rate = ytm_vector[owner]
+
+    valid = np.isfinite(times) & (times > 0.0) & np.isfinite(amounts)
+    safe_times = np.where(valid, times, 0.0)
+    pv = np.where(valid, amounts, 0.0) / np.power(1.0 + rate, safe_times)
+
+    terms = (pv, safe_times * pv, safe_times * (safe_times + 1.0) * pv)
+
+    if offsets is None:
+        sums = [term.sum(axis=1) for term in terms]
+    else:
+        sums = [np.bincount(owner, weights=term, minlength=n) for term in terms]
+
+    return _risk_from_sums(ytm_vector, *sums)
+
+
+def bond_risk_from_time_amount_pairs(
+    time_amount_pairs: Iterable[Iterable[tuple[float, float]]],
+    ytm,
+) -> BondRiskBatch:
+    """bond_risk_batch over per-bond (time, amount) pairs, flattened to CSR."""
+
+    bonds = [tuple(pairs) for pairs in time_amount_pairs]
+    offsets = np.zeros(len(bonds) + 1, dtype=np.int64)
+    np.cumsum([len(pairs) for pairs in bonds], out=offsets[1:])
+
+    flat = np.asarray(
+        [pair for pairs in bonds for pair in pairs],
+        dtype=float,
+    ).reshape(-1, 2)
+
+    return bond_risk_batch(
+        times=flat[:, 0],
+        amounts=flat[:, 1],
+        ytm=ytm,
+        offsets=offsets,
+    )
@@ -1,7 +1,30 @@
 from datetime import date
 
+import numpy as np
+
 from engine_product.cashflows.models import Cashflow
-from engine_product.convention import DayCountConventionRepository
+from engine_product.convention import DayCountConventionRepository, year_fractions
+
+
+def _future_time_amount_arrays(
+    cashflows: list[Cashflow],
+    settlement_date: date,
+    day_count: DayCountConventionRepository,
+) -> tuple[np.ndarray, np.ndarray]:
+    future = [cf for cf in cashflows if cf.payment_date > settlement_date]
+
+    if not future:
+        return np.empty(0, dtype=float), np.empty(0, dtype=float)
+
+    times = year_fractions(
+        day_count,
+        settlement_date,
+        [cf.payment_date for cf in future],
+    )
+    amounts = np.asarray([cf.amount for cf in future], dtype=float)
+    valid = times > 0
+
+    return times[valid], amounts[valid]
 
 
 def macaulay_duration(
@@ -19,22 +42,15 @@ def macaulay_duration(
     if ytm <= -1.0:
         raise ValueError("ytm must be greater than -1")
 
-    weighted_time_sum = 0.0
-    price = 0.0
-
-    for cf in cashflows:
-        if cf.payment_date <= settlement_date:
-            continue
-
-        t = day_count.year_fraction(settlement_date, cf.payment_date)
-
-        if t <= 0:
-            continue
-
-        pv = cf.amount / ((1.0 + ytm) ** t)
+    times, amounts = _future_time_amount_arrays(
+        cashflows,
+        settlement_date,
+        day_count,
+    )
+    pv = amounts / ((1.0 + ytm) ** times)
 
-        weighted_time_sum += t * pv
-        price += pv
+    weighted_time_sum = float(np.sum(times * pv))
+    price = float(np.sum(pv))
 
     if price <= 0:
         raise ValueError("price must be positive to compute duration")
@@ -83,20 +99,14 @@ def modified_duration_from_derivative(
     if ytm <= -1.0:
         raise ValueError("ytm must be greater than -1")
 
-    price = 0.0
-    derivative = 0.0
-
-    for cf in cashflows:
-        if cf.payment_date <= settlement_date:
-            continue
-
-        t = day_count.year_fraction(settlement_date, cf.payment_date)
-
-        if t <= 0:
-            continue
+    times, amounts = _future_time_amount_arrays(
+        cashflows,
+        settlement_date,
+        day_count,
+    )
 
-        price += cf.amount / ((1.0 + ytm) ** t)
-        derivative += -t * cf.amount / ((1.0 + ytm) ** (t + 1.0))
+    price = float(np.sum(amounts / ((1.0 + ytm) ** times)))
+    derivative = float(np.sum(-times * amounts / ((1.0 + ytm) ** (times + 1.0))))
 
     if price <= 0:
         raise ValueError("price must be positive to compute duration")
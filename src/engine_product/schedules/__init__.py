@@ -6,9 +6,11 @@ used to construct event schedules for financial instruments.
 """
 
 from .builder import ScheduleBuilder
+from .batch import BatchScheduleRule, ScheduleBatch, build_schedule_batch
 
 from .rules import (
     custom_dates,
+    day_of_months,
     every_n_months_backward,
     first_day_of_months,
     nth_weekday_of_month,
@@ -23,8 +25,12 @@ from .adjusters import (
 
 __all__ = [
     "ScheduleBuilder",
+    "BatchScheduleRule",
+    "ScheduleBatch",
+    "build_schedule_batch",
 
     "custom_dates",
+    "day_of_months",
     "every_n_months_backward",
     "first_day_of_months",
     "nth_weekday_of_month",
@@ -0,0 +1,212 @@
+# engine_product/schedules/batch.py
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import date
+from typing import Sequence
+
+import numpy as np
+
+from engine_product.calendars.business_calendar import BusinessCalendar
+
+
+@dataclass(frozen=True)
+class BatchScheduleRule:
+    """
+    Regra de schedule em formato declarativo, para geração em lote.
+
+    Equivale a:
+
+        seed(day_of_months(months, day))
+        add_dates(start)       se include_start
+        add_dates(maturity)    se include_maturity
+        adjust(...)
+        normalize()
+
+    Sem meses, a regra gera apenas as boundaries (ex.: LTN = [maturity]).
+    `day` vai até 28 para existir em todos os meses (ex.: NTN-B = dia 15).
+    """
+
+    months: tuple[int, ...] = ()
+    include_start: bool = False
+    include_maturity: bool = True
+    day: int = 1
+
+    def __post_init__(self):
+        if any(not 1 <= month <= 12 for month in self.months):
+            raise ValueError("months must be between 1 and 12")
+
+        if not 1 <= self.day <= 28:
+            raise ValueError("day must be between 1 and 28")
+
+
+@dataclass(frozen=True)
+class ScheduleBatch:
+    """
+    Schedules de vários contratos em layout ragged.
+
+    As datas do contrato i estão em dates[offsets[i]:offsets[i + 1]],
+    ordenadas e sem duplicatas.
+    """
+
+    offsets: np.ndarray
+    dates: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    @property
+    def counts(self) -> np.ndarray:
+        return np.diff(self.offsets)
+
+    @property
+    def owner(self) -> np.ndarray:
+        """Posição do contrato dono de cada data em `dates`."""
+        return np.repeat(np.arange(len(self), dtype=np.int64), self.counts)
+
+    def take(self, positions) -> ScheduleBatch:
+        """Sub-lote com os contratos em `positions`, na ordem dada."""
+        positions = np.asarray(positions, dtype=np.int64)
+        counts = self.counts[positions]
+
+        offsets = np.zeros(len(positions) + 1, dtype=np.int64)
+        np.cumsum(counts, out=offsets[1:])
+
+        rows = (
+            np.repeat(self.offsets[positions] - offsets[:-1], counts)
+            + np.arange(offsets[-1])
+        )
+
+        return ScheduleBatch(offsets=offsets, dates=self.dates[rows])
+
+    def schedule_array(self, i: int) -> np.ndarray:
+        return self.dates[self.offsets[i]:self.offsets[i + 1]]
+
+    def schedule(self, i: int) -> list[date]:
+        return self.schedule_array(i).astype(object).tolist()
+
+
+def build_schedule_batch(
+    start_dates,
+    maturity_dates,
+    rules: BatchScheduleRule | Sequence[BatchScheduleRule],
+    calendar: BusinessCalendar | None = None,
+    adjustment: str = "following",
+) -> ScheduleBatch:
+    """
+    Gera os schedules de todos os contratos de uma vez.
+
+    `rules` pode ser uma única regra ou uma regra por contrato. O ajuste
+    `following` é feito com uma única consulta vetorial ao calendário.
+    """
+    starts = np.asarray(start_dates, dtype="datetime64[D]").reshape(-1)
+    maturities = np.asarray(maturity_dates, dtype="datetime64[D]").reshape(-1)
+
+    if starts.shape != maturities.shape:
+        raise ValueError("start_dates and maturity_dates must have the same length")
+
+    n = len(starts)
+
+    if isinstance(rules, BatchScheduleRule):
+        rules = [rules] * n
+
+    if len(rules) != n:
+        raise ValueError("rules must be a single rule or one rule per contract")
+
+    owners: list[np.ndarray] = []
+    values: list[np.ndarray] = []
+
+    for rule in dict.fromkeys(rules):
+        positions = np.flatnonzero(
+            np.fromiter((r == rule for r in rules), dtype=bool, count=n)
+        )
+        rule_owner, rule_dates = _seed_dates(
+            rule,
+            positions,
+            starts[positions],
+            maturities[positions],
+        )
+        owners.append(rule_owner)
+        values.append(rule_dates)
+
+    owner = np.concatenate(owners) if owners else np.empty(0, dtype=np.int64)
+    dates = (
+        np.concatenate(values) if values else np.empty(0, dtype="datetime64[D]")
+    )
+
+    if adjustment == "following":
+        if calendar is None:
+            raise ValueError("calendar is required for following adjustment")
+
+        dates = np.asarray(
+            calendar.adjust_to_next_business_day_array(dates),
+            dtype="datetime64[D]",
+        )
+    elif adjustment != "unadjusted":
+        raise ValueError(f"Unsupported schedule adjustment: {adjustment}")
+
+    order = np.lexsort((dates, owner))
+    owner = owner[order]
+    dates = dates[order]
+
+    keep = np.ones(len(dates), dtype=bool)
+    keep[1:] = (owner[1:] != owner[:-1]) | (dates[1:] != dates[:-1])
+    owner = owner[keep]
+    dates = dates[keep]
+
+    offsets = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(np.bincount(owner, minlength=n), out=offsets[1:])
+
+    return ScheduleBatch(offsets=offsets, dates=dates)
+
+
+def _seed_dates(
+    rule: BatchScheduleRule,
+    positions: np.ndarray,
+    starts: np.ndarray,
+    maturities: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    owners: list[np.ndarray] = []
+    values: list[np.ndarray] = []
+
+    if rule.months:
+        first_month = starts.astype("datetime64[M]").astype(np.int64)
+        last_month = maturities.astype("datetime64[M]").astype(np.int64)
+        month_counts = np.maximum(last_month - first_month + 1, 0)
+
+        local_owner = np.repeat(np.arange(len(positions)), month_counts)
+        month_offsets = np.cumsum(month_counts) - month_counts
+        months = (
+            first_month[local_owner]
+            + np.arange(len(local_owner))
+            - month_offsets[local_owner]
+        )
+        candidates = (
+            months.astype("datetime64[M]").astype("datetime64[D]")
+            + (rule.day - 1)
+        )
+
+        selected = (
+            np.isin(months % 12 + 1, rule.months)
+            & (candidates > starts[local_owner])
+            & (candidates <= maturities[local_owner])
+        )
+        owners.append(positions[local_owner[selected]])
+        values.append(candidates[selected])
+
+    if rule.include_start:
+        owners.append(positions)
+        values.append(starts)
+
+    if rule.include_maturity:
+        owners.append(positions)
+        values.append(maturities)
+
+    if not owners:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype="datetime64[D]")
+
+    return (
+        np.concatenate(owners).astype(np.int64),
+        np.concatenate(values).astype("datetime64[D]"),
+    )
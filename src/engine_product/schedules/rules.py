@@ -49,6 +49,17 @@ def first_day_of_months(months: Iterable[int]) -> DateRule:
     Gera o primeiro dia dos meses informados.
     Exemplo: janeiro e julho.
     """
+    return day_of_months(months, 1)
+
+
+def day_of_months(months: Iterable[int], day: int) -> DateRule:
+    """
+    Gera o dia `day` dos meses informados.
+    Exemplo: dia 15 de maio e novembro (NTN-B).
+    """
+    if not 1 <= day <= 28:
+        raise ValueError("day must be between 1 and 28")
+
     selected_months = list(months)
 
     def rule(start: date, maturity: date) -> list[date]:
@@ -56,7 +67,7 @@ def first_day_of_months(months: Iterable[int]) -> DateRule:
 
         for year in range(start.year, maturity.year + 1):
             for month in selected_months:
-                candidate = date(year, month, 1)
+                candidate = date(year, month, day)
 
                 if start < candidate <= maturity:
                     dates.append(candidate)
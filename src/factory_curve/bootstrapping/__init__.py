@@ -2,12 +2,16 @@
 
 from .core import (
     BootstrapConfig,
+    MultiDateBootstrapResult,
     PublicBondBootstrapper,
+    bootstrap_discount_curve,
     bootstrap_public_bond_curves,
 )
 
 __all__ = [
     "BootstrapConfig",
+    "MultiDateBootstrapResult",
     "PublicBondBootstrapper",
+    "bootstrap_discount_curve",
     "bootstrap_public_bond_curves",
 ]
@@ -1,17 +1,23 @@
 from __future__ import annotations
 
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
-from typing import Any, Mapping
+from itertools import chain
+from pathlib import Path
+from typing import Any, Callable, Mapping, Sequence
 
 import numpy as np
 import pandas as pd
-from scipy.optimize import brentq, minimize_scalar
 from tqdm.auto import tqdm
 
-from engine_product.pricing.cashflow_arrays import (
-    CashflowScheduleArrays,
-    build_bd_index_lookup,
-    build_cashflow_schedule_lookup,
+from engine_product.calendars import CalendarIndex
+from engine_product.pricing.cashflow_store import CashflowSlices, CashflowStore
+from engine_product.pricing.curves import LogLinearDiscountCurve
+from ml_ettj26.utils.parallel import (
+    SHARDS_PER_WORKER,
+    ref_date_shards,
+    resolve_workers,
 )
 
 
@@ -59,6 +65,7 @@ class BootstrapConfig:
     root_tolerance: float = 1.0e-12
     batch_size: int = 64
     show_progress: bool = True
+    workers: int | None = 1
 
     def __post_init__(self) -> None:
         object.__setattr__(
@@ -79,6 +86,8 @@ class BootstrapConfig:
             raise ValueError("Discount-factor bounds must be positive and ordered")
         if self.root_tolerance <= 0.0:
             raise ValueError("root_tolerance must be positive")
+        if self.workers is not None and self.workers < 1:
+            raise ValueError("workers must be a positive integer or None")
 
     @classmethod
     def from_mapping(cls, values: Mapping[str, Any]) -> BootstrapConfig:
@@ -99,30 +108,336 @@ class BootstrapConfig:
             root_tolerance=float(values.get("root_tolerance", 1.0e-12)),
             batch_size=int(values.get("batch_size", 64)),
             show_progress=bool(values.get("show_progress", True)),
+            workers=(
+                None
+                if values.get("workers", 1) is None
+                else int(values.get("workers", 1))
+            ),
         )
 
 
 @dataclass(frozen=True)
-class BootstrapInstrument:
-    isin: str
-    instrument_type: str
-    market_price: float
-    tenor_bd: np.ndarray
-    amount: np.ndarray
+class DailyBootstrapResult:
+    curve: pd.DataFrame
+    diagnostics: pd.DataFrame
+    discount_curve: LogLinearDiscountCurve | None = None
+
+
+@dataclass(frozen=True)
+class MultiDateBootstrapResult:
+    """
+    Pillar nodes of many dates in CSR layout.
+
+    Date i owns `node_tenor_bd[node_offsets[i]:node_offsets[i + 1]]`,
+    starting at the origin node (0, 0). Failed dates own no nodes and keep
+    their message in `error_messages`; `diagnostics` holds the per-instrument
+    rows of solved dates and one FAILED row per failed date, in date order.
+    """
+
+    reference_dates: np.ndarray
+    node_offsets: np.ndarray
+    node_tenor_bd: np.ndarray
+    node_log_discount: np.ndarray
+    source_instrument_count: np.ndarray
+    error_messages: tuple[str | None, ...]
+    diagnostics: pd.DataFrame
+
+    def __len__(self) -> int:
+        return len(self.reference_dates)
+
+    @classmethod
+    def concat(
+        cls,
+        results: Sequence[MultiDateBootstrapResult],
+    ) -> MultiDateBootstrapResult:
+        """Join results of consecutive ref_date ranges, in the given order."""
+
+        node_offsets = np.zeros(
+            sum(len(result) for result in results) + 1,
+            dtype=np.int64,
+        )
+        np.cumsum(
+            np.concatenate([np.diff(result.node_offsets) for result in results]),
+            out=node_offsets[1:],
+        )
+        return cls(
+            reference_dates=np.concatenate(
+                [result.reference_dates for result in results]
+            ),
+            node_offsets=node_offsets,
+            node_tenor_bd=np.concatenate(
+                [result.node_tenor_bd for result in results]
+            ),
+            node_log_discount=np.concatenate(
+                [result.node_log_discount for result in results]
+            ),
+            source_instrument_count=np.concatenate(
+                [result.source_instrument_count for result in results]
+            ),
+            error_messages=tuple(
+                chain.from_iterable(result.error_messages for result in results)
+            ),
+            diagnostics=pd.concat(
+                [result.diagnostics for result in results],
+                ignore_index=True,
+            ),
+        )
 
     @property
-    def maturity_tenor_bd(self) -> int:
-        return int(self.tenor_bd[-1])
+    def failed(self) -> np.ndarray:
+        return np.asarray(
+            [message is not None for message in self.error_messages],
+            dtype=bool,
+        )
+
+    def nodes(self, position: int) -> tuple[np.ndarray, np.ndarray]:
+        start, end = self.node_offsets[position], self.node_offsets[position + 1]
+        return self.node_tenor_bd[start:end], self.node_log_discount[start:end]
+
+    def discount_curve(self, position: int) -> LogLinearDiscountCurve:
+        node_tenors, node_log_discounts = self.nodes(position)
+        return LogLinearDiscountCurve(
+            node_tenor_bd=node_tenors.astype(np.float64),
+            node_log_discount=node_log_discounts,
+        )
+
+
+MAX_PILLAR_ITERATIONS = 200
 
 
 @dataclass(frozen=True)
-class DailyBootstrapResult:
-    curve: pd.DataFrame
-    diagnostics: pd.DataFrame
+class _PillarStep:
+    """
+    Instruments of one pillar rank across dates, one problem per pillar.
+
+    With k + 1 known nodes, cashflows up to the last node N_k have a fixed
+    present value. A later cashflow at tenor t has log discount
+    `(1 - w) * L_k + w * x`, with `w = (t - N_k) / (T - N_k)` and x the
+    unknown log discount at the pillar T, so prices and their derivatives
+    in x are exact weighted sums.
+    """
+
+    problem: np.ndarray
+    shared: np.ndarray
+    market_price: np.ndarray
+    fixed_value: np.ndarray
+    initial: np.ndarray
+    owner: np.ndarray
+    cashflow_problem: np.ndarray
+    amount: np.ndarray
+    base: np.ndarray
+    weight: np.ndarray
+
+    @classmethod
+    def build(
+        cls,
+        *,
+        slices: CashflowSlices,
+        rows: np.ndarray,
+        problem: np.ndarray,
+        market_price: np.ndarray,
+        shared: np.ndarray,
+        pillar_tenor: np.ndarray,
+        known_tenor: np.ndarray,
+        known_log: np.ndarray,
+    ) -> _PillarStep:
+        counts = slices.counts[rows]
+        owner = np.repeat(np.arange(rows.size), counts)
+        ends = np.cumsum(counts)
+        flat = slices.offsets[rows][owner] + (
+            np.arange(owner.size) - (ends - counts)[owner]
+        )
+        tenor = slices.tenor_bd[flat]
+        amount = slices.amount[flat]
+        cashflow_problem = problem[owner]
+        last_tenor = known_tenor[:, -1]
+        last_log = known_log[:, -1]
+
+        fixed = tenor <= last_tenor[cashflow_problem]
+        fixed_log = _interpolate_known_nodes(
+            known_tenor,
+            known_log,
+            cashflow_problem[fixed],
+            tenor[fixed],
+        )
+        fixed_value = np.bincount(
+            owner[fixed],
+            weights=amount[fixed] * np.exp(fixed_log),
+            minlength=rows.size,
+        )
+
+        variable = ~fixed
+        variable_problem = cashflow_problem[variable]
+        node = last_tenor[variable_problem]
+        weight = (tenor[variable] - node) / (pillar_tenor[variable_problem] - node)
+        if known_tenor.shape[1] == 1:
+            initial = np.log(
+                np.bincount(problem, weights=market_price, minlength=shared.size)
+                / np.bincount(cashflow_problem, weights=amount, minlength=shared.size)
+            )
+        else:
+            initial = last_log * pillar_tenor / last_tenor
+
+        return cls(
+            problem=problem,
+            shared=shared,
+            market_price=market_price,
+            fixed_value=fixed_value,
+            initial=initial,
+            owner=owner[variable],
+            cashflow_problem=variable_problem,
+            amount=amount[variable],
+            base=(1.0 - weight) * last_log[variable_problem],
+            weight=weight,
+        )
+
+    def _terms(self, log_discount: np.ndarray) -> np.ndarray:
+        return self.amount * np.exp(
+            self.base + self.weight * log_discount[self.cashflow_problem]
+        )
+
+    def price(self, log_discount: np.ndarray) -> np.ndarray:
+        return self.fixed_value + np.bincount(
+            self.owner,
+            weights=self._terms(log_discount),
+            minlength=self.market_price.size,
+        )
+
+    def objective(self, log_discount: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Root function and its derivative per problem.
+
+        A single instrument solves its price residual r(x). A shared pillar
+        solves the least-squares first-order condition sum(r * r') = 0, whose
+        derivative is sum(r'^2 + r * r'').
+        """
+
+        terms = self._terms(log_discount)
+        size = self.market_price.size
+        residual = self.fixed_value - self.market_price + np.bincount(
+            self.owner, weights=terms, minlength=size
+        )
+        slope = np.bincount(self.owner, weights=terms * self.weight, minlength=size)
+        curvature = np.bincount(
+            self.owner,
+            weights=terms * self.weight**2,
+            minlength=size,
+        )
+        problems = self.shared.size
+        value = np.where(
+            self.shared,
+            np.bincount(self.problem, weights=residual * slope, minlength=problems),
+            np.bincount(self.problem, weights=residual, minlength=problems),
+        )
+        derivative = np.where(
+            self.shared,
+            np.bincount(
+                self.problem,
+                weights=slope**2 + residual * curvature,
+                minlength=problems,
+            ),
+            np.bincount(self.problem, weights=slope, minlength=problems),
+        )
+        return value, derivative
+
+    def solve(
+        self,
+        *,
+        lower: float,
+        upper: float,
+        tolerance: float,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Safeguarded Newton on every problem at once.
+
+        The bracket shrinks with the sign of the objective; a Newton step
+        leaving it, or not halving the previous step, falls back to
+        bisection. Single instruments without a sign change fail; shared
+        pillars without one take the bound where the squared error is lowest.
+        """
+
+        size = self.shared.size
+        low = np.full(size, lower)
+        high = np.full(size, upper)
+        value_low, _ = self.objective(low)
+        value_high, _ = self.objective(high)
+
+        solved = np.isfinite(value_low) & np.isfinite(value_high)
+        at_lower = solved & np.where(self.shared, value_low >= 0.0, value_low == 0.0)
+        at_upper = (
+            solved
+            & ~at_lower
+            & np.where(self.shared, value_high <= 0.0, value_high == 0.0)
+        )
+        solved &= self.shared | at_lower | at_upper | (
+            np.signbit(value_low) != np.signbit(value_high)
+        )
+        pending = solved & ~at_lower & ~at_upper
+
+        inside = (self.initial > lower) & (self.initial < upper)
+        log_discount = np.where(inside, self.initial, 0.5 * (lower + upper))
+        log_discount = np.where(at_lower, lower, log_discount)
+        log_discount = np.where(at_upper, upper, log_discount)
+        previous_step = np.full(size, upper - lower)
+
+        for _ in range(MAX_PILLAR_ITERATIONS):
+            if not pending.any():
+                break
+            value, derivative = self.objective(log_discount)
+            high = np.where(pending & (value > 0.0), log_discount, high)
+            low = np.where(pending & (value < 0.0), log_discount, low)
+
+            with np.errstate(divide="ignore", invalid="ignore"):
+                newton_step = value / derivative
+            candidate = log_discount - newton_step
+            use_newton = (
+                (derivative > 0.0)
+                & (candidate > low)
+                & (candidate < high)
+                & (2.0 * np.abs(newton_step) <= np.abs(previous_step))
+            )
+            next_value = np.where(use_newton, candidate, 0.5 * (low + high))
+            next_value = np.where(value == 0.0, log_discount, next_value)
+
+            scale = tolerance * (1.0 + np.abs(log_discount))
+            converged = (
+                (value == 0.0)
+                | (np.abs(next_value - log_discount) <= scale)
+                | (high - low <= scale)
+            )
+            previous_step = np.where(
+                pending,
+                next_value - log_discount,
+                previous_step,
+            )
+            log_discount = np.where(pending, next_value, log_discount)
+            pending &= ~converged
+
+        return log_discount, solved & ~pending
+
+
+def _interpolate_known_nodes(
+    known_tenor: np.ndarray,
+    known_log: np.ndarray,
+    problem: np.ndarray,
+    tenor: np.ndarray,
+) -> np.ndarray:
+    """Log-linear interpolation of each tenor inside its problem's node row."""
+
+    if not tenor.size:
+        return np.empty(0, dtype=np.float64)
+    span = int(known_tenor.max()) + 1
+    keys = (np.arange(len(known_tenor))[:, None] * span + known_tenor).ravel()
+    right = np.searchsorted(keys, problem * span + tenor, side="left")
+    left = right - 1
+    tenors = known_tenor.ravel()
+    logs = known_log.ravel()
+    weight = (tenor - tenors[left]) / (tenors[right] - tenors[left])
+    return logs[left] + weight * (logs[right] - logs[left])
 
 
 class PublicBondBootstrapper:
-    """Bootstrap daily curves while reusing static per-ISIN cashflow arrays."""
+    """Bootstrap daily curves while reusing one static cashflow store."""
 
     REQUIRED_COLUMNS = {
         "ref_date",
@@ -134,15 +449,58 @@ class PublicBondBootstrapper:
     def __init__(
         self,
         *,
-        cashflow_dimension: pd.DataFrame,
-        calendar_df: pd.DataFrame,
+        cashflow_dimension: pd.DataFrame | None = None,
+        calendar_df: pd.DataFrame | None = None,
         config: BootstrapConfig | None = None,
+        cashflow_store: CashflowStore | None = None,
+        calendar_index: CalendarIndex | None = None,
     ) -> None:
+        """
+        Build the lookups from the frames, or reuse prebuilt ones.
+
+        Pass either `cashflow_dimension` or `cashflow_store`, and either
+        `calendar_df` or `calendar_index`.
+        """
+        if (cashflow_dimension is None) == (cashflow_store is None):
+            raise ValueError("pass exactly one of cashflow_dimension or cashflow_store")
+        if (calendar_df is None) == (calendar_index is None):
+            raise ValueError("pass exactly one of calendar_df or calendar_index")
+
         self._config = config or BootstrapConfig()
-        self._cashflows_by_isin = build_cashflow_schedule_lookup(
-            cashflow_dimension
+        self._cashflow_store = (
+            cashflow_store
+            if cashflow_store is not None
+            else CashflowStore.from_cashflow_dimension(cashflow_dimension)
+        )
+        self._calendar_index = (
+            calendar_index
+            if calendar_index is not None
+            else CalendarIndex.from_calendar_df(calendar_df)
+        )
+
+    @classmethod
+    def from_lookups(
+        cls,
+        *,
+        cashflow_store: CashflowStore,
+        calendar_index: CalendarIndex,
+        config: BootstrapConfig | None = None,
+    ) -> PublicBondBootstrapper:
+        """Reuse prebuilt lookups, e.g. a store memory-mapped by a worker."""
+
+        return cls(
+            cashflow_store=cashflow_store,
+            calendar_index=calendar_index,
+            config=config,
         )
-        self._bd_index_by_date = build_bd_index_lookup(calendar_df)
+
+    @property
+    def cashflow_store(self) -> CashflowStore:
+        return self._cashflow_store
+
+    @property
+    def calendar_index(self) -> CalendarIndex:
+        return self._calendar_index
 
     @property
     def config(self) -> BootstrapConfig:
@@ -191,211 +549,307 @@ class PublicBondBootstrapper:
         ).dt.normalize().unique()
         if len(reference_dates) != 1:
             raise ValueError("bootstrap requires observations from exactly one date")
-        reference_date = pd.Timestamp(reference_dates[0])
-        if daily_observations["isin"].astype(str).duplicated().any():
-            raise ValueError(
-                f"Duplicate ISINs found for {reference_date.date().isoformat()}"
-            )
 
-        ref_date_key = reference_date.date()
-        if ref_date_key not in self._bd_index_by_date:
-            raise ValueError(
-                f"Calendar business-day index is missing for {ref_date_key}"
-            )
-        ref_bd_index = self._bd_index_by_date[ref_date_key]
-        instruments = self._build_instruments(
-            daily_observations,
-            ref_bd_index=ref_bd_index,
-        )
-        if not instruments:
-            raise ValueError("No eligible instruments remain for bootstrapping")
-
-        node_tenors = [0]
-        node_log_discounts = [0.0]
-        diagnostic_rows: list[dict[str, Any]] = []
-        maturity_groups: dict[int, list[BootstrapInstrument]] = {}
-        for instrument in instruments:
-            maturity_groups.setdefault(
-                instrument.maturity_tenor_bd,
-                [],
-            ).append(instrument)
-
-        for maturity_tenor_bd, group in sorted(maturity_groups.items()):
-            log_discount = self._solve_pillar(
-                instruments=group,
-                known_tenors=np.asarray(node_tenors, dtype=np.float64),
-                known_log_discounts=np.asarray(
-                    node_log_discounts,
-                    dtype=np.float64,
-                ),
-                maturity_tenor_bd=maturity_tenor_bd,
-            )
-            node_tenors.append(maturity_tenor_bd)
-            node_log_discounts.append(log_discount)
-            discount_factor = float(np.exp(log_discount))
-            tenor_years = maturity_tenor_bd / self._config.business_days_per_year
-            zero_rate = float(np.expm1(-log_discount / tenor_years))
-            all_tenors = np.asarray(node_tenors, dtype=np.float64)
-            all_logs = np.asarray(node_log_discounts, dtype=np.float64)
-            for instrument in group:
-                fitted_price = self._price_instrument(
-                    instrument,
-                    all_tenors,
-                    all_logs,
-                )
-                diagnostic_rows.append(
-                    {
-                        "ref_date": reference_date,
-                        "isin": instrument.isin,
-                        "instrument_type": instrument.instrument_type,
-                        "maturity_tenor_bd": maturity_tenor_bd,
-                        "market_price": instrument.market_price,
-                        "fitted_price": fitted_price,
-                        "price_error": fitted_price - instrument.market_price,
-                        "discount_factor": discount_factor,
-                        "zero_rate": zero_rate,
-                        "instruments_at_pillar": len(group),
-                        "status": (
-                            "BOOTSTRAPPED"
-                            if len(group) == 1
-                            else "BOOTSTRAPPED_SHARED_PILLAR"
-                        ),
-                        "error_type": None,
-                        "error_message": None,
-                    }
-                )
-
-        curve = self._build_curve(
-            reference_date=reference_date,
-            node_tenors=np.asarray(node_tenors, dtype=np.int64),
-            node_log_discounts=np.asarray(
-                node_log_discounts,
-                dtype=np.float64,
+        result = self.bootstrap_many(daily_observations)
+        if result.error_messages[0] is not None:
+            raise ValueError(result.error_messages[0])
+        return DailyBootstrapResult(
+            curve=self.build_curve(result, 0),
+            diagnostics=result.diagnostics,
+            discount_curve=result.discount_curve(0),
+        )
+
+    def bootstrap_many(self, observations: pd.DataFrame) -> MultiDateBootstrapResult:
+        """
+        Bootstrap every date of `observations` at once, one pillar rank per step.
+
+        Step k solves the k-th shortest maturity of all dates together. Each
+        date then knows exactly k + 1 nodes, so cashflows up to the last node
+        are priced once by interpolation and the remaining ones depend on the
+        unknown log discount through fixed weights. A date that fails
+        validation or a pillar solve keeps the message the per-date loop would
+        have raised and leaves the remaining dates untouched.
+        """
+        config = self._config
+        reference_dates, date_code = np.unique(
+            pd.to_datetime(observations["ref_date"])
+            .dt.normalize()
+            .to_numpy(),
+            return_inverse=True,
+        )
+        date_code = date_code.reshape(-1)
+        n_dates = reference_dates.size
+        isins = observations["isin"].astype(str).to_numpy()
+        errors = np.full(n_dates, None, dtype=object)
+
+        def record(dates: np.ndarray, messages) -> None:
+            for date, message in zip(dates.tolist(), messages):
+                if errors[date] is None:
+                    errors[date] = message
+
+        duplicated = pd.DataFrame(
+            {"date": date_code, "isin": isins}
+        ).duplicated().to_numpy()
+        duplicate_dates = np.unique(date_code[duplicated])
+        record(
+            duplicate_dates,
+            (
+                "Duplicate ISINs found for "
+                f"{pd.Timestamp(reference_dates[date]).date().isoformat()}"
+                for date in duplicate_dates
             ),
-            source_instrument_count=len(instruments),
         )
-        diagnostics = pd.DataFrame(
-            diagnostic_rows,
-            columns=DIAGNOSTIC_COLUMNS,
+
+        ref_bd_index = self._calendar_index.bd_index(reference_dates).astype(np.int64)
+        missing_dates = np.flatnonzero(ref_bd_index < 0)
+        record(
+            missing_dates,
+            (
+                "Calendar business-day index is missing for "
+                f"{pd.Timestamp(reference_dates[date]).date()}"
+                for date in missing_dates
+            ),
         )
-        return DailyBootstrapResult(curve=curve, diagnostics=diagnostics)
 
-    def _build_instruments(
-        self,
-        observations: pd.DataFrame,
-        *,
-        ref_bd_index: int,
-    ) -> list[BootstrapInstrument]:
-        instruments: list[BootstrapInstrument] = []
-        for row in observations.itertuples(index=False):
-            isin = str(row.isin)
-            schedule: CashflowScheduleArrays | None = (
-                self._cashflows_by_isin.get(isin)
+        slices = self._cashflow_store.future_slices(
+            self._cashflow_store.isin_codes(isins),
+            ref_bd_index[date_code],
+        )
+        counts = slices.counts
+        maturity = np.zeros(len(isins), dtype=np.int64)
+        has_cashflows = counts > 0
+        maturity[has_cashflows] = slices.tenor_bd[slices.offsets[1:][has_cashflows] - 1]
+        invalid_amount = np.bincount(
+            np.repeat(np.arange(len(isins)), counts),
+            weights=~np.isfinite(slices.amount) | (slices.amount <= 0.0),
+            minlength=len(isins),
+        ) > 0
+        long_enough = maturity >= config.min_maturity_bd
+        row_errors = np.select(
+            [
+                ~slices.found,
+                ~has_cashflows,
+                long_enough & invalid_amount,
+            ],
+            [
+                "Cashflow dimension not found for isin=",
+                "No eligible future cashflows found for isin=",
+                "Cashflows must be finite and positive for isin=",
+            ],
+            default="",
+        )
+        failed_rows = np.flatnonzero(row_errors != "")
+        _, first = np.unique(date_code[failed_rows], return_index=True)
+        failed_rows = failed_rows[first]
+        record(
+            date_code[failed_rows],
+            (row_errors[row] + isins[row] for row in failed_rows),
+        )
+
+        eligible = slices.found & has_cashflows & long_enough & ~invalid_amount
+        instrument_counts = np.bincount(
+            date_code,
+            weights=eligible,
+            minlength=n_dates,
+        ).astype(np.int64)
+        empty_dates = np.flatnonzero(instrument_counts == 0)
+        record(
+            empty_dates,
+            ["No eligible instruments remain for bootstrapping"] * empty_dates.size,
+        )
+
+        alive = np.equal(errors, None)
+        rows = np.flatnonzero(eligible & alive[date_code])
+        rows = rows[np.lexsort((rows, maturity[rows], date_code[rows]))]
+        row_dates = date_code[rows]
+        row_maturity = maturity[rows]
+        new_pillar = np.ones(rows.size, dtype=bool)
+        new_pillar[1:] = (np.diff(row_dates) != 0) | (np.diff(row_maturity) != 0)
+        row_pillar = np.cumsum(new_pillar) - 1
+        pillar_date = row_dates[new_pillar]
+        pillar_tenor = row_maturity[new_pillar]
+        pillar_rank = np.arange(pillar_date.size) - np.searchsorted(
+            pillar_date,
+            pillar_date,
+            side="left",
+        )
+        pillar_size = np.bincount(row_pillar, minlength=pillar_date.size)
+        pillar_count = np.bincount(pillar_date, minlength=n_dates)
+
+        max_pillars = int(pillar_count.max(initial=0))
+        node_tenor = np.zeros((n_dates, max_pillars + 1), dtype=np.int64)
+        node_log = np.zeros((n_dates, max_pillars + 1), dtype=np.float64)
+        market_price = observations["market_pu"].to_numpy(dtype=np.float64)[rows]
+        fitted_price = np.full(rows.size, np.nan)
+        lower = float(np.log(config.min_discount_factor))
+        upper = float(np.log(config.max_discount_factor))
+
+        for rank in range(max_pillars):
+            pillars = np.flatnonzero((pillar_rank == rank) & alive[pillar_date])
+            if not pillars.size:
+                break
+            dates = pillar_date[pillars]
+            members = np.flatnonzero(np.isin(row_pillar, pillars))
+            step = _PillarStep.build(
+                slices=slices,
+                rows=rows[members],
+                problem=np.searchsorted(pillars, row_pillar[members]),
+                market_price=market_price[members],
+                shared=pillar_size[pillars] > 1,
+                pillar_tenor=pillar_tenor[pillars],
+                known_tenor=node_tenor[dates, : rank + 1],
+                known_log=node_log[dates, : rank + 1],
             )
-            if schedule is None:
-                raise ValueError(f"Cashflow dimension not found for isin={isin}")
-            tenor_bd, amounts = schedule.future_arrays_as_of(ref_bd_index)
-            if tenor_bd.size == 0:
-                raise ValueError(
-                    f"No eligible future cashflows found for isin={isin}"
-                )
-            if int(tenor_bd[-1]) < self._config.min_maturity_bd:
-                continue
-            tenor_bd = tenor_bd.astype(np.int64, copy=False)
-            amounts = amounts.astype(np.float64, copy=False)
-            if not np.isfinite(amounts).all() or (amounts <= 0.0).any():
-                raise ValueError(
-                    f"Cashflows must be finite and positive for isin={isin}"
-                )
-            instruments.append(
-                BootstrapInstrument(
-                    isin=isin,
-                    instrument_type=str(row.instrument_type),
-                    market_price=float(row.market_pu),
-                    tenor_bd=tenor_bd,
-                    amount=amounts,
-                )
+            log_discount, solved = step.solve(
+                lower=lower,
+                upper=upper,
+                tolerance=config.root_tolerance,
             )
-        return instruments
 
-    def _solve_pillar(
-        self,
-        *,
-        instruments: list[BootstrapInstrument],
-        known_tenors: np.ndarray,
-        known_log_discounts: np.ndarray,
-        maturity_tenor_bd: int,
-    ) -> float:
-        lower = float(np.log(self._config.min_discount_factor))
-        upper = float(np.log(self._config.max_discount_factor))
-
-        def residual(log_discount: float) -> float:
-            tenors = np.append(known_tenors, maturity_tenor_bd)
-            logs = np.append(known_log_discounts, log_discount)
-            return (
-                self._price_instrument(instruments[0], tenors, logs)
-                - instruments[0].market_price
+            failed = np.flatnonzero(~solved)
+            record(
+                dates[failed],
+                (
+                    f"Shared bootstrap pillar failed at tenor_bd={pillar_tenor[pillars[p]]}"
+                    if step.shared[p]
+                    else "Market price cannot be matched inside discount-factor "
+                    f"bounds at tenor_bd={pillar_tenor[pillars[p]]}"
+                    for p in failed
+                ),
             )
-
-        if len(instruments) == 1:
-            lower_residual = residual(lower)
-            upper_residual = residual(upper)
-            if lower_residual == 0.0:
-                return lower
-            if upper_residual == 0.0:
-                return upper
-            if np.signbit(lower_residual) == np.signbit(upper_residual):
-                raise ValueError(
-                    "Market price cannot be matched inside discount-factor "
-                    f"bounds at tenor_bd={maturity_tenor_bd}"
-                )
-            return float(
-                brentq(
-                    residual,
-                    lower,
-                    upper,
-                    xtol=self._config.root_tolerance,
-                    rtol=self._config.root_tolerance,
-                )
+            alive[dates[failed]] = False
+            node_tenor[dates, rank + 1] = pillar_tenor[pillars]
+            node_log[dates, rank + 1] = log_discount
+            fitted_price[members] = step.price(log_discount)
+
+        node_counts = np.where(alive, pillar_count + 1, 0)
+        node_mask = np.arange(max_pillars + 1) < node_counts[:, None]
+        node_offsets = np.zeros(n_dates + 1, dtype=np.int64)
+        np.cumsum(node_counts, out=node_offsets[1:])
+
+        solved_rows = alive[row_dates]
+        pillar_log = node_log[row_dates, pillar_rank[row_pillar] + 1]
+        tenor_years = row_maturity / config.business_days_per_year
+        shared = pillar_size[row_pillar] > 1
+        diagnostics = pd.DataFrame(
+            {
+                "ref_date": reference_dates[row_dates],
+                "isin": isins[rows],
+                "instrument_type": observations["instrument_type"]
+                .astype(str)
+                .to_numpy()[rows],
+                "maturity_tenor_bd": row_maturity,
+                "market_price": market_price,
+                "fitted_price": fitted_price,
+                "price_error": fitted_price - market_price,
+                "discount_factor": np.exp(pillar_log),
+                "zero_rate": np.expm1(-pillar_log / tenor_years),
+                "instruments_at_pillar": pillar_size[row_pillar],
+                "status": np.where(
+                    shared,
+                    "BOOTSTRAPPED_SHARED_PILLAR",
+                    "BOOTSTRAPPED",
+                ).astype(object),
+                "error_type": None,
+                "error_message": None,
+            },
+            columns=DIAGNOSTIC_COLUMNS,
+        ).loc[solved_rows]
+        failed_dates = np.flatnonzero(~alive)
+        if failed_dates.size:
+            failures = pd.DataFrame(
+                {
+                    "ref_date": reference_dates[failed_dates],
+                    "status": "FAILED",
+                    "error_type": ValueError.__name__,
+                    "error_message": errors[failed_dates],
+                },
+                columns=DIAGNOSTIC_COLUMNS,
             )
+            diagnostics = pd.concat(
+                [frame for frame in (diagnostics, failures) if not frame.empty],
+                ignore_index=True,
+            ).sort_values("ref_date", kind="stable")
+
+        return MultiDateBootstrapResult(
+            reference_dates=reference_dates,
+            node_offsets=node_offsets,
+            node_tenor_bd=node_tenor[node_mask],
+            node_log_discount=node_log[node_mask],
+            source_instrument_count=np.where(alive, instrument_counts, 0),
+            error_messages=tuple(errors.tolist()),
+            diagnostics=diagnostics.reset_index(drop=True),
+        )
 
-        def squared_errors(log_discount: float) -> float:
-            tenors = np.append(known_tenors, maturity_tenor_bd)
-            logs = np.append(known_log_discounts, log_discount)
-            errors = np.asarray(
-                [
-                    self._price_instrument(instrument, tenors, logs)
-                    - instrument.market_price
-                    for instrument in instruments
-                ],
-                dtype=np.float64,
-            )
-            return float(errors @ errors)
+    def build_curve(
+        self,
+        result: MultiDateBootstrapResult,
+        position: int,
+    ) -> pd.DataFrame:
+        """Curve grid of one successfully bootstrapped date of `result`."""
+
+        node_tenors, node_log_discounts = result.nodes(position)
+        return self._build_curve(
+            reference_date=pd.Timestamp(result.reference_dates[position]),
+            node_tenors=node_tenors,
+            node_log_discounts=node_log_discounts,
+            source_instrument_count=int(result.source_instrument_count[position]),
+        )
 
-        result = minimize_scalar(
-            squared_errors,
-            bounds=(lower, upper),
-            method="bounded",
-            options={"xatol": self._config.root_tolerance},
+    def build_curve_partitions(
+        self,
+        result: MultiDateBootstrapResult,
+    ) -> dict[str, Callable[[], pd.DataFrame]]:
+        """
+        Lazy Parquet-ready curve batches of `batch_size` solved dates.
+
+        Kedro's ``PartitionedDataset`` invokes each callable immediately
+        before saving its partition, so memory is bounded by one batch of
+        daily curves rather than the complete history.
+        """
+
+        positions = np.flatnonzero(~result.failed)
+        batches = [
+            positions[start : start + self._config.batch_size]
+            for start in range(0, positions.size, self._config.batch_size)
+        ]
+        progress = tqdm(
+            total=len(batches),
+            desc="Bootstrapping public-bond curves",
+            unit="batch",
+            disable=not self._config.show_progress,
+            dynamic_ncols=True,
         )
-        if not result.success or not np.isfinite(result.fun):
-            raise ValueError(
-                f"Shared bootstrap pillar failed at tenor_bd={maturity_tenor_bd}"
+        return {
+            f"batch_{batch_index:05d}": self._lazy_curve_batch(
+                result=result,
+                batch=batch,
+                partition_id=f"batch_{batch_index:05d}",
+                progress=progress,
             )
-        return float(result.x)
+            for batch_index, batch in enumerate(batches)
+        }
 
-    @staticmethod
-    def _price_instrument(
-        instrument: BootstrapInstrument,
-        node_tenors: np.ndarray,
-        node_log_discounts: np.ndarray,
-    ) -> float:
-        log_discounts = np.interp(
-            instrument.tenor_bd.astype(np.float64),
-            node_tenors,
-            node_log_discounts,
-        )
-        return float(instrument.amount @ np.exp(log_discounts))
+    def _lazy_curve_batch(
+        self,
+        *,
+        result: MultiDateBootstrapResult,
+        batch: np.ndarray,
+        partition_id: str,
+        progress: Any,
+    ) -> Callable[[], pd.DataFrame]:
+        def calculate_batch() -> pd.DataFrame:
+            curves = pd.concat(
+                [self.build_curve(result, int(position)) for position in batch],
+                ignore_index=True,
+            )
+            progress.set_postfix_str(partition_id, refresh=False)
+            progress.update(1)
+            if progress.n >= progress.total:
+                progress.close()
+            return curves
+
+        return calculate_batch
 
     def _build_curve(
         self,
@@ -451,13 +905,41 @@ class PublicBondBootstrapper:
         )
 
 
+def bootstrap_discount_curve(curve: pd.DataFrame) -> LogLinearDiscountCurve:
+    """Rebuild the pillar-node discount curve of one persisted bootstrap date."""
+
+    if curve["ref_date"].nunique() != 1:
+        raise ValueError("bootstrap_discount_curve requires exactly one date")
+    pillars = curve.loc[curve["is_bootstrap_pillar"].astype(bool)].sort_values(
+        "tenor_bd"
+    )
+    if pillars.empty:
+        raise ValueError("Bootstrap curve has no pillars")
+    return LogLinearDiscountCurve.from_discount_factors(
+        pillars["tenor_bd"].to_numpy(dtype=np.float64),
+        pillars["discount_factor"].to_numpy(dtype=np.float64),
+    )
+
+
 def bootstrap_public_bond_curves(
     curve_inputs: pd.DataFrame,
     cashflow_dimension: pd.DataFrame,
     calendar_df: pd.DataFrame,
     parameters: Mapping[str, Any],
-) -> tuple[pd.DataFrame, pd.DataFrame]:
-    """Bootstrap all eligible dates, reusing the static cashflow dimension."""
+) -> tuple[dict[str, Callable[[], pd.DataFrame]], pd.DataFrame]:
+    """
+    Bootstrap all eligible dates, reusing the static cashflow dimension.
+
+    Pillars of every date are solved up front; the curve grids are returned
+    as lazy `batch_NNNNN` partitions (see `build_curve_partitions`), together
+    with the diagnostics frame.
+
+    With `workers` other than one (None uses every core), contiguous ref_date
+    shards are solved in a process pool. The cashflow store is written once
+    to a temporary file that every worker memory-maps, and shard results are
+    joined in date order. Dates are solved independently, so the result is
+    identical to a serial run.
+    """
 
     config = BootstrapConfig.from_mapping(parameters)
     bootstrapper = PublicBondBootstrapper(
@@ -467,58 +949,61 @@ def bootstrap_public_bond_curves(
     )
     observations = bootstrapper.prepare_inputs(curve_inputs)
     if observations.empty:
-        return (
-            pd.DataFrame(columns=CURVE_COLUMNS),
-            pd.DataFrame(columns=DIAGNOSTIC_COLUMNS),
-        )
-
-    curve_batches: list[pd.DataFrame] = []
-    current_batch: list[pd.DataFrame] = []
-    diagnostics: list[pd.DataFrame] = []
-    grouped = observations.groupby("ref_date", sort=True, observed=True)
-    progress = tqdm(
-        grouped,
-        total=observations["ref_date"].nunique(),
-        desc="Bootstrapping public-bond curves",
-        unit="date",
-        disable=not config.show_progress,
-        dynamic_ncols=True,
-    )
-    for reference_date, daily_observations in progress:
-        try:
-            result = bootstrapper.bootstrap(daily_observations)
-        except Exception as exc:
-            diagnostics.append(
-                pd.DataFrame(
-                    [
-                        {
-                            "ref_date": pd.Timestamp(reference_date),
-                            "status": "FAILED",
-                            "error_type": type(exc).__name__,
-                            "error_message": str(exc),
-                        }
-                    ],
-                    columns=DIAGNOSTIC_COLUMNS,
-                )
+        return {}, pd.DataFrame(columns=DIAGNOSTIC_COLUMNS)
+
+    workers = resolve_workers(config.workers)
+    if workers == 1:
+        result = bootstrapper.bootstrap_many(observations)
+    else:
+        result = _bootstrap_in_processes(bootstrapper, observations, workers)
+    return bootstrapper.build_curve_partitions(result), result.diagnostics
+
+
+def _bootstrap_in_processes(
+    bootstrapper: PublicBondBootstrapper,
+    observations: pd.DataFrame,
+    workers: int,
+) -> MultiDateBootstrapResult:
+    shards = [
+        observations.iloc[positions]
+        for positions in ref_date_shards(
+            observations["ref_date"],
+            workers * SHARDS_PER_WORKER,
+        )
+    ]
+    with tempfile.TemporaryDirectory(prefix="bootstrap_cashflow_store_") as directory:
+        cashflow_store_path = str(Path(directory) / "cashflow_store.bin")
+        bootstrapper.cashflow_store.save(cashflow_store_path)
+
+        with ProcessPoolExecutor(
+            max_workers=min(workers, len(shards)),
+            initializer=_attach_bootstrap_worker,
+            initargs=(
+                cashflow_store_path,
+                bootstrapper.calendar_index,
+                bootstrapper.config,
+            ),
+        ) as executor:
+            return MultiDateBootstrapResult.concat(
+                list(executor.map(_bootstrap_shard, shards))
             )
-            continue
-
-        current_batch.append(result.curve)
-        diagnostics.append(result.diagnostics)
-        if len(current_batch) == config.batch_size:
-            curve_batches.append(pd.concat(current_batch, ignore_index=True))
-            current_batch.clear()
-
-    if current_batch:
-        curve_batches.append(pd.concat(current_batch, ignore_index=True))
-    curves = (
-        pd.concat(curve_batches, ignore_index=True)
-        if curve_batches
-        else pd.DataFrame(columns=CURVE_COLUMNS)
-    )
-    diagnostic_frame = (
-        pd.concat(diagnostics, ignore_index=True)
-        if diagnostics
-        else pd.DataFrame(columns=DIAGNOSTIC_COLUMNS)
+
+
+# Bootstrapper attached once per worker process by `_attach_bootstrap_worker`.
+_WORKER_STATE: dict[str, Any] = {}
+
+
+def _attach_bootstrap_worker(
+    cashflow_store_path: str,
+    calendar_index: CalendarIndex,
+    config: BootstrapConfig,
+) -> None:
+    _WORKER_STATE["bootstrapper"] = PublicBondBootstrapper.from_lookups(
+        cashflow_store=CashflowStore.load(cashflow_store_path, mmap=True),
+        calendar_index=calendar_index,
+        config=config,
     )
-    return curves, diagnostic_frame[DIAGNOSTIC_COLUMNS]
+
+
+def _bootstrap_shard(observations: pd.DataFrame) -> MultiDateBootstrapResult:
+    return _WORKER_STATE["bootstrapper"].bootstrap_many(observations)
@@ -115,8 +115,8 @@ def format_partitioned_curves(
 
 
 def data_treatment(
-    flat_forward_curves: pd.DataFrame,
-    bootstrapping_curves: pd.DataFrame,
+    flat_forward_curves: Mapping[str, CurvePartition],
+    bootstrapping_curves: Mapping[str, CurvePartition],
     nelson_siegel_curves: Mapping[str, CurvePartition],
     svensson_curves: Mapping[str, CurvePartition],
     kernel_ridge_curves: Mapping[str, CurvePartition],
@@ -130,12 +130,12 @@ def data_treatment(
 ]:
     """Create one wide, test-ready DataFrame for each curve methodology."""
 
-    flat_forward = _validate_and_pivot_curve(
+    flat_forward = format_partitioned_curves(
         flat_forward_curves,
         rate_column="zero_rate",
         source_name="flat_forward",
     )
-    bootstrapping = _validate_and_pivot_curve(
+    bootstrapping = format_partitioned_curves(
         bootstrapping_curves,
         rate_column="zero_rate",
         source_name="bootstrapping",
@@ -5,6 +5,8 @@ from dataclasses import dataclass
 import numpy as np
 import pandas as pd
 
+from engine_product.calendars import CalendarIndex
+
 from .contracts import EvaluationContext
 from .repricing import zero_coupon_price
 
@@ -23,19 +25,11 @@ def _repeated_ltn_pairs(
         observations["instrument_type"].eq("LTN")
     ].copy()
     ltn["ref_date"] = pd.to_datetime(ltn["ref_date"]).dt.normalize()
-    business_calendar = calendar.loc[
-        calendar["is_business_day"], ["date", "bd_index"]
-    ].copy()
-    business_calendar["date"] = pd.to_datetime(
-        business_calendar["date"]
-    ).dt.normalize()
-    ltn = ltn.merge(
-        business_calendar.rename(
-            columns={"date": "ref_date", "bd_index": "ref_bd_index"}
-        ),
-        on="ref_date",
-        how="inner",
-    )
+    ltn["ref_bd_index"] = CalendarIndex.from_calendar_df(calendar).bd_index(
+        ltn["ref_date"],
+        business_days_only=True,
+    ).astype(np.int64)
+    ltn = ltn.loc[ltn["ref_bd_index"].ge(0)].reset_index(drop=True)
     next_rows = ltn[
         ["isin", "ref_bd_index", "ref_date", "market_ytm", "market_pu"]
     ].rename(
@@ -3,15 +3,21 @@
 from .interpolation import (
     FlatForwardConfig,
     FlatForwardInterpolator,
+    FlatForwardMatrices,
     PublicBondCurveBatchBuilder,
     interpolate_flat_forward,
     interpolate_flat_forward_batch,
+    interpolate_flat_forward_partitions,
+    interpolate_flat_forward_wide,
 )
 
 __all__ = [
     "FlatForwardConfig",
     "FlatForwardInterpolator",
+    "FlatForwardMatrices",
     "PublicBondCurveBatchBuilder",
     "interpolate_flat_forward",
     "interpolate_flat_forward_batch",
+    "interpolate_flat_forward_partitions",
+    "interpolate_flat_forward_wide",
 ]
@@ -1,11 +1,13 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Iterable, Protocol, Sequence
+from typing import Callable, Iterable, Protocol, Sequence
 
 import numpy as np
 import pandas as pd
 
+from engine_product.pricing.curves import LogLinearDiscountCurve
+
 
 CURVE_COLUMNS = [
     "tenor_bd",
@@ -36,6 +38,25 @@ class FlatForwardConfig:
             raise ValueError("business_days_per_year must be strictly positive")
 
 
+@dataclass(frozen=True)
+class FlatForwardMatrices:
+    """
+    Curves of many dates on one grid, as (dates x grid) matrices.
+
+    Row i of `zero_rate`, `discount_factor` and `forward_rate` is the curve
+    of the i-th date; column j is `tenor_bd[j]`.
+    """
+
+    tenor_bd: np.ndarray
+    tenor_years: np.ndarray
+    zero_rate: np.ndarray
+    discount_factor: np.ndarray
+    forward_rate: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.zero_rate)
+
+
 class CurveInterpolator(Protocol):
     """Minimal dependency accepted by the batch orchestration service."""
 
@@ -47,6 +68,18 @@ class CurveInterpolator(Protocol):
         """Interpolate one curve on its configured target grid."""
 
 
+class BatchCurveInterpolator(CurveInterpolator, Protocol):
+    """Interpolator that also handles many dates in one call."""
+
+    def interpolate_many(
+        self,
+        offsets: np.ndarray,
+        tenors: np.ndarray,
+        rates: np.ndarray,
+    ) -> FlatForwardMatrices:
+        """Interpolate the ragged knots of many dates on the target grid."""
+
+
 class FlatForwardInterpolator:
     """
     Interpolate zero rates by keeping the forward rate flat per segment.
@@ -95,6 +128,111 @@ class FlatForwardInterpolator:
             columns=CURVE_COLUMNS,
         )
 
+    def interpolate_many(
+        self,
+        offsets: np.ndarray,
+        tenors: np.ndarray,
+        rates: np.ndarray,
+    ) -> FlatForwardMatrices:
+        """
+        Interpolate many dates at once from ragged knots.
+
+        Date i owns `tenors[offsets[i]:offsets[i + 1]]` and the matching
+        rates. Knots are snapped to BU vertices and averaged per (date,
+        vertex) with one `np.unique`, and every grid point of every date finds
+        its segment with one `searchsorted` over the date-keyed knots. Row i
+        equals `interpolate` on date i's knots, up to the rounding of the
+        vertex means.
+        """
+        offsets = np.asarray(offsets, dtype=np.int64)
+        tenor_values = np.asarray(tenors, dtype=np.float64)
+        rate_values = np.asarray(rates, dtype=np.float64)
+        if offsets.ndim != 1 or offsets.size < 2 or offsets[0] != 0:
+            raise ValueError("offsets must start at zero and have one entry per date plus one")
+        if offsets[-1] != tenor_values.size:
+            raise ValueError("offsets must cover tenors and rates")
+        counts = np.diff(offsets)
+        if (counts <= 0).any():
+            raise ValueError("every date must contain at least one observation")
+        self._validate_knots(tenor_values, rate_values)
+
+        owner = np.repeat(np.arange(counts.size), counts)
+        tenor_bd = np.maximum(
+            np.rint(tenor_values * self._config.business_days_per_year).astype(np.int64),
+            1,
+        )
+        target_bd = np.arange(
+            1,
+            self._config.max_years * self._config.business_days_per_year + 1,
+            dtype=np.int32,
+        )
+        span = max(int(tenor_bd.max()), int(target_bd[-1])) + 1
+
+        # One key per (date, vertex): duplicated vertices of a date collapse
+        # into one knot holding the mean log discount, like `_normalize_knots`.
+        knot_keys, inverse, vertex_counts = np.unique(
+            owner * span + tenor_bd,
+            return_inverse=True,
+            return_counts=True,
+        )
+        knot_log_discounts = (
+            np.bincount(
+                inverse.reshape(-1),
+                weights=-tenor_values * np.log1p(rate_values),
+                minlength=knot_keys.size,
+            )
+            / vertex_counts
+        )
+        knot_dates = knot_keys // span
+        knot_times = (knot_keys % span) / self._config.business_days_per_year
+        knot_starts = np.searchsorted(knot_dates, np.arange(counts.size), side="left")
+        knot_counts = np.diff(np.append(knot_starts, knot_keys.size))
+
+        # Segment k of a date ends at its knot k and starts at the previous
+        # knot, or at the (0, 0) anchor for the first knot.
+        first_knot = np.zeros(knot_keys.size, dtype=bool)
+        first_knot[knot_starts] = True
+        left_times = np.where(first_knot, 0.0, np.roll(knot_times, 1))
+        left_log_discounts = np.where(first_knot, 0.0, np.roll(knot_log_discounts, 1))
+        segment_slopes = (knot_log_discounts - left_log_discounts) / (
+            knot_times - left_times
+        )
+
+        # For targets after the final knot of a date, the last segment is
+        # extrapolated, as in `_interpolate_log_discounts`.
+        target_times = target_bd / self._config.business_days_per_year
+        dates = np.arange(counts.size)[:, None]
+        segments = np.searchsorted(knot_keys, dates * span + target_bd, side="left")
+        segments = np.minimum(
+            segments - knot_starts[:, None],
+            knot_counts[:, None] - 1,
+        ) + knot_starts[:, None]
+
+        selected_slopes = segment_slopes[segments]
+        log_discounts = left_log_discounts[segments] + selected_slopes * (
+            target_times - left_times[segments]
+        )
+        return FlatForwardMatrices(
+            tenor_bd=target_bd,
+            tenor_years=target_times,
+            zero_rate=np.expm1(-log_discounts / target_times),
+            discount_factor=np.exp(log_discounts),
+            forward_rate=np.expm1(-selected_slopes),
+        )
+
+    def discount_curve(
+        self,
+        tenors: Sequence[float] | pd.Series,
+        rates: Sequence[float] | pd.Series,
+    ) -> LogLinearDiscountCurve:
+        """Knot-based DiscountCurve that reproduces `interpolate` off-grid."""
+
+        knot_times, knot_log_discounts = self._normalize_knots(tenors, rates)
+        return LogLinearDiscountCurve(
+            node_tenor_bd=np.rint(knot_times * self._config.business_days_per_year),
+            node_log_discount=knot_log_discounts,
+        )
+
     def _normalize_knots(
         self,
         tenors: Sequence[float] | pd.Series,
@@ -102,19 +240,7 @@ class FlatForwardInterpolator:
     ) -> tuple[np.ndarray, np.ndarray]:
         tenor_values = np.asarray(tenors, dtype=np.float64)
         rate_values = np.asarray(rates, dtype=np.float64)
-
-        if tenor_values.ndim != 1 or rate_values.ndim != 1:
-            raise ValueError("tenors and rates must be one-dimensional")
-        if tenor_values.size == 0:
-            raise ValueError("tenors and rates must contain at least one observation")
-        if tenor_values.size != rate_values.size:
-            raise ValueError("tenors and rates must have the same length")
-        if not np.isfinite(tenor_values).all() or not np.isfinite(rate_values).all():
-            raise ValueError("tenors and rates must contain only finite values")
-        if (tenor_values <= 0.0).any():
-            raise ValueError("tenors must be strictly positive")
-        if (rate_values <= -1.0).any():
-            raise ValueError("rates must be greater than -1")
+        self._validate_knots(tenor_values, rate_values)
 
         log_discounts = -tenor_values * np.log1p(rate_values)
         tenor_bd = np.rint(
@@ -143,6 +269,21 @@ class FlatForwardInterpolator:
             normalized["log_discount"].to_numpy(dtype=np.float64),
         )
 
+    @staticmethod
+    def _validate_knots(tenor_values: np.ndarray, rate_values: np.ndarray) -> None:
+        if tenor_values.ndim != 1 or rate_values.ndim != 1:
+            raise ValueError("tenors and rates must be one-dimensional")
+        if tenor_values.size == 0:
+            raise ValueError("tenors and rates must contain at least one observation")
+        if tenor_values.size != rate_values.size:
+            raise ValueError("tenors and rates must have the same length")
+        if not np.isfinite(tenor_values).all() or not np.isfinite(rate_values).all():
+            raise ValueError("tenors and rates must contain only finite values")
+        if (tenor_values <= 0.0).any():
+            raise ValueError("tenors must be strictly positive")
+        if (rate_values <= -1.0).any():
+            raise ValueError("rates must be greater than -1")
+
     @staticmethod
     def _interpolate_log_discounts(
         *,
@@ -202,42 +343,164 @@ class PublicBondCurveBatchBuilder:
         self._batch_size = batch_size
 
     def build(self, curve_inputs: pd.DataFrame) -> pd.DataFrame:
+        partitions = self.build_partitions(curve_inputs)
+        if not partitions:
+            return self._empty_result()
+
+        return pd.concat(
+            [calculate_batch() for calculate_batch in partitions.values()],
+            ignore_index=True,
+        )
+
+    def build_partitions(
+        self,
+        curve_inputs: pd.DataFrame,
+    ) -> dict[str, Callable[[], pd.DataFrame]]:
+        """
+        Lazy Parquet-ready batches of `batch_size` dates, keyed `batch_NNNNN`.
+
+        Kedro's ``PartitionedDataset`` invokes each callable immediately
+        before saving its partition, so memory is bounded by one batch of
+        daily curves rather than the complete history.
+        """
+        observations, dates = self._dated_observations(curve_inputs)
+        return {
+            f"batch_{batch_index:05d}": self._lazy_batch(
+                observations,
+                dates[start : start + self._batch_size],
+            )
+            for batch_index, start in enumerate(
+                range(0, len(dates), self._batch_size)
+            )
+        }
+
+    def build_wide(self, curve_inputs: pd.DataFrame) -> dict[str, pd.DataFrame]:
+        """
+        Zero, discount and forward curves as ref_date x tenor_bd frames.
+
+        Every date is interpolated in one `interpolate_many` call. Frames are
+        indexed by `ref_date` with string `tenor_bd` columns, the layout
+        `data_treatment` otherwise pivots from the long batches.
+        """
+        observations, dates = self._dated_observations(curve_inputs)
+        if not dates:
+            raise ValueError("No valid curve observations remain")
+
+        ref_dates, matrices, _ = self._interpolate_dates(observations, dates)
+        index = pd.DatetimeIndex(ref_dates, name="ref_date")
+        columns = pd.Index(matrices.tenor_bd.astype(str))
+        return {
+            column: pd.DataFrame(
+                getattr(matrices, column),
+                index=index,
+                columns=columns,
+            )
+            for column in ("zero_rate", "discount_factor", "forward_rate")
+        }
+
+    def _dated_observations(
+        self,
+        curve_inputs: pd.DataFrame,
+    ) -> tuple[pd.DataFrame, list[tuple[pd.Timestamp, np.ndarray]]]:
         missing_columns = self._required_columns.difference(curve_inputs.columns)
         if missing_columns:
             missing = ", ".join(sorted(missing_columns))
             raise ValueError(f"Missing required columns: {missing}")
 
         observations = self._prepare_observations(curve_inputs)
-        if observations.empty:
-            return self._empty_result()
+        dates = sorted(
+            observations.groupby("ref_date", sort=True, observed=True)
+            .indices
+            .items()
+        )
+        return observations, dates
 
-        curve_batches: list[pd.DataFrame] = []
-        batch: list[pd.DataFrame] = []
+    def _interpolate_dates(
+        self,
+        observations: pd.DataFrame,
+        dates: Sequence[tuple[pd.Timestamp, np.ndarray]],
+    ) -> tuple[pd.DatetimeIndex, FlatForwardMatrices, np.ndarray]:
+        counts = np.asarray([positions.size for _, positions in dates], dtype=np.int64)
+        offsets = np.zeros(counts.size + 1, dtype=np.int64)
+        np.cumsum(counts, out=offsets[1:])
+        selected = observations.iloc[
+            np.concatenate([positions for _, positions in dates])
+        ]
+        matrices = self._interpolate_many(
+            offsets,
+            selected["macaulay_duration"].to_numpy(dtype=np.float64),
+            selected["market_ytm"].to_numpy(dtype=np.float64),
+        )
+        source_tenor_counts = (
+            selected.groupby("ref_date", sort=True, observed=True)[
+                "macaulay_duration"
+            ]
+            .nunique()
+            .to_numpy()
+        )
+        return (
+            pd.DatetimeIndex([ref_date for ref_date, _ in dates]),
+            matrices,
+            source_tenor_counts,
+        )
+
+    def _interpolate_many(
+        self,
+        offsets: np.ndarray,
+        tenors: np.ndarray,
+        rates: np.ndarray,
+    ) -> FlatForwardMatrices:
+        """
+        Use `interpolate_many` when available, else `interpolate` per date.
+
+        Injected interpolators only need `interpolate`; the per-date curves
+        are stacked into the same dates x grid matrices.
+        """
+        interpolate_many = getattr(self._interpolator, "interpolate_many", None)
+        if interpolate_many is not None:
+            return interpolate_many(offsets, tenors, rates)
+
+        curves = [
+            self._interpolator.interpolate(tenors[start:end], rates[start:end])
+            for start, end in zip(offsets[:-1], offsets[1:])
+        ]
+        return FlatForwardMatrices(
+            tenor_bd=curves[0]["tenor_bd"].to_numpy(),
+            tenor_years=curves[0]["tenor_years"].to_numpy(),
+            **{
+                column: np.vstack([curve[column].to_numpy() for curve in curves])
+                for column in ("zero_rate", "discount_factor", "forward_rate")
+            },
+        )
 
-        for ref_date, daily_observations in observations.groupby(
-            "ref_date", sort=True, observed=True
-        ):
-            curve = self._interpolator.interpolate(
-                tenors=daily_observations["macaulay_duration"],
-                rates=daily_observations["market_ytm"],
+    def _lazy_batch(
+        self,
+        observations: pd.DataFrame,
+        dates: Sequence[tuple[pd.Timestamp, np.ndarray]],
+    ) -> Callable[[], pd.DataFrame]:
+        def calculate_batch() -> pd.DataFrame:
+            ref_dates, matrices, source_tenor_counts = self._interpolate_dates(
+                observations,
+                dates,
             )
-            curve.insert(0, "ref_date", ref_date)
-            curve["source_tenor_count"] = int(
-                daily_observations["macaulay_duration"].nunique()
+            grid_size = matrices.tenor_bd.size
+            return pd.DataFrame(
+                {
+                    "ref_date": ref_dates.repeat(grid_size),
+                    "tenor_bd": np.tile(matrices.tenor_bd, len(ref_dates)),
+                    "tenor_years": np.tile(matrices.tenor_years, len(ref_dates)),
+                    "zero_rate": matrices.zero_rate.ravel(),
+                    "discount_factor": matrices.discount_factor.ravel(),
+                    "forward_rate": matrices.forward_rate.ravel(),
+                    "source_tenor_count": np.repeat(
+                        source_tenor_counts,
+                        grid_size,
+                    ).astype("int16"),
+                },
+                columns=BATCH_CURVE_COLUMNS,
             )
-            batch.append(curve)
-
-            if len(batch) == self._batch_size:
-                curve_batches.append(pd.concat(batch, ignore_index=True))
-                batch.clear()
-
-        if batch:
-            curve_batches.append(pd.concat(batch, ignore_index=True))
 
-        result = pd.concat(curve_batches, ignore_index=True)
-        result["ref_date"] = pd.to_datetime(result["ref_date"])
-        result["source_tenor_count"] = result["source_tenor_count"].astype("int16")
-        return result[BATCH_CURVE_COLUMNS]
+        return calculate_batch
 
     def _prepare_observations(self, curve_inputs: pd.DataFrame) -> pd.DataFrame:
         observations = curve_inputs[
@@ -306,6 +569,28 @@ def interpolate_flat_forward(
     return interpolator.interpolate(tenors=tenors, rates=rates)
 
 
+def _public_bond_batch_builder(
+    *,
+    start_date: str | pd.Timestamp,
+    max_years: int,
+    business_days_per_year: int,
+    instrument_types: Iterable[str],
+    batch_size: int,
+) -> PublicBondCurveBatchBuilder:
+    interpolator = FlatForwardInterpolator(
+        FlatForwardConfig(
+            max_years=max_years,
+            business_days_per_year=business_days_per_year,
+        )
+    )
+    return PublicBondCurveBatchBuilder(
+        interpolator=interpolator,
+        start_date=start_date,
+        instrument_types=instrument_types,
+        batch_size=batch_size,
+    )
+
+
 def interpolate_flat_forward_batch(
     curve_inputs: pd.DataFrame,
     *,
@@ -317,16 +602,49 @@ def interpolate_flat_forward_batch(
 ) -> pd.DataFrame:
     """Functional API for many reference dates."""
 
-    interpolator = FlatForwardInterpolator(
-        FlatForwardConfig(
-            max_years=max_years,
-            business_days_per_year=business_days_per_year,
-        )
-    )
-    builder = PublicBondCurveBatchBuilder(
-        interpolator=interpolator,
+    return _public_bond_batch_builder(
         start_date=start_date,
+        max_years=max_years,
+        business_days_per_year=business_days_per_year,
         instrument_types=instrument_types,
         batch_size=batch_size,
-    )
-    return builder.build(curve_inputs)
+    ).build(curve_inputs)
+
+
+def interpolate_flat_forward_partitions(
+    curve_inputs: pd.DataFrame,
+    *,
+    start_date: str | pd.Timestamp = "2020-01-01",
+    max_years: int = 20,
+    business_days_per_year: int = 252,
+    instrument_types: Iterable[str] = ("LTN", "NTN-F"),
+    batch_size: int = 64,
+) -> dict[str, Callable[[], pd.DataFrame]]:
+    """Functional API for many reference dates as lazy batch partitions."""
+
+    return _public_bond_batch_builder(
+        start_date=start_date,
+        max_years=max_years,
+        business_days_per_year=business_days_per_year,
+        instrument_types=instrument_types,
+        batch_size=batch_size,
+    ).build_partitions(curve_inputs)
+
+
+def interpolate_flat_forward_wide(
+    curve_inputs: pd.DataFrame,
+    *,
+    start_date: str | pd.Timestamp = "2020-01-01",
+    max_years: int = 20,
+    business_days_per_year: int = 252,
+    instrument_types: Iterable[str] = ("LTN", "NTN-F"),
+) -> dict[str, pd.DataFrame]:
+    """Functional API for many reference dates as wide rate matrices."""
+
+    return _public_bond_batch_builder(
+        start_date=start_date,
+        max_years=max_years,
+        business_days_per_year=business_days_per_year,
+        instrument_types=instrument_types,
+        batch_size=1,
+    ).build_wide(curve_inputs)
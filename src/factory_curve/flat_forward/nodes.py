@@ -1,19 +1,19 @@
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, Callable
 
 import pandas as pd
 
-from .interpolation import interpolate_flat_forward_batch
+from .interpolation import interpolate_flat_forward_partitions
 
 
 def build_public_bonds_flat_forward_curves(
     curve_inputs: pd.DataFrame,
     parameters: dict[str, Any],
-) -> pd.DataFrame:
-    """Build daily public-bond curves on every BU/252 tenor in one batch."""
+) -> dict[str, Callable[[], pd.DataFrame]]:
+    """Build daily public-bond curves on every BU/252 tenor as lazy batches."""
 
-    return interpolate_flat_forward_batch(
+    return interpolate_flat_forward_partitions(
         curve_inputs,
         start_date=parameters.get("start_date", "2020-01-01"),
         max_years=int(parameters.get("max_years", 20)),
@@ -6,10 +6,8 @@ from typing import Any, Mapping, Sequence
 import numpy as np
 import pandas as pd
 
-from engine_product.pricing.cashflow_arrays import (
-    build_bd_index_lookup,
-    build_cashflow_schedule_lookup,
-)
+from engine_product.calendars import CalendarIndex
+from engine_product.pricing.cashflow_store import CashflowStore
 
 from .model import KernelRidgeDailyModel, kernel_matrix
 
@@ -216,10 +214,10 @@ class CurveDataBuilder:
         calendar_df: pd.DataFrame,
         config: KernelRidgeConfig,
     ) -> None:
-        self._cashflows_by_isin = build_cashflow_schedule_lookup(
+        self._cashflow_store = CashflowStore.from_cashflow_dimension(
             cashflow_dimension
         )
-        self._bd_index_by_date = build_bd_index_lookup(calendar_df)
+        self._calendar_index = CalendarIndex.from_calendar_df(calendar_df)
         self._config = config
 
     def prepare_inputs(self, curve_inputs: pd.DataFrame) -> pd.DataFrame:
@@ -272,11 +270,11 @@ class CurveDataBuilder:
             raise ValueError("CurveDataBuilder.build requires exactly one date")
         reference_date = pd.Timestamp(reference_dates[0])
         ref_date_key = reference_date.date()
-        if ref_date_key not in self._bd_index_by_date:
+        ref_bd_index = int(self._calendar_index.bd_index(reference_date))
+        if ref_bd_index < 0:
             raise ValueError(
                 f"Calendar business-day index is missing for {ref_date_key}"
             )
-        ref_bd_index = self._bd_index_by_date[ref_date_key]
         if daily_observations["isin"].astype(str).duplicated().any():
             raise ValueError(
                 f"Duplicate ISINs found for {reference_date.date().isoformat()}"
@@ -285,14 +283,15 @@ class CurveDataBuilder:
         schedules: list[tuple[np.ndarray, np.ndarray]] = []
         rows: list[Any] = []
         all_tenors: list[np.ndarray] = []
-        for row in daily_observations.itertuples(index=False):
+        slices = self._cashflow_store.future_slices(
+            self._cashflow_store.isin_codes(daily_observations["isin"]),
+            ref_bd_index,
+        )
+        for row_index, row in enumerate(daily_observations.itertuples(index=False)):
             isin = str(row.isin)
-            schedule = self._cashflows_by_isin.get(isin)
-            if schedule is None:
+            if not slices.found[row_index]:
                 raise ValueError(f"Cashflow dimension not found for isin={isin}")
-            future = schedule.payment_bd_index > ref_bd_index
-            tenor_bd = schedule.payment_bd_index[future] - ref_bd_index
-            amounts = schedule.amount[future]
+            tenor_bd, amounts = slices.row(row_index)
             if tenor_bd.size == 0:
                 raise ValueError(
                     f"No future cashflows found for isin={isin} at "
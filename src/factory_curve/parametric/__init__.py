@@ -5,6 +5,7 @@ from .calculator import (
     CurveCalculationConfig,
     ModelDimensionBuilder,
     ParametricCurveCalculator,
+    ParametricDiscountCurve,
 )
 from .core import (
     CurveFitConfig,
@@ -25,6 +26,7 @@ __all__ = [
     "ModifiedDurationWeighting",
     "ModelDimensionBuilder",
     "ParametricCurveCalculator",
+    "ParametricDiscountCurve",
     "ProfiledWLSObjective",
     "fit_models_by_date",
     "prepare_curve_inputs",
@@ -84,6 +84,35 @@ def _optional_float(value: Any) -> float:
     return converted
 
 
+@dataclass(frozen=True)
+class ParametricDiscountCurve:
+    """
+    Fitted parametric zero curve as a DiscountCurve.
+
+    Fitted rates are effective annual yields on BU/252 year tenors, so the
+    discount factor is ``(1 + rate) ** -tenor_years``.
+    """
+
+    specification: LoadingSpecification
+    lambdas: np.ndarray
+    betas: np.ndarray
+    business_days_per_year: int = 252
+
+    def zero_rates(self, tenor_bd: Sequence[int] | np.ndarray) -> np.ndarray:
+        return self._zero_rates(self._tenor_years(tenor_bd))
+
+    def discount_factors(self, tenor_bd: Sequence[int] | np.ndarray) -> np.ndarray:
+        tenor_years = self._tenor_years(tenor_bd)
+        return np.exp(-tenor_years * np.log1p(self._zero_rates(tenor_years)))
+
+    def _tenor_years(self, tenor_bd: Sequence[int] | np.ndarray) -> np.ndarray:
+        return np.asarray(tenor_bd, dtype=np.float64) / self.business_days_per_year
+
+    def _zero_rates(self, tenor_years: np.ndarray) -> np.ndarray:
+        design = self.specification.design_matrix(tenor_years, self.lambdas)
+        return design @ self.betas
+
+
 class ParametricCurveCalculator:
     """Calculate a curve grid and dimension row from one fitted model."""
 
@@ -117,21 +146,7 @@ class ParametricCurveCalculator:
         self,
         model: RegressionResultsWrapper,
     ) -> pd.DataFrame:
-        metadata = self._validated_metadata(model)
-        lambdas = np.array(
-            [
-                metadata["lambdas"][name]
-                for name in self._specification.lambda_names
-            ],
-            dtype=np.float64,
-        )
-        betas = np.array(
-            [
-                _named_value(model.params, name, index)
-                for index, name in enumerate(self._specification.beta_names)
-            ],
-            dtype=np.float64,
-        )
+        metadata, lambdas, betas = self._parameters(model)
         design = self._specification.design_matrix(
             self._tenor_years,
             lambdas,
@@ -149,6 +164,20 @@ class ParametricCurveCalculator:
             }
         )
 
+    def discount_curve(
+        self,
+        model: RegressionResultsWrapper,
+    ) -> ParametricDiscountCurve:
+        """DiscountCurve view of one fitted model, without building the grid."""
+
+        _, lambdas, betas = self._parameters(model)
+        return ParametricDiscountCurve(
+            specification=self._specification,
+            lambdas=lambdas,
+            betas=betas,
+            business_days_per_year=self._config.business_days_per_year,
+        )
+
     def parameter_record(
         self,
         model: RegressionResultsWrapper,
@@ -261,6 +290,27 @@ class ParametricCurveCalculator:
             "rsquared_adj",
         ]
 
+    def _parameters(
+        self,
+        model: RegressionResultsWrapper,
+    ) -> tuple[Mapping[str, Any], np.ndarray, np.ndarray]:
+        metadata = self._validated_metadata(model)
+        lambdas = np.array(
+            [
+                metadata["lambdas"][name]
+                for name in self._specification.lambda_names
+            ],
+            dtype=np.float64,
+        )
+        betas = np.array(
+            [
+                _named_value(model.params, name, index)
+                for index, name in enumerate(self._specification.beta_names)
+            ],
+            dtype=np.float64,
+        )
+        return metadata, lambdas, betas
+
     def _validated_metadata(
         self,
         model: RegressionResultsWrapper,
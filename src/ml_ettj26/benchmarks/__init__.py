@@ -0,0 +1 @@
+"""Synthetic market data and offline benchmark harnesses."""
@@ -0,0 +1,483 @@
+"""
+Curve-factory model benchmarks and scaling curves.
+
+    flat-forward       → interpolate_flat_forward_partitions
+    bootstrap          → bootstrap_public_bond_curves
+    nelson-siegel      → fit_models_by_date (Nelson-Siegel specification)
+    svensson           → fit_models_by_date (Svensson specification)
+    kernel-ridge-tune  → tune_kernel_ridge_hyperparameters (LOOCV grid)
+    kernel-ridge-fit   → fit_kernel_ridge_models
+
+Each case fixes the number of dates, the bonds per day (a synthetic volume
+scale) and the curve grid (`max_years × business_days_per_year`). Sweeping
+one axis at a time and regressing log(seconds) on log(axis) gives the
+scaling exponent of each model along that axis: ~1 is linear, ~0 flat.
+
+Curve inputs are built once per volume scale from the synthetic market, with
+the columnar mart node, before anything is timed. A fit is one estimated
+curve, except for LOOCV tuning where it is one (date, grid point) pair, so
+seconds_per_fit extrapolates a reduced benchmark grid to the production one.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, replace
+from typing import Any, Callable, Mapping, Sequence
+
+import numpy as np
+import pandas as pd
+
+from factory_curve.bootstrapping.core import bootstrap_public_bond_curves
+from factory_curve.flat_forward.interpolation import interpolate_flat_forward_partitions
+from factory_curve.kernel_ridge.core import KernelRidgeConfig
+from factory_curve.kernel_ridge.nodes import (
+    fit_kernel_ridge_models,
+    tune_kernel_ridge_hyperparameters,
+)
+from factory_curve.nelson_siegel.model import NelsonSiegelSpecification
+from factory_curve.parametric.core import CurveFitConfig, fit_models_by_date
+from factory_curve.svensson.model import SvenssonSpecification
+from ml_ettj26.pipelines.curve_factory.public_bonds_mart.nodes_dimension_batch import (
+    build_public_bonds_curve_inputs_columnar,
+)
+
+from .harness import LOWER_IS_BETTER, StageTimer, run_benchmark, safe_rate
+from .synthetic_market import (
+    SyntheticMarketConfig,
+    build_synthetic_curve_candidates,
+    generate_synthetic_market,
+)
+
+
+DATES_AXIS = "dates"
+BONDS_AXIS = "bonds_per_day"
+GRID_AXIS = "grid_size"
+BASE_AXIS = "base"
+
+# A grid point of LOOCV costs the same whatever its value, so a few points
+# measure the per-fit cost of the 20 × 8 × 9 production grid.
+BENCHMARK_KERNEL_RIDGE_GRID = {
+    "alpha": [0.05, 0.10, 0.15],
+    "delta": [0.0, 0.01],
+    "ridge": [1.0, 10.0],
+}
+
+CURVE_FACTORY_METRICS = {
+    "seconds_per_date": LOWER_IS_BETTER,
+    "peak_mb_per_date": LOWER_IS_BETTER,
+}
+
+
+@dataclass(frozen=True)
+class CurveBenchmarkCase:
+    """One point of a sweep; `axis` names the dimension being varied."""
+
+    dates: int
+    bonds_scale: float
+    max_years: int
+    axis: str = BASE_AXIS
+
+    def __post_init__(self) -> None:
+        if self.dates <= 0 or self.bonds_scale <= 0 or self.max_years <= 0:
+            raise ValueError("dates, bonds_scale and max_years must be positive")
+
+    @property
+    def size(self) -> str:
+        return f"d{self.dates}-b{self.bonds_scale:g}-y{self.max_years}"
+
+
+@dataclass(frozen=True)
+class CurveBenchmarkInputs:
+    case: CurveBenchmarkCase
+    curve_inputs: pd.DataFrame
+    cashflow_dimension: pd.DataFrame
+    calendar_df: pd.DataFrame
+
+    @property
+    def ref_dates(self) -> pd.DatetimeIndex:
+        return pd.DatetimeIndex(self.curve_inputs["ref_date"].unique()).sort_values()
+
+    @property
+    def bonds_per_day(self) -> float:
+        return float(len(self.curve_inputs) / max(len(self.ref_dates), 1))
+
+
+def scaling_cases(
+    dates: Sequence[int] = (10, 20, 40),
+    bonds_scales: Sequence[float] = (1, 2, 4),
+    max_years: Sequence[int] = (5, 10, 20),
+) -> list[CurveBenchmarkCase]:
+    """
+    One sweep per axis; the others stay at their first value.
+
+    The shared base point is emitted once, tagged `base`, and counts as a
+    point of every sweep when exponents are estimated.
+    """
+    base = CurveBenchmarkCase(dates[0], bonds_scales[0], max_years[0])
+    cases = [base]
+
+    cases += [replace(base, axis=DATES_AXIS, dates=value) for value in dates[1:]]
+    cases += [replace(base, axis=BONDS_AXIS, bonds_scale=value) for value in bonds_scales[1:]]
+    cases += [replace(base, axis=GRID_AXIS, max_years=value) for value in max_years[1:]]
+
+    return cases
+
+
+def synthetic_curve_inputs(
+    cases: Sequence[CurveBenchmarkCase],
+    config: SyntheticMarketConfig = SyntheticMarketConfig(),
+) -> list[CurveBenchmarkInputs]:
+    """
+    Curve inputs for each case, one synthetic market per volume scale.
+
+    The market covers the longest case and shorter cases keep its first
+    dates, so the dates sweep measures more history of the same market.
+    """
+    years = (max(case.dates for case in cases) + 10) / 250
+    by_scale: dict[float, tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]] = {}
+
+    for scale in sorted({case.bonds_scale for case in cases}):
+        market = generate_synthetic_market(replace(config.scaled(scale), years=years))
+        curve_inputs, _ = build_public_bonds_curve_inputs_columnar(
+            curve_candidates=build_synthetic_curve_candidates(market),
+            cashflow_dimension=market.cashflow_dimension,
+            calendar_df=market.calendar_df,
+        )
+        by_scale[scale] = (curve_inputs, market.cashflow_dimension, market.calendar_df)
+
+    inputs = []
+
+    for case in cases:
+        curve_inputs, cashflow_dimension, calendar_df = by_scale[case.bonds_scale]
+        ref_dates = np.sort(curve_inputs["ref_date"].unique())
+
+        if ref_dates.size < case.dates:
+            raise ValueError(f"Synthetic market has only {ref_dates.size} dates")
+
+        inputs.append(
+            CurveBenchmarkInputs(
+                case=case,
+                curve_inputs=curve_inputs.loc[
+                    curve_inputs["ref_date"].isin(ref_dates[: case.dates])
+                ].reset_index(drop=True),
+                cashflow_dimension=cashflow_dimension,
+                calendar_df=calendar_df,
+            )
+        )
+
+    return inputs
+
+
+def model_parameters(
+    parameters: Mapping[str, Any],
+    section: str,
+    inputs: CurveBenchmarkInputs,
+) -> dict[str, Any]:
+    """A parameters.yml section set to the case's dates and grid, without progress bars."""
+
+    first_date = inputs.ref_dates[0].date().isoformat()
+
+    return {
+        **parameters.get(section, {}),
+        "start_date": first_date,
+        "production_start_date": first_date,
+        "tuning_cutoff_date": (inputs.ref_dates[-1] + pd.Timedelta(days=1)).date().isoformat(),
+        "max_years": inputs.case.max_years,
+        "show_progress": False,
+    }
+
+
+def consume_curve_partitions(
+    partitions: Mapping[str, Callable[[], pd.DataFrame]],
+) -> tuple[int, int]:
+    """Compute lazy curve batches one at a time, as Kedro saves them."""
+
+    fits = curve_rows = 0
+    for calculate_batch in partitions.values():
+        curves = calculate_batch()
+        fits += int(curves["ref_date"].nunique())
+        curve_rows += len(curves)
+
+    return fits, curve_rows
+
+
+def flat_forward_benchmark(
+    inputs: CurveBenchmarkInputs,
+    parameters: Mapping[str, Any],
+    timer: StageTimer,
+) -> dict[str, Any]:
+    values = model_parameters(parameters, "flat_forward", inputs)
+
+    with timer.stage("fit"):
+        partitions = interpolate_flat_forward_partitions(
+            inputs.curve_inputs,
+            start_date=values["start_date"],
+            max_years=values["max_years"],
+            business_days_per_year=int(values.get("business_days_per_year", 252)),
+            instrument_types=tuple(values.get("instrument_types", ("LTN", "NTN-F"))),
+            batch_size=int(values.get("batch_size", 64)),
+        )
+        fits, curve_rows = consume_curve_partitions(partitions)
+
+    return {"fits": fits, "curve_rows": curve_rows}
+
+
+def bootstrap_benchmark(
+    inputs: CurveBenchmarkInputs,
+    parameters: Mapping[str, Any],
+    timer: StageTimer,
+) -> dict[str, Any]:
+    with timer.stage("fit"):
+        partitions, diagnostics = bootstrap_public_bond_curves(
+            inputs.curve_inputs,
+            inputs.cashflow_dimension,
+            inputs.calendar_df,
+            model_parameters(parameters, "bootstrapping", inputs),
+        )
+        fits, curve_rows = consume_curve_partitions(partitions)
+
+    return {
+        "fits": fits,
+        "curve_rows": curve_rows,
+        "failed_dates": int(diagnostics["status"].eq("FAILED").sum()),
+    }
+
+
+def parametric_benchmark(
+    section: str,
+    specification_factory: Callable[[Mapping[str, Any]], Any],
+    lambda_count: int,
+    min_observations: int,
+) -> Callable[[CurveBenchmarkInputs, Mapping[str, Any], StageTimer], dict[str, Any]]:
+    def benchmark(
+        inputs: CurveBenchmarkInputs,
+        parameters: Mapping[str, Any],
+        timer: StageTimer,
+    ) -> dict[str, Any]:
+        values = model_parameters(parameters, section, inputs)
+        config = CurveFitConfig.from_mapping(
+            values,
+            expected_lambda_count=lambda_count,
+            default_min_observations=min_observations,
+        )
+
+        with timer.stage("fit"):
+            models = fit_models_by_date(
+                inputs.curve_inputs,
+                specification=specification_factory(values),
+                config=config,
+            )
+
+        return {"fits": len(models)}
+
+    return benchmark
+
+
+def kernel_ridge_tune_benchmark(
+    inputs: CurveBenchmarkInputs,
+    parameters: Mapping[str, Any],
+    timer: StageTimer,
+) -> dict[str, Any]:
+    values = {
+        **model_parameters(parameters, "kernel_ridge", inputs),
+        "hyperparameter_grid": BENCHMARK_KERNEL_RIDGE_GRID,
+    }
+    config = KernelRidgeConfig.from_mapping(values)
+    calibration_dates = pd.DataFrame(
+        {
+            "ref_date": inputs.ref_dates,
+            "tuning_cutoff_date": config.tuning_cutoff_date,
+        }
+    )
+
+    with timer.stage("fit"):
+        search, _ = tune_kernel_ridge_hyperparameters(
+            inputs.curve_inputs,
+            inputs.cashflow_dimension,
+            inputs.calendar_df,
+            calibration_dates,
+            values,
+        )
+
+    return {
+        "fits": int(len(search) * len(calibration_dates)),
+        "grid_points": int(len(search)),
+        "failed_grid_points": int(search["n_failed_dates"].gt(0).sum()),
+    }
+
+
+def kernel_ridge_fit_benchmark(
+    inputs: CurveBenchmarkInputs,
+    parameters: Mapping[str, Any],
+    timer: StageTimer,
+) -> dict[str, Any]:
+    values = model_parameters(parameters, "kernel_ridge", inputs)
+    selected = pd.DataFrame([{"alpha": 0.10, "delta": 0.0, "ridge": 1.0}])
+
+    with timer.stage("fit"):
+        models = fit_kernel_ridge_models(
+            inputs.curve_inputs,
+            inputs.cashflow_dimension,
+            inputs.calendar_df,
+            selected,
+            values,
+        )
+
+    return {"fits": len(models)}
+
+
+MODELS: dict[
+    str,
+    Callable[[CurveBenchmarkInputs, Mapping[str, Any], StageTimer], dict[str, Any]],
+] = {
+    "flat-forward": flat_forward_benchmark,
+    "bootstrap": bootstrap_benchmark,
+    "nelson-siegel": parametric_benchmark(
+        "nelson_siegel",
+        lambda values: NelsonSiegelSpecification(),
+        lambda_count=1,
+        min_observations=4,
+    ),
+    "svensson": parametric_benchmark(
+        "svensson",
+        lambda values: SvenssonSpecification(
+            min_lambda_ratio=float(values.get("min_lambda_ratio", 1.2))
+        ),
+        lambda_count=2,
+        min_observations=5,
+    ),
+    "kernel-ridge-tune": kernel_ridge_tune_benchmark,
+    "kernel-ridge-fit": kernel_ridge_fit_benchmark,
+}
+
+
+def run_curve_factory_benchmarks(
+    inputs: Sequence[CurveBenchmarkInputs],
+    parameters: Mapping[str, Any],
+    models: Sequence[str] = tuple(MODELS),
+    repeats: int = 1,
+    trace_memory: bool = True,
+    business_days_per_year: int = 252,
+) -> list[dict[str, Any]]:
+    """
+    One result per (case, model), with per-date and per-fit costs.
+
+    Each model runs once untimed on the first case, so its first
+    measurement does not pay lazy imports.
+    """
+
+    unknown = sorted(set(models).difference(MODELS))
+    if unknown:
+        raise KeyError(f"Unknown curve-factory benchmark models: {unknown}")
+
+    results = []
+    warmed: set[str] = set()
+
+    for case_inputs in inputs:
+        case = case_inputs.case
+        dates = len(case_inputs.ref_dates)
+
+        for model in models:
+            run = run_benchmark(
+                lambda timer: MODELS[model](case_inputs, parameters, timer),
+                repeats=repeats,
+                trace_memory=trace_memory,
+                warmup=0 if model in warmed else 1,
+            )
+            warmed.add(model)
+            fits = int(run.counts.get("fits", 0))
+            peak_mb = run.measured_peak_mb
+
+            results.append(
+                {
+                    "model": model,
+                    "axis": case.axis,
+                    "size": case.size,
+                    "dates": dates,
+                    "bonds": int(len(case_inputs.curve_inputs)),
+                    "bonds_per_day": case_inputs.bonds_per_day,
+                    "grid_size": case.max_years * business_days_per_year,
+                    "fits": fits,
+                    "seconds": run.measured_seconds,
+                    "seconds_per_date": run.measured_seconds / dates,
+                    "seconds_per_fit": run.measured_seconds / fits if fits else None,
+                    "fits_per_second": safe_rate(fits, run.measured_seconds),
+                    "peak_mb": peak_mb,
+                    "peak_mb_per_date": peak_mb / dates if peak_mb is not None else None,
+                    "repeats": run.repeats,
+                    "counts": run.counts,
+                }
+            )
+
+    return results
+
+
+def log_log_slope(x: Sequence[float], y: Sequence[float]) -> float | None:
+    """Least-squares slope of log(y) on log(x); None below two usable points."""
+
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    usable = (x > 0) & (y > 0) & np.isfinite(x) & np.isfinite(y)
+
+    if np.unique(x[usable]).size < 2:
+        return None
+
+    return float(np.polyfit(np.log(x[usable]), np.log(y[usable]), 1)[0])
+
+
+def scaling_exponents(
+    results: Sequence[Mapping[str, Any]],
+    metrics: Sequence[str] = ("seconds", "peak_mb"),
+) -> list[dict[str, Any]]:
+    """
+    Log-log exponent of each metric along each swept axis, per model.
+
+    Points of an axis are its own cases plus the `base` case.
+    """
+    exponents = []
+    models = list(dict.fromkeys(result["model"] for result in results))
+
+    for model in models:
+        model_results = [result for result in results if result["model"] == model]
+
+        for axis in (DATES_AXIS, BONDS_AXIS, GRID_AXIS):
+            points = [
+                result for result in model_results if result["axis"] in (axis, BASE_AXIS)
+            ]
+            if not any(result["axis"] == axis for result in points):
+                continue
+
+            for metric in metrics:
+                exponents.append(
+                    {
+                        "model": model,
+                        "axis": axis,
+                        "metric": metric,
+                        "exponent": log_log_slope(
+                            [result[axis] for result in points],
+                            [result[metric] or 0.0 for result in points],
+                        ),
+                        "points": len(points),
+                    }
+                )
+
+    return exponents
+
+
+def curve_factory_report_summary(results: Sequence[Mapping[str, Any]]) -> pd.DataFrame:
+    """Flat table of the main metrics, for printing."""
+
+    columns = [
+        "model",
+        "axis",
+        "size",
+        "dates",
+        "bonds_per_day",
+        "grid_size",
+        "fits",
+        "seconds",
+        "seconds_per_date",
+        "seconds_per_fit",
+        "peak_mb_per_date",
+    ]
+    return pd.DataFrame([{column: result[column] for column in columns} for result in results])
@@ -0,0 +1,301 @@
+"""
+Timing, memory and baseline helpers shared by the benchmark suites.
+
+A benchmark is a callable that receives a StageTimer and wraps each stage in
+`timer.stage(name)`. `run_benchmark` repeats it, keeping the fastest time of
+each stage; memory is traced (tracemalloc) only on the first repeat, so with
+`repeats > 1` the reported times come from untraced runs.
+
+Reports are plain JSON dicts. `compare_to_baseline` matches results by key
+and flags metrics that moved past a relative threshold in the bad direction.
+`run_report_script` is the shared `main()` tail of the benchmark scripts.
+"""
+
+from __future__ import annotations
+
+import argparse
+import cProfile
+import json
+import platform
+import pstats
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Iterator, Mapping, Sequence
+
+import numpy as np
+
+
+MB = 1024 * 1024
+
+HIGHER_IS_BETTER = "higher"
+LOWER_IS_BETTER = "lower"
+
+
+@dataclass
+class StageTimer:
+    """
+    Wall time and traced memory per named stage.
+
+    Memory is relative to the traced memory when the timer was created, so
+    inputs built before the benchmark do not count. A stage entered several
+    times (once per file, say) adds up its time and keeps its highest peak.
+    `setup` stages are reported but left out of `measured_seconds`.
+    """
+
+    trace_memory: bool = False
+    seconds: dict[str, float] = field(default_factory=dict)
+    peak_mb: dict[str, float] = field(default_factory=dict)
+    setup: set[str] = field(default_factory=set)
+    _origin: int = 0
+
+    def __post_init__(self) -> None:
+        if self.trace_memory:
+            self._origin = tracemalloc.get_traced_memory()[0]
+
+    @contextmanager
+    def stage(self, name: str, setup: bool = False) -> Iterator[None]:
+        if self.trace_memory:
+            tracemalloc.reset_peak()
+
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.seconds[name] = self.seconds.get(name, 0.0) + time.perf_counter() - start
+
+            if self.trace_memory:
+                self.peak_mb[name] = max(
+                    self.peak_mb.get(name, 0.0),
+                    (tracemalloc.get_traced_memory()[1] - self._origin) / MB,
+                )
+            if setup:
+                self.setup.add(name)
+
+    @property
+    def measured_seconds(self) -> float:
+        return float(
+            sum(seconds for name, seconds in self.seconds.items() if name not in self.setup)
+        )
+
+
+@dataclass(frozen=True)
+class BenchmarkRun:
+    """Fastest time per stage over the repeats, memory from the traced run."""
+
+    seconds: dict[str, float]
+    peak_mb: dict[str, float]
+    setup: frozenset[str]
+    counts: dict[str, Any]
+    repeats: int
+
+    @property
+    def measured_seconds(self) -> float:
+        return float(
+            sum(seconds for name, seconds in self.seconds.items() if name not in self.setup)
+        )
+
+    @property
+    def measured_peak_mb(self) -> float | None:
+        peaks = [peak for name, peak in self.peak_mb.items() if name not in self.setup]
+        return max(peaks) if peaks else None
+
+    def stages(self) -> dict[str, dict[str, Any]]:
+        return {
+            name: {
+                "seconds": seconds,
+                "peak_mb": self.peak_mb.get(name),
+                "setup": name in self.setup,
+            }
+            for name, seconds in self.seconds.items()
+        }
+
+
+def run_benchmark(
+    benchmark: Callable[[StageTimer], Mapping[str, Any] | None],
+    repeats: int = 1,
+    trace_memory: bool = True,
+    warmup: int = 0,
+) -> BenchmarkRun:
+    """
+    Run `benchmark` `repeats` times; it returns optional counts (first run).
+
+    `warmup` untimed runs go first, so one-off costs such as lazy imports and
+    caches filled on first call stay out of the times and the memory peak.
+    """
+    if repeats < 1:
+        raise ValueError("repeats must be a positive integer")
+    if warmup < 0:
+        raise ValueError("warmup must be non-negative")
+
+    for _ in range(warmup):
+        benchmark(StageTimer())
+
+    seconds: dict[str, float] = {}
+    peak_mb: dict[str, float] = {}
+    setup: set[str] = set()
+    counts: dict[str, Any] = {}
+
+    for repeat in range(repeats):
+        traced = trace_memory and repeat == 0
+        started_tracing = traced and not tracemalloc.is_tracing()
+
+        if started_tracing:
+            tracemalloc.start()
+
+        try:
+            timer = StageTimer(trace_memory=traced)
+            result = benchmark(timer)
+        finally:
+            if started_tracing:
+                tracemalloc.stop()
+
+        if repeat == 0:
+            counts = dict(result or {})
+            peak_mb = dict(timer.peak_mb)
+
+        setup |= timer.setup
+        for name, value in timer.seconds.items():
+            seconds[name] = min(value, seconds.get(name, np.inf))
+
+    return BenchmarkRun(
+        seconds=seconds,
+        peak_mb=peak_mb,
+        setup=frozenset(setup),
+        counts=counts,
+        repeats=repeats,
+    )
+
+
+def safe_rate(count: int | float, seconds: float) -> float:
+    if seconds <= 0.0:
+        return 0.0
+
+    return float(count / seconds)
+
+
+def environment_info() -> dict[str, Any]:
+    return {
+        "created_at_utc": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "numpy": np.__version__,
+    }
+
+
+def result_key(result: Mapping[str, Any], key_fields: Sequence[str]) -> tuple:
+    return tuple(str(result.get(name)) for name in key_fields)
+
+
+def compare_to_baseline(
+    results: Sequence[Mapping[str, Any]],
+    baseline_results: Sequence[Mapping[str, Any]],
+    metrics: Mapping[str, str],
+    key_fields: Sequence[str] = ("scenario", "size"),
+    threshold: float = 0.10,
+) -> dict[str, Any]:
+    """
+    Compare each result with the baseline result that has the same key.
+
+    `metrics` maps a metric name to HIGHER_IS_BETTER or LOWER_IS_BETTER. A
+    regression is a move of more than `threshold` (relative) in the bad
+    direction; results or metrics missing on either side are skipped.
+    """
+    if threshold < 0:
+        raise ValueError("threshold must be non-negative")
+
+    baseline = {result_key(result, key_fields): result for result in baseline_results}
+    comparisons = []
+    regressions = []
+
+    for result in results:
+        key = result_key(result, key_fields)
+        previous = baseline.get(key)
+
+        if previous is None:
+            continue
+
+        for metric, direction in metrics.items():
+            if direction not in (HIGHER_IS_BETTER, LOWER_IS_BETTER):
+                raise ValueError(f"Unknown metric direction: {direction}")
+
+            current_value = result.get(metric)
+            baseline_value = previous.get(metric)
+
+            if current_value is None or not baseline_value:
+                continue
+
+            ratio = float(current_value) / float(baseline_value)
+            regressed = (
+                ratio < 1.0 - threshold
+                if direction == HIGHER_IS_BETTER
+                else ratio > 1.0 + threshold
+            )
+            comparison = {
+                **dict(zip(key_fields, key)),
+                "metric": metric,
+                "baseline": float(baseline_value),
+                "current": float(current_value),
+                "ratio": ratio,
+                "regressed": regressed,
+            }
+            comparisons.append(comparison)
+
+            if regressed:
+                regressions.append(comparison)
+
+    return {
+        "threshold": threshold,
+        "comparisons": comparisons,
+        "regressions": regressions,
+    }
+
+
+def write_report(report: Mapping[str, Any], path: str | Path) -> None:
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(report, indent=2, default=str) + "\n", encoding="utf-8")
+
+
+def read_report(path: str | Path) -> dict[str, Any]:
+    return json.loads(Path(path).read_text(encoding="utf-8"))
+
+
+def run_report_script(
+    args: argparse.Namespace,
+    run: Callable[[argparse.Namespace], dict[str, Any]],
+    summary: Callable[[Mapping[str, Any]], str],
+) -> None:
+    """
+    Run a benchmark script: profile, save, print and flag regressions.
+
+    `run` builds the report from the parsed arguments, under cProfile when
+    `args.cprofile_out` is set. The report is written to `args.output`,
+    `summary(report)` goes to stderr and the JSON to stdout. Exits with code
+    1 when the baseline comparison found regressions.
+    """
+    if args.cprofile_out:
+        profiler = cProfile.Profile()
+        profiler.enable()
+        report = run(args)
+        profiler.disable()
+        profiler.dump_stats(args.cprofile_out)
+
+        stats = pstats.Stats(profiler).sort_stats("cumtime")
+        stats.print_stats(args.pstats_top)
+    else:
+        report = run(args)
+
+    if args.output:
+        write_report(report, args.output)
+
+    print(summary(report), file=sys.stderr)
+    print(json.dumps(report, indent=2, default=str))
+
+    if report.get("comparison", {}).get("regressions"):
+        sys.exit(1)
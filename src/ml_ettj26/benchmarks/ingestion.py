@@ -0,0 +1,509 @@
+"""
+Trusted-layer ingestion throughput benchmarks.
+
+    price-report → build_b3_di1_trusted_month (B3 PriceReport XML)
+    swap         → build_b3_swap_trusted_range_partitioned (B3 swap TXT)
+    demab        → DemabTrustedBuilder.build_quotes_df (BCB DEMAB CSV)
+    sgs          → SgsTrustedBuilder.build_points_df (BCB SGS JSON)
+
+Every parser runs in two modes over the same raw files, written by the
+synthetic market in the production layout:
+
+    builder → the public entry point, end to end;
+    stages  → the builder's steps replayed with the same domain functions,
+              timed as zip_open, header_probe, sha256, parse, normalize
+              (rows → domain records) and dataframe.
+
+Stages a format does not have are absent (SGS is plain JSON, so it has no
+zip_open nor header_probe). A stages total far from the builder time means
+the replay no longer follows the builder. Throughput is input MB (files on
+disk) and output rows per second.
+"""
+
+from __future__ import annotations
+
+import zipfile
+from contextlib import ExitStack
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from io import BytesIO
+from pathlib import Path
+from typing import Any, Callable, Mapping, Sequence
+
+import pandas as pd
+
+from ml_ettj26.domain.b3_DerivativeMarket.SwapMarketRates.file_discovery import (
+    list_zip_files_in_date_range,
+)
+from ml_ettj26.domain.b3_DerivativeMarket.SwapMarketRates.mapper import (
+    SwapLineMapper,
+    SwapLineMapperConfig,
+)
+from ml_ettj26.domain.b3_DerivativeMarket.SwapMarketRates.parsing import parse_swap_txt_line
+from ml_ettj26.domain.b3_DerivativeMarket.SwapMarketRates.zip_reader import sha256_bytes
+from ml_ettj26.domain.b3_PriceReport.models import DataLineage, InstrumentMaster
+from ml_ettj26.domain.b3_PriceReport.parsing import iter_di1_quotes, rank_xml_candidates
+from ml_ettj26.domain.b3_PriceReport.service import (
+    build_b3_di1_trusted_month,
+    build_first_bd_by_ym,
+    di1_maturity_from_ticker,
+)
+from ml_ettj26.domain.b3_PriceReport.zip_reader import NestedZipReader, sha256_zip_member
+from ml_ettj26.domain.bcb_demab.normalize import normalize_demab_df, row_to_quote
+from ml_ettj26.domain.bcb_demab.parsing import read_demab_csv
+from ml_ettj26.domain.bcb_demab.service import DemabIngestConfig, DemabTrustedBuilder
+from ml_ettj26.domain.bcb_demab.zip_reader import get_single_csv_name, open_csv_stream
+from ml_ettj26.domain.bcb_sgs.normalize import normalize_sgs_records
+from ml_ettj26.domain.bcb_sgs.parsing import parse_series_id_from_filename, read_sgs_json
+from ml_ettj26.domain.bcb_sgs.service import SgsIngestConfig, SgsTrustedBuilder
+from ml_ettj26.pipelines.trusted.b3.DerivativeMarket.SwapMarketRates.DIxPRE.nodes import (
+    build_b3_swap_trusted_range_partitioned,
+    dataclasses_to_dataframe,
+)
+from ml_ettj26.utils.io.fs import file_sha256
+
+from .harness import HIGHER_IS_BETTER, LOWER_IS_BETTER, MB, StageTimer, run_benchmark, safe_rate
+from .synthetic_market import (
+    SyntheticMarketConfig,
+    generate_synthetic_market,
+    write_synthetic_market,
+)
+
+
+STAGES_MODE = "stages"
+BUILDER_MODE = "builder"
+
+SWAP_TARGET_COD_PROD = "T1PRE"
+SWAP_ADJUSTED_VALUE_SCALE = 100_000
+
+INGESTION_METRICS = {
+    "mb_per_second": HIGHER_IS_BETTER,
+    "rows_per_second": HIGHER_IS_BETTER,
+    "peak_mb": LOWER_IS_BETTER,
+}
+
+
+@dataclass(frozen=True)
+class IngestionFixtures:
+    """Raw files of one synthetic market, by parser, plus its calendar."""
+
+    size: str
+    files: dict[str, list[Path]]
+    raw_dirs: dict[str, Path]
+    calendar_df: pd.DataFrame
+    start_date: str
+    end_date: str
+
+    def input_bytes(self, parser: str) -> int:
+        return int(sum(path.stat().st_size for path in self.files[parser]))
+
+
+def write_ingestion_fixtures(
+    config: SyntheticMarketConfig,
+    root: str | Path,
+    size: str,
+) -> IngestionFixtures:
+    market = generate_synthetic_market(config)
+    paths = write_synthetic_market(market, root)
+    raw_dirs = {
+        "price-report": paths["b3_price_report"],
+        "swap": paths["b3_swap"],
+        "demab": paths["bcb_demab"],
+        "sgs": paths["bcb_sgs"],
+    }
+    patterns = {"price-report": "*.zip", "swap": "*.zip", "demab": "NegE*.ZIP", "sgs": "*.json"}
+
+    return IngestionFixtures(
+        size=size,
+        files={
+            parser: sorted(raw_dir.glob(patterns[parser]))
+            for parser, raw_dir in raw_dirs.items()
+        },
+        raw_dirs=raw_dirs,
+        calendar_df=market.calendar_df.assign(date=pd.to_datetime(market.calendar_df["date"])),
+        start_date=config.start_date.isoformat(),
+        end_date=config.end_date.isoformat(),
+    )
+
+
+def price_report_months(fixtures: IngestionFixtures) -> list[tuple[int, int]]:
+    stamps = sorted({path.stem.rsplit("_", 1)[-1][:6] for path in fixtures.files["price-report"]})
+    return [(int(stamp[:4]), int(stamp[4:])) for stamp in stamps]
+
+
+def price_report_builder(fixtures: IngestionFixtures, timer: StageTimer) -> dict[str, Any]:
+    rows = 0
+    instrument_master = None
+
+    with timer.stage("builder"):
+        for year, month in price_report_months(fixtures):
+            quotes, _, instrument_master = build_b3_di1_trusted_month(
+                raw_zip_paths=[str(path) for path in fixtures.files["price-report"]],
+                bd_index_df=fixtures.calendar_df,
+                year=year,
+                month=month,
+                previous_instrument_master_df=instrument_master,
+            )
+            rows += len(quotes)
+
+    return {"rows": rows}
+
+
+def price_report_stages(fixtures: IngestionFixtures, timer: StageTimer) -> dict[str, Any]:
+    ingestion_ts = datetime.now(timezone.utc)
+    first_bd_by_ym: dict = {}
+    months_seen: set[str] = set()
+    quotes = []
+    lineages = []
+    instruments: dict[str, InstrumentMaster] = {}
+    payload_bytes = 0
+
+    for path in fixtures.files["price-report"]:
+        with ExitStack() as stack:
+            with timer.stage("zip_open"):
+                inner = stack.enter_context(NestedZipReader(str(path)).open_inner_zip())
+                xml_names = [name for name in inner.namelist() if name.lower().endswith(".xml")]
+
+            with timer.stage("header_probe"):
+                candidate = rank_xml_candidates(inner, xml_names)[0]
+                snapshot_ts = candidate.snapshot_dt or ingestion_ts
+
+            with timer.stage("sha256"):
+                file_hash = sha256_zip_member(inner, candidate.xml_name)
+
+            lineage_id = f"{path.name}|<inner_in_memory.zip>|{candidate.xml_name}|{snapshot_ts.isoformat()}|{file_hash}"
+            payload_bytes += inner.getinfo(candidate.xml_name).file_size
+
+            with timer.stage("parse"):
+                with inner.open(candidate.xml_name) as stream:
+                    day_quotes = list(
+                        iter_di1_quotes(
+                            stream,
+                            snapshot_ts_utc=snapshot_ts,
+                            lineage_id=lineage_id,
+                            ingestion_ts_utc=ingestion_ts,
+                        )
+                    )
+
+        with timer.stage("normalize"):
+            # The builder runs once per month and rebuilds the month map each time.
+            month = path.stem.rsplit("_", 1)[-1][:6]
+            if month not in months_seen:
+                months_seen.add(month)
+                first_bd_by_ym = build_first_bd_by_ym(fixtures.calendar_df)
+
+            for quote in day_quotes:
+                ticker = quote.TckrSymb
+                if ticker not in instruments:
+                    instruments[ticker] = InstrumentMaster(
+                        TckrSymb=ticker,
+                        asset="DI1",
+                        contract_month_code=ticker[3],
+                        contract_year=2000 + int(ticker[4:6]),
+                        maturity_date=di1_maturity_from_ticker(ticker, first_bd_by_ym),
+                    )
+            lineages.append(
+                DataLineage(
+                    lineage_id=lineage_id,
+                    outer_zip=path.name,
+                    inner_zip="<inner_in_memory.zip>",
+                    xml_name=candidate.xml_name,
+                    snapshot_ts_utc=snapshot_ts.isoformat(),
+                    hash_file=file_hash,
+                    ingestion_ts_utc=ingestion_ts,
+                )
+            )
+            quotes.extend(day_quotes)
+
+    with timer.stage("dataframe"):
+        quotes_df = dataclasses_to_dataframe(quotes)
+        dataclasses_to_dataframe(lineages)
+        dataclasses_to_dataframe(list(instruments.values()))
+
+    return {"rows": int(len(quotes_df)), "payload_bytes": payload_bytes}
+
+
+def swap_builder(fixtures: IngestionFixtures, timer: StageTimer) -> dict[str, Any]:
+    with timer.stage("builder"):
+        partitions, _, _ = build_b3_swap_trusted_range_partitioned(
+            raw_dir=str(fixtures.raw_dirs["swap"]),
+            start_date=fixtures.start_date,
+            end_date=fixtures.end_date,
+            target_cod_prod=SWAP_TARGET_COD_PROD,
+        )
+
+    return {"rows": int(sum(len(frame) for frame in partitions.values()))}
+
+
+def swap_stages(fixtures: IngestionFixtures, timer: StageTimer) -> dict[str, Any]:
+    mapper = SwapLineMapper(config=SwapLineMapperConfig(adjusted_value_scale=SWAP_ADJUSTED_VALUE_SCALE))
+    zip_paths = list_zip_files_in_date_range(
+        raw_dir=fixtures.raw_dirs["swap"],
+        start_date=fixtures.start_date,
+        end_date=fixtures.end_date,
+    )
+    rows = 0
+    payload_bytes = 0
+
+    for path in zip_paths:
+        with timer.stage("zip_open"):
+            with zipfile.ZipFile(path) as outer:
+                inner_zip_name = outer.namelist()[0]
+                inner_zip_bytes = outer.read(inner_zip_name)
+
+        with timer.stage("header_probe"):
+            start = inner_zip_bytes.find(b"PK\x03\x04")
+
+        with timer.stage("zip_open"):
+            with zipfile.ZipFile(BytesIO(inner_zip_bytes[start:])) as inner:
+                txt_name = inner.namelist()[0]
+                txt_bytes = inner.read(txt_name)
+
+        with timer.stage("sha256"):
+            hash_file = sha256_bytes(txt_bytes)
+
+        payload_bytes += len(txt_bytes)
+
+        with timer.stage("parse"):
+            text = txt_bytes.decode("cp1252")
+            records = [
+                parse_swap_txt_line(line.rstrip("\n"))
+                for line in text.splitlines()
+                if line.strip()
+            ]
+
+        with timer.stage("normalize"):
+            lineage = mapper.to_data_lineage(
+                outer_zip=path.name,
+                inner_zip=inner_zip_name,
+                txt_name=txt_name,
+                hash_file=hash_file,
+            )
+            swap_rows = [mapper.to_swap_dixpre(record, lineage.lineage_id) for record in records]
+            masters = {record.codigo_produto: mapper.to_swap_master(record) for record in records}
+
+        with timer.stage("dataframe"):
+            swap = dataclasses_to_dataframe(swap_rows)
+            dataclasses_to_dataframe(list(masters.values()))
+            swap = swap.loc[swap["CodProd"] == SWAP_TARGET_COD_PROD]
+            trade_dates = pd.to_datetime(swap["TradDt"]).dt.strftime("%Y-%m-%d")
+            for _, partition in swap.groupby(trade_dates, sort=True):
+                rows += len(
+                    partition.drop_duplicates(
+                        subset=["TradDt", "CodProd", "days_to_maturity"],
+                        keep="last",
+                    )
+                )
+
+    return {"rows": rows, "payload_bytes": payload_bytes}
+
+
+def demab_builder(fixtures: IngestionFixtures, timer: StageTimer) -> dict[str, Any]:
+    builder = DemabTrustedBuilder(DemabIngestConfig(raw_dir=str(fixtures.raw_dirs["demab"])))
+
+    with timer.stage("builder"):
+        quotes = builder.build_quotes_df()
+
+    return {"rows": int(len(quotes))}
+
+
+def demab_stages(fixtures: IngestionFixtures, timer: StageTimer) -> dict[str, Any]:
+    ingestion_ts_utc = datetime.now(timezone.utc).replace(microsecond=0).isoformat()
+    quotes = []
+    payload_bytes = 0
+
+    for path in fixtures.files["demab"]:
+        with timer.stage("sha256"):
+            raw_zip_hash = file_sha256(path)
+
+        with timer.stage("zip_open"):
+            inner = get_single_csv_name(path)
+            archive, stream = open_csv_stream(path, inner)
+
+        payload_bytes += archive.getinfo(inner).file_size
+
+        try:
+            with timer.stage("parse"):
+                raw = read_demab_csv(stream)
+        finally:
+            stream.close()
+            archive.close()
+
+        with timer.stage("normalize"):
+            ref_month = f"{path.stem[4:8]}-{path.stem[8:10]}"
+            quotes.extend(
+                row_to_quote(
+                    row,
+                    ref_month=ref_month,
+                    raw_zip_file=path.name,
+                    raw_zip_hash=raw_zip_hash,
+                    inner_file=inner,
+                    ingestion_ts_utc=ingestion_ts_utc,
+                )
+                for _, row in normalize_demab_df(raw).iterrows()
+            )
+
+    with timer.stage("dataframe"):
+        out = (
+            pd.DataFrame([quote.__dict__ for quote in quotes])
+            .sort_values(["trade_date", "isin", "raw_zip_file"])
+            .drop_duplicates(subset=["trade_date", "isin"], keep="last")
+        )
+
+    return {"rows": int(len(out)), "payload_bytes": payload_bytes}
+
+
+def sgs_builder(fixtures: IngestionFixtures, timer: StageTimer) -> dict[str, Any]:
+    builder = SgsTrustedBuilder(SgsIngestConfig(raw_dir=str(fixtures.raw_dirs["sgs"])))
+
+    with timer.stage("builder"):
+        points = builder.build_points_df()
+
+    return {"rows": int(len(points))}
+
+
+def sgs_stages(fixtures: IngestionFixtures, timer: StageTimer) -> dict[str, Any]:
+    ingestion_ts_utc = datetime.now(timezone.utc).replace(microsecond=0).isoformat()
+    points = []
+    payload_bytes = 0
+
+    for path in fixtures.files["sgs"]:
+        with timer.stage("parse"):
+            series_id = parse_series_id_from_filename(path)
+            payload = read_sgs_json(path)
+
+        with timer.stage("sha256"):
+            raw_hash = file_sha256(path)
+
+        payload_bytes += path.stat().st_size
+
+        with timer.stage("normalize"):
+            points.extend(
+                normalize_sgs_records(
+                    series_id=series_id,
+                    raw_file=path.name,
+                    raw_hash=raw_hash,
+                    ingestion_ts_utc=ingestion_ts_utc,
+                    records=payload,
+                )
+            )
+
+    with timer.stage("dataframe"):
+        out = pd.DataFrame([point.__dict__ for point in points])
+        out["series_id"] = out["series_id"].astype("int64")
+        out["value"] = pd.to_numeric(out["value"], errors="coerce")
+        out = out.sort_values(["series_id", "ref_date", "raw_file"]).drop_duplicates(
+            subset=["series_id", "ref_date"],
+            keep="last",
+        )
+
+    return {"rows": int(len(out)), "payload_bytes": payload_bytes}
+
+
+PARSERS: dict[
+    str,
+    dict[str, Callable[[IngestionFixtures, StageTimer], dict[str, Any]]],
+] = {
+    "price-report": {BUILDER_MODE: price_report_builder, STAGES_MODE: price_report_stages},
+    "swap": {BUILDER_MODE: swap_builder, STAGES_MODE: swap_stages},
+    "demab": {BUILDER_MODE: demab_builder, STAGES_MODE: demab_stages},
+    "sgs": {BUILDER_MODE: sgs_builder, STAGES_MODE: sgs_stages},
+}
+
+
+def run_ingestion_benchmarks(
+    fixtures: Sequence[IngestionFixtures],
+    parsers: Sequence[str] = tuple(PARSERS),
+    modes: Sequence[str] = (BUILDER_MODE, STAGES_MODE),
+    repeats: int = 1,
+    trace_memory: bool = True,
+) -> list[dict[str, Any]]:
+    """One result per (fixtures size, parser, mode), with per-stage rates and shares."""
+
+    unknown = sorted(set(parsers).difference(PARSERS))
+    if unknown:
+        raise KeyError(f"Unknown ingestion benchmark parsers: {unknown}")
+    unknown = sorted(set(modes).difference((BUILDER_MODE, STAGES_MODE)))
+    if unknown:
+        raise KeyError(f"Unknown ingestion benchmark modes: {unknown}")
+
+    results = []
+
+    for size_fixtures in fixtures:
+        for parser in parsers:
+            input_mb = size_fixtures.input_bytes(parser) / MB
+
+            for mode in modes:
+                run = run_benchmark(
+                    lambda timer: PARSERS[parser][mode](size_fixtures, timer),
+                    repeats=repeats,
+                    trace_memory=trace_memory,
+                )
+                rows = int(run.counts.get("rows", 0))
+                seconds = run.measured_seconds
+                stages = run.stages()
+
+                for stage in stages.values():
+                    stage["mb_per_second"] = safe_rate(input_mb, stage["seconds"])
+                    stage["share"] = stage["seconds"] / seconds if seconds > 0 else 0.0
+
+                results.append(
+                    {
+                        "parser": parser,
+                        "mode": mode,
+                        "size": size_fixtures.size,
+                        "files": len(size_fixtures.files[parser]),
+                        "input_mb": input_mb,
+                        "rows": rows,
+                        "seconds": seconds,
+                        "mb_per_second": safe_rate(input_mb, seconds),
+                        "rows_per_second": safe_rate(rows, seconds),
+                        "peak_mb": run.measured_peak_mb,
+                        "repeats": run.repeats,
+                        "stages": stages,
+                        "counts": run.counts,
+                    }
+                )
+
+    return results
+
+
+def dominant_stages(results: Sequence[Mapping[str, Any]]) -> list[dict[str, Any]]:
+    """The slowest stage of every stages-mode result."""
+
+    dominant = []
+
+    for result in results:
+        if result["mode"] != STAGES_MODE or not result["stages"]:
+            continue
+
+        name, stage = max(result["stages"].items(), key=lambda item: item[1]["seconds"])
+        dominant.append(
+            {
+                "parser": result["parser"],
+                "size": result["size"],
+                "stage": name,
+                "seconds": stage["seconds"],
+                "share": stage["share"],
+            }
+        )
+
+    return dominant
+
+
+def ingestion_report_summary(results: Sequence[Mapping[str, Any]]) -> pd.DataFrame:
+    """Flat table of the main metrics with the stage shares, for printing."""
+
+    rows = []
+
+    for result in results:
+        row = {
+            column: result[column]
+            for column in ("parser", "mode", "size", "input_mb", "rows", "seconds", "mb_per_second", "rows_per_second", "peak_mb")
+        }
+        if result["mode"] == STAGES_MODE:
+            row.update({f"share_{name}": stage["share"] for name, stage in result["stages"].items()})
+        rows.append(row)
+
+    return pd.DataFrame(rows)
+
@@ -0,0 +1,345 @@
+"""
+Public-bonds mart benchmark scenarios.
+
+    unit                 → build_public_bonds_curve_inputs (one unit solve per row)
+    batch                → build_public_bonds_curve_inputs_batch
+    dimension-batch      → cashflow dimension + columnar curve-input node
+    dimension-batch-warm → the same, with the Newton warm start
+    solver-only          → BatchYieldSolver.solve_ragged over store cashflows
+    duration-only        → bond_risk_batch at the solved yields
+
+Inputs come from the synthetic market (any volume, no data needed) or from
+the project's DuckDB views, as the old profile scripts used. Throughput is
+curve-candidate rows (bonds) per second of the measured stages; setup
+stages, such as building the cashflows a solver-only run consumes, are
+reported but not counted.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Callable, Mapping, Sequence
+
+import numpy as np
+import pandas as pd
+
+from engine_product.calendars import CalendarIndex
+from engine_product.pricing.cashflow_store import CashflowStore
+from engine_product.pricing.yield_solvers_batch import BatchYieldSolver, RaggedCashflows
+from engine_product.risk import bond_risk_batch
+from ml_ettj26.pipelines.curve_factory.public_bonds_cashflows.nodes import (
+    build_public_bond_cashflow_dimension,
+    execute_duckdb_sql_files as execute_cashflow_sql_files,
+    load_public_bond_instruments_from_duckdb,
+)
+from ml_ettj26.pipelines.curve_factory.public_bonds_mart.nodes import (
+    build_public_bonds_curve_inputs,
+    execute_duckdb_sql_files as execute_mart_sql_files,
+    load_public_bond_curve_candidates_from_duckdb,
+    load_refined_calendar_from_duckdb,
+    solver_method_value,
+)
+from ml_ettj26.pipelines.curve_factory.public_bonds_mart.nodes_batch import (
+    build_public_bonds_curve_inputs_batch,
+)
+from ml_ettj26.pipelines.curve_factory.public_bonds_mart.nodes_dimension_batch import (
+    build_public_bonds_curve_inputs_columnar,
+)
+
+from .harness import (
+    HIGHER_IS_BETTER,
+    LOWER_IS_BETTER,
+    StageTimer,
+    run_benchmark,
+    safe_rate,
+)
+from .synthetic_market import (
+    SyntheticMarketConfig,
+    build_synthetic_curve_candidates,
+    generate_synthetic_market,
+)
+
+
+DEFAULT_CASHFLOW_SQL_FILES = [
+    "sql/03_refined/calendar.sql",
+    "sql/03_refined/bcb_demab.sql",
+]
+
+DEFAULT_MART_SQL_FILES = [
+    "sql/marts/public_bonds/01_mart_public_bonds_quotes_quality.sql",
+    "sql/marts/public_bonds/02_mart_public_bonds_curve_candidates_and_exclusions.sql",
+]
+
+# Instruments priced without VNA anchors, the ones solver/duration scenarios use.
+NOMINAL_INSTRUMENT_TYPES = ("LTN", "NTN-F")
+
+MART_METRICS = {
+    "bonds_per_second": HIGHER_IS_BETTER,
+    "peak_mb": LOWER_IS_BETTER,
+}
+
+
+@dataclass(frozen=True)
+class MartBenchmarkInputs:
+    size: str
+    curve_candidates: pd.DataFrame
+    calendar_df: pd.DataFrame
+    instruments: pd.DataFrame
+
+
+def synthetic_mart_inputs(
+    config: SyntheticMarketConfig,
+    size: str,
+    limit: int | None = None,
+) -> MartBenchmarkInputs:
+    market = generate_synthetic_market(config)
+    candidates = build_synthetic_curve_candidates(market)
+
+    if limit is not None:
+        candidates = candidates.head(limit).copy()
+
+    return MartBenchmarkInputs(
+        size=size,
+        curve_candidates=candidates,
+        calendar_df=market.calendar_df,
+        instruments=market.instruments,
+    )
+
+
+def duckdb_mart_inputs(
+    duckdb_path: str,
+    limit: int | None = None,
+    cashflow_sql_files: Sequence[str] = DEFAULT_CASHFLOW_SQL_FILES,
+    mart_sql_files: Sequence[str] = DEFAULT_MART_SQL_FILES,
+) -> MartBenchmarkInputs:
+    execute_cashflow_sql_files(duckdb_path=duckdb_path, sql_files=list(cashflow_sql_files))
+    instruments = load_public_bond_instruments_from_duckdb(duckdb_path=duckdb_path)
+    execute_mart_sql_files(duckdb_path=duckdb_path, sql_files=list(mart_sql_files))
+    candidates = load_public_bond_curve_candidates_from_duckdb(duckdb_path=duckdb_path)
+
+    if limit is not None:
+        candidates = candidates.head(limit).copy()
+
+    return MartBenchmarkInputs(
+        size="duckdb" if limit is None else f"duckdb-{limit}",
+        curve_candidates=candidates,
+        calendar_df=load_refined_calendar_from_duckdb(duckdb_path=duckdb_path),
+        instruments=instruments,
+    )
+
+
+def value_counts(values: pd.Series) -> dict[str, int]:
+    return {str(key): int(count) for key, count in values.value_counts().items()}
+
+
+def curve_input_counts(inputs: pd.DataFrame, failures: pd.DataFrame) -> dict[str, Any]:
+    return {
+        "output_rows": int(len(inputs)),
+        "failure_rows": int(len(failures)),
+        "solver_method_counts": value_counts(inputs["solver_method"].map(solver_method_value))
+        if not inputs.empty
+        else {},
+        "failure_error_counts": value_counts(failures["calculation_error_type"])
+        if not failures.empty
+        else {},
+    }
+
+
+def nominal_ragged_cashflows(
+    inputs: MartBenchmarkInputs,
+) -> tuple[RaggedCashflows, np.ndarray]:
+    """
+    Future cashflows and PU_MED of the nominal candidates, in candidate order.
+
+    Rows without a price or without future cashflows are dropped.
+    """
+    candidates = inputs.curve_candidates
+    candidates = candidates.loc[
+        candidates["instrument_type"].isin(NOMINAL_INSTRUMENT_TYPES)
+        & pd.to_numeric(candidates["pu_med"], errors="coerce").gt(0)
+    ]
+    cashflow_dimension = build_public_bond_cashflow_dimension(
+        inputs.instruments.loc[
+            inputs.instruments["instrument_type"].isin(NOMINAL_INSTRUMENT_TYPES)
+        ],
+        inputs.calendar_df,
+    )
+    store = CashflowStore.from_cashflow_dimension(cashflow_dimension)
+    calendar_index = CalendarIndex.from_calendar_df(inputs.calendar_df)
+
+    slices = store.future_slices(
+        store.isin_codes(candidates["isin"]),
+        calendar_index.bd_index(pd.to_datetime(candidates["ref_date"])),
+    )
+    keep = np.flatnonzero(slices.counts > 0)
+
+    return (
+        slices.to_ragged_cashflows().take(keep),
+        candidates["pu_med"].to_numpy(dtype=float)[keep],
+    )
+
+
+def unit_scenario(inputs: MartBenchmarkInputs, timer: StageTimer) -> dict[str, Any]:
+    with timer.stage("curve_inputs"):
+        curve_inputs, failures = build_public_bonds_curve_inputs(
+            curve_candidates=inputs.curve_candidates,
+            calendar_df=inputs.calendar_df,
+        )
+
+    return curve_input_counts(curve_inputs, failures)
+
+
+def batch_scenario(inputs: MartBenchmarkInputs, timer: StageTimer) -> dict[str, Any]:
+    with timer.stage("curve_inputs"):
+        curve_inputs, failures = build_public_bonds_curve_inputs_batch(
+            curve_candidates=inputs.curve_candidates,
+            calendar_df=inputs.calendar_df,
+        )
+
+    return curve_input_counts(curve_inputs, failures)
+
+
+def dimension_batch_scenario(
+    inputs: MartBenchmarkInputs,
+    timer: StageTimer,
+    warm_start: bool = False,
+) -> dict[str, Any]:
+    with timer.stage("cashflow_dimension"):
+        cashflow_dimension = build_public_bond_cashflow_dimension(
+            instruments=inputs.instruments,
+            calendar_df=inputs.calendar_df,
+        )
+
+    with timer.stage("curve_inputs"):
+        curve_inputs, failures = build_public_bonds_curve_inputs_columnar(
+            curve_candidates=inputs.curve_candidates,
+            cashflow_dimension=cashflow_dimension,
+            calendar_df=inputs.calendar_df,
+            warm_start=warm_start,
+        )
+
+    return {
+        "cashflow_rows": int(len(cashflow_dimension)),
+        **curve_input_counts(curve_inputs, failures),
+        "solver_iterations": int(curve_inputs["solver_iterations"].fillna(0).sum())
+        if not curve_inputs.empty
+        else 0,
+    }
+
+
+def dimension_batch_warm_scenario(
+    inputs: MartBenchmarkInputs,
+    timer: StageTimer,
+) -> dict[str, Any]:
+    return dimension_batch_scenario(inputs, timer, warm_start=True)
+
+
+def solver_only_scenario(inputs: MartBenchmarkInputs, timer: StageTimer) -> dict[str, Any]:
+    with timer.stage("prepare_cashflows", setup=True):
+        cashflows, prices = nominal_ragged_cashflows(inputs)
+
+    with timer.stage("solve"):
+        solution = BatchYieldSolver().solve_ragged(cashflows, prices)
+
+    return {
+        "problems": len(cashflows),
+        "cashflows": int(cashflows.offsets[-1]),
+        "solved": int(solution.solved.sum()),
+        "solver_method_counts": value_counts(
+            pd.Series([solver_method_value(method) for method in solution.method])
+        ),
+    }
+
+
+def duration_only_scenario(inputs: MartBenchmarkInputs, timer: StageTimer) -> dict[str, Any]:
+    with timer.stage("prepare_cashflows", setup=True):
+        cashflows, prices = nominal_ragged_cashflows(inputs)
+
+    with timer.stage("solve", setup=True):
+        ytm = BatchYieldSolver().solve_ragged(cashflows, prices).ytm
+
+    with timer.stage("duration"):
+        risk = bond_risk_batch(
+            cashflows.times,
+            cashflows.amounts,
+            ytm,
+            offsets=cashflows.offsets,
+        )
+
+    return {
+        "problems": len(cashflows),
+        "cashflows": int(cashflows.offsets[-1]),
+        "finite_durations": int(np.isfinite(risk.modified_duration).sum()),
+    }
+
+
+SCENARIOS: dict[str, Callable[[MartBenchmarkInputs, StageTimer], dict[str, Any]]] = {
+    "unit": unit_scenario,
+    "batch": batch_scenario,
+    "dimension-batch": dimension_batch_scenario,
+    "dimension-batch-warm": dimension_batch_warm_scenario,
+    "solver-only": solver_only_scenario,
+    "duration-only": duration_only_scenario,
+}
+
+
+def run_mart_benchmarks(
+    inputs: Sequence[MartBenchmarkInputs],
+    scenarios: Sequence[str] = tuple(SCENARIOS),
+    repeats: int = 1,
+    trace_memory: bool = True,
+) -> list[dict[str, Any]]:
+    """One result per (inputs size, scenario), in the given order."""
+
+    unknown = sorted(set(scenarios).difference(SCENARIOS))
+    if unknown:
+        raise KeyError(f"Unknown mart benchmark scenarios: {unknown}")
+
+    results = []
+
+    for size_inputs in inputs:
+        bonds = int(len(size_inputs.curve_candidates))
+
+        for scenario in scenarios:
+            run = run_benchmark(
+                lambda timer: SCENARIOS[scenario](size_inputs, timer),
+                repeats=repeats,
+                trace_memory=trace_memory,
+            )
+            stages = run.stages()
+            for stage in stages.values():
+                stage["bonds_per_second"] = safe_rate(bonds, stage["seconds"])
+
+            results.append(
+                {
+                    "scenario": scenario,
+                    "size": size_inputs.size,
+                    "bonds": bonds,
+                    "seconds": run.measured_seconds,
+                    "bonds_per_second": safe_rate(bonds, run.measured_seconds),
+                    "peak_mb": run.measured_peak_mb,
+                    "repeats": run.repeats,
+                    "stages": stages,
+                    "counts": run.counts,
+                }
+            )
+
+    return results
+
+
+def mart_report_summary(results: Sequence[Mapping[str, Any]]) -> pd.DataFrame:
+    """Flat table of the main metrics, for printing."""
+
+    return pd.DataFrame(
+        [
+            {
+                "scenario": result["scenario"],
+                "size": result["size"],
+                "bonds": result["bonds"],
+                "seconds": result["seconds"],
+                "bonds_per_second": result["bonds_per_second"],
+                "peak_mb": result["peak_mb"],
+            }
+            for result in results
+        ]
+    )
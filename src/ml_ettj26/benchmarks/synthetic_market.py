@@ -0,0 +1,1005 @@
+"""
+Deterministic synthetic Brazilian bond market for offline benchmarks.
+
+Everything is derived from one SyntheticMarketConfig and its seed:
+
+    holidays / calendar_df  → ANBIMA-style holidays and the refined calendar
+    instruments             → LTN and NTN-F lists (isin, type, issue, maturity)
+    curve_params            → daily Nelson-Siegel betas, AR(1) around a base curve
+    demab_quotes            → DEMAB-shaped quotes priced off the curve plus noise
+    di1_quotes / swap_rates → B3 DI1 futures and DI x PRE swaps off the same curve
+    sgs_points              → SGS Selic (432) and IPCA (433) points
+
+`write_synthetic_market` writes the raw files in the formats and folder layout
+read by the trusted builders, so every pipeline can run without network or
+licensed data. `SyntheticMarketConfig.scaled` multiplies the daily volume.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import math
+import zipfile
+from dataclasses import dataclass, replace
+from datetime import date, timedelta
+from io import BytesIO
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from engine_product.calendars import CalendarIndex
+from engine_product.pricing.cashflow_store import CashflowStore
+from engine_product.pricing.yield_solvers_batch import BatchYieldSolver
+from factory_curve.parametric.loadings import slope_and_curvature_loadings
+from ml_ettj26.domain.bcb_demab.normalize import EXPECTED_MAP as DEMAB_COLUMN_MAP
+from ml_ettj26.pipelines.curve_factory.public_bonds_cashflows.nodes import (
+    build_public_bond_cashflow_dimension,
+)
+from ml_ettj26.service.refined.reference.calendar import (
+    build_refined_dim_calendar_br_market,
+)
+
+
+BUSINESS_DAYS_PER_YEAR = 252
+CALENDAR_ID = "BR_ANBIMA"
+
+# Raw paths relative to a project root, as configured in conf/base.
+RAW_LAYOUT = {
+    "anbima_holidays": "data/calendars/01_raw/feriados_nacionais(Feriados).csv",
+    "bcb_sgs": "data/01_raw/bcb/sgs",
+    "bcb_demab": "data/01_raw/bcb/demab/negociacoes_titulos_federais_secundario",
+    "b3_price_report": "data/01_raw/b3/PriceReport",
+    "b3_swap": "data/01_raw/b3/DerivativesMarket-SwapMarketRates",
+}
+
+FIXED_HOLIDAYS = [
+    (1, 1, "Confraternização Universal"),
+    (4, 21, "Tiradentes"),
+    (5, 1, "Dia do Trabalho"),
+    (9, 7, "Independência do Brasil"),
+    (10, 12, "Nossa Sr.a Aparecida - Padroeira do Brasil"),
+    (11, 2, "Finados"),
+    (11, 15, "Proclamação da República"),
+    (12, 25, "Natal"),
+]
+EASTER_HOLIDAYS = [
+    (-48, "Carnaval"),
+    (-47, "Carnaval"),
+    (-2, "Paixão de Cristo"),
+    (60, "Corpus Christi"),
+]
+BLACK_CONSCIOUSNESS_DAY = (11, 20, "Dia Nacional de Zumbi e da Consciência Negra")
+BLACK_CONSCIOUSNESS_DAY_FIRST_YEAR = 2024
+WEEKDAY_NAMES = [
+    "segunda-feira",
+    "terça-feira",
+    "quarta-feira",
+    "quinta-feira",
+    "sexta-feira",
+    "sábado",
+    "domingo",
+]
+
+# instrument_type → (ISIN code, maturity months)
+INSTRUMENT_LAYOUT = {
+    "LTN": ("LT", (1, 4, 7, 10)),
+    "NTN-F": ("NF", (1,)),
+}
+PAR_VALUE = 1000.0
+
+DI1_MONTH_CODES = "FGHJKMNQUVXZ"
+DI1_MONTHLY_CONTRACTS = 12
+DI1_QUARTERLY_MONTHS = (1, 4, 7, 10)
+DI1_NOTIONAL = 100_000.0
+
+SWAP_PRODUCT_CODE = "T1PRE"
+SWAP_PRODUCT_NAME = "SWAP DI X PRE"
+# Matches SwapLineMapperConfig(adjusted_value_scale=100_000) in the trusted node.
+SWAP_VALUE_SCALE = 100_000
+
+SGS_SELIC_SERIES_ID = 432
+SGS_IPCA_SERIES_ID = 433
+
+# Fixed member timestamp, so the same market always writes the same bytes.
+ZIP_DATE_TIME = (2000, 1, 1, 0, 0, 0)
+# The real TSyymmdd.ex_ is a self-extracting archive: a stub before the zip.
+SELF_EXTRACTOR_STUB = b"MZ" + b"\x00" * 62
+
+
+@dataclass(frozen=True)
+class SyntheticMarketConfig:
+    """
+    Size and shape of a synthetic market.
+
+    The defaults approximate one year at today's daily volume. Quotes cover
+    the business days in [start_date, start_date + years); the calendar
+    extends far enough back for issue dates and forward for maturities.
+    """
+
+    start_date: date = date(2024, 1, 2)
+    years: float = 1.0
+    ltn_per_day: int = 14
+    ntnf_per_day: int = 6
+    ltn_tenor_years: int = 4
+    ntnf_tenor_years: int = 10
+    di1_contracts: int = 30
+    swap_vertices: tuple[int, ...] = (
+        30, 60, 90, 120, 180, 252, 360, 540, 720, 1080, 1440, 1800, 2520, 3600,
+    )
+    pricereport_filler_per_day: int = 200
+    noise_bp: float = 3.0
+    curve_vol_bp: float = 4.0
+    curve_mean_reversion: float = 0.98
+    beta_0: float = 0.115
+    beta_1: float = -0.015
+    beta_2: float = 0.02
+    lambda_1: float = 0.6
+    seed: int = 0
+
+    def __post_init__(self) -> None:
+        if self.years <= 0:
+            raise ValueError("years must be positive")
+
+        counts = (
+            self.ltn_per_day,
+            self.ntnf_per_day,
+            self.ltn_tenor_years,
+            self.ntnf_tenor_years,
+            self.di1_contracts,
+        )
+        if min(counts) < 1:
+            raise ValueError("per-day counts, tenors and di1_contracts must be positive")
+        if self.pricereport_filler_per_day < 0:
+            raise ValueError("pricereport_filler_per_day must be non-negative")
+        if not self.swap_vertices or min(self.swap_vertices) < 1:
+            raise ValueError("swap_vertices must be positive calendar days")
+        if self.noise_bp < 0 or self.curve_vol_bp < 0:
+            raise ValueError("noise_bp and curve_vol_bp must be non-negative")
+        if not 0.0 <= self.curve_mean_reversion < 1.0:
+            raise ValueError("curve_mean_reversion must be in [0, 1)")
+        if self.lambda_1 <= 0:
+            raise ValueError("lambda_1 must be positive")
+
+    @property
+    def end_date(self) -> date:
+        """First date after the quote window."""
+
+        return self.start_date + timedelta(days=round(365.25 * self.years))
+
+    @property
+    def horizon_years(self) -> int:
+        """Years the calendar must cover after the quote window."""
+
+        di1_years = DI1_MONTHLY_CONTRACTS / 12 + self.di1_contracts / len(DI1_QUARTERLY_MONTHS)
+        swap_years = max(self.swap_vertices) / 365
+
+        return math.ceil(
+            max(self.ltn_tenor_years, self.ntnf_tenor_years, di1_years, swap_years)
+        ) + 1
+
+    def scaled(self, factor: float) -> SyntheticMarketConfig:
+        """Same market with `factor` times the ISINs and PriceReport rows per day."""
+
+        if factor <= 0:
+            raise ValueError("factor must be positive")
+
+        return replace(
+            self,
+            ltn_per_day=max(1, math.ceil(self.ltn_per_day * factor)),
+            ntnf_per_day=max(1, math.ceil(self.ntnf_per_day * factor)),
+            pricereport_filler_per_day=math.ceil(self.pricereport_filler_per_day * factor),
+        )
+
+
+@dataclass(frozen=True)
+class SyntheticMarket:
+    config: SyntheticMarketConfig
+    holidays: pd.DataFrame
+    calendar_df: pd.DataFrame
+    curve_params: pd.DataFrame
+    instruments: pd.DataFrame
+    cashflow_dimension: pd.DataFrame
+    demab_quotes: pd.DataFrame
+    di1_quotes: pd.DataFrame
+    swap_rates: pd.DataFrame
+    sgs_points: pd.DataFrame
+
+    @property
+    def ref_dates(self) -> pd.Series:
+        return self.curve_params["ref_date"]
+
+
+def easter_sunday(year: int) -> date:
+    """Gregorian Easter Sunday (anonymous Gregorian algorithm)."""
+
+    a = year % 19
+    b, c = divmod(year, 100)
+    d, e = divmod(b, 4)
+    f = (b + 8) // 25
+    g = (b - f + 1) // 3
+    h = (19 * a + b - d - g + 15) % 30
+    i, k = divmod(c, 4)
+    l = (32 + 2 * e + 2 * i - h - k) % 7
+    m = (a + 11 * h + 22 * l) // 451
+    month, day = divmod(h + l - 7 * m + 114, 31)
+
+    return date(year, month, day + 1)
+
+
+def build_synthetic_holidays(first_year: int, last_year: int) -> pd.DataFrame:
+    """National holidays in the ANBIMA list, including those on weekends."""
+
+    rows = []
+
+    for year in range(first_year, last_year + 1):
+        rows.extend((date(year, month, day), name) for month, day, name in FIXED_HOLIDAYS)
+
+        if year >= BLACK_CONSCIOUSNESS_DAY_FIRST_YEAR:
+            month, day, name = BLACK_CONSCIOUSNESS_DAY
+            rows.append((date(year, month, day), name))
+
+        easter = easter_sunday(year)
+        rows.extend((easter + timedelta(days=offset), name) for offset, name in EASTER_HOLIDAYS)
+
+    return (
+        pd.DataFrame(rows, columns=["date", "holiday_name"])
+        .drop_duplicates(subset=["date"], keep="first")
+        .sort_values("date")
+        .reset_index(drop=True)
+    )
+
+
+def anbima_holidays_csv(holidays: pd.DataFrame) -> bytes:
+    """The holidays as the ANBIMA CSV (Data;Dia da Semana;Feriado)."""
+
+    lines = ["Data;Dia da Semana;Feriado"]
+    lines.extend(
+        f"{day:%d/%m/%Y};{WEEKDAY_NAMES[day.weekday()]};{name}"
+        for day, name in zip(holidays["date"], holidays["holiday_name"])
+    )
+
+    return ("\n".join(lines) + "\n").encode("utf-8")
+
+
+def build_synthetic_calendar(
+    holidays: pd.DataFrame,
+    first_date: date,
+    last_date: date,
+) -> pd.DataFrame:
+    """
+    Refined calendar over [first_date, last_date], as the calendar pipelines
+    build it from the ANBIMA CSV: bd_index counts business days up to and
+    including each date, and source_file_hash is the CSV's SHA-256.
+    """
+    dates = pd.date_range(first_date, last_date, freq="D", tz="UTC")
+    holiday_names = dict(zip(holidays["date"], holidays["holiday_name"]))
+
+    trusted = pd.DataFrame({"cal_id": CALENDAR_ID, "date": dates})
+    trusted["weekday"] = dates.weekday
+    trusted["holiday_name"] = [holiday_names.get(day) for day in dates.date]
+    trusted["is_business_day"] = trusted["weekday"].lt(5) & trusted["holiday_name"].isna()
+    trusted["bd_index"] = trusted["is_business_day"].astype("int64").cumsum()
+    trusted["source_file_hash"] = hashlib.sha256(anbima_holidays_csv(holidays)).hexdigest()
+
+    return build_refined_dim_calendar_br_market(trusted)
+
+
+def following_business_days(calendar_index: CalendarIndex, dates) -> np.ndarray:
+    """Each date, or the next business day when it is not one."""
+
+    days = np.asarray(dates, dtype="datetime64[D]")
+    bd_index = calendar_index.bd_index(days)
+
+    return calendar_index.dates(
+        np.where(calendar_index.is_business_day(days), bd_index, bd_index + 1)
+    )
+
+
+def nelson_siegel_zero_rates(betas: np.ndarray, lambda_1: float, tenors) -> np.ndarray:
+    """Zero rates (BU/252, annual compounding) of per-row betas at per-row tenors."""
+
+    tenors = np.asarray(tenors, dtype=np.float64)
+    slope, curvature = slope_and_curvature_loadings(tenors, lambda_1)
+
+    return betas[:, 0] + betas[:, 1] * slope + betas[:, 2] * curvature
+
+
+def simulate_curve_params(
+    config: SyntheticMarketConfig,
+    ref_dates: np.ndarray,
+    rng: np.random.Generator,
+) -> pd.DataFrame:
+    """Daily betas following an AR(1) around the configured base curve."""
+
+    base = np.array([config.beta_0, config.beta_1, config.beta_2])
+    shocks = rng.normal(0.0, config.curve_vol_bp / 10_000, size=(len(ref_dates), 3))
+    betas = np.empty_like(shocks)
+    state = base.copy()
+
+    for position, shock in enumerate(shocks):
+        state = base + config.curve_mean_reversion * (state - base) + shock
+        betas[position] = state
+
+    return pd.DataFrame(
+        {
+            "ref_date": ref_dates.astype("datetime64[ns]"),
+            "beta_0": betas[:, 0],
+            "beta_1": betas[:, 1],
+            "beta_2": betas[:, 2],
+            "lambda_1": config.lambda_1,
+        }
+    )
+
+
+def build_synthetic_instruments(
+    config: SyntheticMarketConfig,
+    calendar_index: CalendarIndex,
+) -> pd.DataFrame:
+    """
+    LTN and NTN-F lists with enough live ISINs for the daily counts.
+
+    Each maturity has `series` ISINs issued `tenor` years before it, on the
+    following business day. At least `len(months) * tenor - 2` maturities
+    are live on any date, so `series` reaches the requested count per day.
+    """
+    per_day = {"LTN": config.ltn_per_day, "NTN-F": config.ntnf_per_day}
+    tenor_years = {"LTN": config.ltn_tenor_years, "NTN-F": config.ntnf_tenor_years}
+    frames = []
+
+    for instrument_type, (code, months) in INSTRUMENT_LAYOUT.items():
+        tenor = tenor_years[instrument_type]
+        live = max(1, len(months) * tenor - 2)
+        series = math.ceil(per_day[instrument_type] / live)
+
+        maturities = [
+            date(year, month, 1)
+            for year in range(config.start_date.year, config.end_date.year + tenor + 1)
+            for month in months
+            if config.start_date < date(year, month, 1)
+            and date(year - tenor, month, 1) < config.end_date
+        ]
+        maturity_dates = np.repeat(np.array(maturities, dtype="datetime64[D]"), series)
+        nominal_issue = np.array(
+            [date(day.year - tenor, day.month, 1) for day in maturities],
+            dtype="datetime64[D]",
+        )
+
+        frames.append(
+            pd.DataFrame(
+                {
+                    "isin": [
+                        f"BRSTN{code}{serial:05d}" for serial in range(len(maturity_dates))
+                    ],
+                    "instrument_type": instrument_type,
+                    "issue_date": pd.to_datetime(
+                        np.repeat(following_business_days(calendar_index, nominal_issue), series)
+                    ).date,
+                    "maturity_date": pd.to_datetime(maturity_dates).date,
+                }
+            )
+        )
+
+    return pd.concat(frames, ignore_index=True)
+
+
+def select_daily_instruments(
+    instruments: pd.DataFrame,
+    ref_dates: np.ndarray,
+    per_day: dict[str, int],
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    (ref_date position, instrument position) of the quoted pairs.
+
+    Each day quotes the first `per_day` live ISINs of each type, in
+    (maturity, series) order; an ISIN is live from its issue date until the
+    day before maturity.
+    """
+    days = np.asarray(ref_dates, dtype="datetime64[D]")[:, None]
+    issue = pd.to_datetime(instruments["issue_date"]).to_numpy("datetime64[D]")
+    maturity = pd.to_datetime(instruments["maturity_date"]).to_numpy("datetime64[D]")
+    types = instruments["instrument_type"].to_numpy()
+
+    date_positions, instrument_positions = [], []
+
+    for instrument_type, count in per_day.items():
+        positions = np.flatnonzero(types == instrument_type)
+        live = (issue[positions] <= days) & (days < maturity[positions])
+        rank = np.cumsum(live, axis=1, dtype=np.int32)
+        rows, columns = np.nonzero(live & (rank <= count))
+
+        date_positions.append(rows)
+        instrument_positions.append(positions[columns])
+
+    return np.concatenate(date_positions), np.concatenate(instrument_positions)
+
+
+def truncate(values: np.ndarray, decimals: int) -> np.ndarray:
+    scale = 10.0 ** decimals
+    return np.floor(values * scale) / scale
+
+
+def build_synthetic_demab_quotes(
+    config: SyntheticMarketConfig,
+    instruments: pd.DataFrame,
+    cashflow_dimension: pd.DataFrame,
+    curve_params: pd.DataFrame,
+    calendar_index: CalendarIndex,
+    rng: np.random.Generator,
+) -> pd.DataFrame:
+    """
+    DEMAB trusted-shaped quotes priced off the day's curve plus noise.
+
+    Every cashflow is discounted at the NS zero rate of its tenor plus a
+    per-quote parallel shift N(0, noise_bp); PU MIN/MAX use the shift plus
+    or minus a random half spread. PUs are truncated to 6 decimals as in
+    DEMAB and TAXA MED is the yield of PU MED; TAXA MIN/MAX shift it by the
+    half spread.
+    """
+    ref_dates = curve_params["ref_date"].to_numpy("datetime64[D]")
+    date_positions, instrument_positions = select_daily_instruments(
+        instruments,
+        ref_dates,
+        {"LTN": config.ltn_per_day, "NTN-F": config.ntnf_per_day},
+    )
+    order = np.lexsort(
+        (instruments["isin"].to_numpy()[instrument_positions], date_positions)
+    )
+    date_positions = date_positions[order]
+    instrument_positions = instrument_positions[order]
+    quoted = instruments.iloc[instrument_positions].reset_index(drop=True)
+    n = len(quoted)
+
+    store = CashflowStore.from_cashflow_dimension(cashflow_dimension)
+    slices = store.future_slices(
+        store.isin_codes(quoted["isin"]),
+        calendar_index.bd_index(ref_dates[date_positions]),
+    )
+    owner = np.repeat(np.arange(n), slices.counts)
+    times = slices.tenor_bd / BUSINESS_DAYS_PER_YEAR
+    betas = curve_params[["beta_0", "beta_1", "beta_2"]].to_numpy()
+    zero_rates = nelson_siegel_zero_rates(
+        betas[date_positions][owner],
+        config.lambda_1,
+        times,
+    )
+
+    noise = config.noise_bp / 10_000
+    shift = rng.normal(0.0, noise, size=n)
+    half_spread = np.abs(rng.normal(0.0, noise, size=n)) + 0.5 / 10_000
+
+    def price(extra: np.ndarray) -> np.ndarray:
+        discounted = slices.amount * (1.0 + zero_rates + extra[owner]) ** -times
+        return truncate(np.bincount(owner, weights=discounted, minlength=n), 6)
+
+    pu_med = price(shift)
+    ytm = BatchYieldSolver().solve_ragged(slices.to_ragged_cashflows(), pu_med).ytm
+
+    return pd.DataFrame(
+        {
+            "trade_date": pd.to_datetime(ref_dates[date_positions]).date,
+            "sigla": quoted["instrument_type"],
+            "isin": quoted["isin"],
+            "emissao_date": quoted["issue_date"],
+            "vencimento_date": quoted["maturity_date"],
+            "pu_min": price(shift + half_spread),
+            "pu_med": pu_med,
+            "pu_max": price(shift - half_spread),
+            "pu_lastro": pu_med,
+            "valor_par": PAR_VALUE,
+            "taxa_min": np.round(100 * (ytm - half_spread), 4),
+            "taxa_med": np.round(100 * ytm, 4),
+            "taxa_max": np.round(100 * (ytm + half_spread), 4),
+        }
+    )
+
+
+def di1_contract_months(ref_month: int, count: int) -> list[int]:
+    """
+    Month ordinals (year * 12 + month - 1) of the listed DI1 maturities:
+    the next 12 months, then January, April, July and October.
+    """
+    months = []
+    ahead = 1
+
+    while len(months) < count:
+        ordinal = ref_month + ahead
+        if ahead <= DI1_MONTHLY_CONTRACTS or ordinal % 12 + 1 in DI1_QUARTERLY_MONTHS:
+            months.append(ordinal)
+        ahead += 1
+
+    return months
+
+
+def build_synthetic_di1_quotes(
+    config: SyntheticMarketConfig,
+    curve_params: pd.DataFrame,
+    calendar_index: CalendarIndex,
+    rng: np.random.Generator,
+) -> pd.DataFrame:
+    """
+    DI1 futures settlement rates and PUs off the day's curve plus noise.
+
+    Each contract matures on the first business day of its month, as
+    `di1_maturity_from_ticker` assumes; rates are in % a.a. (BU/252).
+    """
+    ref_dates = curve_params["ref_date"].to_numpy("datetime64[D]")
+    ref_months = ref_dates.astype("datetime64[M]").astype(np.int64) + 1970 * 12
+    months = np.array(
+        [di1_contract_months(int(month), config.di1_contracts) for month in ref_months]
+    )
+    date_positions = np.repeat(np.arange(len(ref_dates)), config.di1_contracts)
+    months = months.reshape(-1)
+
+    first_days = np.array(
+        [np.datetime64(f"{month // 12:04d}-{month % 12 + 1:02d}-01") for month in months],
+        dtype="datetime64[D]",
+    )
+    maturity = following_business_days(calendar_index, first_days)
+    bd_to_maturity = (
+        calendar_index.bd_index(maturity) - calendar_index.bd_index(ref_dates[date_positions])
+    ).astype(np.int64)
+    betas = curve_params[["beta_0", "beta_1", "beta_2"]].to_numpy()
+    rates = nelson_siegel_zero_rates(
+        betas[date_positions],
+        config.lambda_1,
+        bd_to_maturity / BUSINESS_DAYS_PER_YEAR,
+    ) + rng.normal(0.0, config.noise_bp / 10_000, size=len(months))
+    half_spread = np.abs(rng.normal(0.0, config.noise_bp / 10_000, size=len(months)))
+    # Liquidity decays along the strip.
+    contract_rank = np.tile(np.arange(config.di1_contracts), len(ref_dates))
+    trade_qty = rng.integers(1_000, 400_000, size=len(months)) // (1 + contract_rank)
+
+    return pd.DataFrame(
+        {
+            "ref_date": ref_dates[date_positions],
+            "ticker": [
+                f"DI1{DI1_MONTH_CODES[month % 12]}{month // 12 % 100:02d}" for month in months
+            ],
+            "maturity_date": maturity,
+            "bd_to_maturity": bd_to_maturity,
+            "adjusted_rate": np.round(100 * rates, 3),
+            "adjusted_price": np.round(
+                DI1_NOTIONAL * (1.0 + rates) ** (-bd_to_maturity / BUSINESS_DAYS_PER_YEAR),
+                2,
+            ),
+            "min_rate": np.round(100 * (rates - half_spread), 3),
+            "max_rate": np.round(100 * (rates + half_spread), 3),
+            "average_rate": np.round(100 * rates, 3),
+            "last_rate": np.round(100 * rates, 3),
+            "trade_qty": trade_qty,
+            "open_interest": trade_qty * 7,
+        }
+    )
+
+
+def build_synthetic_swap_rates(
+    config: SyntheticMarketConfig,
+    curve_params: pd.DataFrame,
+    calendar_index: CalendarIndex,
+    rng: np.random.Generator,
+) -> pd.DataFrame:
+    """DI x PRE swap rates (% a.a., BU/252) at the calendar-day vertices."""
+
+    ref_dates = curve_params["ref_date"].to_numpy("datetime64[D]")
+    vertices = np.asarray(config.swap_vertices, dtype=np.int64)
+    date_positions = np.repeat(np.arange(len(ref_dates)), len(vertices))
+    days_to_maturity = np.tile(vertices, len(ref_dates))
+    ref_days = ref_dates[date_positions]
+
+    bd_to_maturity = (
+        calendar_index.bd_index(ref_days + days_to_maturity)
+        - calendar_index.bd_index(ref_days)
+    ).astype(np.int64)
+    betas = curve_params[["beta_0", "beta_1", "beta_2"]].to_numpy()
+    rates = nelson_siegel_zero_rates(
+        betas[date_positions],
+        config.lambda_1,
+        bd_to_maturity / BUSINESS_DAYS_PER_YEAR,
+    ) + rng.normal(0.0, config.noise_bp / 10_000, size=len(date_positions))
+
+    return pd.DataFrame(
+        {
+            "ref_date": ref_days,
+            "days_to_maturity": days_to_maturity,
+            "bd_to_maturity": bd_to_maturity,
+            "rate": np.round(100 * rates, 5),
+        }
+    )
+
+
+def build_synthetic_sgs_points(
+    config: SyntheticMarketConfig,
+    curve_params: pd.DataFrame,
+    rng: np.random.Generator,
+) -> pd.DataFrame:
+    """
+    Selic (432, % a.a.) on every calendar day, from the curve's short rate
+    on the last business day, and IPCA (433, % a.m.) on the first of each
+    month.
+    """
+    days = np.arange(
+        np.datetime64(config.start_date, "D"),
+        np.datetime64(config.end_date, "D"),
+    )
+    ref_dates = curve_params["ref_date"].to_numpy("datetime64[D]")
+    short_rate = (curve_params["beta_0"] + curve_params["beta_1"]).to_numpy()
+    last_business = np.clip(np.searchsorted(ref_dates, days, side="right") - 1, 0, None)
+
+    month_starts = np.unique(days.astype("datetime64[M]")).astype("datetime64[D]")
+    month_starts = month_starts[month_starts >= days[0]]
+
+    return pd.concat(
+        [
+            pd.DataFrame(
+                {
+                    "series_id": SGS_SELIC_SERIES_ID,
+                    "ref_date": days,
+                    "value": np.round(100 * short_rate[last_business], 2),
+                }
+            ),
+            pd.DataFrame(
+                {
+                    "series_id": SGS_IPCA_SERIES_ID,
+                    "ref_date": month_starts,
+                    "value": np.round(rng.normal(0.4, 0.2, size=len(month_starts)), 2),
+                }
+            ),
+        ],
+        ignore_index=True,
+    )
+
+
+def generate_synthetic_market(
+    config: SyntheticMarketConfig | None = None,
+) -> SyntheticMarket:
+    """Build every synthetic dataset from `config`; same config, same market."""
+
+    config = config or SyntheticMarketConfig()
+    rng = np.random.default_rng(config.seed)
+
+    holidays = build_synthetic_holidays(
+        config.start_date.year - config.ntnf_tenor_years - 1,
+        config.end_date.year + config.horizon_years,
+    )
+    calendar_df = build_synthetic_calendar(
+        holidays,
+        date(config.start_date.year - config.ntnf_tenor_years - 1, 1, 1),
+        date(config.end_date.year + config.horizon_years, 12, 31),
+    )
+    calendar_index = CalendarIndex.from_calendar_df(calendar_df)
+
+    business_dates = calendar_index.business_dates
+    ref_dates = business_dates[
+        (business_dates >= np.datetime64(config.start_date, "D"))
+        & (business_dates < np.datetime64(config.end_date, "D"))
+    ]
+    if not len(ref_dates):
+        raise ValueError("the quote window has no business days")
+
+    curve_params = simulate_curve_params(config, ref_dates, rng)
+    instruments = build_synthetic_instruments(config, calendar_index)
+    cashflow_dimension = build_public_bond_cashflow_dimension(instruments, calendar_df)
+
+    return SyntheticMarket(
+        config=config,
+        holidays=holidays,
+        calendar_df=calendar_df,
+        curve_params=curve_params,
+        instruments=instruments,
+        cashflow_dimension=cashflow_dimension,
+        demab_quotes=build_synthetic_demab_quotes(
+            config,
+            instruments,
+            cashflow_dimension,
+            curve_params,
+            calendar_index,
+            rng,
+        ),
+        di1_quotes=build_synthetic_di1_quotes(config, curve_params, calendar_index, rng),
+        swap_rates=build_synthetic_swap_rates(config, curve_params, calendar_index, rng),
+        sgs_points=build_synthetic_sgs_points(config, curve_params, rng),
+    )
+
+
+def build_synthetic_curve_candidates(market: SyntheticMarket) -> pd.DataFrame:
+    """
+    The DEMAB quotes as rows of mart_public_bonds_curve_candidates.
+
+    Quotes are priced (PU_MED); the observation counts and quality flags
+    follow 02_mart_public_bonds_curve_candidates_and_exclusions.sql.
+    """
+    quotes = market.demab_quotes
+    calendar_index = CalendarIndex.from_calendar_df(market.calendar_df)
+    bd_to_maturity = (
+        calendar_index.bd_index(pd.to_datetime(quotes["vencimento_date"]))
+        - calendar_index.bd_index(pd.to_datetime(quotes["trade_date"]))
+    ).astype(np.int64)
+
+    candidates = pd.DataFrame(
+        {
+            "ref_date": quotes["trade_date"],
+            "instrument_type": quotes["sigla"],
+            "isin": quotes["isin"],
+            "issue_date": quotes["emissao_date"],
+            "maturity_date": quotes["vencimento_date"],
+            "bd_to_maturity": bd_to_maturity,
+            "pu_med": quotes["pu_med"],
+            "taxa_med": quotes["taxa_med"],
+            "pu_lastro": quotes["pu_lastro"],
+            "quote_quality": "OBSERVED_PU",
+            "quote_source": "PU_MED",
+            "primary_quote_type": "PRICE",
+        }
+    )
+    candidates = candidates.loc[candidates["bd_to_maturity"] > 0].reset_index(drop=True)
+
+    by_date = candidates.groupby("ref_date")["bd_to_maturity"]
+    short = candidates["bd_to_maturity"].le(219)
+    long = candidates["bd_to_maturity"].gt(920)
+    total = by_date.transform("size")
+    n_short = short.groupby(candidates["ref_date"]).transform("sum")
+    n_long = long.groupby(candidates["ref_date"]).transform("sum")
+    n_medium = total - n_short - n_long
+    spread_years = (by_date.transform("max") - by_date.transform("min")) / BUSINESS_DAYS_PER_YEAR
+
+    candidates["numero_observacoes_dia"] = total
+    candidates["numero_observacoes_curto"] = n_short
+    candidates["numero_observacoes_medio"] = n_medium
+    candidates["numero_observacoes_longo"] = n_long
+    candidates["flag_volume"] = np.select(
+        [total < 8, total <= 12],
+        ["LOW", "MEDIUM"],
+        "HIGH",
+    )
+    candidates["flag_cobertura_tenors"] = np.select(
+        [spread_years < 2.0, spread_years <= 5.0],
+        ["POOR", "MEDIUM"],
+        "GOOD",
+    )
+    candidates["flag_ocupacao_tenors"] = np.select(
+        [
+            (n_short >= 2)
+            & (n_medium >= 3)
+            & (n_long >= 2)
+            & (n_short / total >= 0.15)
+            & (n_medium / total >= 0.30)
+            & (n_long / total >= 0.15),
+            (n_short >= 1) & (n_medium >= 1) & (n_long >= 1),
+        ],
+        ["GOOD", "MEDIUM"],
+        "POOR",
+    )
+
+    return candidates
+
+
+def zip_bytes(members: list[tuple[str, bytes]]) -> bytes:
+    buffer = BytesIO()
+
+    with zipfile.ZipFile(buffer, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+        for name, payload in members:
+            archive.writestr(
+                zipfile.ZipInfo(name, date_time=ZIP_DATE_TIME),
+                payload,
+                compress_type=zipfile.ZIP_DEFLATED,
+            )
+
+    return buffer.getvalue()
+
+
+def ptbr_numbers(values: pd.Series, decimals: int) -> pd.Series:
+    return values.map(
+        lambda value: "" if pd.isna(value) else f"{value:.{decimals}f}".replace(".", ",")
+    )
+
+
+def ptbr_dates(values: pd.Series) -> pd.Series:
+    return pd.to_datetime(values).dt.strftime("%d/%m/%Y")
+
+
+def write_demab_zips(demab_quotes: pd.DataFrame, raw_dir: str | Path) -> list[Path]:
+    """One NegEYYYYMM.ZIP per month, each with a ';' CSV in decimal comma."""
+
+    raw_dir = Path(raw_dir)
+    raw_dir.mkdir(parents=True, exist_ok=True)
+
+    csv = pd.DataFrame(
+        {
+            "trade_date": ptbr_dates(demab_quotes["trade_date"]),
+            "sigla": demab_quotes["sigla"],
+            "isin": demab_quotes["isin"],
+            "emissao_date": ptbr_dates(demab_quotes["emissao_date"]),
+            "vencimento_date": ptbr_dates(demab_quotes["vencimento_date"]),
+            **{
+                column: ptbr_numbers(demab_quotes[column], 6)
+                for column in ("pu_min", "pu_med", "pu_max", "pu_lastro", "valor_par")
+            },
+            **{
+                column: ptbr_numbers(demab_quotes[column], 4)
+                for column in ("taxa_min", "taxa_med", "taxa_max")
+            },
+        }
+    ).rename(columns={value: key for key, value in DEMAB_COLUMN_MAP.items()})
+
+    months = pd.to_datetime(demab_quotes["trade_date"]).dt.strftime("%Y%m")
+    paths = []
+
+    for month, frame in csv.groupby(months.to_numpy(), sort=True):
+        path = raw_dir / f"NegE{month}.ZIP"
+        text = frame.to_csv(sep=";", index=False, lineterminator="\n")
+        path.write_bytes(zip_bytes([(f"NegE{month}.CSV", text.encode("utf-8"))]))
+        paths.append(path)
+
+    return paths
+
+
+def price_report_xml(ref_date: date, di1_quotes: pd.DataFrame, filler: int) -> str:
+    """
+    BVBG.086 PriceReport with one PricRpt per DI1 contract plus `filler`
+    non-DI1 instruments, which the DI1 parser reads and skips.
+    """
+    trade_date = f"{ref_date:%Y-%m-%d}"
+    reports = [
+        "<PricRpt>"
+        f"<TradDt><Dt>{trade_date}</Dt></TradDt>"
+        f"<SctyId><TckrSymb>{row.ticker}</TckrSymb></SctyId>"
+        f"<TradDtls><TradQty>{row.trade_qty}</TradQty></TradDtls>"
+        "<FinInstrmAttrbts>"
+        f"<OpnIntrst>{row.open_interest}</OpnIntrst>"
+        f"<FinInstrmQty>{row.trade_qty}</FinInstrmQty>"
+        f"<BestBidPric>{row.max_rate:.3f}</BestBidPric>"
+        f"<BestAskPric>{row.min_rate:.3f}</BestAskPric>"
+        f"<LastPric>{row.last_rate:.3f}</LastPric>"
+        f"<TradAvrgPric>{row.average_rate:.3f}</TradAvrgPric>"
+        f"<MinPric>{row.min_rate:.3f}</MinPric>"
+        f"<MaxPric>{row.max_rate:.3f}</MaxPric>"
+        f"<AdjstdQt>{row.adjusted_price:.2f}</AdjstdQt>"
+        f"<AdjstdQtTax>{row.adjusted_rate:.3f}</AdjstdQtTax>"
+        "</FinInstrmAttrbts>"
+        "</PricRpt>"
+        for row in di1_quotes.itertuples(index=False)
+    ]
+    reports.extend(
+        "<PricRpt>"
+        f"<TradDt><Dt>{trade_date}</Dt></TradDt>"
+        f"<SctyId><TckrSymb>SYN{number:05d}</TckrSymb></SctyId>"
+        f"<TradDtls><TradQty>{number % 1000}</TradQty></TradDtls>"
+        "<FinInstrmAttrbts>"
+        f"<LastPric>{number % 997 + 1}.{number % 100:02d}</LastPric>"
+        f"<AdjstdQt>{number % 991 + 1}.{number % 100:02d}</AdjstdQt>"
+        "</FinInstrmAttrbts>"
+        "</PricRpt>"
+        for number in range(filler)
+    )
+
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        '<BizData xmlns="urn:bvmf.052.01.xsd">'
+        f"<AppHdr><CreDt>{trade_date}T21:30:00Z</CreDt></AppHdr>"
+        '<Document xmlns="urn:bvmf.217.01.xsd">'
+        + "\n".join(reports)
+        + "</Document></BizData>\n"
+    )
+
+
+def write_price_report_zips(
+    di1_quotes: pd.DataFrame,
+    raw_dir: str | Path,
+    filler_per_day: int = 0,
+) -> list[Path]:
+    """One PRyymmdd_YYYYMMDD.zip per day: outer zip → inner zip → XML."""
+
+    raw_dir = Path(raw_dir)
+    raw_dir.mkdir(parents=True, exist_ok=True)
+    paths = []
+
+    for ref_date, frame in di1_quotes.groupby("ref_date", sort=True):
+        day = pd.Timestamp(ref_date).date()
+        xml_name = f"BVBG.086.01_BV000328{day:%Y%m%d}0328000001.xml"
+        inner = zip_bytes(
+            [(xml_name, price_report_xml(day, frame, filler_per_day).encode("utf-8"))]
+        )
+        path = raw_dir / f"PR{day:%y%m%d}_{day:%Y%m%d}.zip"
+        path.write_bytes(zip_bytes([(f"PR{day:%y%m%d}.zip", inner)]))
+        paths.append(path)
+
+    return paths
+
+
+def swap_txt_line(
+    sequence: int,
+    ref_date: date,
+    days_to_maturity: int,
+    bd_to_maturity: int,
+    rate: float,
+) -> str:
+    """One fixed-width TaxaSwap.txt line, as read by parse_swap_txt_line."""
+
+    raw_value = round(rate * SWAP_VALUE_SCALE)
+
+    return (
+        f"{sequence:06d}"
+        "00101"
+        f"{ref_date:%Y%m%d}"
+        f"{SWAP_PRODUCT_CODE:<5}"
+        "  "
+        f"{SWAP_PRODUCT_NAME:<15}"
+        f"{days_to_maturity:05d}"
+        f"{bd_to_maturity:05d}"
+        f"{'-' if raw_value < 0 else '+'}"
+        f"{abs(raw_value):014d}"
+        "1"
+        f"{days_to_maturity:05d}"
+    )
+
+
+def write_swap_zips(swap_rates: pd.DataFrame, raw_dir: str | Path) -> list[Path]:
+    """One TSyymmdd_YYYYMMDD.zip per day: outer zip → TSyymmdd.ex_ → TaxaSwap.txt."""
+
+    raw_dir = Path(raw_dir)
+    raw_dir.mkdir(parents=True, exist_ok=True)
+    paths = []
+
+    for ref_date, frame in swap_rates.groupby("ref_date", sort=True):
+        day = pd.Timestamp(ref_date).date()
+        text = "\r\n".join(
+            swap_txt_line(sequence, day, int(days), int(business_days), float(rate))
+            for sequence, (days, business_days, rate) in enumerate(
+                frame[["days_to_maturity", "bd_to_maturity", "rate"]].itertuples(index=False),
+                start=1,
+            )
+        ) + "\r\n"
+        embedded = SELF_EXTRACTOR_STUB + zip_bytes([("TaxaSwap.txt", text.encode("cp1252"))])
+        path = raw_dir / f"TS{day:%y%m%d}_{day:%Y%m%d}.zip"
+        path.write_bytes(zip_bytes([(f"TS{day:%y%m%d}.ex_", embedded)]))
+        paths.append(path)
+
+    return paths
+
+
+def write_sgs_json(sgs_points: pd.DataFrame, raw_dir: str | Path) -> list[Path]:
+    """One `<series>_<dd-mm-yyyy>_<dd-mm-yyyy>.json` per series and year."""
+
+    raw_dir = Path(raw_dir)
+    raw_dir.mkdir(parents=True, exist_ok=True)
+    points = sgs_points.assign(ref_date=pd.to_datetime(sgs_points["ref_date"]))
+    paths = []
+
+    for (series_id, _), frame in points.groupby(
+        [points["series_id"], points["ref_date"].dt.year],
+        sort=True,
+    ):
+        first, last = frame["ref_date"].min(), frame["ref_date"].max()
+        path = raw_dir / f"{series_id}_{first:%d-%m-%Y}_{last:%d-%m-%Y}.json"
+        records = [
+            {"data": f"{ref_date:%d/%m/%Y}", "valor": f"{value:.2f}"}
+            for ref_date, value in zip(frame["ref_date"], frame["value"])
+        ]
+        path.write_text(json.dumps(records), encoding="utf-8")
+        paths.append(path)
+
+    return paths
+
+
+def write_synthetic_market(market: SyntheticMarket, root: str | Path) -> dict[str, Path]:
+    """
+    Write the raw files under `root` with the RAW_LAYOUT paths, so a Kedro
+    project rooted there reads them through the usual catalog and params.
+    """
+    root = Path(root)
+    paths = {key: root / relative for key, relative in RAW_LAYOUT.items()}
+
+    paths["anbima_holidays"].parent.mkdir(parents=True, exist_ok=True)
+    paths["anbima_holidays"].write_bytes(anbima_holidays_csv(market.holidays))
+    write_sgs_json(market.sgs_points, paths["bcb_sgs"])
+    write_demab_zips(market.demab_quotes, paths["bcb_demab"])
+    write_price_report_zips(
+        market.di1_quotes,
+        paths["b3_price_report"],
+        market.config.pricereport_filler_per_day,
+    )
+    write_swap_zips(market.swap_rates, paths["b3_swap"])
+
+    return paths
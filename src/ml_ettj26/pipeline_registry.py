@@ -24,6 +24,7 @@ from ml_ettj26.pipelines.refined.view_duckdb.pipeline import create_pipeline as
 from ml_ettj26.pipelines.curve_factory.public_bonds_mart import pipeline as public_bonds_mart_pipeline
 from ml_ettj26.pipelines.curve_factory.public_bonds_mart import pipeline_batch as public_bonds_mart_batch_pipeline
 from ml_ettj26.pipelines.curve_factory.public_bonds_mart import pipeline_dimension_batch as public_bonds_mart_dimension_batch_pipeline
+from ml_ettj26.pipelines.curve_factory.public_bonds_mart import pipeline_incremental as public_bonds_mart_incremental_pipeline
 from ml_ettj26.pipelines.curve_factory.public_bonds_cashflows import pipeline as public_bonds_cashflows_pipeline
 from factory_curve.flat_forward import pipeline as flat_forward_pipeline
 from factory_curve.bootstrapping import pipeline as bootstrapping_pipeline
@@ -54,6 +55,7 @@ def register_pipelines() -> dict[str, Pipeline]:
     public_bonds_mart = public_bonds_mart_pipeline.create_pipeline()
     public_bonds_mart_batch = public_bonds_mart_batch_pipeline.create_pipeline()
     public_bonds_mart_dimension_batch = public_bonds_mart_dimension_batch_pipeline.create_pipeline()
+    public_bonds_mart_incremental = public_bonds_mart_incremental_pipeline.create_pipeline()
     public_bonds_cashflows = public_bonds_cashflows_pipeline.create_pipeline()
     public_bonds_flat_forward = flat_forward_pipeline.create_pipeline()
     public_bonds_bootstrapping = bootstrapping_pipeline.create_pipeline()
@@ -94,6 +96,7 @@ def register_pipelines() -> dict[str, Pipeline]:
         "public_bonds_mart": public_bonds_mart,
         "public_bonds_mart_batch": public_bonds_mart_batch,
         "public_bonds_mart_dimension_batch": public_bonds_mart_dimension_batch,
+        "public_bonds_mart_incremental": public_bonds_mart_incremental,
         "public_bonds_flat_forward": public_bonds_flat_forward,
         "public_bonds_bootstrapping": public_bonds_bootstrapping,
         "public_bonds_kernel_ridge": public_bonds_kernel_ridge,
@@ -1,18 +1,36 @@
 from __future__ import annotations
 
+import hashlib
 import json
-from datetime import date, datetime
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
+from typing import Callable
 
 import duckdb
+import numpy as np
 import pandas as pd
 
+from engine_product.calendars import CalendarIndex
 from engine_product.calendars.business_calendar import BusinessCalendar
-from engine_product.calendars.repository import DataFrameCalendarRepository
-from engine_product.cashflows.models import Cashflow, CashflowType
+from engine_product.calendars.repository import ArrayCalendarRepository
+from engine_product.cashflows import CashflowBatch
+from engine_product.cashflows.models import CashflowType
 from engine_product.convention.conventions import BU252
-from engine_product.instruments.public_bonds import LTNContract, NTNFContract
+from engine_product.instruments.public_bonds import (
+    LFT_SCHEDULE_RULE,
+    LTN_SCHEDULE_RULE,
+    NTNF_SCHEDULE_RULE,
+    build_lft_cashflow_batch,
+    build_ltn_cashflow_batch,
+    build_ntnb_cashflow_batch,
+    build_ntnf_cashflow_batch,
+    ntnb_schedule_rule,
+)
+from engine_product.schedules import (
+    BatchScheduleRule,
+    ScheduleBatch,
+    build_schedule_batch,
+)
 
 
 CASHFLOW_TYPE_RANK = {
@@ -22,6 +40,24 @@ CASHFLOW_TYPE_RANK = {
     CashflowType.FEE: 40,
 }
 
+SCHEDULE_RULES: dict[str, BatchScheduleRule] = {
+    "LTN": LTN_SCHEDULE_RULE,
+    "NTN-F": NTNF_SCHEDULE_RULE,
+    "LFT": LFT_SCHEDULE_RULE,
+}
+
+# Rules whose coupon months depend on the maturity month.
+MATURITY_SCHEDULE_RULES: dict[str, Callable[[int], BatchScheduleRule]] = {
+    "NTN-B": ntnb_schedule_rule,
+}
+
+CASHFLOW_BATCH_BUILDERS = {
+    "LTN": build_ltn_cashflow_batch,
+    "NTN-F": build_ntnf_cashflow_batch,
+    "LFT": build_lft_cashflow_batch,
+    "NTN-B": build_ntnb_cashflow_batch,
+}
+
 CASHFLOW_DIMENSION_COLUMNS = [
     "isin",
     "instrument_type",
@@ -42,18 +78,13 @@ CASHFLOW_DIMENSION_COLUMNS = [
     "metadata_json",
 ]
 
-
-def as_date(value: Any) -> date:
-    if isinstance(value, pd.Timestamp):
-        return value.date()
-
-    if isinstance(value, datetime):
-        return value.date()
-
-    if isinstance(value, date):
-        return value
-
-    return pd.to_datetime(value).date()
+CASHFLOW_DIMENSION_STATE_COLUMNS = [
+    "calendar_hash",
+    "full_rebuild",
+    "instruments",
+    "new_instruments",
+    "updated_at_utc",
+]
 
 
 def execute_duckdb_sql_files(
@@ -81,7 +112,7 @@ def load_public_bond_instruments_from_duckdb(
                 issue_date,
                 maturity AS maturity_date
             FROM vw_refined_bcb_demab_government_bonds_secondary_market
-            WHERE sigla IN ('LTN', 'NTN-F')
+            WHERE sigla IN ('LTN', 'NTN-F', 'LFT', 'NTN-B')
               AND isin IS NOT NULL
               AND issue_date IS NOT NULL
               AND maturity IS NOT NULL
@@ -104,20 +135,22 @@ def load_refined_calendar_from_duckdb(
 
 def build_business_calendar(
     calendar_df: pd.DataFrame,
-) -> tuple[BusinessCalendar, BU252, dict[date, int]]:
+) -> tuple[BusinessCalendar, BU252, CalendarIndex]:
+    """
+    Build the calendar, BU252 day count and the dense date -> bd_index index.
+
+    The CalendarIndex is taken from the ArrayCalendarRepository, so the
+    calendar arrays are built once.
+    """
     calendar_df = calendar_df.copy()
     calendar_df["date"] = pd.to_datetime(calendar_df["date"]).dt.date
     calendar_df["is_business_day"] = calendar_df["is_business_day"].astype(bool)
 
-    bd_index_by_date = dict(
-        zip(calendar_df["date"], calendar_df["bd_index"], strict=True)
-    )
-
-    calendar_repo = DataFrameCalendarRepository(calendar_df)
+    calendar_repo = ArrayCalendarRepository(calendar_df)
     calendar = BusinessCalendar(calendar_repo)
     day_count = BU252(calendar)
 
-    return calendar, day_count, bd_index_by_date
+    return calendar, day_count, calendar_repo.calendar_index
 
 
 def cashflow_type_rank(cashflow_type: CashflowType) -> int:
@@ -131,66 +164,37 @@ def metadata_to_json(metadata: dict | None) -> str | None:
     return json.dumps(metadata, sort_keys=True, default=str)
 
 
-def build_contract_cashflows(
-    *,
-    instrument_type: str,
-    issue_date: date,
-    maturity_date: date,
+def build_instrument_schedules(
+    instruments: pd.DataFrame,
     calendar: BusinessCalendar,
-    day_count: BU252,
-) -> list[Cashflow]:
-    if instrument_type == "LTN":
-        contract = LTNContract(
-            start_date=issue_date,
-            maturity_date=maturity_date,
-            calendar=calendar,
-        )
-    elif instrument_type == "NTN-F":
-        contract = NTNFContract(
-            start_date=issue_date,
-            maturity_date=maturity_date,
-            calendar=calendar,
-            day_count=day_count,
+) -> ScheduleBatch:
+    """
+    Build every instrument schedule in one columnar pass.
+
+    The result is a ScheduleBatch aligned with the instruments rows.
+    """
+    instrument_types = instruments["instrument_type"].astype(str).tolist()
+    unsupported = sorted(
+        set(instrument_types) - set(SCHEDULE_RULES) - set(MATURITY_SCHEDULE_RULES)
+    )
+
+    if unsupported:
+        raise ValueError(
+            f"Unsupported public bond instrument_type: {unsupported[0]}"
         )
-    else:
-        raise ValueError(f"Unsupported public bond instrument_type: {instrument_type}")
-
-    return contract.build_cashflows(as_of_date=issue_date)
-
-
-def cashflow_to_row(
-    *,
-    isin: str,
-    instrument_type: str,
-    issue_date: date,
-    maturity_date: date,
-    cashflow_number: int,
-    cashflow: Cashflow,
-    bd_index_by_date: dict[date, int],
-) -> dict:
-    payment_date = as_date(cashflow.payment_date)
-    issue_bd_index = int(bd_index_by_date[issue_date])
-    payment_bd_index = int(bd_index_by_date[payment_date])
-
-    return {
-        "isin": isin,
-        "instrument_type": instrument_type,
-        "issue_date": issue_date,
-        "maturity_date": maturity_date,
-        "cashflow_number": cashflow_number,
-        "payment_date": payment_date,
-        "payment_bd_index": payment_bd_index,
-        "issue_bd_index": issue_bd_index,
-        "bd_from_issue": payment_bd_index - issue_bd_index,
-        "cashflow_type": cashflow.cashflow_type.value,
-        "cashflow_type_rank": cashflow_type_rank(cashflow.cashflow_type),
-        "amount": cashflow.amount,
-        "accrual_start": cashflow.accrual_start,
-        "accrual_end": cashflow.accrual_end,
-        "notional_before": cashflow.notional_before,
-        "notional_after": cashflow.notional_after,
-        "metadata_json": metadata_to_json(cashflow.metadata),
-    }
+
+    maturity_dates = pd.to_datetime(instruments["maturity_date"])
+    maturity_months = maturity_dates.dt.month.tolist()
+
+    return build_schedule_batch(
+        start_dates=pd.to_datetime(instruments["issue_date"]).to_numpy("datetime64[D]"),
+        maturity_dates=maturity_dates.to_numpy("datetime64[D]"),
+        rules=[
+            SCHEDULE_RULES[t] if t in SCHEDULE_RULES else MATURITY_SCHEDULE_RULES[t](m)
+            for t, m in zip(instrument_types, maturity_months)
+        ],
+        calendar=calendar,
+    )
 
 
 def build_public_bond_cashflow_dimension(
@@ -202,50 +206,83 @@ def build_public_bond_cashflow_dimension(
 
     The output keeps one row per Cashflow object, keyed by (isin, cashflow_number).
     Consumers that only need yield pricing can aggregate by payment_bd_index later.
+
+    Schedules and cashflows are generated in columnar batches, one per
+    instrument type, so no Cashflow object is created per row.
     """
-    calendar, day_count, bd_index_by_date = build_business_calendar(calendar_df)
-
-    rows: list[dict] = []
-
-    for instrument in instruments.itertuples(index=False):
-        isin = str(instrument.isin)
-        instrument_type = str(instrument.instrument_type)
-        issue_date = as_date(instrument.issue_date)
-        maturity_date = as_date(instrument.maturity_date)
-
-        cashflows = build_contract_cashflows(
-            instrument_type=instrument_type,
-            issue_date=issue_date,
-            maturity_date=maturity_date,
-            calendar=calendar,
-            day_count=day_count,
-        )
+    calendar, _, _ = build_business_calendar(calendar_df)
 
-        ordered_cashflows = sorted(
-            cashflows,
-            key=lambda cf: (
-                as_date(cf.payment_date),
-                cashflow_type_rank(cf.cashflow_type),
-            ),
+    if instruments.empty:
+        return pd.DataFrame(columns=CASHFLOW_DIMENSION_COLUMNS)
+
+    schedules = build_instrument_schedules(instruments, calendar)
+    instrument_types = instruments["instrument_type"].astype(str).to_numpy()
+    issue_dates = pd.to_datetime(instruments["issue_date"]).to_numpy("datetime64[D]")
+
+    frames: list[pd.DataFrame] = []
+
+    for instrument_type, build_batch in CASHFLOW_BATCH_BUILDERS.items():
+        positions = np.flatnonzero(instrument_types == instrument_type)
+
+        if positions.size == 0:
+            continue
+
+        batch = build_batch(
+            schedules.take(positions),
+            issue_dates[positions],
+            issue_dates[positions],
         )
+        frames.append(cashflow_batch_to_frame(batch, positions))
 
-        for cashflow_number, cashflow in enumerate(ordered_cashflows, start=1):
-            rows.append(
-                cashflow_to_row(
-                    isin=isin,
-                    instrument_type=instrument_type,
-                    issue_date=issue_date,
-                    maturity_date=maturity_date,
-                    cashflow_number=cashflow_number,
-                    cashflow=cashflow,
-                    bd_index_by_date=bd_index_by_date,
-                )
-            )
-
-    if not rows:
+    if not frames:
         return pd.DataFrame(columns=CASHFLOW_DIMENSION_COLUMNS)
 
-    dimension = pd.DataFrame(rows)
+    cashflows = (
+        pd.concat(frames, ignore_index=True)
+        .sort_values(
+            ["position", "payment_date", "cashflow_type_rank"],
+            kind="stable",
+        )
+        .reset_index(drop=True)
+    )
+    position = cashflows["position"].to_numpy()
+
+    payment_bd_index = calendar.repository.bd_index_array(
+        cashflows["payment_date"].to_numpy("datetime64[D]")
+    )
+    issue_bd_index = calendar.repository.bd_index_array(issue_dates)[position]
+
+    dimension = pd.DataFrame(
+        {
+            "isin": instruments["isin"].astype(str).to_numpy()[position],
+            "instrument_type": instrument_types[position],
+            "issue_date": issue_dates.astype(object)[position],
+            "maturity_date": (
+                pd.to_datetime(instruments["maturity_date"])
+                .to_numpy("datetime64[D]")
+                .astype(object)[position]
+            ),
+            "cashflow_number": cashflows.groupby("position").cumcount().to_numpy() + 1,
+            "payment_date": (
+                cashflows["payment_date"].to_numpy("datetime64[D]").astype(object)
+            ),
+            "payment_bd_index": payment_bd_index,
+            "issue_bd_index": issue_bd_index,
+            "bd_from_issue": payment_bd_index - issue_bd_index,
+            "cashflow_type": cashflows["cashflow_type"].to_numpy(),
+            "cashflow_type_rank": cashflows["cashflow_type_rank"].to_numpy(),
+            "amount": cashflows["amount"].to_numpy(),
+            "accrual_start": (
+                cashflows["accrual_start"].to_numpy("datetime64[D]").astype(object)
+            ),
+            "accrual_end": (
+                cashflows["accrual_end"].to_numpy("datetime64[D]").astype(object)
+            ),
+            "notional_before": cashflows["notional_before"].to_numpy(),
+            "notional_after": cashflows["notional_after"].to_numpy(),
+            "metadata_json": cashflows["metadata_json"].to_numpy(),
+        }
+    )
     dimension = dimension[CASHFLOW_DIMENSION_COLUMNS]
     dimension = (
         dimension.sort_values(["isin", "cashflow_number"])
@@ -264,6 +301,111 @@ def build_public_bond_cashflow_dimension(
     return dimension
 
 
+def calendar_source_hash(calendar_df: pd.DataFrame) -> str:
+    """
+    Hash of the calendar sources, from `source_file_hash` when available.
+
+    Without that column, the whole calendar frame is hashed.
+    """
+    hasher = hashlib.sha256()
+
+    if "source_file_hash" in calendar_df:
+        sources = sorted(calendar_df["source_file_hash"].dropna().astype(str).unique())
+        hasher.update(json.dumps(sources).encode())
+    else:
+        hasher.update(
+            pd.util.hash_pandas_object(calendar_df, index=False).to_numpy().tobytes()
+        )
+
+    return hasher.hexdigest()
+
+
+def build_public_bond_cashflow_dimension_incremental(
+    instruments: pd.DataFrame,
+    calendar_df: pd.DataFrame,
+    previous_dimension: pd.DataFrame,
+    previous_state: pd.DataFrame,
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Build cashflows only for ISINs missing from the previous dimension.
+
+    Contract cashflows do not change after issue, so rows of known ISINs are
+    reused. Everything is rebuilt when there is no previous state or the
+    calendar sources changed, since bd_index values depend on the calendar.
+    ISINs no longer listed are dropped, so the result equals a full build,
+    sorted by (isin, cashflow_number) with new issues merged into place.
+
+    Returns the dimension and a one-row state with the calendar hash.
+    """
+    calendar_hash = calendar_source_hash(calendar_df)
+    full_rebuild = (
+        previous_state.empty
+        or previous_dimension.empty
+        or previous_state["calendar_hash"].iloc[-1] != calendar_hash
+    )
+    current_isins = instruments["isin"].astype(str)
+
+    if full_rebuild:
+        kept = pd.DataFrame(columns=CASHFLOW_DIMENSION_COLUMNS)
+        new_instruments = instruments
+    else:
+        known_isins = previous_dimension["isin"].astype(str)
+        kept = previous_dimension.loc[known_isins.isin(current_isins)]
+        new_instruments = instruments.loc[~current_isins.isin(known_isins)]
+
+    new_rows = build_public_bond_cashflow_dimension(new_instruments, calendar_df)
+    frames = [frame for frame in (kept, new_rows) if not frame.empty]
+    dimension = (
+        pd.concat(frames, ignore_index=True)[CASHFLOW_DIMENSION_COLUMNS]
+        .sort_values(["isin", "cashflow_number"], kind="stable")
+        .reset_index(drop=True)
+        if frames
+        else pd.DataFrame(columns=CASHFLOW_DIMENSION_COLUMNS)
+    )
+
+    state = pd.DataFrame(
+        [
+            {
+                "calendar_hash": calendar_hash,
+                "full_rebuild": full_rebuild,
+                "instruments": int(current_isins.nunique()),
+                "new_instruments": int(new_instruments["isin"].nunique()),
+                "updated_at_utc": datetime.now(timezone.utc),
+            }
+        ],
+        columns=CASHFLOW_DIMENSION_STATE_COLUMNS,
+    )
+
+    return dimension, state
+
+
+def cashflow_batch_to_frame(
+    batch: CashflowBatch,
+    positions: np.ndarray,
+) -> pd.DataFrame:
+    """
+    Flatten a CashflowBatch into rows tagged with the instrument position.
+    """
+    cashflow_type = batch.cashflow_type
+
+    return pd.DataFrame(
+        {
+            "position": positions[batch.owner],
+            "payment_date": batch.payment_date,
+            "cashflow_type": cashflow_type,
+            "cashflow_type_rank": [
+                cashflow_type_rank(CashflowType(value)) for value in cashflow_type
+            ],
+            "amount": batch.amount,
+            "accrual_start": batch.accrual_start,
+            "accrual_end": batch.accrual_end,
+            "notional_before": batch.notional_before,
+            "notional_after": batch.notional_after,
+            "metadata_json": [metadata_to_json(m) for m in batch.metadata()],
+        }
+    )
+
+
 def register_public_bond_cashflow_dimension_view(
     duckdb_path: str,
     parquet_path: str,
@@ -3,7 +3,7 @@ from __future__ import annotations
 from kedro.pipeline import Pipeline, node, pipeline
 
 from .nodes import (
-    build_public_bond_cashflow_dimension,
+    build_public_bond_cashflow_dimension_incremental,
     execute_duckdb_sql_files,
     load_public_bond_instruments_from_duckdb,
     load_refined_calendar_from_duckdb,
@@ -40,12 +40,17 @@ def create_pipeline(**kwargs) -> Pipeline:
                 name="load_refined_calendar_br_for_cashflow_dimension",
             ),
             node(
-                func=build_public_bond_cashflow_dimension,
+                func=build_public_bond_cashflow_dimension_incremental,
                 inputs={
                     "instruments": "public_bond_cashflow_dimension_instruments",
                     "calendar_df": "refined_calendar_br_for_cashflow_dimension",
+                    "previous_dimension": "mart_public_bonds_cashflow_dimension_prev",
+                    "previous_state": "mart_public_bonds_cashflow_dimension_state_prev",
                 },
-                outputs="mart_public_bonds_cashflow_dimension",
+                outputs=[
+                    "mart_public_bonds_cashflow_dimension",
+                    "mart_public_bonds_cashflow_dimension_state",
+                ],
                 name="build_public_bonds_cashflow_dimension",
             ),
             node(
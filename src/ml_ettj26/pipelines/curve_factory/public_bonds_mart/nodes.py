@@ -7,10 +7,12 @@ from pathlib import Path
 from typing import Any
 
 import duckdb
+import numpy as np
 import pandas as pd
 
 from engine_product.calendars.business_calendar import BusinessCalendar
-from engine_product.calendars.repository import DataFrameCalendarRepository
+from engine_product.calendars.repository import ArrayCalendarRepository
+from engine_product.convention import year_fractions
 from engine_product.convention.conventions import BU252
 
 from engine_product.instruments.public_bonds import (
@@ -26,6 +28,23 @@ from engine_product.risk import (
 )
 
 
+# Instrument types priced by the contract paths (nodes, nodes_batch). LFT and
+# NTN-B need the VNA and are priced by the cashflow-dimension path only.
+NOMINAL_INSTRUMENT_TYPES = ("LTN", "NTN-F")
+
+
+def nominal_curve_candidates(curve_candidates: pd.DataFrame) -> pd.DataFrame:
+    """
+    Keep the LTN and NTN-F candidates.
+
+    The candidates view also marks LFT and NTN-B as eligible; they are left
+    to the cashflow-dimension pipelines instead of becoming failures here.
+    """
+    return curve_candidates.loc[
+        curve_candidates["instrument_type"].isin(NOMINAL_INSTRUMENT_TYPES)
+    ]
+
+
 def execute_duckdb_sql_files(
     duckdb_path: str,
     sql_files: list[str],
@@ -148,14 +167,16 @@ def build_business_calendar(
 
         calendar_df["date"] = pd.to_datetime(calendar_df["date"]).dt.date
 
-    This keeps the product engine operating with datetime.date.
+    This keeps the product engine operating with datetime.date. Lookups are
+    served by ArrayCalendarRepository, so each schedule adjustment and BU252
+    year fraction is an array index instead of a pandas .loc.
     """
     calendar_df = calendar_df.copy()
 
     calendar_df["date"] = pd.to_datetime(calendar_df["date"]).dt.date
     calendar_df["is_business_day"] = calendar_df["is_business_day"].astype(bool)
 
-    calendar_repo = DataFrameCalendarRepository(calendar_df)
+    calendar_repo = ArrayCalendarRepository(calendar_df)
     calendar = BusinessCalendar(calendar_repo)
     bu252 = BU252(calendar)
 
@@ -174,18 +195,19 @@ def price_cashflows_from_yield(
     This is used when LTN has observed TAXA_MED but missing PU_MED.
     """
     settlement_date = as_date(settlement_date)
-    price = 0.0
-
-    for cf in cashflows:
-        payment_date = as_date(cf.payment_date)
+    future = [
+        (payment_date, cf.amount)
+        for cf in cashflows
+        if (payment_date := as_date(cf.payment_date)) > settlement_date
+    ]
 
-        if payment_date <= settlement_date:
-            continue
+    if not future:
+        return 0.0
 
-        t = day_count.year_fraction(settlement_date, payment_date)
-        price += cf.amount / ((1.0 + ytm) ** t)
+    payment_dates, amounts = zip(*future)
+    times = year_fractions(day_count, settlement_date, list(payment_dates))
 
-    return price
+    return float(np.sum(np.asarray(amounts, dtype=float) / ((1.0 + ytm) ** times)))
 
 
 def compute_ltn_curve_input_row(
@@ -407,7 +429,9 @@ def build_public_bonds_curve_inputs(
         mart_public_bonds_curve_calculation_failures
 
     This prevents one bad quote/instrument from cancelling the whole batch.
+    Only LTN and NTN-F are priced; see nominal_curve_candidates.
     """
+    curve_candidates = nominal_curve_candidates(curve_candidates)
     calendar, bu252 = build_business_calendar(calendar_df)
 
     rows: list[dict] = []
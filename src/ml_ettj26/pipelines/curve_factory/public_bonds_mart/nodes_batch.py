@@ -1,22 +1,26 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, Sequence
 
+import numpy as np
 import pandas as pd
 from tqdm.auto import tqdm
 
 from engine_product.calendars.business_calendar import BusinessCalendar
+from engine_product.calendars.index import as_datetime64_days
 from engine_product.cashflows.models import Cashflow
 from engine_product.convention.conventions import BU252
 from engine_product.instruments.public_bonds import LTNContract, NTNFContract
 from engine_product.pricing import YieldProblem, yield_to_maturity_batch
+from engine_product.pricing.yield_solvers_batch import YieldSolverBatchResult
 from engine_product.risk import macaulay_duration
 
 from .nodes import (
     as_date,
     build_business_calendar,
     get_row_value,
+    nominal_curve_candidates,
     normalize_rate,
     price_cashflows_from_yield,
     solver_method_value,
@@ -62,6 +66,18 @@ INPUT_COLUMNS = [
     "market_ytm_source",
     "solver_method",
     "solver_iterations",
+    "solver_start_type",
+]
+
+SOLVER_START_STATIC = "STATIC"
+SOLVER_START_WARM = "WARM"
+
+SOLVER_ITERATION_REPORT_COLUMNS = [
+    "solver_start_type",
+    "solver_method",
+    "observations",
+    "total_iterations",
+    "mean_iterations",
 ]
 
 FAILURE_COLUMNS = [
@@ -119,6 +135,7 @@ def make_success_row(
     solver_method: str,
     solver_iterations: int | None,
     day_count: BU252,
+    solver_start_type: str | None = None,
 ) -> dict:
     mac = macaulay_duration(
         cashflows=cashflows,
@@ -152,6 +169,7 @@ def make_success_row(
         "market_ytm_source": market_ytm_source,
         "solver_method": solver_method,
         "solver_iterations": solver_iterations,
+        "solver_start_type": solver_start_type,
     }
 
 
@@ -306,9 +324,96 @@ def finalize_curve_inputs(
     return inputs, calculation_failures
 
 
+def normalize_rates(values: Any) -> np.ndarray:
+    """Vectorized normalize_rate; missing rates are NaN."""
+
+    rates = pd.to_numeric(pd.Series(values, dtype=object), errors="coerce").to_numpy(
+        dtype=np.float64
+    )
+
+    return np.where(np.abs(rates) > 1.0, rates / 100.0, rates)
+
+
+def previous_quote_rates(curve_candidates: pd.DataFrame) -> np.ndarray:
+    """
+    taxa_med of each row's ISIN on its previous ref_date, NaN without one.
+
+    Warm starts begin Newton there. The previous day's DEMAB mean rate is
+    within a few basis points of the yield solved on that day, and it is
+    known for every date up front, so all dates are solved in one batch.
+    """
+    n = len(curve_candidates)
+    previous = np.full(n, np.nan, dtype=np.float64)
+
+    if n == 0 or "taxa_med" not in curve_candidates.columns:
+        return previous
+
+    rates = normalize_rates(curve_candidates["taxa_med"].to_numpy())
+    isin_codes, _ = pd.factorize(curve_candidates["isin"].astype(str))
+    order = np.lexsort((as_datetime64_days(curve_candidates["ref_date"]), isin_codes))
+    same_isin = isin_codes[order[1:]] == isin_codes[order[:-1]]
+    previous[order[1:][same_isin]] = rates[order[:-1][same_isin]]
+
+    return previous
+
+
+def solve_curve_input_problems(
+    contexts: Sequence[Any],
+    previous_rates: np.ndarray | None = None,
+) -> tuple[list[YieldSolverBatchResult], list[str]]:
+    """
+    Solve the yield problems of curve-input contexts in one batch.
+
+    Returns batch results indexed by context position and the solver start
+    type of each context. `previous_rates`, aligned with the candidate rows
+    (see previous_quote_rates), warm-starts Newton at each context's
+    row_index; contexts without a finite rate start from the static guess.
+    """
+    guesses = (
+        None
+        if previous_rates is None
+        else np.asarray([previous_rates[context.row_index] for context in contexts])
+    )
+    results = yield_to_maturity_batch(
+        [context.problem for context in contexts],
+        initial_guesses=guesses,
+    )
+    start_types = [SOLVER_START_STATIC] * len(contexts)
+
+    if guesses is not None:
+        for position in np.flatnonzero(np.isfinite(guesses)):
+            start_types[position] = SOLVER_START_WARM
+
+    return results, start_types
+
+
+def summarize_solver_iterations(curve_inputs: pd.DataFrame) -> pd.DataFrame:
+    """
+    Observations and solver iterations by start type and solver method.
+    """
+    solved = curve_inputs.dropna(subset=["solver_start_type"])
+
+    if solved.empty:
+        return pd.DataFrame(columns=SOLVER_ITERATION_REPORT_COLUMNS)
+
+    report = (
+        solved.groupby(["solver_start_type", "solver_method"], as_index=False)
+        .agg(
+            observations=("isin", "size"),
+            total_iterations=("solver_iterations", "sum"),
+            mean_iterations=("solver_iterations", "mean"),
+        )
+        .sort_values(["solver_start_type", "solver_method"])
+        .reset_index(drop=True)
+    )
+
+    return report[SOLVER_ITERATION_REPORT_COLUMNS]
+
+
 def build_public_bonds_curve_inputs_batch(
     curve_candidates: pd.DataFrame,
     calendar_df: pd.DataFrame,
+    warm_start: bool = False,
 ) -> tuple[pd.DataFrame, pd.DataFrame]:
     """
     Build public-bond curve inputs using the batch yield solver.
@@ -316,7 +421,10 @@ def build_public_bonds_curve_inputs_batch(
     PRICE observations are solved together through yield_to_maturity_batch.
     LTN observations quoted directly as YIELD keep the observed yield path.
     Failed problem construction or solver failures are returned per observation.
+    With `warm_start`, Newton starts from each ISIN's previous-day taxa_med.
+    Only LTN and NTN-F are priced; see nominal_curve_candidates.
     """
+    curve_candidates = nominal_curve_candidates(curve_candidates)
     calendar, bu252 = build_business_calendar(calendar_df)
 
     rows: list[dict] = []
@@ -380,8 +488,10 @@ def build_public_bonds_curve_inputs_batch(
                 )
             )
 
-    problems = [context.problem for context in contexts]
-    batch_results = yield_to_maturity_batch(problems)
+    batch_results, start_types = solve_curve_input_problems(
+        contexts,
+        previous_quote_rates(curve_candidates) if warm_start else None,
+    )
 
     for batch_result in batch_results:
         context = contexts[batch_result.index]
@@ -411,6 +521,7 @@ def build_public_bonds_curve_inputs_batch(
                 solver_method=solver_method_value(result.method),
                 solver_iterations=result.iterations,
                 day_count=bu252,
+                solver_start_type=start_types[batch_result.index],
             )
         )
 
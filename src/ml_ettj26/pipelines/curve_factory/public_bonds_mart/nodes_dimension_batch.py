@@ -1,25 +1,73 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, Iterable, Mapping
 
+import numpy as np
 import pandas as pd
 from tqdm.auto import tqdm
 
-from engine_product.pricing import YieldProblem, yield_to_maturity_batch
+from engine_product.calendars import CalendarIndex
+from engine_product.calendars.index import as_datetime64_days
+from engine_product.cashflows.indexers.cumulative import (
+    build_cdi_index_table,
+    build_ipca_index_table,
+)
+from engine_product.instruments.public_bonds import IndexedNotional
+from engine_product.pricing import (
+    BatchYieldSolver,
+    RaggedCashflows,
+    RaggedYieldSolution,
+    YieldProblem,
+)
 from engine_product.pricing.cashflow_arrays import (
-    build_bd_index_lookup,
-    build_cashflow_schedule_lookup,
     macaulay_duration_from_time_amount_pairs,
     price_from_time_amount_pairs,
 )
+from engine_product.pricing.cashflow_store import CashflowStore
+from engine_product.risk import bond_risk_batch, bond_risk_from_time_amount_pairs
 
 from .nodes import as_date, get_row_value, normalize_rate, solver_method_value
-from .nodes_batch import finalize_curve_inputs, make_failure_row
+from .nodes_batch import (
+    FAILURE_COLUMNS,
+    INPUT_COLUMNS,
+    SOLVER_START_STATIC,
+    SOLVER_START_WARM,
+    finalize_curve_inputs,
+    make_failure_row,
+    normalize_rates,
+    previous_quote_rates,
+    solve_curve_input_problems,
+)
+
+
+# Cumulative-index table behind the VNA of each indexed instrument type.
+INDEXED_NOTIONAL_TABLE_BUILDERS = {
+    "LFT": build_cdi_index_table,
+    "NTN-B": build_ipca_index_table,
+}
+
+VNA_UNAVAILABLE_MESSAGE = "VNA not available"
+
+# Error type of indexed rows dated after the last published index point; the
+# only VNA failure that a later SGS publication can fix.
+VNA_PENDING_ERROR_TYPE = "KeyError"
+
+# Candidate columns copied as-is into curve inputs; missing ones become None.
+OPTIONAL_INPUT_COLUMNS = [
+    "numero_observacoes_dia",
+    "numero_observacoes_curto",
+    "numero_observacoes_medio",
+    "numero_observacoes_longo",
+    "flag_volume",
+    "flag_cobertura_tenors",
+    "flag_ocupacao_tenors",
+]
 
 
 @dataclass(frozen=True)
 class CurveInputArrayProblemContext:
+    row_index: int
     row: Any
     problem: YieldProblem
     time_amount_pairs: tuple[tuple[float, float], ...]
@@ -44,11 +92,15 @@ def make_success_row_from_pairs(
     market_ytm_source: str,
     solver_method: str,
     solver_iterations: int | None,
+    macaulay_duration: float | None = None,
+    solver_start_type: str | None = None,
 ) -> dict:
-    mac = macaulay_duration_from_time_amount_pairs(
-        time_amount_pairs=time_amount_pairs,
-        ytm=market_ytm,
-    )
+    mac = macaulay_duration
+    if mac is None:
+        mac = macaulay_duration_from_time_amount_pairs(
+            time_amount_pairs=time_amount_pairs,
+            ytm=market_ytm,
+        )
 
     return {
         "ref_date": ref_date,
@@ -75,25 +127,306 @@ def make_success_row_from_pairs(
         "market_ytm_source": market_ytm_source,
         "solver_method": solver_method,
         "solver_iterations": solver_iterations,
+        "solver_start_type": solver_start_type,
     }
 
 
+def make_success_rows_from_pairs(
+    successes: list[dict],
+    failures: list[dict],
+) -> list[dict]:
+    """
+    Build success rows with durations computed for all bonds in one pass.
+
+    Observations whose duration cannot be computed are moved to `failures`.
+    """
+    if not successes:
+        return []
+
+    risk = bond_risk_from_time_amount_pairs(
+        [success["time_amount_pairs"] for success in successes],
+        ytm=[success["market_ytm"] for success in successes],
+    )
+
+    rows: list[dict] = []
+
+    for success, mac in zip(successes, risk.macaulay_duration, strict=True):
+        if not np.isfinite(mac):
+            failures.append(
+                make_failure_row(
+                    row=success["row"],
+                    error_type="ValueError",
+                    error_message="price must be positive to compute duration",
+                )
+            )
+            continue
+
+        rows.append(make_success_row_from_pairs(**success, macaulay_duration=float(mac)))
+
+    return rows
+
+
+def build_indexed_notional(
+    sgs_points: pd.DataFrame,
+    calendar_index: CalendarIndex,
+    instrument_type: str,
+    anchor: Mapping[str, Any] | None,
+) -> IndexedNotional:
+    """
+    Build the VNA of one indexed instrument type from SGS points.
+
+    The anchor is a published {date, value} VNA. It must be configured and
+    fall inside the index table, which only covers the SGS points and the
+    calendar; otherwise a ValueError says why.
+    """
+    if anchor is None or anchor.get("date") is None or anchor.get("value") is None:
+        raise ValueError(f"No VNA anchor configured for {instrument_type}")
+
+    index_table = INDEXED_NOTIONAL_TABLE_BUILDERS[instrument_type](
+        sgs_points,
+        calendar_index,
+    )
+    anchor_date = as_date(anchor["date"])
+
+    if np.isnan(index_table.log_factors([anchor_date])[0]):
+        raise ValueError(
+            f"VNA anchor {anchor_date} for {instrument_type} is outside the index "
+            f"table ({index_table.first_date} to {index_table.last_date})"
+        )
+
+    return IndexedNotional(
+        index_table=index_table,
+        anchor_date=anchor_date,
+        anchor_value=float(anchor["value"]),
+    )
+
+
+def build_indexed_notionals(
+    sgs_points: pd.DataFrame,
+    calendar_index: CalendarIndex,
+    anchors: Mapping[str, Mapping[str, Any]] | None = None,
+    instrument_types: Iterable[str] | None = None,
+) -> dict[str, IndexedNotional]:
+    """
+    Build the VNA of LFT (SELIC) and NTN-B (IPCA) from SGS points.
+
+    `instrument_types` restricts the tables built to the types actually
+    quoted. Any type that cannot be built raises; see
+    build_available_indexed_notionals to keep the others.
+    """
+    notionals, errors = build_available_indexed_notionals(
+        sgs_points,
+        calendar_index,
+        anchors,
+        instrument_types,
+    )
+
+    if errors:
+        raise ValueError("; ".join(errors.values()))
+
+    return notionals
+
+
+def build_available_indexed_notionals(
+    sgs_points: pd.DataFrame,
+    calendar_index: CalendarIndex,
+    anchors: Mapping[str, Mapping[str, Any]] | None = None,
+    instrument_types: Iterable[str] | None = None,
+) -> tuple[dict[str, IndexedNotional], dict[str, str]]:
+    """
+    Build each VNA independently, returning the errors of the ones that fail.
+
+    A missing SGS series, a gap in IPCA months or an anchor outside the
+    table only affects its own instrument type; the curve input nodes turn
+    the returned message into a failure of every row of that type.
+    """
+    anchors = dict(anchors or {})
+    selected = (
+        set(INDEXED_NOTIONAL_TABLE_BUILDERS)
+        if instrument_types is None
+        else set(instrument_types)
+    )
+    notionals: dict[str, IndexedNotional] = {}
+    errors: dict[str, str] = {}
+
+    for instrument_type in INDEXED_NOTIONAL_TABLE_BUILDERS:
+        if instrument_type not in selected:
+            continue
+
+        try:
+            notionals[instrument_type] = build_indexed_notional(
+                sgs_points,
+                calendar_index,
+                instrument_type,
+                anchors.get(instrument_type),
+            )
+        except ValueError as exc:
+            errors[instrument_type] = str(exc)
+
+    return notionals, errors
+
+
+def candidate_indexed_notionals(
+    curve_candidates: pd.DataFrame,
+    calendar_index: CalendarIndex,
+    sgs_points: pd.DataFrame | None = None,
+    indexed_notional_anchors: Mapping[str, Mapping[str, Any]] | None = None,
+) -> tuple[dict[str, IndexedNotional], dict[str, str]]:
+    """
+    VNA tables and errors of the indexed types quoted in `curve_candidates`.
+
+    Shared setup of the row, columnar and parallel curve input nodes; with
+    no `sgs_points` nothing is built and every quoted indexed type gets an
+    error.
+    """
+    instrument_types = set(
+        curve_candidates.get("instrument_type", pd.Series(dtype=object))
+        .astype(str)
+        .unique()
+    )
+
+    if sgs_points is None:
+        return {}, {
+            instrument_type: "No SGS points given"
+            for instrument_type in INDEXED_NOTIONAL_TABLE_BUILDERS
+            if instrument_type in instrument_types
+        }
+
+    return build_available_indexed_notionals(
+        sgs_points,
+        calendar_index,
+        indexed_notional_anchors,
+        instrument_types=instrument_types,
+    )
+
+
+def vna_unavailable_failure(
+    instrument_type: Any,
+    isin: Any,
+    ref_date: Any,
+    indexed_notionals: Mapping[str, IndexedNotional],
+    indexed_notional_errors: Mapping[str, str],
+) -> tuple[str, str]:
+    """
+    Error type and message of a row whose VNA is missing.
+
+    Only a ref_date after the end of the index table is pending
+    (VNA_PENDING_ERROR_TYPE): the next SGS publication covers it. A type
+    whose VNA could not be built, or a ref_date before the table, is a
+    ValueError with the reason, and is not retried.
+    """
+    message = f"{VNA_UNAVAILABLE_MESSAGE} for {instrument_type} {isin} at {ref_date}"
+    reason = indexed_notional_errors.get(str(instrument_type))
+    indexed_notional = indexed_notionals.get(str(instrument_type))
+
+    if reason is None and indexed_notional is None:
+        reason = f"No VNA table for {instrument_type}"
+
+    if reason is None:
+        index_table = indexed_notional.index_table
+
+        if as_datetime64_days(ref_date) < index_table.first_date:
+            reason = (
+                f"ref_date is before the index table "
+                f"({index_table.first_date} to {index_table.last_date})"
+            )
+
+    if reason is None:
+        return VNA_PENDING_ERROR_TYPE, message
+
+    return "ValueError", f"{message}: {reason}"
+
+
+def pending_vna_failures(failures: pd.DataFrame) -> pd.Series:
+    """
+    Mask of the failures that wait for a later SGS publication.
+    """
+    return failures["calculation_error_type"].eq(VNA_PENDING_ERROR_TYPE) & (
+        failures["calculation_error_message"]
+        .astype(str)
+        .str.startswith(VNA_UNAVAILABLE_MESSAGE)
+    )
+
+
+def indexed_notional_factors(
+    instrument_types: np.ndarray,
+    ref_dates: np.ndarray,
+    indexed_notionals: Mapping[str, IndexedNotional],
+) -> np.ndarray:
+    """
+    VNA / notional of each candidate row, computed per instrument type.
+
+    Nominal bonds get 1.0; indexed bonds without a VNA on ref_date get NaN.
+    """
+    factors = np.ones(len(instrument_types), dtype=np.float64)
+
+    for instrument_type in INDEXED_NOTIONAL_TABLE_BUILDERS:
+        mask = instrument_types == instrument_type
+
+        if not mask.any():
+            continue
+
+        indexed_notional = indexed_notionals.get(instrument_type)
+        factors[mask] = (
+            np.nan
+            if indexed_notional is None
+            else indexed_notional.notional_factors(ref_dates[mask])
+        )
+
+    return factors
+
+
 def build_public_bonds_curve_inputs_from_cashflow_dimension(
     curve_candidates: pd.DataFrame,
     cashflow_dimension: pd.DataFrame,
     calendar_df: pd.DataFrame,
+    warm_start: bool = False,
+    sgs_points: pd.DataFrame | None = None,
+    indexed_notional_anchors: Mapping[str, Mapping[str, Any]] | None = None,
 ) -> tuple[pd.DataFrame, pd.DataFrame]:
     """
     Build public-bond curve inputs using precomputed cashflow-dimension arrays.
 
     This node avoids rebuilding contracts, schedules and Cashflow objects for
     each historical observation. It filters cashflows by ref_date/as_of_date
-    through bd_index arrays and then uses the batch yield solver.
+    through bd_index arrays and then uses the batch yield solver. With
+    `warm_start`, Newton starts from each ISIN's previous-day taxa_med.
+
+    LFT and NTN-B cashflows are in base-VNA units, so their PU_MED is divided
+    by VNA / notional, gathered from cumulative SELIC/IPCA tables built once
+    from `sgs_points`, before solving. Their yields are the SELIC spread and
+    the real yield. Without `sgs_points`, or when a type's VNA cannot be
+    built, those rows become failures.
     """
-    bd_index_by_date = build_bd_index_lookup(calendar_df)
-    cashflows_by_isin = build_cashflow_schedule_lookup(cashflow_dimension)
+    calendar_index = CalendarIndex.from_calendar_df(calendar_df)
+    cashflow_store = CashflowStore.from_cashflow_dimension(cashflow_dimension)
+
+    candidate_ref_dates = curve_candidates.get("ref_date", pd.Series(dtype=object))
+    candidate_types = (
+        curve_candidates.get("instrument_type", pd.Series(dtype=object))
+        .astype(str)
+        .to_numpy()
+    )
+    ref_bd_indexes = calendar_index.bd_index(candidate_ref_dates)
+
+    indexed_notionals, indexed_notional_errors = candidate_indexed_notionals(
+        curve_candidates,
+        calendar_index,
+        sgs_points,
+        indexed_notional_anchors,
+    )
+    notional_factors = indexed_notional_factors(
+        candidate_types,
+        as_datetime64_days(candidate_ref_dates),
+        indexed_notionals,
+    )
+    cashflow_slices = cashflow_store.future_slices(
+        cashflow_store.isin_codes(curve_candidates.get("isin", [])),
+        ref_bd_indexes,
+    )
 
     rows: list[dict] = []
+    successes: list[dict] = []
     failures: list[dict] = []
     contexts: list[CurveInputArrayProblemContext] = []
 
@@ -104,23 +437,44 @@ def build_public_bonds_curve_inputs_from_cashflow_dimension(
         unit="bond",
     )
 
-    for row in iterator:
-        if row.pu_med > 5000.0:
+    for row_index, row in enumerate(iterator):
+        notional_factor = notional_factors[row_index]
+
+        if not np.isfinite(notional_factor):
+            error_type, error_message = vna_unavailable_failure(
+                row.instrument_type,
+                row.isin,
+                get_row_value(row, "ref_date"),
+                indexed_notionals,
+                indexed_notional_errors,
+            )
+            failures.append(
+                make_failure_row(
+                    row=row,
+                    error_type=error_type,
+                    error_message=error_message,
+                )
+            )
+            continue
+
+        market_price = row.pu_med / notional_factor
+
+        if market_price > 5000.0:
             failures.append(
                 make_failure_row(
                     row=row,
                     error_type="InvalidPrice",
-                    error_message=f"Market price {row.pu_med} is above Notional (5000.00)",
+                    error_message=f"Market price {market_price} is above Notional (5000.00)",
                 )
             )
             continue
 
-        if row.pu_med < 50.0:
+        if market_price < 50.0:
             failures.append(
                 make_failure_row(
                     row=row,
                     error_type="InvalidPrice",
-                    error_message=f"Market price {row.pu_med} is below Notional (90.00)",
+                    error_message=f"Market price {market_price} is below Notional (90.00)",
                 )
             )
             continue
@@ -130,15 +484,14 @@ def build_public_bonds_curve_inputs_from_cashflow_dimension(
             ref_date = as_date(get_row_value(row, "ref_date"))
             issue_date = as_date(get_row_value(row, "issue_date", "emissao"))
             maturity_date = as_date(get_row_value(row, "maturity_date", "maturity"))
-            ref_bd_index = int(bd_index_by_date[ref_date])
-            cashflow_schedule = cashflows_by_isin.get(str(row.isin))
 
-            if cashflow_schedule is None:
+            if ref_bd_indexes[row_index] < 0:
+                raise KeyError(ref_date)
+
+            if not cashflow_slices.found[row_index]:
                 raise ValueError(f"Cashflow dimension not found for isin={row.isin}")
 
-            time_amount_pairs = cashflow_schedule.time_amount_pairs_as_of(
-                ref_bd_index=ref_bd_index,
-            )
+            time_amount_pairs = cashflow_slices.time_amount_pairs(row_index)
 
             if not time_amount_pairs:
                 raise ValueError(
@@ -159,8 +512,8 @@ def build_public_bonds_curve_inputs_from_cashflow_dimension(
                     ytm=market_ytm,
                 )
 
-                rows.append(
-                    make_success_row_from_pairs(
+                successes.append(
+                    dict(
                         row=row,
                         time_amount_pairs=time_amount_pairs,
                         ref_date=ref_date,
@@ -185,11 +538,12 @@ def build_public_bonds_curve_inputs_from_cashflow_dimension(
             market_pu = float(row.pu_med)
             problem = YieldProblem.from_time_amount_pairs(
                 time_amount_pairs=time_amount_pairs,
-                market_price=market_pu,
+                market_price=float(market_price),
             )
 
             contexts.append(
                 CurveInputArrayProblemContext(
+                    row_index=row_index,
                     row=row,
                     problem=problem,
                     time_amount_pairs=time_amount_pairs,
@@ -198,7 +552,11 @@ def build_public_bonds_curve_inputs_from_cashflow_dimension(
                     maturity_date=maturity_date,
                     market_pu=market_pu,
                     market_pu_source="PU_MED",
-                    market_ytm_source="IMPLIED_FROM_PU_MED",
+                    market_ytm_source=(
+                        "IMPLIED_FROM_PU_MED"
+                        if row.instrument_type not in INDEXED_NOTIONAL_TABLE_BUILDERS
+                        else "IMPLIED_FROM_PU_MED_OVER_VNA"
+                    ),
                 )
             )
 
@@ -211,8 +569,10 @@ def build_public_bonds_curve_inputs_from_cashflow_dimension(
                 )
             )
 
-    problems = [context.problem for context in contexts]
-    batch_results = yield_to_maturity_batch(problems)
+    batch_results, start_types = solve_curve_input_problems(
+        contexts,
+        previous_quote_rates(curve_candidates) if warm_start else None,
+    )
 
     for batch_result in batch_results:
         context = contexts[batch_result.index]
@@ -228,8 +588,8 @@ def build_public_bonds_curve_inputs_from_cashflow_dimension(
             continue
 
         result = batch_result.result
-        rows.append(
-            make_success_row_from_pairs(
+        successes.append(
+            dict(
                 row=context.row,
                 time_amount_pairs=context.time_amount_pairs,
                 ref_date=context.ref_date,
@@ -241,7 +601,366 @@ def build_public_bonds_curve_inputs_from_cashflow_dimension(
                 market_ytm_source=context.market_ytm_source,
                 solver_method=solver_method_value(result.method),
                 solver_iterations=result.iterations,
+                solver_start_type=start_types[batch_result.index],
             )
         )
 
+    rows.extend(make_success_rows_from_pairs(successes, failures))
+
     return finalize_curve_inputs(rows, failures)
+
+
+def candidate_column(
+    curve_candidates: pd.DataFrame,
+    *names: str,
+    required: bool = True,
+) -> np.ndarray:
+    """
+    First available candidate column as an object array, like get_row_value.
+
+    Datetime columns come back as Timestamps, as itertuples would give them.
+    Optional columns that are missing become an array of None.
+    """
+    for name in names:
+        if name in curve_candidates.columns:
+            return curve_candidates[name].astype(object).to_numpy()
+
+    if required:
+        raise AttributeError(f"None of these columns were found in row: {names}")
+
+    return np.full(len(curve_candidates), None, dtype=object)
+
+
+def date_column(values: np.ndarray) -> np.ndarray:
+    """Vectorized as_date: an object array of datetime.date."""
+
+    return pd.to_datetime(pd.Series(values, dtype=object)).dt.date.to_numpy()
+
+
+def solve_ragged_curve_inputs(
+    cashflows: RaggedCashflows,
+    prices: np.ndarray,
+    initial_guesses: np.ndarray | None = None,
+) -> tuple[RaggedYieldSolution, np.ndarray]:
+    """
+    Columnar solve_curve_input_problems.
+
+    Returns the RaggedYieldSolution of all problems and their start types;
+    problems with a finite initial guess are warm-started.
+    """
+    solution = BatchYieldSolver().solve_ragged(
+        cashflows,
+        prices,
+        initial_guesses=initial_guesses,
+    )
+    start_types = np.full(len(cashflows), SOLVER_START_STATIC, dtype=object)
+
+    if initial_guesses is not None:
+        start_types[np.isfinite(initial_guesses)] = SOLVER_START_WARM
+
+    return solution, start_types
+
+
+def build_public_bonds_curve_inputs_columnar(
+    curve_candidates: pd.DataFrame,
+    cashflow_dimension: pd.DataFrame,
+    calendar_df: pd.DataFrame,
+    warm_start: bool = False,
+    sgs_points: pd.DataFrame | None = None,
+    indexed_notional_anchors: Mapping[str, Mapping[str, Any]] | None = None,
+    previous_rates: np.ndarray | None = None,
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Columnar build_public_bonds_curve_inputs_from_cashflow_dimension.
+
+    Same inputs, outputs and failure messages, without per-row Python
+    objects: cashflows of every candidate are gathered into one CSR batch,
+    yields are solved with BatchYieldSolver.solve_ragged, durations come
+    from one bond_risk_batch call and the output frames are assembled from
+    columns. Each check marks failed rows in an error array, in the order
+    the row path applies them; only failed rows format a message.
+
+    `previous_rates` are the warm-start guesses aligned with the candidate
+    rows, see curve_inputs_from_cashflow_store.
+    """
+    calendar_index = CalendarIndex.from_calendar_df(calendar_df)
+    indexed_notionals, indexed_notional_errors = candidate_indexed_notionals(
+        curve_candidates,
+        calendar_index,
+        sgs_points,
+        indexed_notional_anchors,
+    )
+
+    return curve_inputs_from_cashflow_store(
+        curve_candidates=curve_candidates,
+        cashflow_store=CashflowStore.from_cashflow_dimension(cashflow_dimension),
+        calendar_index=calendar_index,
+        indexed_notionals=indexed_notionals,
+        warm_start=warm_start,
+        indexed_notional_errors=indexed_notional_errors,
+        previous_rates=previous_rates,
+    )
+
+
+def curve_inputs_from_cashflow_store(
+    curve_candidates: pd.DataFrame,
+    cashflow_store: CashflowStore,
+    calendar_index: CalendarIndex,
+    indexed_notionals: Mapping[str, IndexedNotional],
+    warm_start: bool = False,
+    indexed_notional_errors: Mapping[str, str] | None = None,
+    previous_rates: np.ndarray | None = None,
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Columnar curve inputs over already built store, calendar and VNA tables.
+
+    Parallel workers call this directly on a memory-mapped CashflowStore.
+    `indexed_notional_errors` holds why a type's VNA could not be built.
+    With `warm_start`, Newton starts from `previous_rates`, aligned with
+    the candidate rows; by default previous_quote_rates(curve_candidates).
+    Callers working on a slice of the candidates (a shard, an increment)
+    pass the rates of the full frame, so the first date of the slice is
+    seeded like in a single run.
+    """
+    n = len(curve_candidates)
+
+    if n == 0:
+        return (
+            pd.DataFrame(columns=INPUT_COLUMNS),
+            pd.DataFrame(columns=FAILURE_COLUMNS),
+        )
+
+    raw_ref_dates = candidate_column(curve_candidates, "ref_date")
+    instrument_types = candidate_column(curve_candidates, "instrument_type")
+    isins = candidate_column(curve_candidates, "isin")
+    quote_types = candidate_column(curve_candidates, "primary_quote_type")
+    pu_med = pd.to_numeric(curve_candidates["pu_med"], errors="coerce").to_numpy(
+        dtype=np.float64
+    )
+    type_names = instrument_types.astype(str)
+
+    ref_dates = date_column(raw_ref_dates)
+    issue_dates = date_column(candidate_column(curve_candidates, "issue_date", "emissao"))
+    maturity_dates = date_column(
+        candidate_column(curve_candidates, "maturity_date", "maturity")
+    )
+    ref_bd_indexes = calendar_index.bd_index(curve_candidates["ref_date"])
+
+    notional_factors = indexed_notional_factors(
+        type_names,
+        as_datetime64_days(curve_candidates["ref_date"]),
+        indexed_notionals,
+    )
+    cashflow_slices = cashflow_store.future_slices(
+        cashflow_store.isin_codes(isins),
+        ref_bd_indexes,
+    )
+    cashflows = cashflow_slices.to_ragged_cashflows()
+    counts = cashflow_slices.counts
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        market_prices = pu_med / notional_factors
+
+    pending = np.ones(n, dtype=bool)
+    error_types = np.full(n, None, dtype=object)
+    error_messages = np.full(n, None, dtype=object)
+
+    def reject(mask: np.ndarray, error_type: str, message) -> None:
+        positions = np.flatnonzero(pending & mask)
+        error_types[positions] = error_type
+        error_messages[positions] = [message(position) for position in positions]
+        pending[positions] = False
+
+    missing_vna = np.flatnonzero(~np.isfinite(notional_factors))
+    vna_failures = [
+        vna_unavailable_failure(
+            instrument_types[i],
+            isins[i],
+            raw_ref_dates[i],
+            indexed_notionals,
+            indexed_notional_errors or {},
+        )
+        for i in missing_vna
+    ]
+    error_types[missing_vna] = [error_type for error_type, _ in vna_failures]
+    error_messages[missing_vna] = [message for _, message in vna_failures]
+    pending[missing_vna] = False
+
+    reject(
+        market_prices > 5000.0,
+        "InvalidPrice",
+        lambda i: f"Market price {market_prices[i]} is above Notional (5000.00)",
+    )
+    reject(
+        market_prices < 50.0,
+        "InvalidPrice",
+        lambda i: f"Market price {market_prices[i]} is below Notional (90.00)",
+    )
+    reject(ref_bd_indexes < 0, "KeyError", lambda i: repr(ref_dates[i]))
+    reject(
+        ~cashflow_slices.found,
+        "ValueError",
+        lambda i: f"Cashflow dimension not found for isin={isins[i]}",
+    )
+    reject(
+        counts == 0,
+        "ValueError",
+        lambda i: f"No future cashflows found for isin={isins[i]} at {ref_dates[i]}",
+    )
+
+    observed_yield = pending & (type_names == "LTN") & (quote_types == "YIELD")
+    observed_rates = normalize_rates(candidate_column(curve_candidates, "taxa_med"))
+    reject(
+        observed_yield & np.isnan(observed_rates),
+        "ValueError",
+        lambda i: (
+            f"LTN {isins[i]} at {ref_dates[i]} marked as YIELD, "
+            "but taxa_med is missing."
+        ),
+    )
+    observed_yield &= pending
+    reject(
+        ~observed_yield & (quote_types != "PRICE"),
+        "ValueError",
+        lambda i: (
+            f"Unsupported primary_quote_type for {instrument_types[i]} "
+            f"{isins[i]}: {quote_types[i]}"
+        ),
+    )
+
+    market_ytm = np.where(observed_yield, observed_rates, np.nan)
+    market_pu = np.where(observed_yield, np.nan, pu_med)
+    solver_methods = np.full(n, "OBSERVED_YIELD", dtype=object)
+    solver_iterations = np.full(n, None, dtype=object)
+    solver_start_types = np.full(n, None, dtype=object)
+
+    with np.errstate(over="ignore", invalid="ignore"):
+        market_pu[observed_yield] = cashflows.price(market_ytm, observed_yield)[
+            observed_yield
+        ]
+
+    solve_positions = np.flatnonzero(pending & ~observed_yield)
+    if warm_start and previous_rates is None:
+        previous_rates = previous_quote_rates(curve_candidates)
+    solution, start_types = solve_ragged_curve_inputs(
+        cashflows.take(solve_positions),
+        market_prices[solve_positions],
+        previous_rates[solve_positions] if warm_start else None,
+    )
+    solved = solution.solved
+    unsolved = solve_positions[~solved]
+    error_types[unsolved] = [
+        solution.error_type[pos] or "YieldSolverError"
+        for pos in np.flatnonzero(~solved)
+    ]
+    error_messages[unsolved] = [
+        solution.error_message[pos] or "Yield solver failed"
+        for pos in np.flatnonzero(~solved)
+    ]
+    pending[unsolved] = False
+
+    solved_positions = solve_positions[solved]
+    market_ytm[solved_positions] = solution.ytm[solved]
+    solver_methods[solved_positions] = [
+        solver_method_value(solution.method[pos]) for pos in np.flatnonzero(solved)
+    ]
+    solver_iterations[solved_positions] = solution.iterations[solved].tolist()
+    solver_start_types[solved_positions] = start_types[solved]
+
+    success_positions = np.flatnonzero(pending)
+    success_cashflows = cashflows.take(success_positions)
+    risk = bond_risk_batch(
+        times=success_cashflows.times,
+        amounts=success_cashflows.amounts,
+        ytm=market_ytm[success_positions],
+        offsets=success_cashflows.offsets,
+    )
+    macaulay = np.full(n, np.nan, dtype=float)
+    macaulay[success_positions] = risk.macaulay_duration
+    reject(
+        ~np.isfinite(macaulay),
+        "ValueError",
+        lambda i: "price must be positive to compute duration",
+    )
+
+    market_ytm_sources = np.where(
+        observed_yield,
+        "TAXA_MED",
+        np.where(
+            np.isin(type_names, list(INDEXED_NOTIONAL_TABLE_BUILDERS)),
+            "IMPLIED_FROM_PU_MED_OVER_VNA",
+            "IMPLIED_FROM_PU_MED",
+        ),
+    )
+
+    rows = np.flatnonzero(pending)
+    inputs = pd.DataFrame(
+        {
+            "ref_date": ref_dates[rows],
+            "instrument_type": instrument_types[rows],
+            "isin": isins[rows],
+            "issue_date": issue_dates[rows],
+            "maturity_date": maturity_dates[rows],
+            "bd_to_maturity": curve_candidates["bd_to_maturity"]
+            .to_numpy()[rows]
+            .astype(np.int64),
+            "market_pu": market_pu[rows],
+            "market_ytm": market_ytm[rows],
+            "macaulay_duration": macaulay[rows],
+            "modified_duration": macaulay[rows] / (1.0 + market_ytm[rows]),
+            **{
+                column: pd.Series(
+                    candidate_column(curve_candidates, column, required=False)[rows]
+                ).infer_objects()
+                for column in OPTIONAL_INPUT_COLUMNS
+            },
+            "quote_quality": candidate_column(curve_candidates, "quote_quality")[rows],
+            "quote_source": candidate_column(curve_candidates, "quote_source")[rows],
+            "primary_quote_type": quote_types[rows],
+            "market_pu_source": np.where(
+                observed_yield[rows],
+                "IMPLIED_FROM_TAXA_MED",
+                "PU_MED",
+            ),
+            "market_ytm_source": market_ytm_sources[rows],
+            "solver_method": solver_methods[rows],
+            "solver_iterations": pd.Series(solver_iterations[rows].tolist()),
+            "solver_start_type": solver_start_types[rows],
+        },
+        columns=INPUT_COLUMNS,
+    )
+
+    failed = np.flatnonzero(~pending)
+    failures = pd.DataFrame(
+        {
+            "ref_date": ref_dates[failed],
+            "instrument_type": instrument_types[failed],
+            "isin": isins[failed],
+            "issue_date": issue_dates[failed],
+            "maturity_date": maturity_dates[failed],
+            **{
+                column: pd.Series(
+                    candidate_column(curve_candidates, column, required=False)[failed]
+                ).infer_objects()
+                for column in (
+                    "bd_to_maturity",
+                    "pu_med",
+                    "taxa_med",
+                    "quote_quality",
+                    "quote_source",
+                    "primary_quote_type",
+                )
+            },
+            "calculation_status": "FAILED",
+            "calculation_error_type": error_types[failed],
+            "calculation_error_message": error_messages[failed],
+        },
+        columns=FAILURE_COLUMNS,
+    )
+
+    sort_keys = ["ref_date", "instrument_type", "maturity_date", "isin"]
+
+    return (
+        inputs.sort_values(sort_keys).reset_index(drop=True),
+        failures.sort_values(sort_keys).reset_index(drop=True),
+    )
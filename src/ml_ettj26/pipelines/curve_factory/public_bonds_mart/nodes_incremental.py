@@ -0,0 +1,253 @@
+from __future__ import annotations
+
+import hashlib
+import json
+from datetime import datetime, timezone
+from typing import Any, Callable, Mapping
+
+import pandas as pd
+
+from .nodes_batch import FAILURE_COLUMNS, INPUT_COLUMNS, previous_quote_rates
+from .nodes_dimension_batch import (
+    build_public_bonds_curve_inputs_columnar,
+    pending_vna_failures,
+)
+
+
+WATERMARK_COLUMNS = [
+    "last_ref_date",
+    "reprocess_from",
+    "input_hash",
+    "full_rebuild",
+    "processed_dates",
+    "updated_at_utc",
+]
+
+
+def frame_fingerprint(frame: pd.DataFrame) -> str:
+    """
+    Order-sensitive SHA-256 of a DataFrame's column names and values.
+    """
+    hasher = hashlib.sha256()
+    hasher.update(json.dumps([str(column) for column in frame.columns]).encode())
+    hasher.update(
+        pd.util.hash_pandas_object(frame, index=False).to_numpy().tobytes()
+    )
+
+    return hasher.hexdigest()
+
+
+def curve_inputs_input_hash(
+    cashflow_dimension: pd.DataFrame,
+    calendar_df: pd.DataFrame,
+    indexed_notional_anchors: Mapping[str, Any] | None = None,
+) -> str:
+    """
+    Hash of the static inputs shared by every ref_date.
+
+    A change in the cashflow dimension, the calendar or the VNA anchors can
+    change already processed dates, so it invalidates the watermark.
+    """
+    hasher = hashlib.sha256()
+    hasher.update(frame_fingerprint(cashflow_dimension).encode())
+    hasher.update(frame_fingerprint(calendar_df).encode())
+    hasher.update(
+        json.dumps(indexed_notional_anchors or {}, sort_keys=True, default=str).encode()
+    )
+
+    return hasher.hexdigest()
+
+
+def ref_date_partition_key(value: Any) -> str:
+    return pd.Timestamp(value).strftime("%Y-%m-%d")
+
+
+def select_incremental_curve_candidates(
+    curve_candidates: pd.DataFrame,
+    watermark: pd.DataFrame,
+    input_hash: str,
+) -> tuple[pd.DataFrame, bool]:
+    """
+    Keep the candidates after the watermark, or all of them on a rebuild.
+
+    A full rebuild happens when there is no watermark yet or when its
+    input_hash differs from the current one. Dates from `reprocess_from`
+    on (indexed bonds dated after the last published SGS point) are
+    selected again; VNA configuration errors do not move it.
+    """
+    full_rebuild = (
+        watermark.empty
+        or pd.isna(watermark["last_ref_date"].iloc[-1])
+        or watermark["input_hash"].iloc[-1] != input_hash
+    )
+
+    if full_rebuild:
+        return curve_candidates, True
+
+    last_ref_date = pd.Timestamp(watermark["last_ref_date"].iloc[-1])
+    reprocess_from = pd.Timestamp(watermark["reprocess_from"].iloc[-1])
+    ref_dates = pd.to_datetime(curve_candidates["ref_date"])
+    selected = ref_dates > last_ref_date
+
+    if not pd.isna(reprocess_from):
+        selected |= ref_dates >= reprocess_from
+
+    return curve_candidates.loc[selected], False
+
+
+def split_by_ref_date(
+    frame: pd.DataFrame,
+    ref_date_keys: list[str],
+    columns: list[str],
+) -> dict[str, pd.DataFrame]:
+    """
+    One partition per processed ref_date, empty when the date has no rows.
+
+    Writing empty partitions overwrites stale results of dates that no longer
+    produce rows after a rebuild.
+    """
+    keys = (
+        frame["ref_date"].map(ref_date_partition_key)
+        if not frame.empty
+        else pd.Series(dtype=object)
+    )
+    groups = {key: group for key, group in frame.groupby(keys.to_numpy(), sort=False)}
+
+    return {
+        key: groups.get(key, pd.DataFrame(columns=columns))[columns].reset_index(drop=True)
+        for key in ref_date_keys
+    }
+
+
+def build_public_bonds_curve_inputs_incremental(
+    curve_candidates: pd.DataFrame,
+    cashflow_dimension: pd.DataFrame,
+    calendar_df: pd.DataFrame,
+    watermark: pd.DataFrame,
+    warm_start: bool = False,
+    sgs_points: pd.DataFrame | None = None,
+    indexed_notional_anchors: Mapping[str, Any] | None = None,
+) -> tuple[dict[str, pd.DataFrame], dict[str, pd.DataFrame], pd.DataFrame]:
+    """
+    Build curve inputs only for ref_dates after the watermark.
+
+    Returns the input and failure partitions keyed by ref_date (YYYY-MM-DD)
+    and the updated watermark. Dates at or before the watermark are not
+    revisited unless the input hash changes, which rebuilds every date.
+
+    With `warm_start`, Newton starts from the previous-day taxa_med taken
+    from all candidates, so the first selected date is seeded from the date
+    before it and the partitions match a full rebuild, solver_start_type
+    and solver_iterations included.
+    """
+    input_hash = curve_inputs_input_hash(
+        cashflow_dimension,
+        calendar_df,
+        indexed_notional_anchors,
+    )
+    curve_candidates = curve_candidates.reset_index(drop=True)
+    selected, full_rebuild = select_incremental_curve_candidates(
+        curve_candidates,
+        watermark,
+        input_hash,
+    )
+    previous_rates = (
+        previous_quote_rates(curve_candidates)[selected.index.to_numpy()]
+        if warm_start
+        else None
+    )
+
+    inputs, failures = build_public_bonds_curve_inputs_columnar(
+        curve_candidates=selected,
+        cashflow_dimension=cashflow_dimension,
+        calendar_df=calendar_df,
+        warm_start=warm_start,
+        sgs_points=sgs_points,
+        indexed_notional_anchors=indexed_notional_anchors,
+        previous_rates=previous_rates,
+    )
+
+    ref_dates = pd.to_datetime(selected["ref_date"])
+    ref_date_keys = sorted({ref_date_partition_key(value) for value in ref_dates})
+
+    previous_last = (
+        pd.NaT
+        if full_rebuild
+        else pd.Timestamp(watermark["last_ref_date"].iloc[-1])
+    )
+    last_ref_date = max(
+        [value for value in (previous_last, ref_dates.max()) if not pd.isna(value)],
+        default=pd.NaT,
+    )
+
+    vna_failures = failures.loc[pending_vna_failures(failures), "ref_date"]
+    reprocess_from = (
+        pd.Timestamp(pd.to_datetime(vna_failures).min())
+        if not vna_failures.empty
+        else pd.NaT
+    )
+
+    new_watermark = pd.DataFrame(
+        [
+            {
+                "last_ref_date": last_ref_date,
+                "reprocess_from": reprocess_from,
+                "input_hash": input_hash,
+                "full_rebuild": full_rebuild,
+                "processed_dates": len(ref_date_keys),
+                "updated_at_utc": datetime.now(timezone.utc),
+            }
+        ],
+        columns=WATERMARK_COLUMNS,
+    )
+
+    return (
+        split_by_ref_date(inputs, ref_date_keys, INPUT_COLUMNS),
+        split_by_ref_date(failures, ref_date_keys, FAILURE_COLUMNS),
+        new_watermark,
+    )
+
+
+def consolidate_ref_date_partitions(
+    partitions: Mapping[str, Callable[[], pd.DataFrame]],
+    curve_candidates: pd.DataFrame,
+    columns: list[str],
+) -> pd.DataFrame:
+    """
+    Concatenate the ref_date partitions that still have curve candidates.
+
+    Partitions of dates that left the candidates view are ignored, so the
+    consolidated frame matches a full run.
+    """
+    active_keys = set(
+        pd.to_datetime(curve_candidates["ref_date"]).map(ref_date_partition_key)
+    )
+    frames = [
+        load()
+        for key, load in sorted(partitions.items())
+        if key in active_keys
+    ]
+    frames = [frame for frame in frames if not frame.empty]
+
+    if not frames:
+        return pd.DataFrame(columns=columns)
+
+    return (
+        pd.concat(frames, ignore_index=True)[columns]
+        .sort_values(["ref_date", "instrument_type", "maturity_date", "isin"])
+        .reset_index(drop=True)
+    )
+
+
+def consolidate_curve_input_partitions(
+    partitions: Mapping[str, Callable[[], pd.DataFrame]],
+    curve_candidates: pd.DataFrame,
+) -> pd.DataFrame:
+    return consolidate_ref_date_partitions(partitions, curve_candidates, INPUT_COLUMNS)
+
+
+def consolidate_curve_failure_partitions(
+    partitions: Mapping[str, Callable[[], pd.DataFrame]],
+    curve_candidates: pd.DataFrame,
+) -> pd.DataFrame:
+    return consolidate_ref_date_partitions(partitions, curve_candidates, FAILURE_COLUMNS)
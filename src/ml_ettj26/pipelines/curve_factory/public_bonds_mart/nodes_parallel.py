@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Mapping
+
+import numpy as np
+import pandas as pd
+
+from engine_product.calendars import CalendarIndex
+from engine_product.instruments.public_bonds import IndexedNotional
+from engine_product.pricing.cashflow_store import CashflowStore
+from ml_ettj26.utils.parallel import (
+    SHARDS_PER_WORKER,
+    ref_date_shards,
+    resolve_workers,
+)
+
+from .nodes_batch import FAILURE_COLUMNS, INPUT_COLUMNS, previous_quote_rates
+from .nodes_dimension_batch import (
+    candidate_indexed_notionals,
+    curve_inputs_from_cashflow_store,
+)
+
+
+# State attached once per worker process by `attach_curve_input_worker`.
+_WORKER_STATE: dict[str, Any] = {}
+
+
+def attach_curve_input_worker(
+    cashflow_store_path: str,
+    calendar_index: CalendarIndex,
+    indexed_notionals: Mapping[str, IndexedNotional],
+    indexed_notional_errors: Mapping[str, str] | None = None,
+) -> None:
+    """
+    Process-pool initializer: memory-map the cashflow store once per worker.
+
+    The calendar index and VNA tables are small dense arrays; they travel in
+    the initializer arguments, so they are also sent once per worker.
+    """
+    _WORKER_STATE["cashflow_store"] = CashflowStore.load(cashflow_store_path, mmap=True)
+    _WORKER_STATE["calendar_index"] = calendar_index
+    _WORKER_STATE["indexed_notionals"] = indexed_notionals
+    _WORKER_STATE["indexed_notional_errors"] = indexed_notional_errors or {}
+
+
+def build_curve_input_shard(
+    curve_candidates: pd.DataFrame,
+    warm_start: bool = False,
+    previous_rates: np.ndarray | None = None,
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    return curve_inputs_from_cashflow_store(
+        curve_candidates=curve_candidates,
+        cashflow_store=_WORKER_STATE["cashflow_store"],
+        calendar_index=_WORKER_STATE["calendar_index"],
+        indexed_notionals=_WORKER_STATE["indexed_notionals"],
+        warm_start=warm_start,
+        indexed_notional_errors=_WORKER_STATE["indexed_notional_errors"],
+        previous_rates=previous_rates,
+    )
+
+
+def concat_shard_outputs(
+    outputs: list[tuple[pd.DataFrame, pd.DataFrame]],
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Concatenate shard outputs in shard order.
+
+    Shards are increasing ref_date ranges and each output is already sorted,
+    so the concatenation is sorted like a single run.
+    """
+    inputs = [shard_inputs for shard_inputs, _ in outputs if not shard_inputs.empty]
+    failures = [shard_failures for _, shard_failures in outputs if not shard_failures.empty]
+
+    return (
+        pd.concat(inputs, ignore_index=True)
+        if inputs
+        else pd.DataFrame(columns=INPUT_COLUMNS),
+        pd.concat(failures, ignore_index=True)
+        if failures
+        else pd.DataFrame(columns=FAILURE_COLUMNS),
+    )
+
+
+def build_public_bonds_curve_inputs_parallel(
+    curve_candidates: pd.DataFrame,
+    cashflow_dimension: pd.DataFrame,
+    calendar_df: pd.DataFrame,
+    warm_start: bool = False,
+    sgs_points: pd.DataFrame | None = None,
+    indexed_notional_anchors: Mapping[str, Mapping[str, Any]] | None = None,
+    workers: int | None = None,
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Columnar curve inputs computed by a process pool over ref_date shards.
+
+    The cashflow store is written once to a temporary file that every worker
+    memory-maps, so tasks only carry their candidate rows. Shards are mapped
+    in order and concatenated, so the output does not depend on scheduling.
+    `workers=None` uses every core; `workers=1` runs in this process.
+
+    With `warm_start`, the previous-day taxa_med guesses are taken from all
+    candidates before sharding, so the first ref_date of a shard is seeded
+    from the last date of the shard before it. The output equals
+    build_public_bonds_curve_inputs_columnar with or without `warm_start`.
+    """
+    workers = resolve_workers(workers)
+    calendar_index = CalendarIndex.from_calendar_df(calendar_df)
+    cashflow_store = CashflowStore.from_cashflow_dimension(cashflow_dimension)
+    indexed_notionals, indexed_notional_errors = candidate_indexed_notionals(
+        curve_candidates,
+        calendar_index,
+        sgs_points,
+        indexed_notional_anchors,
+    )
+
+    previous_rates = previous_quote_rates(curve_candidates) if warm_start else None
+
+    def run_in_process(
+        candidates: pd.DataFrame,
+        rates: np.ndarray | None,
+    ) -> tuple[pd.DataFrame, pd.DataFrame]:
+        return curve_inputs_from_cashflow_store(
+            curve_candidates=candidates,
+            cashflow_store=cashflow_store,
+            calendar_index=calendar_index,
+            indexed_notionals=indexed_notionals,
+            warm_start=warm_start,
+            indexed_notional_errors=indexed_notional_errors,
+            previous_rates=rates,
+        )
+
+    if curve_candidates.empty or workers == 1:
+        return run_in_process(curve_candidates, previous_rates)
+
+    shard_positions = ref_date_shards(
+        curve_candidates["ref_date"],
+        workers * SHARDS_PER_WORKER,
+    )
+    shards = [curve_candidates.iloc[positions] for positions in shard_positions]
+    shard_rates = [
+        previous_rates[positions] if warm_start else None
+        for positions in shard_positions
+    ]
+
+    if len(shards) == 1:
+        return run_in_process(shards[0], shard_rates[0])
+
+    with tempfile.TemporaryDirectory(prefix="public_bonds_cashflow_store_") as directory:
+        cashflow_store_path = str(Path(directory) / "cashflow_store.bin")
+        cashflow_store.save(cashflow_store_path)
+
+        with ProcessPoolExecutor(
+            max_workers=min(workers, len(shards)),
+            initializer=attach_curve_input_worker,
+            initargs=(
+                cashflow_store_path,
+                calendar_index,
+                indexed_notionals,
+                indexed_notional_errors,
+            ),
+        ) as executor:
+            outputs = list(
+                executor.map(
+                    build_curve_input_shard,
+                    shards,
+                    [warm_start] * len(shards),
+                    shard_rates,
+                )
+            )
+
+    return concat_shard_outputs(outputs)
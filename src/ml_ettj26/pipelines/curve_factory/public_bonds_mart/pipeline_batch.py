@@ -7,7 +7,10 @@ from .nodes import (
     load_public_bond_curve_candidates_from_duckdb,
     load_refined_calendar_from_duckdb,
 )
-from .nodes_batch import build_public_bonds_curve_inputs_batch
+from .nodes_batch import (
+    build_public_bonds_curve_inputs_batch,
+    summarize_solver_iterations,
+)
 
 
 def create_pipeline(**kwargs) -> Pipeline:
@@ -43,6 +46,7 @@ def create_pipeline(**kwargs) -> Pipeline:
                 inputs={
                     "curve_candidates": "public_bonds_curve_candidates_batch",
                     "calendar_df": "refined_calendar_br_for_curve_mart_batch",
+                    "warm_start": "params:public_bonds_curve_mart.warm_start",
                 },
                 outputs=[
                     "mart_public_bonds_curve_inputs_batch",
@@ -50,5 +54,11 @@ def create_pipeline(**kwargs) -> Pipeline:
                 ],
                 name="build_public_bonds_curve_inputs_batch",
             ),
+            node(
+                func=summarize_solver_iterations,
+                inputs="mart_public_bonds_curve_inputs_batch",
+                outputs="mart_public_bonds_curve_solver_iterations_batch",
+                name="summarize_public_bonds_curve_solver_iterations_batch",
+            ),
         ]
     )
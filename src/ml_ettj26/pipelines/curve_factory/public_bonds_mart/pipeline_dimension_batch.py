@@ -7,9 +7,8 @@ from .nodes import (
     load_public_bond_curve_candidates_from_duckdb,
     load_refined_calendar_from_duckdb,
 )
-from .nodes_dimension_batch import (
-    build_public_bonds_curve_inputs_from_cashflow_dimension,
-)
+from .nodes_batch import summarize_solver_iterations
+from .nodes_parallel import build_public_bonds_curve_inputs_parallel
 
 
 def create_pipeline(**kwargs) -> Pipeline:
@@ -41,11 +40,17 @@ def create_pipeline(**kwargs) -> Pipeline:
                 name="load_refined_calendar_br_for_curve_mart_dimension_batch",
             ),
             node(
-                func=build_public_bonds_curve_inputs_from_cashflow_dimension,
+                func=build_public_bonds_curve_inputs_parallel,
                 inputs={
                     "curve_candidates": "public_bonds_curve_candidates_dimension_batch",
                     "cashflow_dimension": "mart_public_bonds_cashflow_dimension",
                     "calendar_df": "refined_calendar_br_for_curve_mart_dimension_batch",
+                    "warm_start": "params:public_bonds_curve_mart.warm_start",
+                    "sgs_points": "bcb_sgs_points_trusted",
+                    "indexed_notional_anchors": (
+                        "params:public_bonds_curve_mart.indexed_notional_anchors"
+                    ),
+                    "workers": "params:public_bonds_curve_mart.workers",
                 },
                 outputs=[
                     "mart_public_bonds_curve_inputs_dimension_batch",
@@ -53,5 +58,11 @@ def create_pipeline(**kwargs) -> Pipeline:
                 ],
                 name="build_public_bonds_curve_inputs_dimension_batch",
             ),
+            node(
+                func=summarize_solver_iterations,
+                inputs="mart_public_bonds_curve_inputs_dimension_batch",
+                outputs="mart_public_bonds_curve_solver_iterations_dimension_batch",
+                name="summarize_public_bonds_curve_solver_iterations_dimension_batch",
+            ),
         ]
     )
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+from kedro.pipeline import Pipeline, node, pipeline
+
+from .nodes import (
+    execute_duckdb_sql_files,
+    load_public_bond_curve_candidates_from_duckdb,
+    load_refined_calendar_from_duckdb,
+)
+from .nodes_batch import summarize_solver_iterations
+from .nodes_incremental import (
+    build_public_bonds_curve_inputs_incremental,
+    consolidate_curve_failure_partitions,
+    consolidate_curve_input_partitions,
+)
+
+
+def create_pipeline(**kwargs) -> Pipeline:
+    """
+    Incremental variant of the dimension-batch mart.
+
+    Only ref_dates after the watermark are solved and saved as ref_date
+    partitions; the consolidated outputs keep the dimension-batch dataset
+    names, so the curve factories read them unchanged.
+    """
+    return pipeline(
+        [
+            node(
+                func=execute_duckdb_sql_files,
+                inputs={
+                    "duckdb_path": "params:duckdb.database_path",
+                    "sql_files": "params:public_bonds_curve_mart.sql_files",
+                },
+                outputs=None,
+                name="create_public_bonds_quality_views_incremental",
+            ),
+            node(
+                func=load_public_bond_curve_candidates_from_duckdb,
+                inputs={
+                    "duckdb_path": "params:duckdb.database_path",
+                },
+                outputs="public_bonds_curve_candidates_incremental",
+                name="load_public_bonds_curve_candidates_incremental",
+            ),
+            node(
+                func=load_refined_calendar_from_duckdb,
+                inputs={
+                    "duckdb_path": "params:duckdb.database_path",
+                },
+                outputs="refined_calendar_br_for_curve_mart_incremental",
+                name="load_refined_calendar_br_for_curve_mart_incremental",
+            ),
+            node(
+                func=build_public_bonds_curve_inputs_incremental,
+                inputs={
+                    "curve_candidates": "public_bonds_curve_candidates_incremental",
+                    "cashflow_dimension": "mart_public_bonds_cashflow_dimension",
+                    "calendar_df": "refined_calendar_br_for_curve_mart_incremental",
+                    "watermark": "mart_public_bonds_curve_inputs_watermark_prev",
+                    "warm_start": "params:public_bonds_curve_mart.warm_start",
+                    "sgs_points": "bcb_sgs_points_trusted",
+                    "indexed_notional_anchors": (
+                        "params:public_bonds_curve_mart.indexed_notional_anchors"
+                    ),
+                },
+                outputs=[
+                    "mart_public_bonds_curve_inputs_partitions",
+                    "mart_public_bonds_curve_calculation_failures_partitions",
+                    "mart_public_bonds_curve_inputs_watermark",
+                ],
+                name="build_public_bonds_curve_inputs_incremental",
+            ),
+            node(
+                func=consolidate_curve_input_partitions,
+                inputs={
+                    "partitions": "mart_public_bonds_curve_inputs_partitions",
+                    "curve_candidates": "public_bonds_curve_candidates_incremental",
+                },
+                outputs="mart_public_bonds_curve_inputs_dimension_batch",
+                name="consolidate_public_bonds_curve_inputs_incremental",
+            ),
+            node(
+                func=consolidate_curve_failure_partitions,
+                inputs={
+                    "partitions": "mart_public_bonds_curve_calculation_failures_partitions",
+                    "curve_candidates": "public_bonds_curve_candidates_incremental",
+                },
+                outputs="mart_public_bonds_curve_calculation_failures_dimension_batch",
+                name="consolidate_public_bonds_curve_failures_incremental",
+            ),
+            node(
+                func=summarize_solver_iterations,
+                inputs="mart_public_bonds_curve_inputs_dimension_batch",
+                outputs="mart_public_bonds_curve_solver_iterations_dimension_batch",
+                name="summarize_public_bonds_curve_solver_iterations_incremental",
+            ),
+        ]
+    )
@@ -0,0 +1,52 @@
+"""
+Sharding helpers shared by the process-pool nodes and curve models.
+
+Work is split into contiguous ref_date ranges so that each shard sees whole
+days and shard outputs can be joined in date order.
+"""
+
+from __future__ import annotations
+
+import os
+
+import numpy as np
+import pandas as pd
+
+
+# Shards per worker: several ref_date ranges per process even out slow dates.
+SHARDS_PER_WORKER = 4
+
+
+def resolve_workers(workers: int | None) -> int:
+    if workers is None:
+        return os.cpu_count() or 1
+
+    if workers < 1:
+        raise ValueError("workers must be a positive integer or None")
+
+    return int(workers)
+
+
+def ref_date_shards(ref_dates: pd.Series, n_shards: int) -> list[np.ndarray]:
+    """
+    Row positions of `n_shards` contiguous ref_date ranges, in date order.
+
+    A ref_date is never split across shards, so each shard sees whole days.
+    """
+    date_codes, unique_dates = pd.factorize(pd.to_datetime(ref_dates), sort=True)
+
+    if not len(unique_dates):
+        return []
+
+    order = np.argsort(date_codes, kind="stable")
+    date_starts = np.searchsorted(date_codes[order], np.arange(len(unique_dates)))
+    shard_starts = [
+        int(date_starts[dates[0]])
+        for dates in np.array_split(
+            np.arange(len(unique_dates)),
+            min(n_shards, len(unique_dates)),
+        )
+    ]
+
+    return np.split(order, shard_starts[1:])
+
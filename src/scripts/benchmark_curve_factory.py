@@ -0,0 +1,204 @@
+"""
+Benchmark curve-factory models and estimate how they scale.
+
+Models (--models, default all): flat-forward, bootstrap, nelson-siegel,
+svensson, kernel-ridge-tune and kernel-ridge-fit, with the parameters of
+conf/base/parameters.yml.
+
+Each axis is swept on synthetic inputs while the others stay at their first
+value: --dates (reference dates), --bond-scales (synthetic bonds per day)
+and --max-years (grid size = max_years × business_days_per_year). The JSON
+report carries time per date, time per fit and memory per date of every
+case, plus the log-log scaling exponent of each model along each axis. With
+--baseline the run is compared with a previous report and exits with code 1
+when a metric regresses past --threshold.
+
+Run from the repository root.
+
+PowerShell:
+    python src/scripts/benchmark_curve_factory.py
+    python src/scripts/benchmark_curve_factory.py --models flat-forward bootstrap --dates 20 80 320
+    python src/scripts/benchmark_curve_factory.py --output bench/curve_factory.json
+    python src/scripts/benchmark_curve_factory.py --baseline bench/curve_factory.json
+
+Bash:
+    # python src/scripts/benchmark_curve_factory.py --models svensson --dates 5 10 --bond-scales 1 --max-years 20
+    # python src/scripts/benchmark_curve_factory.py --cprofile-out curve_factory.prof
+    # python -m pstats curve_factory.prof
+    #   sort cumtime
+    #   stats 40
+
+If your environment uses uv:
+    # uv run python src/scripts/benchmark_curve_factory.py
+"""
+
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+from typing import Any
+
+import pandas as pd
+import yaml
+
+from ml_ettj26.benchmarks.curve_factory import (
+    CURVE_FACTORY_METRICS,
+    MODELS,
+    curve_factory_report_summary,
+    run_curve_factory_benchmarks,
+    scaling_cases,
+    scaling_exponents,
+    synthetic_curve_inputs,
+)
+from ml_ettj26.benchmarks.harness import (
+    compare_to_baseline,
+    environment_info,
+    read_report,
+    run_report_script,
+)
+from ml_ettj26.benchmarks.synthetic_market import SyntheticMarketConfig
+
+
+def run(args: argparse.Namespace) -> dict[str, Any]:
+    parameters = yaml.safe_load(Path(args.parameters).read_text(encoding="utf-8"))
+    cases = scaling_cases(
+        dates=args.dates,
+        bonds_scales=args.bond_scales,
+        max_years=args.max_years,
+    )
+    inputs = synthetic_curve_inputs(cases, SyntheticMarketConfig(seed=args.seed))
+    results = run_curve_factory_benchmarks(
+        inputs,
+        parameters,
+        models=args.models,
+        repeats=args.repeats,
+        trace_memory=not args.no_trace_memory,
+    )
+
+    report: dict[str, Any] = {
+        "benchmark": "curve_factory",
+        "environment": environment_info(),
+        "config": {
+            "models": list(args.models),
+            "dates": list(args.dates),
+            "bond_scales": list(args.bond_scales),
+            "max_years": list(args.max_years),
+            "seed": args.seed,
+            "repeats": args.repeats,
+            "parameters": args.parameters,
+        },
+        "results": results,
+        "scaling": scaling_exponents(results),
+    }
+
+    if args.baseline:
+        report["comparison"] = compare_to_baseline(
+            results,
+            read_report(args.baseline)["results"],
+            metrics=CURVE_FACTORY_METRICS,
+            key_fields=("model", "axis", "size"),
+            threshold=args.threshold,
+        )
+
+    return report
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Benchmark curve-factory models on synthetic inputs and fit scaling exponents.",
+    )
+    parser.add_argument(
+        "--models",
+        nargs="+",
+        choices=list(MODELS),
+        default=list(MODELS),
+        help="Models to run, in order.",
+    )
+    parser.add_argument(
+        "--dates",
+        nargs="+",
+        type=int,
+        default=[10, 20, 40],
+        help="Reference-date counts of the dates sweep.",
+    )
+    parser.add_argument(
+        "--bond-scales",
+        nargs="+",
+        type=float,
+        default=[1, 2, 4],
+        help="Synthetic bonds-per-day factors of the volume sweep.",
+    )
+    parser.add_argument(
+        "--max-years",
+        nargs="+",
+        type=int,
+        default=[5, 10, 20],
+        help="Curve horizons of the grid-size sweep.",
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=0,
+        help="Synthetic market seed.",
+    )
+    parser.add_argument(
+        "--parameters",
+        default="conf/base/parameters.yml",
+        help="Kedro parameters file with the model sections.",
+    )
+    parser.add_argument(
+        "--repeats",
+        type=int,
+        default=1,
+        help="Runs per case; the fastest time is kept.",
+    )
+    parser.add_argument(
+        "--no-trace-memory",
+        action="store_true",
+        help="Skip tracemalloc (faster, no peak_mb).",
+    )
+    parser.add_argument(
+        "--output",
+        default=None,
+        help="Optional path to write the JSON report.",
+    )
+    parser.add_argument(
+        "--baseline",
+        default=None,
+        help="Previous JSON report to compare with.",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.10,
+        help="Relative change that counts as a regression.",
+    )
+    parser.add_argument(
+        "--cprofile-out",
+        default=None,
+        help="Optional path to write a cProfile .prof file.",
+    )
+    parser.add_argument(
+        "--pstats-top",
+        type=int,
+        default=40,
+        help="Number of cProfile rows to print when --cprofile-out is used.",
+    )
+    return parser.parse_args()
+
+
+def summary(report: dict[str, Any]) -> str:
+    return "\n".join(
+        [
+            curve_factory_report_summary(report["results"]).to_string(index=False),
+            pd.DataFrame(report["scaling"]).to_string(index=False),
+        ]
+    )
+
+
+def main() -> None:
+    run_report_script(parse_args(), run, summary)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,208 @@
+"""
+Benchmark trusted-layer ingestion parsers on generated raw files.
+
+Parsers (--parsers, default all): price-report (B3 PriceReport XML), swap
+(B3 swap TXT), demab (BCB DEMAB CSV) and sgs (BCB SGS JSON). Each one runs
+end to end through its trusted builder and, in `stages` mode, as a replay
+timed by zip_open, header_probe, sha256, parse, normalize and dataframe.
+
+Raw files are written by the synthetic market at each --scales volume factor
+into --workdir (a temporary directory by default). The JSON report carries
+MB/s, rows/s, peak traced memory and the share of each stage; with
+--baseline the run is compared with a previous report and exits with code 1
+when a metric regresses past --threshold.
+
+Run from the repository root.
+
+PowerShell:
+    python src/scripts/benchmark_ingestion.py
+    python src/scripts/benchmark_ingestion.py --parsers price-report swap --scales 1 5
+    python src/scripts/benchmark_ingestion.py --output bench/ingestion.json
+    python src/scripts/benchmark_ingestion.py --baseline bench/ingestion.json
+
+Bash:
+    # python src/scripts/benchmark_ingestion.py --modes stages --years 1
+    # python src/scripts/benchmark_ingestion.py --cprofile-out ingestion.prof
+    # python -m pstats ingestion.prof
+    #   sort cumtime
+    #   stats 40
+
+If your environment uses uv:
+    # uv run python src/scripts/benchmark_ingestion.py
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+from contextlib import ExitStack
+from pathlib import Path
+from typing import Any
+
+import pandas as pd
+
+from ml_ettj26.benchmarks.harness import (
+    compare_to_baseline,
+    environment_info,
+    read_report,
+    run_report_script,
+)
+from ml_ettj26.benchmarks.ingestion import (
+    BUILDER_MODE,
+    INGESTION_METRICS,
+    PARSERS,
+    STAGES_MODE,
+    dominant_stages,
+    ingestion_report_summary,
+    run_ingestion_benchmarks,
+    write_ingestion_fixtures,
+)
+from ml_ettj26.benchmarks.synthetic_market import SyntheticMarketConfig
+
+
+def run(args: argparse.Namespace) -> dict[str, Any]:
+    config = SyntheticMarketConfig(years=args.years, seed=args.seed)
+
+    with ExitStack() as stack:
+        workdir = Path(args.workdir or stack.enter_context(tempfile.TemporaryDirectory()))
+        fixtures = [
+            write_ingestion_fixtures(
+                config.scaled(scale),
+                workdir / f"scale_{scale:g}",
+                size=f"{scale:g}x",
+            )
+            for scale in args.scales
+        ]
+        results = run_ingestion_benchmarks(
+            fixtures,
+            parsers=args.parsers,
+            modes=args.modes,
+            repeats=args.repeats,
+            trace_memory=not args.no_trace_memory,
+        )
+
+    report: dict[str, Any] = {
+        "benchmark": "ingestion",
+        "environment": environment_info(),
+        "config": {
+            "parsers": list(args.parsers),
+            "modes": list(args.modes),
+            "scales": list(args.scales),
+            "years": args.years,
+            "seed": args.seed,
+            "repeats": args.repeats,
+        },
+        "results": results,
+        "dominant_stages": dominant_stages(results),
+    }
+
+    if args.baseline:
+        report["comparison"] = compare_to_baseline(
+            results,
+            read_report(args.baseline)["results"],
+            metrics=INGESTION_METRICS,
+            key_fields=("parser", "mode", "size"),
+            threshold=args.threshold,
+        )
+
+    return report
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Benchmark trusted-layer ingestion parsers on synthetic raw files.",
+    )
+    parser.add_argument(
+        "--parsers",
+        nargs="+",
+        choices=list(PARSERS),
+        default=list(PARSERS),
+        help="Parsers to run, in order.",
+    )
+    parser.add_argument(
+        "--modes",
+        nargs="+",
+        choices=[BUILDER_MODE, STAGES_MODE],
+        default=[BUILDER_MODE, STAGES_MODE],
+        help="End-to-end builder runs and/or stage-by-stage replays.",
+    )
+    parser.add_argument(
+        "--scales",
+        nargs="+",
+        type=float,
+        default=[1, 5],
+        help="Synthetic daily-volume factors, one fixture set each.",
+    )
+    parser.add_argument(
+        "--years",
+        type=float,
+        default=0.25,
+        help="Synthetic history length in years.",
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=0,
+        help="Synthetic market seed.",
+    )
+    parser.add_argument(
+        "--workdir",
+        default=None,
+        help="Directory to keep the generated raw files (temporary by default).",
+    )
+    parser.add_argument(
+        "--repeats",
+        type=int,
+        default=1,
+        help="Runs per parser and mode; the fastest time per stage is kept.",
+    )
+    parser.add_argument(
+        "--no-trace-memory",
+        action="store_true",
+        help="Skip tracemalloc (faster, no peak_mb).",
+    )
+    parser.add_argument(
+        "--output",
+        default=None,
+        help="Optional path to write the JSON report.",
+    )
+    parser.add_argument(
+        "--baseline",
+        default=None,
+        help="Previous JSON report to compare with.",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.10,
+        help="Relative change that counts as a regression.",
+    )
+    parser.add_argument(
+        "--cprofile-out",
+        default=None,
+        help="Optional path to write a cProfile .prof file.",
+    )
+    parser.add_argument(
+        "--pstats-top",
+        type=int,
+        default=40,
+        help="Number of cProfile rows to print when --cprofile-out is used.",
+    )
+    return parser.parse_args()
+
+
+def summary(report: dict[str, Any]) -> str:
+    return "\n".join(
+        [
+            ingestion_report_summary(report["results"]).to_string(index=False),
+            pd.DataFrame(report["dominant_stages"]).to_string(index=False),
+        ]
+    )
+
+
+def main() -> None:
+    run_report_script(parse_args(), run, summary)
+
+
+if __name__ == "__main__":
+    main()
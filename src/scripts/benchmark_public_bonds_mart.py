@@ -0,0 +1,231 @@
+"""
+Benchmark the public-bonds YTM flow end to end and by stage.
+
+Scenarios (--scenarios, default all):
+
+    unit                 row-by-row curve inputs with the unit solver;
+    batch                curve inputs with the batch YTM solver;
+    dimension-batch      cashflow dimension + columnar curve inputs;
+    dimension-batch-warm the same, warm-started from previous-day taxa_med;
+    solver-only          BatchYieldSolver.solve_ragged over prepared cashflows;
+    duration-only        bond_risk_batch at the solved yields.
+
+Inputs are generated by the synthetic market at each --scales volume factor
+(no data needed), or loaded from DuckDB with --source duckdb. The JSON
+report carries bonds/s and peak traced memory per scenario and stage; with
+--baseline the run is compared with a previous report and exits with code 1
+when a metric regresses past --threshold.
+
+Run from the repository root.
+
+PowerShell:
+    python src/scripts/benchmark_public_bonds_mart.py
+    python src/scripts/benchmark_public_bonds_mart.py --scales 1 10 --output bench/mart.json
+    python src/scripts/benchmark_public_bonds_mart.py --baseline bench/mart.json
+    python src/scripts/benchmark_public_bonds_mart.py --source duckdb --limit 5000
+
+Bash:
+    # python src/scripts/benchmark_public_bonds_mart.py --scenarios batch dimension-batch
+    # python src/scripts/benchmark_public_bonds_mart.py --cprofile-out public_bonds_mart.prof
+    # python -m pstats public_bonds_mart.prof
+    #   sort cumtime
+    #   stats 40
+
+If your environment uses uv:
+    # uv run python src/scripts/benchmark_public_bonds_mart.py
+"""
+
+from __future__ import annotations
+
+import argparse
+from dataclasses import asdict, replace
+from typing import Any
+
+from ml_ettj26.benchmarks.harness import (
+    compare_to_baseline,
+    environment_info,
+    read_report,
+    run_report_script,
+)
+from ml_ettj26.benchmarks.mart import (
+    DEFAULT_CASHFLOW_SQL_FILES,
+    DEFAULT_MART_SQL_FILES,
+    MART_METRICS,
+    SCENARIOS,
+    duckdb_mart_inputs,
+    mart_report_summary,
+    run_mart_benchmarks,
+    synthetic_mart_inputs,
+)
+from ml_ettj26.benchmarks.synthetic_market import SyntheticMarketConfig
+
+
+def build_inputs(args: argparse.Namespace) -> list:
+    if args.source == "duckdb":
+        return [
+            duckdb_mart_inputs(
+                duckdb_path=args.duckdb_path,
+                limit=args.limit,
+                cashflow_sql_files=args.cashflow_sql_files,
+                mart_sql_files=args.mart_sql_files,
+            )
+        ]
+
+    config = SyntheticMarketConfig(years=args.years, seed=args.seed)
+
+    return [
+        synthetic_mart_inputs(config.scaled(scale), size=f"{scale}x", limit=args.limit)
+        for scale in args.scales
+    ]
+
+
+def run(args: argparse.Namespace) -> dict[str, Any]:
+    inputs = build_inputs(args)
+    results = run_mart_benchmarks(
+        inputs,
+        scenarios=args.scenarios,
+        repeats=args.repeats,
+        trace_memory=not args.no_trace_memory,
+    )
+
+    report: dict[str, Any] = {
+        "benchmark": "public_bonds_mart",
+        "environment": environment_info(),
+        "config": {
+            "source": args.source,
+            "scenarios": list(args.scenarios),
+            "repeats": args.repeats,
+            "limit": args.limit,
+            **(
+                {"duckdb_path": args.duckdb_path}
+                if args.source == "duckdb"
+                else {
+                    "scales": list(args.scales),
+                    "synthetic": asdict(replace(SyntheticMarketConfig(), years=args.years, seed=args.seed)),
+                }
+            ),
+        },
+        "results": results,
+    }
+
+    if args.baseline:
+        report["comparison"] = compare_to_baseline(
+            results,
+            read_report(args.baseline)["results"],
+            metrics=MART_METRICS,
+            threshold=args.threshold,
+        )
+
+    return report
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Benchmark public-bonds curve-input scenarios on synthetic or DuckDB data.",
+    )
+    parser.add_argument(
+        "--scenarios",
+        nargs="+",
+        choices=list(SCENARIOS),
+        default=list(SCENARIOS),
+        help="Scenarios to run, in order.",
+    )
+    parser.add_argument(
+        "--source",
+        choices=["synthetic", "duckdb"],
+        default="synthetic",
+        help="Where curve candidates come from.",
+    )
+    parser.add_argument(
+        "--scales",
+        nargs="+",
+        type=int,
+        default=[1, 10],
+        help="Synthetic daily-volume factors, one benchmark size each.",
+    )
+    parser.add_argument(
+        "--years",
+        type=float,
+        default=0.25,
+        help="Synthetic history length in years.",
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=0,
+        help="Synthetic market seed.",
+    )
+    parser.add_argument(
+        "--duckdb-path",
+        default="data/duckdb/ml_ettj26.duckdb",
+        help="Path to the DuckDB database (--source duckdb).",
+    )
+    parser.add_argument(
+        "--cashflow-sql-files",
+        nargs="+",
+        default=DEFAULT_CASHFLOW_SQL_FILES,
+        help="SQL files needed to load instrument/calendar source views.",
+    )
+    parser.add_argument(
+        "--mart-sql-files",
+        nargs="+",
+        default=DEFAULT_MART_SQL_FILES,
+        help="SQL files used to create the mart candidate views.",
+    )
+    parser.add_argument(
+        "--limit",
+        type=int,
+        default=None,
+        help="Optional curve-candidate row limit for faster runs.",
+    )
+    parser.add_argument(
+        "--repeats",
+        type=int,
+        default=1,
+        help="Runs per scenario; the fastest time per stage is kept.",
+    )
+    parser.add_argument(
+        "--no-trace-memory",
+        action="store_true",
+        help="Skip tracemalloc (faster, no peak_mb).",
+    )
+    parser.add_argument(
+        "--output",
+        default=None,
+        help="Optional path to write the JSON report.",
+    )
+    parser.add_argument(
+        "--baseline",
+        default=None,
+        help="Previous JSON report to compare with.",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.10,
+        help="Relative change that counts as a regression.",
+    )
+    parser.add_argument(
+        "--cprofile-out",
+        default=None,
+        help="Optional path to write a cProfile .prof file.",
+    )
+    parser.add_argument(
+        "--pstats-top",
+        type=int,
+        default=40,
+        help="Number of cProfile rows to print when --cprofile-out is used.",
+    )
+    return parser.parse_args()
+
+
+def summary(report: dict[str, Any]) -> str:
+    return mart_report_summary(report["results"]).to_string(index=False)
+
+
+def main() -> None:
+    run_report_script(parse_args(), run, summary)
+
+
+if __name__ == "__main__":
+    main()
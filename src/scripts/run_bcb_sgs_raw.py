@@ -7,7 +7,8 @@ def main():
     storage = LocalFileStorage("data/01_raw")
     sgs = BcbSgsRawExtractor(http, storage)
 
-    start = "01/01/2018"
+    # From 2000, so the LFT and NTN-B VNA base dates are covered.
+    start = "01/01/2000"
     end = "13/02/2026"
 
     selic_paths = sgs.fetch_and_store(432, start=start, end=end, out_dir="bcb/sgs")
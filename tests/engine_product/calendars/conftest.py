@@ -3,7 +3,10 @@ from datetime import date
 import pandas as pd
 import pytest
 
-from engine_product.calendars.repository import DataFrameCalendarRepository
+from engine_product.calendars.repository import (
+    ArrayCalendarRepository,
+    DataFrameCalendarRepository,
+)
 from engine_product.calendars.business_calendar import BusinessCalendar
 
 
@@ -113,4 +116,8 @@ def calendar_repo(calendar_df):
 
 @pytest.fixture
 def business_calendar(calendar_repo):
-    return BusinessCalendar(calendar_repo)
\ No newline at end of file
+    return BusinessCalendar(calendar_repo)
+
+@pytest.fixture
+def array_calendar_repo(calendar_df):
+    return ArrayCalendarRepository(calendar_df)
@@ -0,0 +1,79 @@
+from datetime import date
+
+import numpy as np
+import pytest
+
+
+def test_get_returns_full_row(array_calendar_repo):
+    row = array_calendar_repo.get(date(2026, 1, 2))
+
+    assert row["calendar_id"] == "BR_ANBIMA"
+    assert row["bd_index"] == 1
+
+
+def test_calendar_id_is_exposed(array_calendar_repo):
+    assert array_calendar_repo.calendar_id == "BR_ANBIMA"
+
+
+def test_scalar_lookups_match_dataframe_repository(array_calendar_repo, calendar_repo):
+    dates = [date(2025, 12, 31)] + [date(2026, 1, day) for day in range(1, 6)]
+
+    for d in dates:
+        assert array_calendar_repo.is_business_day(d) is calendar_repo.is_business_day(d)
+        assert array_calendar_repo.adjust_to_next_business_day(d) == (
+            calendar_repo.adjust_to_next_business_day(d)
+        )
+        assert array_calendar_repo.adjust_to_previous_business_day(d) == (
+            calendar_repo.adjust_to_previous_business_day(d)
+        )
+        assert array_calendar_repo.business_days_between(dates[0], d) == (
+            calendar_repo.business_days_between(dates[0], d)
+        )
+        assert array_calendar_repo.actual_days_between(dates[1], d) == (
+            calendar_repo.actual_days_between(dates[1], d)
+        )
+
+
+def test_first_business_day_of_month(array_calendar_repo):
+    assert array_calendar_repo.first_business_day_of_month(2026, 1) == date(2026, 1, 2)
+
+
+def test_adjust_to_next_business_day_returns_python_date(array_calendar_repo):
+    result = array_calendar_repo.adjust_to_next_business_day(date(2026, 1, 3))
+
+    assert type(result) is date
+    assert result == date(2026, 1, 5)
+
+
+def test_date_outside_calendar_raises_key_error(array_calendar_repo):
+    with pytest.raises(KeyError):
+        array_calendar_repo.is_business_day(date(2030, 1, 1))
+
+    with pytest.raises(KeyError):
+        array_calendar_repo.bd_index_array([date(2026, 1, 2), date(2030, 1, 1)])
+
+
+def test_array_lookups(array_calendar_repo):
+    dates = np.array(["2026-01-01", "2026-01-02", "2026-01-03", "2026-01-05"], dtype="datetime64[D]")
+
+    assert array_calendar_repo.bd_index_array(dates).tolist() == [0, 1, 1, 2]
+    assert array_calendar_repo.is_business_day_array(dates).tolist() == [False, True, False, True]
+    assert array_calendar_repo.adjust_to_next_business_day_array(dates).tolist() == [
+        date(2026, 1, 2),
+        date(2026, 1, 2),
+        date(2026, 1, 5),
+        date(2026, 1, 5),
+    ]
+    assert array_calendar_repo.business_days_between_array(
+        np.datetime64("2026-01-01"),
+        dates,
+    ).tolist() == [0, 1, 1, 2]
+
+
+def test_default_array_methods_delegate_to_scalar_lookups(calendar_repo, array_calendar_repo):
+    dates = [date(2026, 1, 1), date(2026, 1, 3), date(2026, 1, 4)]
+
+    assert calendar_repo.adjust_to_next_business_day_array(dates).tolist() == (
+        array_calendar_repo.adjust_to_next_business_day_array(dates).tolist()
+    )
+    assert calendar_repo.is_business_day_array(dates).tolist() == [False, False, False]
@@ -0,0 +1,59 @@
+from datetime import date
+
+import numpy as np
+import pandas as pd
+
+from engine_product.calendars import CalendarIndex
+
+
+def test_bd_index_gathers_datetime64_arrays(calendar_df):
+    index = CalendarIndex.from_calendar_df(calendar_df)
+    dates = np.array(
+        ["2025-12-31", "2026-01-01", "2026-01-02", "2026-01-04", "2026-01-05"],
+        dtype="datetime64[D]",
+    )
+
+    result = index.bd_index(dates)
+
+    assert result.dtype == np.int32
+    assert result.tolist() == [0, 0, 1, 1, 2]
+
+
+def test_bd_index_returns_minus_one_for_missing_dates(calendar_df):
+    index = CalendarIndex.from_calendar_df(calendar_df)
+    dates = pd.Series(
+        [pd.Timestamp("2025-12-30"), pd.NaT, pd.Timestamp("2026-01-05"), pd.Timestamp("2030-01-01")]
+    )
+
+    assert index.bd_index(dates).tolist() == [-1, -1, 2, -1]
+    assert date(2026, 1, 2) in index
+    assert date(2030, 1, 1) not in index
+
+
+def test_business_days_only_masks_non_business_days(calendar_df):
+    index = CalendarIndex.from_calendar_df(calendar_df)
+
+    result = index.bd_index(
+        [date(2025, 12, 31), date(2026, 1, 1), date(2026, 1, 3), date(2026, 1, 5)],
+        business_days_only=True,
+    )
+
+    assert result.tolist() == [0, -1, -1, 2]
+
+
+def test_dates_inverts_business_day_indexes(calendar_df):
+    index = CalendarIndex.from_calendar_df(calendar_df)
+
+    result = index.dates([0, 1, 2, 3, -1])
+
+    assert result[:3].tolist() == [date(2025, 12, 31), date(2026, 1, 2), date(2026, 1, 5)]
+    assert np.isnat(result[3:]).all()
+
+
+def test_array_repository_exposes_matching_index(array_calendar_repo, calendar_df):
+    dates = pd.to_datetime(calendar_df["date"]).to_numpy("datetime64[D]")
+
+    index = array_calendar_repo.calendar_index
+
+    assert index is array_calendar_repo.calendar_index
+    assert index.bd_index(dates).tolist() == array_calendar_repo.bd_index_array(dates).tolist()
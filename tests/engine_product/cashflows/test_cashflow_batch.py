@@ -0,0 +1,117 @@
+from datetime import date
+
+import numpy as np
+import pytest
+
+from engine_product.cashflows.batch import CashflowEventBatch
+from engine_product.cashflows.components.amortization import AmortizationComponent
+from engine_product.cashflows.components.interest import InterestComponent
+from engine_product.cashflows.components.optionality import EarlyRedemptionComponent
+from engine_product.cashflows.components.principal import PrincipalComponent
+from engine_product.cashflows.engine import CashflowEngine
+from engine_product.cashflows.events import CashflowEvent
+
+
+class FakeIndexer:
+    def accrual_factor(self, start, end):
+        return (end - start).days / 3650
+
+
+def make_engine():
+    return CashflowEngine(
+        components=[
+            InterestComponent(FakeIndexer()),
+            AmortizationComponent(),
+            EarlyRedemptionComponent(),
+            PrincipalComponent(),
+        ]
+    )
+
+
+def make_events():
+    return [
+        [
+            CashflowEvent(event_date=date(2026, 1, 15), amortization_factor=0.20),
+            CashflowEvent(event_date=date(2026, 7, 15), amortization_amount=100.0),
+            CashflowEvent(event_date=date(2027, 1, 15), principal=True),
+        ],
+        [
+            CashflowEvent(
+                event_date=date(2026, 6, 1),
+                early_redemption=True,
+                redemption_premium=0.01,
+            ),
+        ],
+        [
+            CashflowEvent(event_date=date(2027, 1, 4), interest=False, principal=True),
+        ],
+    ]
+
+
+def test_build_batch_matches_unit_engine():
+    engine = make_engine()
+    events = make_events()
+    issue_dates = [date(2025, 7, 15), date(2025, 12, 1), date(2026, 1, 2)]
+    notionals = [1_000.0, 500.0, 1_000.0]
+    as_of_dates = [date(2026, 3, 1), date(2026, 1, 2), date(2026, 1, 2)]
+
+    batch = engine.build_batch(
+        issue_dates=issue_dates,
+        events=CashflowEventBatch.from_events(events),
+        notionals=notionals,
+        as_of_dates=as_of_dates,
+    )
+
+    assert len(batch) == 3
+
+    for i in range(3):
+        expected = engine._build_unit(
+            issue_date=issue_dates[i],
+            events=events[i],
+            notional=notionals[i],
+            as_of_date=as_of_dates[i],
+        )
+
+        assert batch.to_cashflows(i) == expected
+
+
+def test_batch_exposes_columnar_arrays():
+    batch = make_engine().build_batch(
+        issue_dates=date(2025, 7, 15),
+        events=CashflowEventBatch.from_events(make_events()[:1]),
+        notionals=1_000.0,
+        as_of_dates=date(2026, 3, 1),
+    )
+
+    assert batch.payment_date.dtype == np.dtype("datetime64[D]")
+    assert batch.cashflow_type.tolist() == [
+        "AMORTIZATION",
+        "INTEREST",
+        "INTEREST",
+        "PRINCIPAL",
+    ]
+    assert batch.notional_before.tolist() == pytest.approx([800.0, 800.0, 700.0, 700.0])
+    assert batch.offsets.tolist() == [0, 4]
+
+
+def test_build_batch_requires_batch_components():
+    class UnitOnlyComponent:
+        def generate(self, event, state):
+            return []
+
+    engine = CashflowEngine(components=[UnitOnlyComponent()])
+
+    assert engine.build(
+        issue_date=date(2026, 1, 1),
+        events=[CashflowEvent(event_date=date(2027, 1, 1))],
+        notional=1.0,
+        as_of_date=date(2026, 1, 1),
+    ) == []
+
+    with pytest.raises(TypeError):
+        engine.build_batch(
+            issue_dates=date(2026, 1, 1),
+            events=CashflowEventBatch.from_events([[]]),
+            notionals=1.0,
+            as_of_dates=date(2026, 1, 1),
+        )
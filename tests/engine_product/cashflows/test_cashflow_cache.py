@@ -0,0 +1,108 @@
+import gc
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+
+import pytest
+
+from engine_product.cashflows.cache import (
+    FULL_LIFE_AS_OF_DATE,
+    CashflowCache,
+    calendar_cache_id,
+)
+from engine_product.cashflows.models import Cashflow, CashflowType
+
+
+def make_builder(calls):
+    def build(as_of_date):
+        calls.append(as_of_date)
+        return [
+            Cashflow(date(2026, 1, 2), 50.0, CashflowType.INTEREST),
+            Cashflow(date(2026, 7, 1), 50.0, CashflowType.INTEREST),
+            Cashflow(date(2026, 7, 1), 1000.0, CashflowType.PRINCIPAL),
+        ]
+
+    return build
+
+
+def test_cache_builds_full_life_once_and_slices_by_as_of_date():
+    calls = []
+    cache = CashflowCache()
+    build = make_builder(calls)
+
+    first = cache.get_cashflows("k", date(2025, 12, 31), build)
+    second = cache.get_cashflows("k", date(2026, 1, 2), build)
+    third = cache.get_cashflows("k", date(2026, 7, 1), build)
+
+    assert calls == [FULL_LIFE_AS_OF_DATE]
+    assert len(first) == 3
+    assert [cf.payment_date for cf in second] == [date(2026, 7, 1)] * 2
+    assert third == []
+    assert cache.info().hits == 2
+    assert cache.info().misses == 1
+
+
+def test_cache_evicts_least_recently_used_entry():
+    calls = []
+    cache = CashflowCache(maxsize=2)
+    build = make_builder(calls)
+
+    cache.get_cashflows("a", date(2025, 1, 1), build)
+    cache.get_cashflows("b", date(2025, 1, 1), build)
+    cache.get_cashflows("a", date(2025, 1, 1), build)
+    cache.get_cashflows("c", date(2025, 1, 1), build)
+
+    assert "a" in cache
+    assert "b" not in cache
+    assert "c" in cache
+    assert cache.info().currsize == 2
+
+
+def test_cache_clear_resets_entries_and_counters():
+    cache = CashflowCache()
+    cache.get_cashflows("a", date(2025, 1, 1), make_builder([]))
+
+    cache.clear()
+
+    assert len(cache) == 0
+    assert cache.info().hits == 0
+    assert cache.info().misses == 0
+
+
+def test_cache_rejects_non_positive_maxsize():
+    with pytest.raises(ValueError, match="maxsize"):
+        CashflowCache(maxsize=0)
+
+
+class _Calendar:
+    def __init__(self, calendar_id=None):
+        self.calendar_id = calendar_id
+
+
+def test_calendar_cache_id_uses_calendar_id_and_keeps_no_reference():
+    assert calendar_cache_id(_Calendar("ANBIMA")) == calendar_cache_id(_Calendar("ANBIMA"))
+
+    first, second = _Calendar(), _Calendar()
+    assert calendar_cache_id(first) == calendar_cache_id(first)
+    assert calendar_cache_id(first) != calendar_cache_id(second)
+
+    reference = weakref.ref(first)
+    del first
+    gc.collect()
+    assert reference() is None
+
+
+def test_cache_counts_every_lookup_under_concurrent_access():
+    cache = CashflowCache(maxsize=8)
+    build = make_builder([])
+    keys = [f"k{i % 16}" for i in range(2000)]
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(
+            pool.map(lambda key: cache.get_cashflows(key, date(2025, 1, 1), build), keys)
+        )
+
+    info = cache.info()
+    assert all(len(result) == 3 for result in results)
+    assert info.hits + info.misses == len(keys)
+    assert info.currsize == 8
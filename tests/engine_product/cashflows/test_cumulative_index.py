@@ -0,0 +1,110 @@
+from datetime import date
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from engine_product.calendars import CalendarIndex
+from engine_product.cashflows.indexers.cdi import CDIPlusSpreadIndexer
+from engine_product.cashflows.indexers.cumulative import (
+    CumulativeIndexTable,
+    build_cdi_index_table,
+    build_ipca_index_table,
+)
+from engine_product.cashflows.indexers.ipca import IPCAPlusSpreadIndexer
+
+
+class FakeDayCount:
+    def year_fraction(self, start, end):
+        return 0.5
+
+
+def make_calendar_index(start="2026-01-01", end="2026-03-31"):
+    dates = pd.date_range(start, end, freq="D")
+    is_business_day = dates.weekday < 5
+
+    return CalendarIndex(
+        dates=dates,
+        bd_index=np.cumsum(is_business_day) - 1,
+        is_business_day=is_business_day,
+    )
+
+
+def make_points(series_id, dates, values):
+    return pd.DataFrame(
+        {
+            "series_id": series_id,
+            "ref_date": pd.to_datetime(dates),
+            "value": values,
+        }
+    )
+
+
+def test_table_accrues_business_days_between_dates():
+    table = CumulativeIndexTable(
+        business_dates=np.array(["2026-01-02", "2026-01-05", "2026-01-06"], dtype="datetime64[D]"),
+        log_increments=np.log([1.01, 1.02, 1.03]),
+    )
+
+    assert table.accumulated_factor(date(2026, 1, 2), date(2026, 1, 6)) == pytest.approx(1.01 * 1.02)
+    assert table.accumulated_factor(date(2026, 1, 3), date(2026, 1, 7)) == pytest.approx(1.02 * 1.03)
+
+    with pytest.raises(KeyError):
+        table.accumulated_factor(date(2026, 1, 1), date(2026, 1, 6))
+
+
+def test_cdi_table_compounds_forward_filled_annual_rate():
+    calendar_index = make_calendar_index()
+    points = pd.concat(
+        [
+            make_points(432, ["2026-01-01", "2026-01-05"], [10.0, 12.0]),
+            make_points(433, ["2026-01-01"], [0.5]),
+        ]
+    )
+
+    table = build_cdi_index_table(points, calendar_index)
+    result = table.accumulated_factors(
+        np.array(["2026-01-02", "2026-01-05"], dtype="datetime64[D]"),
+        np.array(["2026-01-06", "2026-01-06"], dtype="datetime64[D]"),
+    )
+
+    assert result == pytest.approx(
+        [1.10 ** (1 / 252) * 1.12 ** (1 / 252), 1.12 ** (1 / 252)]
+    )
+
+
+def test_ipca_table_is_pro_rata_by_business_days_in_month():
+    calendar_index = make_calendar_index()
+    points = make_points(433, ["2026-01-01", "2026-02-01"], [0.5, 0.3])
+
+    table = build_ipca_index_table(points, calendar_index)
+
+    assert table.accumulated_factor(date(2026, 1, 1), date(2026, 3, 1)) == pytest.approx(1.005 * 1.003)
+    # Janeiro/2026 tem 22 dias úteis neste calendário (seg-sex).
+    assert table.accumulated_factor(date(2026, 1, 1), date(2026, 1, 2)) == pytest.approx(1.005 ** (1 / 22))
+
+    with pytest.raises(ValueError, match="consecutive"):
+        build_ipca_index_table(
+            make_points(433, ["2026-01-01", "2026-03-01"], [0.5, 0.3]),
+            calendar_index,
+        )
+
+
+def test_indexers_accrue_vectorized_periods_from_tables():
+    calendar_index = make_calendar_index()
+    table = build_cdi_index_table(
+        make_points(432, ["2026-01-01", "2026-03-31"], [10.0, 10.0]),
+        calendar_index,
+    )
+    starts = np.array(["2026-01-02", "2026-02-02"], dtype="datetime64[D]")
+    ends = np.array(["2026-02-02", "2026-03-02"], dtype="datetime64[D]")
+
+    cdi = CDIPlusSpreadIndexer(cdi_curve=table, spread=0.02, day_count=FakeDayCount())
+    ipca = IPCAPlusSpreadIndexer(inflation_curve=table, spread=0.06, day_count=FakeDayCount())
+
+    for indexer in (cdi, ipca):
+        expected = [
+            indexer.accrual_factor(start, end)
+            for start, end in zip(starts.astype(object), ends.astype(object))
+        ]
+        assert indexer.accrual_factors(starts, ends) == pytest.approx(expected)
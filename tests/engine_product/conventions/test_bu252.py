@@ -1,5 +1,11 @@
-from datetime import date
+from datetime import date, timedelta
 
+import pandas as pd
+
+from engine_product.calendars.business_calendar import BusinessCalendar
+from engine_product.calendars.repository import ArrayCalendarRepository
+
+from engine_product.convention import year_fractions
 from engine_product.convention.conventions import BU252
 
 
@@ -8,6 +14,23 @@ class FakeBusinessCalendar:
         return 2
 
 
+def make_calendar_df():
+    dates = [date(2025, 12, 31) + timedelta(days=i) for i in range(6)]
+    is_business_day = [d.weekday() < 5 and d != date(2026, 1, 1) for d in dates]
+
+    bd_index = (pd.Series(is_business_day).cumsum() - 1).tolist()
+
+    return pd.DataFrame(
+        {
+            "calendar_id": "BR_ANBIMA",
+            "date": dates,
+            "is_business_day": is_business_day,
+            "act_index": range(len(dates)),
+            "bd_index": bd_index,
+        }
+    )
+
+
 def test_bu252_day_count():
     bu252 = BU252(FakeBusinessCalendar())
 
@@ -21,4 +44,28 @@ def test_bu252_year_fraction():
 
     result = bu252.year_fraction(date(2026, 1, 1), date(2026, 1, 5))
 
-    assert result == 2 / 252
\ No newline at end of file
+    assert result == 2 / 252
+
+def test_bu252_year_fractions_uses_calendar_arrays():
+    bu252 = BU252(BusinessCalendar(ArrayCalendarRepository(make_calendar_df())))
+    payment_dates = [date(2026, 1, 2), date(2026, 1, 5)]
+
+    counts = bu252.day_counts(date(2025, 12, 31), payment_dates)
+    fractions = bu252.year_fractions(date(2025, 12, 31), payment_dates)
+
+    assert counts.tolist() == [
+        bu252.day_count(date(2025, 12, 31), d) for d in payment_dates
+    ]
+    assert fractions.tolist() == [
+        bu252.year_fraction(date(2025, 12, 31), d) for d in payment_dates
+    ]
+
+
+def test_year_fractions_falls_back_to_scalar_day_count():
+    class FakeDayCount:
+        def year_fraction(self, start, end):
+            return 0.5
+
+    result = year_fractions(FakeDayCount(), date(2026, 1, 1), [date(2026, 1, 5)])
+
+    assert result.tolist() == [0.5]
@@ -1,16 +1,31 @@
 # tests/engine_product/instruments/test_public_bonds.py
 
+from dataclasses import replace
 from datetime import date, timedelta
 
+import numpy as np
 import pytest
 
+from engine_product.cashflows.cache import CashflowCache
 from engine_product.cashflows.models import CashflowType
+from engine_product.cashflows.indexers.cumulative import CumulativeIndexTable
 from engine_product.instruments.public_bonds import (
+    DEFAULT_NTNB_COUPON_RATE,
     DEFAULT_NTNF_COUPON_RATE,
     DEFAULT_PUBLIC_BOND_NOTIONAL,
+    IndexedNotional,
+    LFTContract,
     LTNContract,
+    NTNBContract,
     NTNFContract,
+    build_lft_cashflow_batch,
+    build_ltn_cashflow_batch,
+    build_ntnb_cashflow_batch,
+    build_ntnf_cashflow_batch,
+    ntnb_coupon_months,
+    ntnb_schedule_rule,
 )
+from engine_product.schedules import ScheduleBatch, build_schedule_batch
 
 
 class FakeCalendar:
@@ -28,6 +43,12 @@ class FakeCalendar:
 
         return current
 
+    def adjust_to_next_business_day_array(self, dates):
+        return [
+            self.adjust_to_next_business_day(d)
+            for d in np.asarray(dates, dtype="datetime64[D]").astype(object)
+        ]
+
     def adjust_previous_business_day(self, d: date) -> date:
         current = d
 
@@ -232,4 +253,167 @@ def test_ntnf_allows_overriding_notional_and_coupon_rate():
     ]
 
     assert interest_cashflows[0].amount == coupon_amount
-    assert principal_cashflows[0].amount == 2_000.0
\ No newline at end of file
+    assert principal_cashflows[0].amount == 2_000.0
+
+
+def schedule_batch_from_contracts(contracts) -> ScheduleBatch:
+    schedules = [contract.build_schedule() for contract in contracts]
+    offsets = np.cumsum([0] + [len(schedule) for schedule in schedules])
+
+    return ScheduleBatch(
+        offsets=offsets,
+        dates=np.asarray(
+            [d for schedule in schedules for d in schedule],
+            dtype="datetime64[D]",
+        ),
+    )
+
+
+def test_cashflow_batches_match_contract_cashflows():
+    as_of_date = date(2026, 3, 1)
+    ltns = [
+        LTNContract(date(2026, 1, 2), date(2027, 1, 1), FakeCalendar()),
+        LTNContract(date(2025, 1, 2), date(2026, 1, 1), FakeCalendar()),
+    ]
+    ntnfs = [
+        NTNFContract(date(2026, 1, 2), date(2029, 1, 1), FakeCalendar(), FakeDayCount()),
+        NTNFContract(date(2024, 1, 2), date(2027, 1, 1), FakeCalendar(), FakeDayCount()),
+    ]
+    lfts = [
+        LFTContract(date(2026, 1, 2), date(2029, 3, 1), FakeCalendar()),
+    ]
+    ntnbs = [
+        NTNBContract(date(2026, 1, 2), date(2035, 5, 15), FakeCalendar(), FakeDayCount()),
+        NTNBContract(date(2024, 1, 2), date(2028, 8, 15), FakeCalendar(), FakeDayCount()),
+    ]
+
+    for contracts, build_batch in [
+        (ltns, build_ltn_cashflow_batch),
+        (ntnfs, build_ntnf_cashflow_batch),
+        (lfts, build_lft_cashflow_batch),
+        (ntnbs, build_ntnb_cashflow_batch),
+    ]:
+        batch = build_batch(
+            schedule_batch_from_contracts(contracts),
+            issue_dates=[contract.start_date for contract in contracts],
+            as_of_dates=as_of_date,
+        )
+
+        assert batch.to_cashflow_lists() == [
+            contract.build_cashflows(as_of_date=as_of_date)
+            for contract in contracts
+        ]
+
+
+def test_contract_cashflows_from_cache_match_uncached_build():
+    calendar = FakeCalendar()
+    cache = CashflowCache()
+    contracts = [
+        LTNContract(date(2026, 1, 2), date(2027, 1, 4), calendar, cashflow_cache=cache),
+        NTNFContract(
+            date(2024, 1, 2),
+            date(2029, 1, 1),
+            calendar,
+            FakeDayCount(),
+            cashflow_cache=cache,
+        ),
+    ]
+
+    for contract in contracts:
+        uncached = replace(contract, cashflow_cache=None)
+
+        for as_of_date in [date(2025, 6, 1), date(2026, 1, 2), date(2026, 3, 15)]:
+            assert contract.build_cashflows(as_of_date) == uncached.build_cashflows(
+                as_of_date
+            )
+
+    assert cache.info().misses == 2
+    assert cache.info().hits == 4
+
+
+def test_contracts_with_different_terms_use_different_cache_entries():
+    calendar = FakeCalendar()
+    cache = CashflowCache()
+
+    for coupon_rate in [0.10, 0.12]:
+        NTNFContract(
+            date(2024, 1, 2),
+            date(2029, 1, 1),
+            calendar,
+            FakeDayCount(),
+            coupon_rate=coupon_rate,
+            cashflow_cache=cache,
+        ).build_cashflows(date(2025, 1, 1))
+
+    assert cache.info().misses == 2
+    assert len(cache) == 2
+
+
+def test_ntnb_pays_semiannual_coupons_on_the_fifteenth():
+    contract = NTNBContract(
+        start_date=date(2026, 1, 2),
+        maturity_date=date(2027, 5, 15),
+        calendar=FakeCalendar(),
+        day_count=FakeDayCount(),
+    )
+
+    cashflows = contract.build_cashflows(as_of_date=date(2026, 1, 2))
+    coupon = DEFAULT_PUBLIC_BOND_NOTIONAL * ((1.0 + DEFAULT_NTNB_COUPON_RATE) ** 0.5 - 1.0)
+
+    assert contract.build_schedule() == [
+        date(2026, 1, 2),
+        date(2026, 5, 15),
+        date(2026, 11, 16),
+        date(2027, 5, 17),
+    ]
+    assert [cf.amount for cf in cashflows if cf.cashflow_type == CashflowType.INTEREST] == (
+        pytest.approx([coupon] * 3)
+    )
+    assert ntnb_coupon_months(8) == (2, 8)
+    assert contract.cache_key[0] == "NTN-B"
+
+
+def test_ntnb_schedule_rule_matches_contract_schedule():
+    contracts = [
+        NTNBContract(date(2026, 1, 2), date(2035, 5, 15), FakeCalendar(), FakeDayCount()),
+        NTNBContract(date(2024, 3, 20), date(2030, 8, 15), FakeCalendar(), FakeDayCount()),
+    ]
+
+    batch = build_schedule_batch(
+        start_dates=[contract.start_date for contract in contracts],
+        maturity_dates=[contract.maturity_date for contract in contracts],
+        rules=[ntnb_schedule_rule(contract.maturity_date.month) for contract in contracts],
+        calendar=FakeCalendar(),
+    )
+
+    assert [batch.schedule(i) for i in range(len(contracts))] == [
+        contract.build_schedule() for contract in contracts
+    ]
+
+
+def test_lft_has_single_principal_under_its_own_cache_key():
+    contract = LFTContract(date(2026, 1, 2), date(2029, 3, 1), FakeCalendar())
+
+    cashflows = contract.build_cashflows(as_of_date=date(2026, 1, 2))
+
+    assert [cf.amount for cf in cashflows] == [DEFAULT_PUBLIC_BOND_NOTIONAL]
+    assert contract.cache_key[0] == "LFT"
+    assert contract.cache_key != LTNContract(
+        date(2026, 1, 2), date(2029, 3, 1), contract.calendar
+    ).cache_key
+
+
+def test_indexed_notional_compounds_from_anchor_in_both_directions():
+    table = CumulativeIndexTable(
+        business_dates=np.array(["2026-01-02", "2026-01-05", "2026-01-06"], dtype="datetime64[D]"),
+        log_increments=np.log([1.01, 1.02, 1.03]),
+    )
+    vna = IndexedNotional(index_table=table, anchor_date=date(2026, 1, 5), anchor_value=2000.0)
+
+    values = vna.values(
+        np.array(["2026-01-02", "2026-01-05", "2026-01-07", "2026-02-01"], dtype="datetime64[D]")
+    )
+
+    assert values[:3] == pytest.approx([2000.0 / 1.01, 2000.0, 2000.0 * 1.02 * 1.03])
+    assert np.isnan(values[3])
+    assert vna.notional_factors([date(2026, 1, 5)]) == pytest.approx([2.0])
@@ -0,0 +1,105 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from engine_product.pricing.cashflow_arrays import build_cashflow_schedule_lookup
+from engine_product.pricing.cashflow_store import CashflowStore
+
+
+def make_dimension():
+    return pd.DataFrame(
+        [
+            {"isin": "NTNF", "payment_bd_index": 504, "amount": 1000.0},
+            {"isin": "NTNF", "payment_bd_index": 252, "amount": 50.0},
+            {"isin": "NTNF", "payment_bd_index": 504, "amount": 50.0},
+            {"isin": "LTN", "payment_bd_index": 300, "amount": 1000.0},
+            {"isin": "NTNF", "payment_bd_index": 126, "amount": 50.0},
+        ]
+    )
+
+
+def test_store_matches_schedule_lookup():
+    dimension = make_dimension()
+    store = CashflowStore.from_cashflow_dimension(dimension)
+    lookup = build_cashflow_schedule_lookup(dimension)
+
+    assert store.isins.tolist() == ["LTN", "NTNF"]
+    assert store.offsets.tolist() == [0, 1, 4]
+
+    for isin, schedule in lookup.items():
+        stored = store.schedule(isin)
+        assert stored.payment_bd_index.tolist() == schedule.payment_bd_index.tolist()
+        assert stored.amount.tolist() == schedule.amount.tolist()
+
+    assert store.schedule("MISSING") is None
+
+
+def test_future_slices_match_per_isin_filtering():
+    dimension = make_dimension()
+    store = CashflowStore.from_cashflow_dimension(dimension)
+    lookup = build_cashflow_schedule_lookup(dimension)
+
+    isins = ["NTNF", "LTN", "NTNF", "NTNF", "LTN", "NTNF", "MISSING"]
+    ref_bd = [0, 0, 126, 300, 300, 600, 0]
+
+    slices = store.future_slices(store.isin_codes(isins), ref_bd)
+
+    assert slices.found.tolist() == [True] * 6 + [False]
+    assert slices.counts.tolist() == [3, 1, 2, 1, 0, 0, 0]
+
+    for index, (isin, ref) in enumerate(zip(isins[:-1], ref_bd[:-1])):
+        tenor_bd, amounts = slices.row(index)
+        expected_tenors, expected_amounts = lookup[isin].future_arrays_as_of(ref)
+
+        assert tenor_bd.tolist() == expected_tenors.tolist()
+        assert amounts.tolist() == expected_amounts.tolist()
+
+
+def test_future_slices_convert_to_ragged_cashflows():
+    store = CashflowStore.from_cashflow_dimension(make_dimension())
+    slices = store.future_slices(store.isin_codes(["NTNF"]), 0)
+
+    ragged = slices.to_ragged_cashflows()
+
+    assert ragged.offsets.tolist() == [0, 3]
+    assert ragged.times.tolist() == pytest.approx([0.5, 1.0, 2.0])
+    assert slices.time_amount_pairs(0) == ((0.5, 50.0), (1.0, 50.0), (2.0, 1050.0))
+
+
+@pytest.mark.parametrize("mmap", [True, False])
+def test_store_round_trips_through_single_file(tmp_path, mmap):
+    store = CashflowStore.from_cashflow_dimension(make_dimension())
+    path = tmp_path / "cashflows.cfstore"
+
+    store.save(path)
+    loaded = CashflowStore.load(path, mmap=mmap)
+
+    assert loaded.isins.tolist() == store.isins.tolist()
+    np.testing.assert_array_equal(loaded.offsets, store.offsets)
+    np.testing.assert_array_equal(loaded.payment_bd_index, store.payment_bd_index)
+    np.testing.assert_array_equal(loaded.amount, store.amount)
+    np.testing.assert_array_equal(loaded.search_keys, store.search_keys)
+
+    if mmap:
+        assert isinstance(loaded.amount, np.memmap)
+        assert isinstance(loaded.search_keys, np.memmap)
+
+    slices = loaded.future_slices(loaded.isin_codes(["NTNF"]), 126)
+    assert slices.tenor_bd.tolist() == [126, 378]
+
+
+def test_empty_store_finds_nothing():
+    store = CashflowStore.from_cashflow_dimension(
+        pd.DataFrame(columns=["isin", "payment_bd_index", "amount"])
+    )
+
+    slices = store.future_slices(store.isin_codes(["ABC"]), 0)
+
+    assert len(store) == 0
+    assert slices.found.tolist() == [False]
+    assert slices.counts.tolist() == [0]
+
+
+def test_store_requires_dimension_columns():
+    with pytest.raises(ValueError, match="missing required columns"):
+        CashflowStore.from_cashflow_dimension(pd.DataFrame({"isin": ["ABC"]}))
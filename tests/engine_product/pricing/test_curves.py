@@ -0,0 +1,67 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from engine_product.pricing import (
+    CashflowMatrix,
+    CashflowStore,
+    LogLinearDiscountCurve,
+    price_from_time_amount_pairs,
+    reprice_bonds,
+)
+
+
+def make_store():
+    return CashflowStore.from_cashflow_dimension(
+        pd.DataFrame(
+            [
+                {"isin": "LTN", "payment_bd_index": 504, "amount": 1000.0},
+                {"isin": "NTNF", "payment_bd_index": 252, "amount": 50.0},
+                {"isin": "NTNF", "payment_bd_index": 504, "amount": 1050.0},
+            ]
+        )
+    )
+
+
+def flat_curve(rate: float) -> LogLinearDiscountCurve:
+    return LogLinearDiscountCurve(
+        node_tenor_bd=[252.0],
+        node_log_discount=[-np.log1p(rate)],
+    )
+
+
+def test_log_linear_curve_interpolates_and_extrapolates_last_forward():
+    curve = LogLinearDiscountCurve.from_discount_factors([252, 504], [0.90, 0.80])
+
+    assert curve.discount_factors([126, 252, 378, 504]) == pytest.approx(
+        [0.90**0.5, 0.90, np.sqrt(0.90 * 0.80), 0.80]
+    )
+    assert curve.discount_factors([756]) == pytest.approx([0.80 * 0.80 / 0.90])
+
+
+def test_cashflow_matrix_prices_like_time_amount_pairs():
+    slices = make_store().future_slices([0, 1], 0)
+    matrix = CashflowMatrix.from_slices(slices)
+
+    prices = matrix.price(flat_curve(0.10))
+
+    assert matrix.tenor_bd.tolist() == [252, 504]
+    assert prices == pytest.approx(
+        [
+            price_from_time_amount_pairs(slices.time_amount_pairs(i), 0.10)
+            for i in range(len(slices))
+        ]
+    )
+
+
+def test_reprice_bonds_against_many_curves_in_one_matmul():
+    slices = make_store().future_slices([0, 1, -1], 252)
+    curves = [flat_curve(0.10), flat_curve(0.12)]
+
+    prices = reprice_bonds(slices, curves)
+
+    assert prices.shape == (3, 2)
+    assert prices[:, 1] == pytest.approx(reprice_bonds(slices, curves[1]))
+    assert prices[0] == pytest.approx([1000.0 / 1.10, 1000.0 / 1.12])
+    assert prices[2].tolist() == [0.0, 0.0]
+
@@ -6,8 +6,10 @@ from engine_product.cashflows.models import Cashflow, CashflowType
 from engine_product.pricing import YieldProblem
 from engine_product.pricing.yield_solvers import YieldSolverMethod, yield_to_maturity_batch
 from engine_product.pricing.yield_solvers_batch import (
+    BatchBracketConfig,
     BatchNewtonConfig,
     BatchYieldSolver,
+    RaggedCashflows,
 )
 
 ACCEPTED_ERROR = 1e-10
@@ -36,9 +38,11 @@ class TrackingBatchYieldSolver(BatchYieldSolver):
         super().__init__()
         object.__setattr__(self, "group_sizes", [])
 
-    def _solve_multi_cashflows_with_newton_batch(self, items, results):
-        self.group_sizes.append(len(items[0][1].time_amount_pairs))
-        return super()._solve_multi_cashflows_with_newton_batch(items, results)
+    def _solve_multi_cashflows_with_newton_batch(self, items, results, **kwargs):
+        self.group_sizes.append(
+            [len(problem.time_amount_pairs) for _, problem in items]
+        )
+        return super()._solve_multi_cashflows_with_newton_batch(items, results, **kwargs)
 
 
 def make_single_problem(amount=1100.0, market_price=1000.0):
@@ -145,7 +149,7 @@ def test_batch_keeps_processing_after_single_cashflow_failure():
     assert results[1].result.ytm == pytest.approx(0.10, abs=ACCEPTED_ERROR)
 
 
-def test_batch_falls_back_to_unit_solver_when_newton_batch_fails():
+def test_batch_bisects_when_newton_batch_fails():
     solver = BatchYieldSolver(
         newton=BatchNewtonConfig(
             initial_guess=9.0,
@@ -159,6 +163,33 @@ def test_batch_falls_back_to_unit_solver_when_newton_batch_fails():
 
     results = solver.solve_many([make_coupon_problem()])
 
+    assert len(results) == 1
+    assert results[0].succeeded is True
+    assert results[0].result.ytm == pytest.approx(0.10, abs=ACCEPTED_ERROR)
+    assert results[0].result.method == YieldSolverMethod.BISECTION_BATCH
+
+
+def test_batch_bisection_expands_upper_bound():
+    solver = BatchYieldSolver(newton=BatchNewtonConfig(maxiter=1))
+    problem = YieldProblem.from_time_amount_pairs(
+        time_amount_pairs=[(1.0, 50.0), (2.0, 1050.0)],
+        market_price=50.0 / 3.0 + 1050.0 / 9.0,
+    )
+
+    results = solver.solve_many([problem])
+
+    assert results[0].result.method == YieldSolverMethod.BISECTION_BATCH
+    assert results[0].result.ytm == pytest.approx(2.0, abs=1e-9)
+
+
+def test_batch_falls_back_to_unit_solver_when_batch_stages_fail():
+    solver = BatchYieldSolver(
+        newton=BatchNewtonConfig(initial_guess=9.0, maxiter=1),
+        bracket=BatchBracketConfig(maxiter=1),
+    )
+
+    results = solver.solve_many([make_coupon_problem()])
+
     assert len(results) == 1
     assert results[0].succeeded is True
     assert results[0].result.ytm == pytest.approx(0.10, abs=ACCEPTED_ERROR)
@@ -184,7 +215,7 @@ def test_batch_returns_individual_failure_when_batch_and_unit_solver_fail():
     assert results[0].error_type == "RuntimeError"
     assert results[0].error_message == "forced failure"
 
-def test_batch_groups_multi_cashflows_by_cashflow_count():
+def test_batch_solves_mixed_multi_cashflow_counts():
     two_cashflow_problem = YieldProblem.from_time_amount_pairs(
         time_amount_pairs=[
             (1.0, 50.0),
@@ -225,7 +256,7 @@ def test_batch_groups_multi_cashflows_by_cashflow_count():
     assert results[0].result.ytm == pytest.approx(0.10, abs=ACCEPTED_ERROR)
     assert results[1].result.ytm == pytest.approx(0.10, abs=ACCEPTED_ERROR)
 
-def test_batch_newton_splits_groups_by_cashflow_count():
+def test_batch_newton_solves_ragged_cashflow_counts_together():
     two_cashflow_problem = YieldProblem.from_time_amount_pairs(
         time_amount_pairs=[
             (1.0, 50.0),
@@ -252,9 +283,93 @@ def test_batch_newton_splits_groups_by_cashflow_count():
         ]
     )
 
-    assert solver.group_sizes == [2, 3]
+    assert solver.group_sizes == [[2, 3]]
     assert [item.succeeded for item in results] == [True, True]
     assert [item.result.method for item in results] == [
         YieldSolverMethod.NEWTON_BATCH,
         YieldSolverMethod.NEWTON_BATCH,
     ]
+
+
+def test_solve_arrays_matches_problem_yields_for_ragged_cashflows():
+    cashflows = RaggedCashflows(
+        offsets=[0, 2, 5],
+        times=[0.5, 1.5, 0.25, 1.25, 2.25],
+        amounts=[48.8, 1048.8, 48.8, 48.8, 1048.8],
+    )
+    ytms = [0.11, 0.13]
+    prices = [
+        48.8 / 1.11**0.5 + 1048.8 / 1.11**1.5,
+        48.8 / 1.13**0.25 + 48.8 / 1.13**1.25 + 1048.8 / 1.13**2.25,
+    ]
+
+    solution = BatchYieldSolver().solve_arrays(cashflows, prices)
+
+    assert solution.solved.tolist() == [True, True]
+    assert solution.method == [YieldSolverMethod.NEWTON_BATCH] * 2
+    assert solution.ytm == pytest.approx(ytms, abs=ACCEPTED_ERROR)
+
+
+def test_ragged_cashflows_take_reorders_problems():
+    cashflows = RaggedCashflows(
+        offsets=[0, 2, 3, 5],
+        times=[0.5, 1.5, 1.0, 0.25, 1.25],
+        amounts=[1.0, 2.0, 3.0, 4.0, 5.0],
+    )
+
+    taken = cashflows.take([2, 0])
+
+    assert taken.offsets.tolist() == [0, 2, 4]
+    assert taken.times.tolist() == [0.25, 1.25, 0.5, 1.5]
+    assert taken.time_amount_pairs(1) == ((0.5, 1.0), (1.5, 2.0))
+
+
+def test_solve_ragged_matches_solve_many_without_problem_objects():
+    cashflows = RaggedCashflows(
+        offsets=[0, 1, 3, 3, 4],
+        times=[2.0, 0.5, 1.5, 1.0],
+        amounts=[1000.0, 48.8, 1048.8, 1000.0],
+    )
+    prices = [1000.0 / 1.10**2, 48.8 / 1.11**0.5 + 1048.8 / 1.11**1.5, 100.0, -5.0]
+
+    solution = BatchYieldSolver(unit_solver=AlwaysFailSolver()).solve_ragged(
+        cashflows,
+        prices,
+    )
+
+    assert solution.solved.tolist() == [True, True, False, False]
+    assert solution.method[:2] == [
+        YieldSolverMethod.ZERO_COUPON,
+        YieldSolverMethod.NEWTON_BATCH,
+    ]
+    assert solution.ytm[:2] == pytest.approx([0.10, 0.11], abs=ACCEPTED_ERROR)
+    assert solution.error_type == [None, None, "ValueError", "ValueError"]
+    assert "at least one valid future cashflow" in solution.error_message[2]
+    assert "single cashflow batch solve" in solution.error_message[3]
+
+
+def test_warm_start_reduces_newton_iterations():
+    problems = [make_coupon_problem(), make_coupon_problem()]
+
+    results = yield_to_maturity_batch(
+        problems,
+        solver=BatchYieldSolver(newton=BatchNewtonConfig(initial_guess=0.30)),
+        initial_guesses=[0.1001, None],
+    )
+
+    assert [item.result.ytm for item in results] == pytest.approx(
+        [0.10, 0.10],
+        abs=ACCEPTED_ERROR,
+    )
+    assert results[0].result.iterations < results[1].result.iterations
+
+
+def test_initial_guess_vector_falls_back_to_static_guess():
+    solver = BatchYieldSolver(newton=BatchNewtonConfig(initial_guess=0.10, upper=10.0))
+
+    guesses = solver.initial_guess_vector([0.12, None, float("nan"), 50.0], 4)
+
+    assert guesses.tolist() == [0.12, 0.10, 0.10, 0.10]
+
+    with pytest.raises(ValueError, match="aligned"):
+        solver.initial_guess_vector([0.12], 2)
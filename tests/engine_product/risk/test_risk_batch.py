@@ -0,0 +1,111 @@
+from datetime import date
+
+import numpy as np
+import pytest
+
+from engine_product.cashflows.models import Cashflow, CashflowType
+from engine_product.pricing import (
+    macaulay_duration_from_time_amount_pairs,
+    price_from_time_amount_pairs,
+)
+from engine_product.risk import (
+    bond_risk_batch,
+    bond_risk_from_time_amount_pairs,
+    modified_duration,
+    modified_duration_from_derivative,
+)
+
+
+class FakeDayCount:
+    def year_fraction(self, start: date, end: date) -> float:
+        return (end - start).days / 365.0
+
+
+BONDS = [
+    ((0.5, 48.8), (1.0, 48.8), (1.5, 1048.8)),
+    ((0.75, 1000.0),),
+    ((0.25, 50.0), (2.0, 1050.0)),
+]
+YTMS = np.array([0.11, 0.095, 0.13])
+
+
+def test_csr_batch_matches_scalar_price_and_duration():
+    risk = bond_risk_from_time_amount_pairs(BONDS, YTMS)
+
+    for i, (pairs, ytm) in enumerate(zip(BONDS, YTMS)):
+        assert risk.price[i] == pytest.approx(price_from_time_amount_pairs(pairs, ytm))
+        assert risk.macaulay_duration[i] == pytest.approx(
+            macaulay_duration_from_time_amount_pairs(pairs, ytm)
+        )
+        assert risk.modified_duration[i] == pytest.approx(
+            risk.macaulay_duration[i] / (1.0 + ytm)
+        )
+
+
+def test_padded_batch_matches_csr_batch():
+    width = max(len(pairs) for pairs in BONDS)
+    times = np.full((len(BONDS), width), np.nan)
+    amounts = np.zeros((len(BONDS), width))
+
+    for i, pairs in enumerate(BONDS):
+        times[i, : len(pairs)] = [t for t, _ in pairs]
+        amounts[i, : len(pairs)] = [a for _, a in pairs]
+
+    padded = bond_risk_batch(times, amounts, YTMS)
+    csr = bond_risk_from_time_amount_pairs(BONDS, YTMS)
+
+    np.testing.assert_allclose(padded.price, csr.price)
+    np.testing.assert_allclose(padded.convexity, csr.convexity)
+    np.testing.assert_allclose(padded.dv01, csr.dv01)
+
+
+def test_convexity_and_dv01_match_finite_differences():
+    risk = bond_risk_from_time_amount_pairs(BONDS, YTMS)
+    h = 1e-5
+
+    for i, (pairs, ytm) in enumerate(zip(BONDS, YTMS)):
+        up = price_from_time_amount_pairs(pairs, ytm + h)
+        mid = price_from_time_amount_pairs(pairs, ytm)
+        down = price_from_time_amount_pairs(pairs, ytm - h)
+
+        assert risk.convexity[i] == pytest.approx(
+            (up - 2.0 * mid + down) / (h * h) / mid,
+            rel=1e-4,
+        )
+        assert risk.dv01[i] == pytest.approx((down - up) / (2.0 * h) * 1e-4, rel=1e-6)
+
+
+def test_batch_matches_cashflow_modified_duration():
+    settlement = date(2026, 1, 2)
+    cashflows = [
+        Cashflow(date(2026, 7, 1), 48.8, CashflowType.INTEREST),
+        Cashflow(date(2027, 1, 4), 1048.8, CashflowType.PRINCIPAL),
+    ]
+    day_count = FakeDayCount()
+    pairs = [
+        (day_count.year_fraction(settlement, cf.payment_date), cf.amount)
+        for cf in cashflows
+    ]
+
+    risk = bond_risk_from_time_amount_pairs([pairs], 0.12)
+
+    assert risk.modified_duration[0] == pytest.approx(
+        modified_duration(cashflows, 0.12, settlement, day_count)
+    )
+    assert risk.modified_duration[0] == pytest.approx(
+        modified_duration_from_derivative(cashflows, 0.12, settlement, day_count)
+    )
+
+
+def test_bonds_without_future_cashflows_get_nan_analytics():
+    risk = bond_risk_from_time_amount_pairs([((1.0, 1000.0),), ()], 0.10)
+
+    assert np.isfinite(risk.macaulay_duration[0])
+    assert risk.price[1] == 0.0
+    assert np.isnan(risk.macaulay_duration[1])
+    assert np.isnan(risk.dv01[1])
+
+
+def test_batch_rejects_yield_below_minus_one():
+    with pytest.raises(ValueError, match="ytm"):
+        bond_risk_from_time_amount_pairs(BONDS, [0.1, -1.0, 0.1])
@@ -0,0 +1,88 @@
+from datetime import date
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from engine_product.calendars.business_calendar import BusinessCalendar
+from engine_product.calendars.repository import ArrayCalendarRepository
+from engine_product.instruments.public_bonds import (
+    LTN_SCHEDULE_RULE,
+    NTNF_SCHEDULE_RULE,
+    LTNContract,
+    NTNFContract,
+)
+from engine_product.schedules.batch import BatchScheduleRule, build_schedule_batch
+
+
+def make_calendar(start: date = date(2025, 12, 1), end: date = date(2029, 1, 31)):
+    dates = pd.date_range(start, end, freq="D").date
+    holidays = {date(2026, 1, 1), date(2027, 1, 1), date(2028, 1, 1), date(2029, 1, 1)}
+    is_business_day = [d.weekday() < 5 and d not in holidays for d in dates]
+
+    df = pd.DataFrame(
+        {
+            "calendar_id": "BR_ANBIMA",
+            "date": dates,
+            "is_business_day": is_business_day,
+            "act_index": range(len(dates)),
+            "bd_index": pd.Series(is_business_day).cumsum() - 1,
+        }
+    )
+
+    return BusinessCalendar(ArrayCalendarRepository(df))
+
+
+def test_batch_schedules_match_contract_schedules():
+    calendar = make_calendar()
+    contracts = [
+        LTNContract(start_date=date(2026, 1, 2), maturity_date=date(2027, 1, 1), calendar=calendar),
+        NTNFContract(
+            start_date=date(2026, 1, 2),
+            maturity_date=date(2029, 1, 1),
+            calendar=calendar,
+            day_count=None,
+        ),
+        NTNFContract(
+            start_date=date(2026, 3, 10),
+            maturity_date=date(2027, 1, 1),
+            calendar=calendar,
+            day_count=None,
+        ),
+    ]
+
+    batch = build_schedule_batch(
+        start_dates=[c.start_date for c in contracts],
+        maturity_dates=[c.maturity_date for c in contracts],
+        rules=[LTN_SCHEDULE_RULE, NTNF_SCHEDULE_RULE, NTNF_SCHEDULE_RULE],
+        calendar=calendar,
+    )
+
+    assert len(batch) == 3
+    assert batch.dates.dtype == np.dtype("datetime64[D]")
+
+    for i, contract in enumerate(contracts):
+        assert batch.schedule(i) == contract.build_schedule()
+
+
+def test_batch_schedule_offsets_and_unadjusted_dates():
+    batch = build_schedule_batch(
+        start_dates=[date(2026, 1, 2), date(2026, 1, 2)],
+        maturity_dates=[date(2026, 7, 1), date(2027, 1, 1)],
+        rules=BatchScheduleRule(months=(1, 7), include_start=True),
+        adjustment="unadjusted",
+    )
+
+    assert batch.offsets.tolist() == [0, 2, 5]
+    assert batch.owner.tolist() == [0, 0, 1, 1, 1]
+    assert batch.schedule(1) == [date(2026, 1, 2), date(2026, 7, 1), date(2027, 1, 1)]
+
+
+def test_batch_schedule_rejects_mismatched_rules():
+    with pytest.raises(ValueError):
+        build_schedule_batch(
+            start_dates=[date(2026, 1, 2)],
+            maturity_dates=[date(2027, 1, 1)],
+            rules=[LTN_SCHEDULE_RULE, LTN_SCHEDULE_RULE],
+            adjustment="unadjusted",
+        )
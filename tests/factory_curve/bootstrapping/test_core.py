@@ -7,6 +7,7 @@ import pytest
 from factory_curve.bootstrapping.core import (
     BootstrapConfig,
     PublicBondBootstrapper,
+    bootstrap_discount_curve,
     bootstrap_public_bond_curves,
 )
 
@@ -34,6 +35,13 @@ def _cashflows() -> pd.DataFrame:
     )
 
 
+def _load(partitions) -> pd.DataFrame:
+    return pd.concat(
+        [calculate() for _, calculate in sorted(partitions.items())],
+        ignore_index=True,
+    )
+
+
 def _curve_inputs() -> pd.DataFrame:
     d1, d2, d3 = 0.90, 0.80, 0.70
     d_630 = np.exp(0.5 * (np.log(d2) + np.log(d3)))
@@ -68,7 +76,7 @@ def _curve_inputs() -> pd.DataFrame:
 
 
 def test_bootstrap_recovers_discount_pillars_and_reprices_coupon_bonds() -> None:
-    curves, diagnostics = bootstrap_public_bond_curves(
+    partitions, diagnostics = bootstrap_public_bond_curves(
         curve_inputs=_curve_inputs(),
         cashflow_dimension=_cashflows(),
         calendar_df=_calendar(),
@@ -79,6 +87,8 @@ def test_bootstrap_recovers_discount_pillars_and_reprices_coupon_bonds() -> None
         },
     )
 
+    curves = _load(partitions)
+    assert list(partitions) == ["batch_00000"]
     assert curves["ref_date"].unique().tolist() == [
         pd.Timestamp("2020-01-02")
     ]
@@ -109,6 +119,24 @@ def test_bootstrapper_builds_static_cashflow_lookup_only_at_initialization() ->
     assert result.curve["bootstrap_pillar_count"].iat[0] == 3
 
 
+def test_bootstrapper_reuses_prebuilt_lookups() -> None:
+    built = PublicBondBootstrapper(cashflow_dimension=_cashflows(), calendar_df=_calendar())
+
+    reused = PublicBondBootstrapper.from_lookups(
+        cashflow_store=built.cashflow_store,
+        calendar_index=built.calendar_index,
+    )
+
+    assert reused.cashflow_store is built.cashflow_store
+    assert reused.calendar_index is built.calendar_index
+    with pytest.raises(ValueError, match="exactly one of cashflow_dimension"):
+        PublicBondBootstrapper(
+            cashflow_dimension=_cashflows(),
+            cashflow_store=built.cashflow_store,
+            calendar_df=_calendar(),
+        )
+
+
 def test_batch_records_date_failure_without_stopping_other_dates() -> None:
     invalid = pd.DataFrame(
         [
@@ -120,14 +148,14 @@ def test_batch_records_date_failure_without_stopping_other_dates() -> None:
             }
         ]
     )
-    curves, diagnostics = bootstrap_public_bond_curves(
+    partitions, diagnostics = bootstrap_public_bond_curves(
         curve_inputs=invalid,
         cashflow_dimension=_cashflows(),
         calendar_df=_calendar(),
         parameters={"show_progress": False},
     )
 
-    assert curves.empty
+    assert partitions == {}
     assert diagnostics.loc[0, "status"] == "FAILED"
     assert "Cashflow dimension not found" in diagnostics.loc[0, "error_message"]
 
@@ -156,15 +184,182 @@ def test_instruments_with_same_maturity_share_one_fitted_pillar() -> None:
         ]
     )
 
-    curves, diagnostics = bootstrap_public_bond_curves(
+    partitions, diagnostics = bootstrap_public_bond_curves(
         curve_inputs=observations,
         cashflow_dimension=cashflows,
         calendar_df=_calendar(),
         parameters={"max_years": 1, "show_progress": False},
     )
 
-    assert curves.set_index("tenor_bd").loc[252, "discount_factor"] == (
+    assert _load(partitions).set_index("tenor_bd").loc[252, "discount_factor"] == (
         pytest.approx(0.90, abs=1.0e-8)
     )
     assert set(diagnostics["status"]) == {"BOOTSTRAPPED_SHARED_PILLAR"}
     assert diagnostics["price_error"].abs().max() < 1.0e-5
+
+
+def test_bootstrap_discount_curve_reprices_bonds_off_the_grid() -> None:
+    bootstrapper = PublicBondBootstrapper(
+        cashflow_dimension=_cashflows(),
+        calendar_df=_calendar(),
+        config=BootstrapConfig(max_years=3, show_progress=False),
+    )
+    observations = bootstrapper.prepare_inputs(_curve_inputs())
+    daily = observations.loc[
+        observations["ref_date"].eq(pd.Timestamp("2020-01-02"))
+    ]
+
+    result = bootstrapper.bootstrap(daily)
+    persisted = bootstrap_discount_curve(result.curve)
+
+    for curve in (result.discount_curve, persisted):
+        assert curve.discount_factors([252, 504, 756]) == pytest.approx(
+            [0.90, 0.80, 0.70]
+        )
+        assert curve.discount_factors([630]) == pytest.approx(
+            result.curve.set_index("tenor_bd").loc[[630], "discount_factor"]
+        )
+
+
+def test_bootstrap_many_solves_dates_independently_and_keeps_failures() -> None:
+    bootstrapper = PublicBondBootstrapper(
+        cashflow_dimension=_cashflows(),
+        calendar_df=_calendar(),
+        config=BootstrapConfig(max_years=3, show_progress=False),
+    )
+    observations = pd.concat(
+        [
+            _curve_inputs(),
+            pd.DataFrame(
+                [
+                    {
+                        "ref_date": "2020-01-03",
+                        "instrument_type": "LTN",
+                        "isin": "LTN1",
+                        "market_pu": 2500.0,
+                    },
+                    {
+                        "ref_date": "2020-01-06",
+                        "instrument_type": "LTN",
+                        "isin": "LTN1",
+                        "market_pu": 950.0,
+                    },
+                ]
+            ),
+        ],
+        ignore_index=True,
+    )
+
+    result = bootstrapper.bootstrap_many(
+        bootstrapper.prepare_inputs(observations)
+    )
+
+    assert len(result) == 3
+    assert result.failed.tolist() == [False, True, True]
+    assert result.error_messages[1:] == (
+        "Market price cannot be matched inside discount-factor bounds "
+        "at tenor_bd=251",
+        "Calendar business-day index is missing for 2020-01-06",
+    )
+    node_tenors, _ = result.nodes(0)
+    assert node_tenors.tolist() == [0, 252, 504, 756]
+    assert result.discount_curve(0).discount_factors([504]) == pytest.approx(
+        [0.80]
+    )
+    assert result.diagnostics["status"].tolist() == [
+        "BOOTSTRAPPED",
+        "BOOTSTRAPPED",
+        "BOOTSTRAPPED",
+        "FAILED",
+        "FAILED",
+    ]
+
+
+def test_shared_pillar_minimizes_squared_price_errors() -> None:
+    cashflows = pd.DataFrame(
+        [
+            {"isin": "A", "payment_bd_index": 252, "amount": 1000.0},
+            {"isin": "B", "payment_bd_index": 252, "amount": 2000.0},
+        ]
+    )
+    observations = pd.DataFrame(
+        {
+            "ref_date": "2020-01-02",
+            "instrument_type": "LTN",
+            "isin": ["A", "B"],
+            "market_pu": [900.0, 1820.0],
+        }
+    )
+
+    _, diagnostics = bootstrap_public_bond_curves(
+        curve_inputs=observations,
+        cashflow_dimension=cashflows,
+        calendar_df=_calendar(),
+        parameters={"max_years": 1, "show_progress": False},
+    )
+
+    expected = (1000.0 * 900.0 + 2000.0 * 1820.0) / (1000.0**2 + 2000.0**2)
+    assert diagnostics["discount_factor"].tolist() == pytest.approx(
+        [expected, expected], abs=1.0e-12
+    )
+    assert diagnostics["fitted_price"].tolist() == pytest.approx(
+        [1000.0 * expected, 2000.0 * expected]
+    )
+
+
+def test_curves_are_lazy_partitions_of_batch_size_solved_dates() -> None:
+    observations = pd.concat(
+        [
+            _curve_inputs(),
+            _curve_inputs().iloc[1:].assign(ref_date="2020-01-03"),
+        ],
+        ignore_index=True,
+    )
+
+    partitions, _ = bootstrap_public_bond_curves(
+        observations,
+        _cashflows(),
+        _calendar(),
+        {"max_years": 3, "batch_size": 1, "show_progress": False},
+    )
+
+    assert list(partitions) == ["batch_00000", "batch_00001"]
+    assert all(callable(calculate) for calculate in partitions.values())
+    assert [
+        partitions[key]()["ref_date"].unique().tolist() for key in sorted(partitions)
+    ] == [[pd.Timestamp("2020-01-02")], [pd.Timestamp("2020-01-03")]]
+
+
+def test_process_pool_output_matches_serial_run() -> None:
+    observations = pd.concat(
+        [
+            _curve_inputs(),
+            _curve_inputs().assign(ref_date="2020-01-03"),
+            pd.DataFrame(
+                [
+                    {
+                        "ref_date": "2020-01-06",
+                        "instrument_type": "LTN",
+                        "isin": "LTN1",
+                        "market_pu": 950.0,
+                    }
+                ]
+            ),
+        ],
+        ignore_index=True,
+    )
+    parameters = {"max_years": 3, "show_progress": False}
+
+    serial = bootstrap_public_bond_curves(
+        observations, _cashflows(), _calendar(), {**parameters, "workers": 1}
+    )
+    parallel = bootstrap_public_bond_curves(
+        observations, _cashflows(), _calendar(), {**parameters, "workers": 2}
+    )
+
+    assert serial[1]["status"].tolist()[-1] == "FAILED"
+    assert list(parallel[0]) == list(serial[0])
+    pd.testing.assert_frame_equal(
+        _load(parallel[0]), _load(serial[0]), check_exact=True
+    )
+    pd.testing.assert_frame_equal(parallel[1], serial[1], check_exact=True)
@@ -41,14 +41,18 @@ def test_data_treatment_pivots_all_methodologies_and_loads_batches() -> None:
         "batch_00000": _curve_frame(["2020-01-02"]),
     }
     outputs = data_treatment(
-        flat_forward_curves=_curve_frame(
-            ["2020-01-02", "2020-01-03"],
-            rate_column="zero_rate",
-        ),
-        bootstrapping_curves=_curve_frame(
-            ["2020-01-02", "2020-01-03"],
-            rate_column="zero_rate",
-        ),
+        flat_forward_curves={
+            "batch_00000": _curve_frame(
+                ["2020-01-02", "2020-01-03"],
+                rate_column="zero_rate",
+            )
+        },
+        bootstrapping_curves={
+            "batch_00000": lambda: _curve_frame(
+                ["2020-01-02", "2020-01-03"],
+                rate_column="zero_rate",
+            )
+        },
         nelson_siegel_curves=partitions,
         svensson_curves=partitions,
         kernel_ridge_curves=partitions,
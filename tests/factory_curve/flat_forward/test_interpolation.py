@@ -9,6 +9,7 @@ from factory_curve.flat_forward.interpolation import (
     FlatForwardInterpolator,
     PublicBondCurveBatchBuilder,
     interpolate_flat_forward,
+    interpolate_flat_forward_wide,
 )
 
 
@@ -29,6 +30,20 @@ def test_interpolation_preserves_observed_tenor_rates() -> None:
     )
 
 
+def test_discount_curve_matches_interpolated_grid() -> None:
+    interpolator = FlatForwardInterpolator(
+        FlatForwardConfig(max_years=3, business_days_per_year=2)
+    )
+    tenors, rates = [1.0, 2.0], [0.10, 0.20]
+
+    grid = interpolator.interpolate(tenors=tenors, rates=rates)
+    curve = interpolator.discount_curve(tenors=tenors, rates=rates)
+
+    assert curve.discount_factors(grid["tenor_bd"]) == pytest.approx(
+        grid["discount_factor"].to_numpy()
+    )
+
+
 def test_log_discount_factors_are_linear_inside_each_segment() -> None:
     curve = interpolate_flat_forward(
         tenors=[1.0, 2.0],
@@ -154,8 +169,118 @@ def test_batch_builder_filters_dates_and_builds_one_curve_per_reference_date() -
     assert result.groupby("ref_date")["source_tenor_count"].first().tolist() == [2, 1]
 
 
+def test_batch_builder_returns_lazy_partitions_of_batch_size_dates() -> None:
+    curve_inputs = pd.DataFrame(
+        {
+            "ref_date": ["2020-01-02", "2020-01-03", "2020-01-06"],
+            "instrument_type": ["LTN", "LTN", "LTN"],
+            "macaulay_duration": [1.0, 2.0, 1.0],
+            "market_ytm": [0.10, 0.20, 0.15],
+        }
+    )
+    builder = PublicBondCurveBatchBuilder(
+        interpolator=FlatForwardInterpolator(
+            FlatForwardConfig(max_years=2, business_days_per_year=1)
+        ),
+        batch_size=2,
+    )
+
+    partitions = builder.build_partitions(curve_inputs)
+
+    assert list(partitions) == ["batch_00000", "batch_00001"]
+    assert partitions["batch_00000"]()["ref_date"].nunique() == 2
+    assert partitions["batch_00001"]()["ref_date"].nunique() == 1
+    pd.testing.assert_frame_equal(
+        pd.concat(
+            [calculate() for calculate in partitions.values()],
+            ignore_index=True,
+        ),
+        builder.build(curve_inputs),
+    )
+    assert builder.build_partitions(curve_inputs.iloc[0:0]) == {}
+
+
 def test_batch_builder_rejects_missing_columns() -> None:
     builder = PublicBondCurveBatchBuilder()
 
     with pytest.raises(ValueError, match="Missing required columns"):
         builder.build(pd.DataFrame({"ref_date": ["2020-01-02"]}))
+
+
+def test_batch_builder_accepts_interpolators_without_interpolate_many() -> None:
+    class SingleCurveInterpolator:
+        def __init__(self, interpolator: FlatForwardInterpolator) -> None:
+            self._interpolator = interpolator
+
+        def interpolate(self, tenors, rates) -> pd.DataFrame:
+            return self._interpolator.interpolate(tenors, rates)
+
+    curve_inputs = pd.DataFrame(
+        {
+            "ref_date": ["2020-01-02", "2020-01-02", "2020-01-03"],
+            "instrument_type": ["LTN", "NTN-F", "LTN"],
+            "macaulay_duration": [1.0, 2.0, 1.5],
+            "market_ytm": [0.10, 0.12, 0.11],
+        }
+    )
+    interpolator = FlatForwardInterpolator(
+        FlatForwardConfig(max_years=3, business_days_per_year=2)
+    )
+
+    pd.testing.assert_frame_equal(
+        PublicBondCurveBatchBuilder(SingleCurveInterpolator(interpolator)).build(
+            curve_inputs
+        ),
+        PublicBondCurveBatchBuilder(interpolator).build(curve_inputs),
+        rtol=0.0,
+        atol=1.0e-15,
+    )
+
+
+def test_interpolate_many_matches_one_date_at_a_time() -> None:
+    interpolator = FlatForwardInterpolator(
+        FlatForwardConfig(max_years=3, business_days_per_year=4)
+    )
+    offsets = np.array([0, 3, 4, 7])
+    tenors = np.array([1.0, 0.5, 1.0, 2.0, 0.25, 2.5, 2.5])
+    rates = np.array([0.10, 0.08, 0.12, 0.09, 0.05, 0.11, 0.13])
+
+    matrices = interpolator.interpolate_many(offsets, tenors, rates)
+
+    assert matrices.zero_rate.shape == (3, 12)
+    for date in range(3):
+        curve = interpolator.interpolate(
+            tenors[offsets[date] : offsets[date + 1]],
+            rates[offsets[date] : offsets[date + 1]],
+        )
+        for column in ("zero_rate", "discount_factor", "forward_rate"):
+            np.testing.assert_allclose(
+                getattr(matrices, column)[date],
+                curve[column],
+                rtol=0.0,
+                atol=1.0e-15,
+            )
+    with pytest.raises(ValueError, match="at least one observation"):
+        interpolator.interpolate_many(np.array([0, 0, 7]), tenors, rates)
+
+
+def test_wide_curves_match_the_pivoted_long_batches() -> None:
+    curve_inputs = pd.DataFrame(
+        {
+            "ref_date": ["2020-01-02", "2020-01-02", "2020-01-03"],
+            "instrument_type": ["LTN", "NTN-F", "LTN"],
+            "macaulay_duration": [1.0, 2.0, 1.5],
+            "market_ytm": [0.10, 0.12, 0.11],
+        }
+    )
+    long = PublicBondCurveBatchBuilder(
+        interpolator=FlatForwardInterpolator(FlatForwardConfig(max_years=3))
+    ).build(curve_inputs)
+
+    wide = interpolate_flat_forward_wide(curve_inputs, max_years=3)
+
+    for column in ("zero_rate", "discount_factor", "forward_rate"):
+        expected = long.pivot(index="ref_date", columns="tenor_bd", values=column)
+        expected.columns = expected.columns.astype(str)
+        expected.columns.name = None
+        pd.testing.assert_frame_equal(wide[column], expected, check_exact=True)
@@ -3,13 +3,14 @@ from __future__ import annotations
 import numpy as np
 import pytest
 
+from engine_product.pricing import CashflowMatrix, DiscountCurve
 from factory_curve.kernel_ridge.core import (
     DailyCurveData,
     KernelRidgeConfig,
     fit_kernel_ridge_model,
     loocv_yield_error_squares,
 )
-from factory_curve.kernel_ridge.model import kernel_matrix
+from factory_curve.kernel_ridge.model import KernelRidgeDailyModel, kernel_matrix
 
 
 def test_delta_zero_kernel_matches_reference_formula() -> None:
@@ -140,3 +141,32 @@ def test_press_loocv_matches_explicit_leave_one_security_out() -> None:
         rtol=1.0e-8,
         atol=1.0e-14,
     )
+
+
+def test_daily_model_is_a_discount_curve_for_batch_repricing() -> None:
+    model = KernelRidgeDailyModel(
+        reference_date="2024-01-02",
+        alpha=0.1,
+        delta=0.0,
+        ridge=1.0,
+        business_days_per_year=252,
+        cashflow_tenors_bd=np.array([252, 504]),
+        coefficients=np.array([-0.05, -0.02]),
+        n_observations=2,
+        max_cashflow_bd=504,
+        price_rmse=0.0,
+        weighted_yield_rmse_approx=0.0,
+        max_abs_price_error=0.0,
+        condition_number=1.0,
+        source_isins=("LTN", "NTNF"),
+    )
+    matrix = CashflowMatrix(
+        tenor_bd=np.array([252, 504]),
+        amounts=np.array([[0.0, 1000.0], [50.0, 1050.0]]),
+    )
+
+    assert isinstance(model, DiscountCurve)
+    np.testing.assert_allclose(
+        matrix.price(model),
+        matrix.amounts @ model.discount_factors(matrix.tenor_bd),
+    )
@@ -124,6 +124,20 @@ def test_nelson_siegel_calculator_matches_model_loadings() -> None:
     ]
 
 
+def test_discount_curves_match_calculated_rates() -> None:
+    for calculator, model in (
+        (NelsonSiegelCurveCalculator(small_config()), make_ns_model()),
+        (SvenssonCurveCalculator(small_config()), make_svensson_model()),
+    ):
+        curve = calculator.calculate_curve(model)
+
+        discount_curve = calculator.discount_curve(model)
+
+        assert discount_curve.discount_factors(curve["tenor_bd"]) == pytest.approx(
+            (1.0 + curve["fitted_rate"].to_numpy()) ** -curve["tenor_years"].to_numpy()
+        )
+
+
 def test_svensson_calculator_matches_model_loadings() -> None:
     model = make_svensson_model()
     calculator = SvenssonCurveCalculator(small_config())
@@ -0,0 +1,91 @@
+from datetime import date
+
+import numpy as np
+import pytest
+
+from ml_ettj26.benchmarks.curve_factory import (
+    BASE_AXIS,
+    DATES_AXIS,
+    GRID_AXIS,
+    MODELS,
+    log_log_slope,
+    run_curve_factory_benchmarks,
+    scaling_cases,
+    scaling_exponents,
+    synthetic_curve_inputs,
+)
+from ml_ettj26.benchmarks.synthetic_market import SyntheticMarketConfig
+
+
+TINY_CONFIG = SyntheticMarketConfig(
+    start_date=date(2024, 1, 2),
+    ltn_per_day=5,
+    ntnf_per_day=3,
+    di1_contracts=4,
+    swap_vertices=(30, 360),
+    pricereport_filler_per_day=1,
+)
+
+FAST_DE = {"strategy": "best1bin", "popsize": 4, "maxiter": 3, "polish": False, "seed": 7}
+
+PARAMETERS = {
+    "flat_forward": {"batch_size": 2},
+    "bootstrapping": {"batch_size": 2},
+    "nelson_siegel": {"de": {**FAST_DE, "lambda_bounds": [[0.1793, 3.5866]]}},
+    "svensson": {
+        "de": {**FAST_DE, "lambda_bounds": [[0.3587, 3.5866], [0.1196, 0.2989]]},
+    },
+    "kernel_ridge": {},
+}
+
+
+def test_scaling_cases_sweep_one_axis_at_a_time():
+    cases = scaling_cases(dates=(2, 4), bonds_scales=(1,), max_years=(5, 10, 20))
+
+    assert [(case.axis, case.size) for case in cases] == [
+        (BASE_AXIS, "d2-b1-y5"),
+        (DATES_AXIS, "d4-b1-y5"),
+        (GRID_AXIS, "d2-b1-y10"),
+        (GRID_AXIS, "d2-b1-y20"),
+    ]
+
+
+def test_log_log_slope_recovers_power_laws():
+    x = np.array([10.0, 20.0, 40.0, 80.0])
+
+    assert log_log_slope(x, 3.0 * x) == pytest.approx(1.0)
+    assert log_log_slope(x, 0.5 * x**2) == pytest.approx(2.0)
+    assert log_log_slope(x, np.full(4, 7.0)) == pytest.approx(0.0)
+    assert log_log_slope([10.0, 10.0], [1.0, 2.0]) is None
+
+
+def test_curve_factory_models_run_and_report_scaling():
+    cases = scaling_cases(dates=(2, 3), bonds_scales=(1,), max_years=(2, 4))
+    inputs = synthetic_curve_inputs(cases, TINY_CONFIG)
+
+    assert [len(case_inputs.ref_dates) for case_inputs in inputs] == [2, 3, 2]
+
+    results = run_curve_factory_benchmarks(inputs, PARAMETERS)
+    by_key = {(result["model"], result["size"]): result for result in results}
+
+    assert len(results) == len(cases) * len(MODELS)
+    assert by_key[("flat-forward", "d2-b1-y4")]["grid_size"] == 4 * 252
+    assert by_key[("flat-forward", "d2-b1-y4")]["counts"]["curve_rows"] == 2 * 4 * 252
+    assert by_key[("bootstrap", "d3-b1-y2")]["fits"] == 3
+    assert by_key[("bootstrap", "d3-b1-y2")]["counts"]["failed_dates"] == 0
+    assert by_key[("svensson", "d2-b1-y2")]["fits"] == 2
+    assert by_key[("kernel-ridge-tune", "d2-b1-y2")]["fits"] == 2 * 12
+    assert all(result["seconds_per_date"] > 0 for result in results)
+    assert all(result["peak_mb_per_date"] is not None for result in results)
+
+    exponents = scaling_exponents(results)
+    axes = {(item["model"], item["axis"], item["metric"]) for item in exponents}
+
+    assert ("bootstrap", DATES_AXIS, "seconds") in axes
+    assert ("kernel-ridge-fit", GRID_AXIS, "peak_mb") in axes
+    assert all(item["points"] == 2 for item in exponents)
+
+
+def test_unknown_curve_factory_model_raises():
+    with pytest.raises(KeyError, match="Unknown curve-factory benchmark models"):
+        run_curve_factory_benchmarks([], PARAMETERS, models=["cubic-spline"])
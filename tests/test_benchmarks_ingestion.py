@@ -0,0 +1,78 @@
+from datetime import date
+
+import pytest
+
+from ml_ettj26.benchmarks.harness import StageTimer
+from ml_ettj26.benchmarks.ingestion import (
+    BUILDER_MODE,
+    PARSERS,
+    STAGES_MODE,
+    dominant_stages,
+    run_ingestion_benchmarks,
+    write_ingestion_fixtures,
+)
+from ml_ettj26.benchmarks.synthetic_market import SyntheticMarketConfig
+
+
+TINY_CONFIG = SyntheticMarketConfig(
+    start_date=date(2024, 1, 2),
+    years=0.1,
+    ltn_per_day=3,
+    ntnf_per_day=2,
+    di1_contracts=4,
+    swap_vertices=(30, 360),
+    pricereport_filler_per_day=3,
+)
+
+EXPECTED_STAGES = {
+    "price-report": {"zip_open", "header_probe", "sha256", "parse", "normalize", "dataframe"},
+    "swap": {"zip_open", "header_probe", "sha256", "parse", "normalize", "dataframe"},
+    "demab": {"zip_open", "sha256", "parse", "normalize", "dataframe"},
+    "sgs": {"sha256", "parse", "normalize", "dataframe"},
+}
+
+
+@pytest.fixture(scope="module")
+def fixtures(tmp_path_factory):
+    return write_ingestion_fixtures(TINY_CONFIG, tmp_path_factory.mktemp("raw"), size="tiny")
+
+
+def test_repeated_stages_accumulate():
+    timer = StageTimer()
+
+    for _ in range(3):
+        with timer.stage("parse"):
+            pass
+
+    assert list(timer.seconds) == ["parse"]
+    assert timer.measured_seconds == timer.seconds["parse"] > 0
+
+
+def test_stage_replays_match_builders(fixtures):
+    results = run_ingestion_benchmarks([fixtures])
+    by_key = {(result["parser"], result["mode"]): result for result in results}
+
+    assert len(results) == 2 * len(PARSERS)
+
+    for parser, stages in EXPECTED_STAGES.items():
+        builder = by_key[(parser, BUILDER_MODE)]
+        replay = by_key[(parser, STAGES_MODE)]
+
+        assert builder["rows"] > 0
+        assert replay["rows"] == builder["rows"]
+        assert replay["input_mb"] == builder["input_mb"] > 0
+        assert set(replay["stages"]) == stages
+        assert sum(stage["share"] for stage in replay["stages"].values()) == pytest.approx(1.0)
+        assert replay["counts"]["payload_bytes"] > 0
+        assert replay["mb_per_second"] > 0 and replay["rows_per_second"] > 0
+
+    dominant = {item["parser"]: item for item in dominant_stages(results)}
+    assert set(dominant) == set(PARSERS)
+    assert all(item["stage"] in EXPECTED_STAGES[parser] for parser, item in dominant.items())
+
+
+def test_unknown_parser_or_mode_raises(fixtures):
+    with pytest.raises(KeyError, match="parsers"):
+        run_ingestion_benchmarks([fixtures], parsers=["csv"])
+    with pytest.raises(KeyError, match="modes"):
+        run_ingestion_benchmarks([fixtures], modes=["lazy"])
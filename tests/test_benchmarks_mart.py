@@ -0,0 +1,142 @@
+import argparse
+from datetime import date
+
+import pytest
+
+from ml_ettj26.benchmarks.harness import (
+    HIGHER_IS_BETTER,
+    LOWER_IS_BETTER,
+    compare_to_baseline,
+    read_report,
+    run_benchmark,
+    run_report_script,
+    write_report,
+)
+from ml_ettj26.benchmarks.mart import (
+    MART_METRICS,
+    SCENARIOS,
+    run_mart_benchmarks,
+    synthetic_mart_inputs,
+)
+from ml_ettj26.benchmarks.synthetic_market import SyntheticMarketConfig
+
+
+TINY_CONFIG = SyntheticMarketConfig(
+    start_date=date(2024, 1, 2),
+    years=0.02,
+    ltn_per_day=4,
+    ntnf_per_day=2,
+    di1_contracts=4,
+    swap_vertices=(30, 360),
+    pricereport_filler_per_day=1,
+)
+
+
+def test_run_benchmark_keeps_fastest_stage_and_excludes_setup():
+    calls = []
+
+    def benchmark(timer):
+        calls.append(timer.trace_memory)
+
+        with timer.stage("prepare", setup=True):
+            bytearray(1024 * 1024)
+        with timer.stage("work"):
+            bytearray(2 * 1024 * 1024)
+
+        return {"calls": len(calls)}
+
+    run = run_benchmark(benchmark, repeats=3)
+
+    assert calls == [True, False, False]
+    assert run.counts == {"calls": 1}
+    assert run.measured_seconds == run.seconds["work"]
+    assert run.measured_peak_mb == pytest.approx(2.0, abs=0.5)
+    assert run.stages()["prepare"]["setup"] is True
+
+    with pytest.raises(ValueError, match="repeats"):
+        run_benchmark(benchmark, repeats=0)
+
+
+def test_compare_to_baseline_flags_moves_past_threshold(tmp_path):
+    metrics = {"bonds_per_second": HIGHER_IS_BETTER, "peak_mb": LOWER_IS_BETTER}
+    baseline = [
+        {"scenario": "batch", "size": "1x", "bonds_per_second": 1000.0, "peak_mb": 10.0},
+        {"scenario": "unit", "size": "1x", "bonds_per_second": 100.0, "peak_mb": 10.0},
+    ]
+    results = [
+        {"scenario": "batch", "size": "1x", "bonds_per_second": 850.0, "peak_mb": 10.5},
+        {"scenario": "unit", "size": "1x", "bonds_per_second": 95.0, "peak_mb": 12.0},
+        {"scenario": "solver-only", "size": "1x", "bonds_per_second": 1.0, "peak_mb": 1.0},
+    ]
+
+    write_report({"results": baseline}, tmp_path / "baseline.json")
+    comparison = compare_to_baseline(
+        results,
+        read_report(tmp_path / "baseline.json")["results"],
+        metrics=metrics,
+        threshold=0.10,
+    )
+
+    assert len(comparison["comparisons"]) == 4
+    assert [(item["scenario"], item["metric"]) for item in comparison["regressions"]] == [
+        ("batch", "bonds_per_second"),
+        ("unit", "peak_mb"),
+    ]
+
+
+
+def test_run_report_script_writes_report_and_exits_on_regressions(tmp_path, capsys):
+    args = argparse.Namespace(
+        cprofile_out=None,
+        pstats_top=40,
+        output=str(tmp_path / "report.json"),
+    )
+
+    run_report_script(args, lambda _: {"results": []}, lambda _: "summary")
+
+    assert read_report(tmp_path / "report.json") == {"results": []}
+    assert capsys.readouterr().err == "summary\n"
+
+    with pytest.raises(SystemExit) as exit_info:
+        run_report_script(
+            args,
+            lambda _: {"results": [], "comparison": {"regressions": [{}]}},
+            lambda _: "summary",
+        )
+
+    assert exit_info.value.code == 1
+
+
+def test_mart_scenarios_run_on_synthetic_inputs():
+    inputs = synthetic_mart_inputs(TINY_CONFIG, size="tiny")
+    results = run_mart_benchmarks([inputs], repeats=1)
+    by_scenario = {result["scenario"]: result for result in results}
+    bonds = len(inputs.curve_candidates)
+
+    assert list(by_scenario) == list(SCENARIOS)
+    assert all(result["bonds"] == bonds for result in results)
+    assert all(result["bonds_per_second"] > 0 for result in results)
+
+    for scenario in ("unit", "batch", "dimension-batch", "dimension-batch-warm"):
+        assert by_scenario[scenario]["counts"]["output_rows"] == bonds
+        assert by_scenario[scenario]["counts"]["failure_rows"] == 0
+
+    assert (
+        by_scenario["dimension-batch-warm"]["counts"]["solver_iterations"]
+        < by_scenario["dimension-batch"]["counts"]["solver_iterations"]
+    )
+
+    assert by_scenario["solver-only"]["counts"]["solved"] == bonds
+    assert by_scenario["solver-only"]["stages"]["prepare_cashflows"]["setup"] is True
+    assert by_scenario["duration-only"]["counts"]["finite_durations"] == bonds
+    assert set(by_scenario["duration-only"]["stages"]) == {"prepare_cashflows", "solve", "duration"}
+
+    comparison = compare_to_baseline(results, results, metrics=MART_METRICS)
+    assert comparison["regressions"] == []
+
+
+def test_unknown_mart_scenario_raises():
+    inputs = synthetic_mart_inputs(TINY_CONFIG, size="tiny", limit=3)
+
+    with pytest.raises(KeyError, match="Unknown mart benchmark scenarios"):
+        run_mart_benchmarks([inputs], scenarios=["batch", "gpu"])
@@ -1,9 +1,11 @@
 from datetime import date, timedelta
 
 import pandas as pd
+import pytest
 
 from ml_ettj26.pipelines.curve_factory.public_bonds_cashflows.nodes import (
     build_public_bond_cashflow_dimension,
+    build_public_bond_cashflow_dimension_incremental,
 )
 
 
@@ -103,3 +105,102 @@ def test_public_bond_cashflow_dimension_uses_single_principal_for_ltn():
     assert dimension.iloc[0]["cashflow_type"] == "PRINCIPAL"
     assert dimension.iloc[0]["cashflow_type_rank"] == 30
     assert dimension.iloc[0]["amount"] == 1000.0
+
+
+def test_public_bond_cashflow_dimension_builds_indexed_bonds():
+    instruments = pd.DataFrame(
+        [
+            {
+                "isin": "BRSTNCLF1001",
+                "instrument_type": "LFT",
+                "issue_date": date(2026, 1, 2),
+                "maturity_date": date(2028, 3, 1),
+            },
+            {
+                "isin": "BRSTNCNTB001",
+                "instrument_type": "NTN-B",
+                "issue_date": date(2026, 1, 2),
+                "maturity_date": date(2027, 8, 15),
+            },
+        ]
+    )
+
+    dimension = build_public_bond_cashflow_dimension(
+        instruments=instruments,
+        calendar_df=make_calendar_df(),
+    )
+    by_isin = dimension.groupby("isin")
+
+    assert by_isin.get_group("BRSTNCLF1001")["amount"].tolist() == [1000.0]
+
+    ntnb = by_isin.get_group("BRSTNCNTB001")
+    coupon = 1000.0 * (1.06**0.5 - 1.0)
+
+    # Cupons no dia 15 de fevereiro e agosto, ajustados para o dia útil seguinte.
+    assert ntnb["payment_date"].tolist() == [
+        date(2026, 2, 16),
+        date(2026, 8, 17),
+        date(2027, 2, 15),
+        date(2027, 8, 16),
+        date(2027, 8, 16),
+    ]
+    assert ntnb["cashflow_type"].tolist() == ["INTEREST"] * 4 + ["PRINCIPAL"]
+    assert ntnb["amount"].tolist() == pytest.approx([coupon] * 4 + [1000.0])
+
+
+def test_incremental_cashflow_dimension_builds_only_new_isins():
+    calendar_df = make_calendar_df()
+    ltn = {
+        "isin": "BRSTNCLTN001",
+        "instrument_type": "LTN",
+        "issue_date": date(2026, 1, 2),
+        "maturity_date": date(2027, 1, 1),
+    }
+    ntnf = {
+        "isin": "BRSTNCNTF001",
+        "instrument_type": "NTN-F",
+        "issue_date": date(2026, 1, 2),
+        "maturity_date": date(2028, 1, 1),
+    }
+
+    first, first_state = build_public_bond_cashflow_dimension_incremental(
+        instruments=pd.DataFrame([ntnf]),
+        calendar_df=calendar_df,
+        previous_dimension=pd.DataFrame(),
+        previous_state=pd.DataFrame(),
+    )
+
+    assert bool(first_state["full_rebuild"].iloc[0])
+
+    # Linhas conhecidas são reaproveitadas: a marca só sobrevive sem rebuild.
+    previous = first.assign(metadata_json="kept")
+    instruments = pd.DataFrame([ntnf, ltn])
+
+    second, second_state = build_public_bond_cashflow_dimension_incremental(
+        instruments=instruments,
+        calendar_df=calendar_df,
+        previous_dimension=previous,
+        previous_state=first_state,
+    )
+
+    assert not bool(second_state["full_rebuild"].iloc[0])
+    assert second_state["new_instruments"].iloc[0] == 1
+    assert second["isin"].is_monotonic_increasing
+    assert (second.loc[second["isin"] == ntnf["isin"], "metadata_json"] == "kept").all()
+    pd.testing.assert_frame_equal(
+        second.drop(columns="metadata_json"),
+        build_public_bond_cashflow_dimension(instruments, calendar_df).drop(
+            columns="metadata_json"
+        ),
+    )
+
+    rebuilt, rebuilt_state = build_public_bond_cashflow_dimension_incremental(
+        instruments=instruments,
+        calendar_df=calendar_df.assign(source_file_hash="new-hash"),
+        previous_dimension=previous,
+        previous_state=first_state,
+    )
+
+    assert bool(rebuilt_state["full_rebuild"].iloc[0])
+    assert rebuilt_state["new_instruments"].iloc[0] == 2
+    assert not (rebuilt["metadata_json"] == "kept").any()
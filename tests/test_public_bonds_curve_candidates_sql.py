@@ -19,13 +19,14 @@ def test_tenor_occupancy_flag_distinguishes_good_medium_and_poor_days():
         """
         CREATE TABLE mart_public_bonds_quotes_quality (
             ref_date DATE,
+            instrument_type VARCHAR,
             bd_to_maturity INTEGER,
             eligible_for_curve_input BOOLEAN
         )
         """
     )
     connection.executemany(
-        "INSERT INTO mart_public_bonds_quotes_quality VALUES (?, ?, TRUE)",
+        "INSERT INTO mart_public_bonds_quotes_quality VALUES (?, 'LTN', ?, TRUE)",
         [
             # GOOD: 2 curtos, 4 médios e 4 longos.
             ("2024-01-02", 100),
@@ -69,3 +70,47 @@ def test_tenor_occupancy_flag_distinguishes_good_medium_and_poor_days():
         (date(2024, 1, 3), 1, 1, 1, "MEDIUM"),
         (date(2024, 1, 4), 2, 1, 0, "POOR"),
     ]
+
+
+def test_indexed_bonds_share_the_day_flags_without_counting_in_them():
+    connection = duckdb.connect()
+    connection.execute(
+        """
+        CREATE TABLE mart_public_bonds_quotes_quality (
+            ref_date DATE,
+            instrument_type VARCHAR,
+            bd_to_maturity INTEGER,
+            eligible_for_curve_input BOOLEAN
+        )
+        """
+    )
+    connection.executemany(
+        "INSERT INTO mart_public_bonds_quotes_quality VALUES ('2024-01-02', ?, ?, TRUE)",
+        [
+            ("LTN", 100),
+            ("NTN-F", 500),
+            ("LFT", 1000),
+            ("NTN-B", 2000),
+        ],
+    )
+    connection.execute(SQL_PATH.read_text(encoding="utf-8"))
+
+    rows = connection.execute(
+        """
+        SELECT
+            instrument_type,
+            numero_observacoes_dia,
+            numero_observacoes_longo,
+            flag_cobertura_tenors,
+            flag_ocupacao_tenors
+        FROM mart_public_bonds_curve_candidates
+        ORDER BY bd_to_maturity
+        """
+    ).fetchall()
+
+    assert rows == [
+        ("LTN", 2, 0, "POOR", "POOR"),
+        ("NTN-F", 2, 0, "POOR", "POOR"),
+        ("LFT", 2, 0, "POOR", "POOR"),
+        ("NTN-B", 2, 0, "POOR", "POOR"),
+    ]
@@ -201,3 +201,30 @@ def test_batch_node_returns_individual_failures_without_dropping_successes():
     assert len(failures) == 1
     assert failures.iloc[0]["isin"] == "BRSTNCLTN_BAD"
     assert failures.iloc[0]["calculation_error_type"] == "InvalidPrice"
+
+
+def test_batch_node_leaves_indexed_bonds_to_the_dimension_path():
+    calendar_df = make_calendar_df()
+    ref_date = date(2026, 1, 2)
+
+    curve_candidates = pd.DataFrame(
+        [
+            make_curve_candidate(
+                instrument_type=instrument_type,
+                isin=f"BRSTN{instrument_type}",
+                ref_date=ref_date,
+                issue_date=ref_date,
+                maturity_date=date(2027, 1, 4),
+                pu_med=900.0,
+            )
+            for instrument_type in ["LTN", "LFT", "NTN-B"]
+        ]
+    )
+
+    inputs, failures = build_public_bonds_curve_inputs_batch(
+        curve_candidates=curve_candidates,
+        calendar_df=calendar_df,
+    )
+
+    assert inputs["instrument_type"].tolist() == ["LTN"]
+    assert failures.empty
@@ -1,13 +1,33 @@
 from datetime import date, timedelta
+from pathlib import Path
 
+import numpy as np
 import pandas as pd
 import pytest
+import yaml
 
+from ml_ettj26.pipelines.curve_factory.public_bonds_mart.nodes_batch import (
+    summarize_solver_iterations,
+)
+from engine_product.calendars import CalendarIndex
 from ml_ettj26.pipelines.curve_factory.public_bonds_mart.nodes_dimension_batch import (
+    build_indexed_notionals,
+    build_public_bonds_curve_inputs_columnar,
     build_public_bonds_curve_inputs_from_cashflow_dimension,
 )
 
 
+@pytest.fixture(
+    params=[
+        build_public_bonds_curve_inputs_from_cashflow_dimension,
+        build_public_bonds_curve_inputs_columnar,
+    ],
+    ids=["rows", "columnar"],
+)
+def build_curve_inputs(request):
+    return request.param
+
+
 def make_calendar_df(start: date = date(2026, 1, 1), end: date = date(2028, 1, 10)):
     rows = []
     current = start
@@ -81,7 +101,7 @@ def make_curve_candidate(
     }
 
 
-def test_dimension_batch_node_uses_cashflow_dimension_for_batch_yields():
+def test_dimension_batch_node_uses_cashflow_dimension_for_batch_yields(build_curve_inputs):
     calendar_df = make_calendar_df()
     ref_date = date(2026, 1, 2)
     issue_date = date(2026, 1, 2)
@@ -147,7 +167,7 @@ def test_dimension_batch_node_uses_cashflow_dimension_for_batch_yields():
         ]
     )
 
-    inputs, failures = build_public_bonds_curve_inputs_from_cashflow_dimension(
+    inputs, failures = build_curve_inputs(
         curve_candidates=curve_candidates,
         cashflow_dimension=cashflow_dimension,
         calendar_df=calendar_df,
@@ -169,7 +189,7 @@ def test_dimension_batch_node_uses_cashflow_dimension_for_batch_yields():
     assert by_isin.loc["NTNF1", "market_ytm"] == pytest.approx(0.10, abs=1e-10)
 
 
-def test_dimension_batch_node_returns_failure_when_isin_is_missing_from_dimension():
+def test_dimension_batch_node_returns_failure_when_isin_is_missing_from_dimension(build_curve_inputs):
     calendar_df = make_calendar_df()
     ref_date = date(2026, 1, 2)
 
@@ -186,7 +206,7 @@ def test_dimension_batch_node_returns_failure_when_isin_is_missing_from_dimensio
         ]
     )
 
-    inputs, failures = build_public_bonds_curve_inputs_from_cashflow_dimension(
+    inputs, failures = build_curve_inputs(
         curve_candidates=curve_candidates,
         cashflow_dimension=pd.DataFrame(columns=["isin", "payment_bd_index", "amount"]),
         calendar_df=calendar_df,
@@ -196,3 +216,354 @@ def test_dimension_batch_node_returns_failure_when_isin_is_missing_from_dimensio
     assert len(failures) == 1
     assert failures.iloc[0]["calculation_error_type"] == "ValueError"
     assert "Cashflow dimension not found" in failures.iloc[0]["calculation_error_message"]
+
+
+def test_dimension_batch_node_warm_starts_from_previous_day_taxa_med(build_curve_inputs):
+    calendar_df = make_calendar_df()
+    one_year_payment = date(2027, 1, 4)
+    two_year_payment = date(2028, 1, 3)
+    one_year_bd = bd_index(calendar_df, one_year_payment)
+    two_year_bd = bd_index(calendar_df, two_year_payment)
+
+    candidates = []
+
+    for ref_date, ytm in [(date(2026, 1, 2), 0.1400), (date(2026, 1, 5), 0.1402)]:
+        ref_bd = bd_index(calendar_df, ref_date)
+        price = (
+            50.0 / (1.0 + ytm) ** ((one_year_bd - ref_bd) / 252.0)
+            + 1050.0 / (1.0 + ytm) ** ((two_year_bd - ref_bd) / 252.0)
+        )
+        candidates.append(
+            make_curve_candidate(
+                instrument_type="NTN-F",
+                isin="NTNF1",
+                ref_date=ref_date,
+                issue_date=date(2026, 1, 2),
+                maturity_date=two_year_payment,
+                pu_med=price,
+                taxa_med=ytm * 100.0,
+            )
+        )
+
+    cashflow_dimension = pd.DataFrame(
+        [
+            {"isin": "NTNF1", "payment_bd_index": one_year_bd, "amount": 50.0},
+            {"isin": "NTNF1", "payment_bd_index": two_year_bd, "amount": 1050.0},
+        ]
+    )
+
+    inputs, failures = build_curve_inputs(
+        curve_candidates=pd.DataFrame(candidates),
+        cashflow_dimension=cashflow_dimension,
+        calendar_df=calendar_df,
+        warm_start=True,
+    )
+
+    assert failures.empty
+    assert inputs["solver_start_type"].tolist() == ["STATIC", "WARM"]
+    assert inputs["market_ytm"].tolist() == pytest.approx([0.1400, 0.1402], abs=1e-10)
+    assert inputs["solver_iterations"].iloc[1] < inputs["solver_iterations"].iloc[0]
+
+    report = summarize_solver_iterations(inputs)
+
+    assert report["solver_start_type"].tolist() == ["STATIC", "WARM"]
+    assert report["observations"].tolist() == [1, 1]
+
+
+def test_dimension_batch_node_prices_indexed_bonds_over_vna(build_curve_inputs):
+    calendar_df = make_calendar_df()
+    ref_date = date(2026, 1, 5)
+    maturity_date = date(2027, 1, 4)
+    ref_bd = bd_index(calendar_df, ref_date)
+    maturity_bd = bd_index(calendar_df, maturity_date)
+    t = (maturity_bd - ref_bd) / 252.0
+
+    # SELIC de 10% a.a. desde 2026-01-02 e VNA de 2000 nessa data.
+    sgs_points = pd.DataFrame(
+        {
+            "series_id": [432, 432],
+            "ref_date": pd.to_datetime(["2026-01-02", "2026-01-30"]),
+            "value": [10.0, 10.0],
+        }
+    )
+    vna = 2000.0 * 1.10 ** (1 / 252)
+    spread = 0.001
+
+    curve_candidates = pd.DataFrame(
+        [
+            make_curve_candidate(
+                instrument_type="LFT",
+                isin="LFT1",
+                ref_date=ref_date,
+                issue_date=date(2026, 1, 2),
+                maturity_date=maturity_date,
+                pu_med=vna / (1.0 + spread) ** t,
+            ),
+            make_curve_candidate(
+                instrument_type="LFT",
+                isin="LFT1",
+                ref_date=date(2026, 3, 2),
+                issue_date=date(2026, 1, 2),
+                maturity_date=maturity_date,
+                pu_med=2000.0,
+            ),
+        ]
+    )
+    cashflow_dimension = pd.DataFrame(
+        [{"isin": "LFT1", "payment_bd_index": maturity_bd, "amount": 1000.0}]
+    )
+
+    inputs, failures = build_curve_inputs(
+        curve_candidates=curve_candidates,
+        cashflow_dimension=cashflow_dimension,
+        calendar_df=calendar_df,
+        sgs_points=sgs_points,
+        indexed_notional_anchors={"LFT": {"date": "2026-01-02", "value": 2000.0}},
+    )
+
+    assert len(inputs) == 1
+    assert inputs.iloc[0]["market_ytm"] == pytest.approx(spread, abs=1e-10)
+    assert inputs.iloc[0]["market_pu"] == pytest.approx(vna / (1.0 + spread) ** t)
+    assert inputs.iloc[0]["market_ytm_source"] == "IMPLIED_FROM_PU_MED_OVER_VNA"
+
+    # Sem SELIC publicada em 2026-03-02, a linha vira falha.
+    assert failures["calculation_error_type"].tolist() == ["KeyError"]
+    assert "VNA not available" in failures.iloc[0]["calculation_error_message"]
+
+
+def test_dimension_batch_node_fails_indexed_bonds_without_sgs_points(build_curve_inputs):
+    calendar_df = make_calendar_df()
+    maturity_bd = bd_index(calendar_df, date(2027, 5, 17))
+
+    inputs, failures = build_curve_inputs(
+        curve_candidates=pd.DataFrame(
+            [
+                make_curve_candidate(
+                    instrument_type="NTN-B",
+                    isin="NTNB1",
+                    ref_date=date(2026, 1, 5),
+                    issue_date=date(2026, 1, 2),
+                    maturity_date=date(2027, 5, 15),
+                    pu_med=4300.0,
+                )
+            ]
+        ),
+        cashflow_dimension=pd.DataFrame(
+            [{"isin": "NTNB1", "payment_bd_index": maturity_bd, "amount": 1000.0}]
+        ),
+        calendar_df=calendar_df,
+    )
+
+    assert inputs.empty
+    assert np.array_equal(failures["isin"].to_numpy(), ["NTNB1"])
+    assert failures.iloc[0]["calculation_error_type"] == "ValueError"
+    assert failures.iloc[0]["calculation_error_message"].endswith("No SGS points given")
+
+
+def test_indexed_notionals_reject_anchor_outside_the_index_table():
+    calendar_index = CalendarIndex.from_calendar_df(make_calendar_df())
+    sgs_points = pd.DataFrame(
+        {
+            "series_id": [432],
+            "ref_date": pd.to_datetime(["2026-01-02"]),
+            "value": [10.0],
+        }
+    )
+
+    with pytest.raises(ValueError, match="VNA anchor 2000-07-01 for LFT is outside"):
+        build_indexed_notionals(
+            sgs_points,
+            calendar_index,
+            {"LFT": {"date": "2000-07-01", "value": 1000.0}},
+            instrument_types=["LFT"],
+        )
+    with pytest.raises(ValueError, match="No VNA anchor configured for LFT"):
+        build_indexed_notionals(
+            sgs_points,
+            calendar_index,
+            {"LFT": {"date": "2026-01-02", "value": None}},
+            instrument_types=["LFT"],
+        )
+
+
+
+def test_configured_vna_bases_fall_inside_tables_built_from_2000():
+    parameters = yaml.safe_load(
+        (Path(__file__).parents[1] / "conf/base/parameters.yml").read_text(encoding="utf-8")
+    )
+    calendar_start = date.fromisoformat(parameters["anbima_calendar"]["min_date"])
+    calendar_index = CalendarIndex.from_calendar_df(
+        make_calendar_df(start=calendar_start, end=date(2001, 12, 31))
+    )
+    months = pd.date_range("2000-01-01", "2001-12-01", freq="MS")
+    sgs_points = pd.DataFrame(
+        {
+            "series_id": [432] * len(months) + [433] * len(months),
+            "ref_date": [*months, *months],
+            "value": [16.5] * len(months) + [0.5] * len(months),
+        }
+    )
+
+    notionals = build_indexed_notionals(
+        sgs_points,
+        calendar_index,
+        parameters["public_bonds_curve_mart"]["indexed_notional_anchors"],
+    )
+
+    assert sorted(notionals) == ["LFT", "NTN-B"]
+    assert {notional.anchor_value for notional in notionals.values()} == {1000.0}
+
+
+def test_dimension_batch_node_fails_only_the_type_whose_vna_cannot_be_built(
+    build_curve_inputs,
+):
+    calendar_df = make_calendar_df()
+    ref_date = date(2026, 1, 5)
+    maturity_date = date(2027, 1, 4)
+    maturity_bd = bd_index(calendar_df, maturity_date)
+    t = (maturity_bd - bd_index(calendar_df, ref_date)) / 252.0
+
+    # SELIC publicada, IPCA (433) ausente.
+    sgs_points = pd.DataFrame(
+        {
+            "series_id": [432, 432],
+            "ref_date": pd.to_datetime(["2026-01-02", "2026-01-30"]),
+            "value": [10.0, 10.0],
+        }
+    )
+    curve_candidates = pd.DataFrame(
+        [
+            make_curve_candidate(
+                instrument_type=instrument_type,
+                isin=isin,
+                ref_date=ref_date,
+                issue_date=date(2026, 1, 2),
+                maturity_date=maturity_date,
+                pu_med=pu_med,
+            )
+            for instrument_type, isin, pu_med in [
+                ("LTN", "LTN1", 1000.0 / 1.10**t),
+                ("LFT", "LFT1", 1000.0),
+                ("NTN-B", "NTNB1", 1000.0),
+            ]
+        ]
+    )
+    cashflow_dimension = pd.DataFrame(
+        [
+            {"isin": isin, "payment_bd_index": maturity_bd, "amount": 1000.0}
+            for isin in ["LTN1", "LFT1", "NTNB1"]
+        ]
+    )
+
+    inputs, failures = build_curve_inputs(
+        curve_candidates=curve_candidates,
+        cashflow_dimension=cashflow_dimension,
+        calendar_df=calendar_df,
+        sgs_points=sgs_points,
+        indexed_notional_anchors={
+            "LFT": {"date": "2026-01-02", "value": 1000.0},
+            "NTN-B": {"date": "2026-01-15", "value": 1000.0},
+        },
+    )
+
+    assert inputs["isin"].tolist() == ["LFT1", "LTN1"]
+    assert failures["isin"].tolist() == ["NTNB1"]
+    assert failures.iloc[0]["calculation_error_type"] == "ValueError"
+    assert failures.iloc[0]["calculation_error_message"].startswith("VNA not available")
+    assert "433" in failures.iloc[0]["calculation_error_message"]
+
+
+def test_columnar_node_matches_row_node_on_mixed_candidates():
+    calendar_df = make_calendar_df()
+    one_year_payment = date(2027, 1, 4)
+    two_year_payment = date(2028, 1, 3)
+    one_year_bd = bd_index(calendar_df, one_year_payment)
+    two_year_bd = bd_index(calendar_df, two_year_payment)
+
+    candidates = []
+
+    for ref_date, ytm in [
+        (date(2026, 1, 2), 0.1400),
+        (date(2026, 1, 5), 0.1402),
+        (date(2026, 1, 6), 0.1399),
+    ]:
+        ref_bd = bd_index(calendar_df, ref_date)
+        t1 = (one_year_bd - ref_bd) / 252.0
+        t2 = (two_year_bd - ref_bd) / 252.0
+        common = dict(ref_date=ref_date, issue_date=date(2026, 1, 2))
+
+        candidates += [
+            make_curve_candidate(
+                instrument_type="LTN",
+                isin="LTN1",
+                maturity_date=one_year_payment,
+                pu_med=1000.0 / (1.0 + ytm) ** t1,
+                **common,
+            ),
+            make_curve_candidate(
+                instrument_type="LTN",
+                isin="LTN2",
+                maturity_date=two_year_payment,
+                pu_med=None,
+                taxa_med=ytm * 100.0,
+                primary_quote_type="YIELD",
+                **common,
+            ),
+            make_curve_candidate(
+                instrument_type="NTN-F",
+                isin="NTNF1",
+                maturity_date=two_year_payment,
+                pu_med=50.0 / (1.0 + ytm) ** t1 + 1050.0 / (1.0 + ytm) ** t2,
+                **common,
+            ),
+            make_curve_candidate(
+                instrument_type="NTN-F",
+                isin="NTNF2",
+                maturity_date=two_year_payment,
+                pu_med=6000.0,
+                **common,
+            ),
+            make_curve_candidate(
+                instrument_type="LTN",
+                isin="LTN3",
+                maturity_date=one_year_payment,
+                pu_med=None,
+                primary_quote_type="YIELD",
+                **common,
+            ),
+            make_curve_candidate(
+                instrument_type="NTN-F",
+                isin="MISSING",
+                maturity_date=two_year_payment,
+                pu_med=900.0,
+                **common,
+            ),
+        ]
+
+    cashflow_dimension = pd.DataFrame(
+        [
+            {"isin": "LTN1", "payment_bd_index": one_year_bd, "amount": 1000.0},
+            {"isin": "LTN2", "payment_bd_index": two_year_bd, "amount": 1000.0},
+            {"isin": "LTN3", "payment_bd_index": one_year_bd, "amount": 1000.0},
+            {"isin": "NTNF1", "payment_bd_index": one_year_bd, "amount": 50.0},
+            {"isin": "NTNF1", "payment_bd_index": two_year_bd, "amount": 1050.0},
+            {"isin": "NTNF2", "payment_bd_index": one_year_bd, "amount": 50.0},
+            {"isin": "NTNF2", "payment_bd_index": two_year_bd, "amount": 1050.0},
+        ]
+    )
+    kwargs = dict(
+        curve_candidates=pd.DataFrame(candidates),
+        cashflow_dimension=cashflow_dimension,
+        calendar_df=calendar_df,
+        warm_start=True,
+    )
+
+    expected_inputs, expected_failures = (
+        build_public_bonds_curve_inputs_from_cashflow_dimension(**kwargs)
+    )
+    inputs, failures = build_public_bonds_curve_inputs_columnar(**kwargs)
+
+    assert len(expected_inputs) == 9
+    assert len(expected_failures) == 9
+    pd.testing.assert_frame_equal(inputs, expected_inputs, check_dtype=False)
+    pd.testing.assert_frame_equal(failures, expected_failures, check_dtype=False)
@@ -0,0 +1,269 @@
+from datetime import date
+
+import pandas as pd
+import pytest
+from kedro_datasets.partitions import PartitionedDataset
+
+from ml_ettj26.pipelines.curve_factory.public_bonds_mart.nodes_dimension_batch import (
+    build_public_bonds_curve_inputs_columnar,
+    build_public_bonds_curve_inputs_from_cashflow_dimension,
+)
+from ml_ettj26.pipelines.curve_factory.public_bonds_mart.nodes_incremental import (
+    build_public_bonds_curve_inputs_incremental,
+    consolidate_curve_input_partitions,
+)
+
+
+def make_calendar_df(start: date = date(2026, 1, 1), end: date = date(2027, 1, 10)):
+    dates = pd.date_range(start, end, freq="D")
+    is_business_day = dates.weekday < 5
+
+    return pd.DataFrame(
+        {
+            "date": dates.date,
+            "is_business_day": is_business_day,
+            "bd_index": is_business_day.cumsum() - 1,
+        }
+    )
+
+
+def make_candidate(ref_date: date, pu_med: float) -> dict:
+    return {
+        "ref_date": ref_date,
+        "instrument_type": "LTN",
+        "isin": "LTN1",
+        "issue_date": date(2026, 1, 2),
+        "maturity_date": date(2027, 1, 4),
+        "bd_to_maturity": 252,
+        "pu_med": pu_med,
+        "taxa_med": None,
+        "quote_quality": "OK",
+        "quote_source": "TEST",
+        "primary_quote_type": "PRICE",
+    }
+
+
+@pytest.fixture
+def partitions(tmp_path):
+    return PartitionedDataset(
+        path=str(tmp_path / "inputs"),
+        dataset="pandas.ParquetDataset",
+        filename_suffix=".parquet",
+    )
+
+
+def run_increment(candidates, cashflow_dimension, calendar_df, watermark, partitions):
+    input_partitions, _, new_watermark = build_public_bonds_curve_inputs_incremental(
+        curve_candidates=candidates,
+        cashflow_dimension=cashflow_dimension,
+        calendar_df=calendar_df,
+        watermark=watermark,
+    )
+    partitions.save(input_partitions)
+
+    return input_partitions, new_watermark
+
+
+def test_incremental_run_solves_only_dates_after_watermark(partitions):
+    calendar_df = make_calendar_df()
+    maturity_bd = int(
+        calendar_df.loc[calendar_df["date"] == date(2027, 1, 4), "bd_index"].iloc[0]
+    )
+    cashflow_dimension = pd.DataFrame(
+        [{"isin": "LTN1", "payment_bd_index": maturity_bd, "amount": 1000.0}]
+    )
+    day_1 = pd.DataFrame([make_candidate(date(2026, 1, 2), 900.0)])
+    day_2 = pd.concat(
+        [day_1, pd.DataFrame([make_candidate(date(2026, 1, 5), 901.0)])],
+        ignore_index=True,
+    )
+
+    first, watermark = run_increment(
+        day_1, cashflow_dimension, calendar_df, pd.DataFrame(), partitions
+    )
+
+    assert list(first) == ["2026-01-02"]
+    assert bool(watermark["full_rebuild"].iloc[0])
+    assert watermark["last_ref_date"].iloc[0] == pd.Timestamp("2026-01-02")
+
+    second, watermark = run_increment(
+        day_2, cashflow_dimension, calendar_df, watermark, partitions
+    )
+
+    assert list(second) == ["2026-01-05"]
+    assert not bool(watermark["full_rebuild"].iloc[0])
+    assert watermark["last_ref_date"].iloc[0] == pd.Timestamp("2026-01-05")
+
+    consolidated = consolidate_curve_input_partitions(partitions.load(), day_2)
+    full, _ = build_public_bonds_curve_inputs_from_cashflow_dimension(
+        curve_candidates=day_2,
+        cashflow_dimension=cashflow_dimension,
+        calendar_df=calendar_df,
+    )
+
+    pd.testing.assert_series_equal(consolidated["market_ytm"], full["market_ytm"])
+
+    third, watermark = run_increment(
+        day_2, cashflow_dimension, calendar_df, watermark, partitions
+    )
+
+    assert third == {}
+    assert watermark["last_ref_date"].iloc[0] == pd.Timestamp("2026-01-05")
+
+
+def test_cashflow_dimension_change_triggers_full_rebuild(partitions):
+    calendar_df = make_calendar_df()
+    maturity_bd = int(
+        calendar_df.loc[calendar_df["date"] == date(2027, 1, 4), "bd_index"].iloc[0]
+    )
+    candidates = pd.DataFrame(
+        [
+            make_candidate(date(2026, 1, 2), 900.0),
+            make_candidate(date(2026, 1, 5), 901.0),
+        ]
+    )
+    cashflow_dimension = pd.DataFrame(
+        [{"isin": "LTN1", "payment_bd_index": maturity_bd, "amount": 1000.0}]
+    )
+
+    _, watermark = run_increment(
+        candidates, cashflow_dimension, calendar_df, pd.DataFrame(), partitions
+    )
+
+    changed = cashflow_dimension.assign(amount=1001.0)
+    rebuilt, new_watermark = run_increment(
+        candidates, changed, calendar_df, watermark, partitions
+    )
+
+    assert list(rebuilt) == ["2026-01-02", "2026-01-05"]
+    assert bool(new_watermark["full_rebuild"].iloc[0])
+    assert new_watermark["input_hash"].iloc[0] != watermark["input_hash"].iloc[0]
+
+
+def test_warm_started_increments_match_a_full_rebuild(partitions):
+    calendar_df = make_calendar_df()
+    bd = dict(zip(calendar_df["date"], calendar_df["bd_index"]))
+    coupon_bd, maturity_bd = bd[date(2026, 7, 1)], bd[date(2027, 1, 4)]
+    cashflow_dimension = pd.DataFrame(
+        [
+            {"isin": "NTNF1", "payment_bd_index": coupon_bd, "amount": 48.81},
+            {"isin": "NTNF1", "payment_bd_index": maturity_bd, "amount": 1048.81},
+        ]
+    )
+    candidates = pd.DataFrame(
+        [
+            {
+                **make_candidate(ref_date, pu_med),
+                "instrument_type": "NTN-F",
+                "isin": "NTNF1",
+                "taxa_med": taxa_med,
+            }
+            for ref_date, pu_med, taxa_med in [
+                (date(2026, 1, 2), 960.0, 14.7),
+                (date(2026, 1, 5), 961.0, 14.6),
+                (date(2026, 1, 6), 959.5, 14.8),
+                (date(2026, 1, 7), 960.5, 14.7),
+            ]
+        ]
+    )
+    watermark = pd.DataFrame()
+
+    for size in (2, 4):
+        input_partitions, _, watermark = build_public_bonds_curve_inputs_incremental(
+            curve_candidates=candidates.iloc[:size],
+            cashflow_dimension=cashflow_dimension,
+            calendar_df=calendar_df,
+            watermark=watermark,
+            warm_start=True,
+        )
+        partitions.save(input_partitions)
+
+    consolidated = consolidate_curve_input_partitions(partitions.load(), candidates)
+    full, _ = build_public_bonds_curve_inputs_columnar(
+        curve_candidates=candidates,
+        cashflow_dimension=cashflow_dimension,
+        calendar_df=calendar_df,
+        warm_start=True,
+    )
+
+    assert consolidated["solver_start_type"].tolist() == ["STATIC"] + ["WARM"] * 3
+    for column in ["market_ytm", "solver_start_type", "solver_iterations"]:
+        assert consolidated[column].tolist() == full[column].tolist()
+
+
+def run_lft_increment(sgs_points, anchor, watermark):
+    calendar_df = make_calendar_df()
+    maturity_bd = int(
+        calendar_df.loc[calendar_df["date"] == date(2027, 1, 4), "bd_index"].iloc[0]
+    )
+    candidates = pd.DataFrame(
+        [
+            {**make_candidate(ref_date, 1000.0), "instrument_type": "LFT", "isin": "LFT1"}
+            for ref_date in (date(2026, 1, 5), date(2026, 1, 6), date(2026, 1, 7))
+        ]
+    )
+
+    return build_public_bonds_curve_inputs_incremental(
+        curve_candidates=candidates,
+        cashflow_dimension=pd.DataFrame(
+            [{"isin": "LFT1", "payment_bd_index": maturity_bd, "amount": 1000.0}]
+        ),
+        calendar_df=calendar_df,
+        watermark=watermark,
+        sgs_points=sgs_points,
+        indexed_notional_anchors={"LFT": anchor},
+    )
+
+
+def test_unconfigured_vna_anchor_does_not_hold_back_the_watermark():
+    sgs_points = pd.DataFrame(
+        {"series_id": [432], "ref_date": pd.to_datetime(["2026-01-02"]), "value": [15.0]}
+    )
+    anchor = {"date": "2000-07-01", "value": None}
+
+    _, failures, watermark = run_lft_increment(sgs_points, anchor, pd.DataFrame())
+
+    assert {
+        frame["calculation_error_type"].iloc[0] for frame in failures.values()
+    } == {"ValueError"}
+    assert pd.isna(watermark["reprocess_from"].iloc[0])
+    assert watermark["last_ref_date"].iloc[0] == pd.Timestamp("2026-01-07")
+
+    inputs, failures, _ = run_lft_increment(sgs_points, anchor, watermark)
+
+    assert inputs == {}
+    assert failures == {}
+
+
+def test_only_dates_after_the_published_index_are_reprocessed():
+    # SELIC publicada até 2026-01-05 cobre 01-06; 01-07 aguarda publicação.
+    sgs_points = pd.DataFrame(
+        {
+            "series_id": [432, 432],
+            "ref_date": pd.to_datetime(["2026-01-02", "2026-01-05"]),
+            "value": [15.0, 15.0],
+        }
+    )
+
+    _, failures, watermark = run_lft_increment(
+        sgs_points,
+        {"date": "2026-01-02", "value": 1000.0},
+        pd.DataFrame(),
+    )
+
+    assert failures["2026-01-06"].empty
+    assert failures["2026-01-07"]["calculation_error_type"].tolist() == ["KeyError"]
+    assert watermark["reprocess_from"].iloc[0] == pd.Timestamp("2026-01-07")
+
+    # Tabela a partir de 2026-01-06: 01-05 fica antes dela e não é retentado.
+    _, failures, watermark = run_lft_increment(
+        sgs_points.assign(ref_date=pd.to_datetime(["2026-01-06", "2026-01-07"])),
+        {"date": "2026-01-06", "value": 1000.0},
+        pd.DataFrame(),
+    )
+
+    assert failures["2026-01-05"]["calculation_error_type"].tolist() == ["ValueError"]
+    assert "before the index table" in failures["2026-01-05"][
+        "calculation_error_message"
+    ].iloc[0]
+    assert pd.isna(watermark["reprocess_from"].iloc[0])
@@ -0,0 +1,164 @@
+from datetime import date, timedelta
+
+import pandas as pd
+from kedro_datasets.partitions import PartitionedDataset
+
+from ml_ettj26.pipelines.curve_factory.public_bonds_mart.nodes_dimension_batch import (
+    build_public_bonds_curve_inputs_columnar,
+)
+from ml_ettj26.pipelines.curve_factory.public_bonds_mart.nodes_incremental import (
+    build_public_bonds_curve_inputs_incremental,
+    consolidate_curve_input_partitions,
+)
+from ml_ettj26.pipelines.curve_factory.public_bonds_mart.nodes_parallel import (
+    build_public_bonds_curve_inputs_parallel,
+)
+from ml_ettj26.utils.parallel import ref_date_shards
+
+
+def make_calendar_df(start: date = date(2026, 1, 1), end: date = date(2028, 1, 10)):
+    dates = pd.date_range(start, end, freq="D")
+    is_business_day = dates.weekday < 5
+
+    return pd.DataFrame(
+        {
+            "date": dates.date,
+            "is_business_day": is_business_day,
+            "bd_index": is_business_day.cumsum() - 1,
+        }
+    )
+
+
+def make_candidate(ref_date: date, isin: str, instrument_type: str, pu_med: float) -> dict:
+    return {
+        "ref_date": ref_date,
+        "instrument_type": instrument_type,
+        "isin": isin,
+        "issue_date": date(2026, 1, 2),
+        "maturity_date": date(2028, 1, 3),
+        "bd_to_maturity": 252,
+        "pu_med": pu_med,
+        "taxa_med": 14.0,
+        "quote_quality": "OK",
+        "quote_source": "TEST",
+        "primary_quote_type": "PRICE",
+    }
+
+
+def make_inputs():
+    calendar_df = make_calendar_df()
+    bd_index = dict(zip(calendar_df["date"], calendar_df["bd_index"]))
+    ref_dates = [date(2026, 1, 2) + timedelta(days=offset) for offset in range(12)]
+
+    candidates = pd.DataFrame(
+        [
+            make_candidate(ref_date, isin, instrument_type, pu_med)
+            for ref_date in ref_dates
+            for isin, instrument_type, pu_med in [
+                ("LTN1", "LTN", 870.0),
+                ("NTNF1", "NTN-F", 960.0),
+                ("MISSING", "LTN", 900.0),
+            ]
+        ]
+    )
+    cashflow_dimension = pd.DataFrame(
+        [
+            {"isin": "LTN1", "payment_bd_index": bd_index[date(2027, 1, 4)], "amount": 1000.0},
+            {"isin": "NTNF1", "payment_bd_index": bd_index[date(2027, 1, 4)], "amount": 50.0},
+            {"isin": "NTNF1", "payment_bd_index": bd_index[date(2028, 1, 3)], "amount": 1050.0},
+        ]
+    )
+
+    return candidates, cashflow_dimension, calendar_df
+
+
+def test_ref_date_shards_keep_whole_days_in_date_order():
+    ref_dates = pd.Series(
+        pd.to_datetime(["2026-01-05", "2026-01-02", "2026-01-05", "2026-01-06", "2026-01-02"])
+    )
+
+    shards = ref_date_shards(ref_dates, n_shards=2)
+
+    assert [shard.tolist() for shard in shards] == [[1, 4, 0, 2], [3]]
+    assert [shard.tolist() for shard in ref_date_shards(ref_dates, n_shards=10)] == [
+        [1, 4],
+        [0, 2],
+        [3],
+    ]
+
+
+def test_parallel_node_matches_single_process_columnar_node():
+    candidates, cashflow_dimension, calendar_df = make_inputs()
+
+    expected_inputs, expected_failures = build_public_bonds_curve_inputs_columnar(
+        curve_candidates=candidates,
+        cashflow_dimension=cashflow_dimension,
+        calendar_df=calendar_df,
+    )
+    inputs, failures = build_public_bonds_curve_inputs_parallel(
+        curve_candidates=candidates,
+        cashflow_dimension=cashflow_dimension,
+        calendar_df=calendar_df,
+        workers=2,
+    )
+
+    assert len(inputs) == 24
+    assert len(failures) == 12
+    pd.testing.assert_frame_equal(inputs, expected_inputs)
+    pd.testing.assert_frame_equal(failures, expected_failures)
+
+
+def test_warm_started_shards_match_a_single_columnar_run():
+    candidates, cashflow_dimension, calendar_df = make_inputs()
+    kwargs = dict(
+        curve_candidates=candidates,
+        cashflow_dimension=cashflow_dimension,
+        calendar_df=calendar_df,
+        warm_start=True,
+    )
+
+    expected_inputs, expected_failures = build_public_bonds_curve_inputs_columnar(**kwargs)
+
+    # Só a primeira data parte do chute estático, inclusive na primeira data
+    # de cada shard.
+    assert (expected_inputs["solver_start_type"] == "STATIC").sum() == 2
+    for workers in (1, 2, 3):
+        inputs, failures = build_public_bonds_curve_inputs_parallel(**kwargs, workers=workers)
+
+        pd.testing.assert_frame_equal(inputs, expected_inputs, check_exact=True)
+        pd.testing.assert_frame_equal(failures, expected_failures, check_exact=True)
+
+
+def test_incremental_and_dimension_batch_pipelines_write_the_same_inputs(tmp_path):
+    candidates, cashflow_dimension, calendar_df = make_inputs()
+    partitions = PartitionedDataset(
+        path=str(tmp_path / "inputs"),
+        dataset="pandas.ParquetDataset",
+        filename_suffix=".parquet",
+    )
+    ref_dates = sorted(candidates["ref_date"].unique())
+    watermark = pd.DataFrame()
+
+    # Incrementos de tamanhos diferentes dos shards do nó paralelo.
+    for last_ref_date in (ref_dates[1], ref_dates[6], ref_dates[-1]):
+        input_partitions, _, watermark = build_public_bonds_curve_inputs_incremental(
+            curve_candidates=candidates.loc[candidates["ref_date"] <= last_ref_date],
+            cashflow_dimension=cashflow_dimension,
+            calendar_df=calendar_df,
+            watermark=watermark,
+            warm_start=True,
+        )
+        partitions.save(input_partitions)
+
+    incremental = consolidate_curve_input_partitions(partitions.load(), candidates)
+    parallel, _ = build_public_bonds_curve_inputs_parallel(
+        curve_candidates=candidates,
+        cashflow_dimension=cashflow_dimension,
+        calendar_df=calendar_df,
+        warm_start=True,
+        workers=3,
+    )
+
+    assert (parallel["solver_start_type"] == "WARM").sum() == 22
+    for column in ["isin", "market_ytm", "solver_start_type", "solver_iterations"]:
+        assert incremental[column].tolist() == parallel[column].tolist()
@@ -0,0 +1,147 @@
+import hashlib
+from dataclasses import replace
+from datetime import date
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from ml_ettj26.benchmarks.synthetic_market import (
+    SyntheticMarketConfig,
+    build_synthetic_curve_candidates,
+    easter_sunday,
+    generate_synthetic_market,
+    write_synthetic_market,
+)
+from ml_ettj26.domain.b3_PriceReport.service import build_b3_di1_trusted_month
+from ml_ettj26.domain.bcb_demab.service import DemabIngestConfig, DemabTrustedBuilder
+from ml_ettj26.domain.bcb_sgs.service import SgsIngestConfig, SgsTrustedBuilder
+from ml_ettj26.pipelines.curve_factory.public_bonds_mart.nodes_dimension_batch import (
+    build_public_bonds_curve_inputs_columnar,
+)
+from ml_ettj26.pipelines.trusted.b3.DerivativeMarket.SwapMarketRates.DIxPRE.nodes import (
+    build_b3_swap_trusted_range_partitioned,
+)
+
+
+SMALL_CONFIG = SyntheticMarketConfig(
+    start_date=date(2024, 1, 2),
+    years=0.12,
+    ltn_per_day=6,
+    ntnf_per_day=3,
+    di1_contracts=8,
+    swap_vertices=(30, 360, 1080),
+    pricereport_filler_per_day=5,
+)
+
+
+@pytest.fixture(scope="module")
+def market():
+    return generate_synthetic_market(SMALL_CONFIG)
+
+
+def file_hashes(paths: dict[str, Path]) -> dict[str, str]:
+    files = []
+    for path in paths.values():
+        files.extend(sorted(path.iterdir()) if path.is_dir() else [path])
+
+    return {file.name: hashlib.sha256(file.read_bytes()).hexdigest() for file in files}
+
+
+def test_easter_and_movable_holidays(market):
+    holidays = dict(zip(market.holidays["date"], market.holidays["holiday_name"]))
+
+    assert easter_sunday(2024) == date(2024, 3, 31)
+    assert easter_sunday(2025) == date(2025, 4, 20)
+    assert holidays[date(2024, 2, 12)] == "Carnaval"
+    assert holidays[date(2024, 3, 29)] == "Paixão de Cristo"
+    assert holidays[date(2024, 5, 30)] == "Corpus Christi"
+    assert date(2023, 11, 20) not in holidays
+    assert date(2024, 11, 20) in holidays
+
+
+def test_market_is_deterministic_and_scales_daily_volume(market, tmp_path):
+    again = generate_synthetic_market(SMALL_CONFIG)
+
+    pd.testing.assert_frame_equal(market.demab_quotes, again.demab_quotes)
+    pd.testing.assert_frame_equal(market.di1_quotes, again.di1_quotes)
+    assert file_hashes(write_synthetic_market(market, tmp_path / "a")) == file_hashes(
+        write_synthetic_market(again, tmp_path / "b")
+    )
+
+    other_seed = generate_synthetic_market(replace(SMALL_CONFIG, seed=1))
+    assert not np.allclose(market.demab_quotes["pu_med"], other_seed.demab_quotes["pu_med"])
+
+    scaled = generate_synthetic_market(replace(SMALL_CONFIG.scaled(10), years=0.02))
+    daily = scaled.demab_quotes.groupby(["trade_date", "sigla"]).size().unstack()
+
+    assert (daily["LTN"] == 60).all()
+    assert (daily["NTN-F"] == 30).all()
+
+
+def test_raw_files_round_trip_through_trusted_builders(market, tmp_path):
+    paths = write_synthetic_market(market, tmp_path)
+
+    assert market.calendar_df["source_file_hash"].iloc[0] == hashlib.sha256(
+        paths["anbima_holidays"].read_bytes()
+    ).hexdigest()
+
+    demab = DemabTrustedBuilder(DemabIngestConfig(raw_dir=str(paths["bcb_demab"])))
+    demab_quotes = demab.build_quotes_df()
+    expected = market.demab_quotes.sort_values(["trade_date", "isin"]).reset_index(drop=True)
+
+    assert len(demab_quotes) == len(expected)
+    assert demab_quotes["pu_med"].to_numpy() == pytest.approx(expected["pu_med"], abs=1e-6)
+    assert demab_quotes["taxa_med"].to_numpy() == pytest.approx(expected["taxa_med"], abs=1e-4)
+    assert set(demab.build_instruments_df()["isin"]) == set(expected["isin"])
+
+    swap_partitions, swap_master, _ = build_b3_swap_trusted_range_partitioned(
+        raw_dir=str(paths["b3_swap"]),
+        start_date="2024-01-01",
+        end_date="2024-12-31",
+        target_cod_prod="T1PRE",
+    )
+    swaps = pd.concat(swap_partitions.values(), ignore_index=True)
+
+    assert len(swap_partitions) == market.ref_dates.size
+    assert swap_master["nome"].tolist() == ["SWAP DI X PRE"]
+    assert swaps["adjusted_value"].to_numpy() == pytest.approx(market.swap_rates["rate"])
+    assert swaps["bd_to_maturity"].tolist() == market.swap_rates["bd_to_maturity"].tolist()
+
+    di1_quotes, lineage, instruments = build_b3_di1_trusted_month(
+        raw_zip_paths=[str(path) for path in sorted(paths["b3_price_report"].iterdir())],
+        bd_index_df=market.calendar_df.assign(date=pd.to_datetime(market.calendar_df["date"])),
+        year=2024,
+        month=1,
+    )
+    expected_di1 = market.di1_quotes.loc[
+        market.di1_quotes["ref_date"].dt.strftime("%Y-%m").eq("2024-01")
+    ]
+
+    assert len(di1_quotes) == len(expected_di1)
+    assert di1_quotes["AdjstdQtTax"].to_numpy() == pytest.approx(expected_di1["adjusted_rate"])
+    assert len(lineage) == expected_di1["ref_date"].nunique()
+    assert (
+        pd.to_datetime(instruments["maturity_date"]).dt.date.tolist()
+        == expected_di1.drop_duplicates("ticker")["maturity_date"].dt.date.tolist()
+    )
+
+    sgs_points = SgsTrustedBuilder(SgsIngestConfig(raw_dir=str(paths["bcb_sgs"]))).build_points_df()
+
+    assert len(sgs_points) == len(market.sgs_points)
+
+
+def test_curve_inputs_recover_synthetic_yields(market):
+    candidates = build_synthetic_curve_candidates(market)
+
+    inputs, failures = build_public_bonds_curve_inputs_columnar(
+        curve_candidates=candidates,
+        cashflow_dimension=market.cashflow_dimension,
+        calendar_df=market.calendar_df,
+    )
+    merged = inputs.merge(candidates[["ref_date", "isin", "taxa_med"]], on=["ref_date", "isin"])
+
+    assert failures.empty
+    assert len(merged) == len(candidates)
+    assert (100 * merged["market_ytm"]).to_numpy() == pytest.approx(merged["taxa_med"], abs=1e-4)